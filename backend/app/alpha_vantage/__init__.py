@@ -11,6 +11,17 @@ from .forex import ForeignExchange
 from .fundamental import Fundamental
 from .intelligence import Intelligence
 from .options import Options
+from .rate_limiter import (
+    LimitResponseError,
+    RateLimiter,
+    RateLimitExceeded,
+    RequestCounter,
+    RequestPriority,
+    count_requests,
+    get_rate_limiter,
+    record_request,
+    request_priority,
+)
 from .technical_indicators import TechnicalIndicators
 
 __all__ = [
@@ -24,4 +35,13 @@ __all__ = [
     "Commodities",
     "EconomicIndicators",
     "Options",
+    "LimitResponseError",
+    "RateLimiter",
+    "RateLimitExceeded",
+    "RequestCounter",
+    "RequestPriority",
+    "count_requests",
+    "get_rate_limiter",
+    "record_request",
+    "request_priority",
 ]
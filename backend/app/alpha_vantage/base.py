@@ -4,7 +4,8 @@ Common utilities and base functionality
 """
 
 import logging
-from typing import TYPE_CHECKING, Any
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import aiohttp
 
@@ -13,6 +14,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class BaseAPIHandler:
     """Base class for API handlers"""
@@ -64,42 +67,33 @@ class BaseAPIHandler:
         return str(value).strip()
 
     async def _make_request(self, params: dict[str, Any]) -> dict[str, Any]:
-        """Make API request with common error handling"""
-        session = await self._get_session()
+        """Make API request through the client (rate limiting, request coalescing)"""
+        return await self._request(params, self.client._make_request)
+
+    async def _make_csv_request(self, params: dict[str, Any]) -> bytes:
+        """Make ``datatype=csv`` API request through the client (raw CSV body)"""
+        return await self._request(params, self.client._make_csv_request)
+
+    async def _request(
+        self,
+        params: dict[str, Any],
+        send: Callable[[dict[str, Any]], Awaitable[T]],
+    ) -> T:
+        logger.info(
+            f"Making Alpha Vantage API request: {params.get('function', 'unknown')} for symbol {params.get('symbol', 'unknown')}"
+        )
 
         try:
-            logger.info(
-                f"Making Alpha Vantage API request: {params.get('function', 'unknown')} for symbol {params.get('symbol', 'unknown')}"
-            )
-
-            async with session.get(self.base_url, params=params) as response:
-                response.raise_for_status()
-                data = await response.json()
-
-                # Check for API errors
-                if "Error Message" in data:
-                    error_msg = data["Error Message"]
-                    if "Invalid API call" in error_msg:
-                        raise ValueError(
-                            f"Alpha Vantage API Error: {error_msg}. "
-                            f"함수: {params.get('function', 'unknown')}, "
-                            f"심볼: {params.get('symbol', 'unknown')}. "
-                            f"심볼이 올바른지 확인하고 유효한 주식 심볼을 사용해주세요."
-                        )
-                    else:
-                        raise ValueError(f"Alpha Vantage API Error: {error_msg}")
-
-                if "Note" in data:
-                    raise ValueError(f"Alpha Vantage API Limit: {data['Note']}")
-
-                logger.info(
-                    f"API request successful: {params.get('function', 'unknown')}"
-                )
-                return data
-
-        except aiohttp.ClientError as e:
-            logger.error(f"HTTP error for request: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Error for request: {e}")
+            data = await send(params)
+        except ValueError as e:
+            if "Invalid API call" in str(e):
+                raise ValueError(
+                    f"{e}. "
+                    f"함수: {params.get('function', 'unknown')}, "
+                    f"심볼: {params.get('symbol', 'unknown')}. "
+                    f"심볼이 올바른지 확인하고 유효한 주식 심볼을 사용해주세요."
+                ) from e
             raise
+
+        logger.info(f"API request successful: {params.get('function', 'unknown')}")
+        return data
@@ -17,11 +17,13 @@ Alpha Vantage API에 대한 통합 클라이언트를 제공합니다.
 """
 
 import logging
+import time
 from typing import Any, Optional
 
 import aiohttp
 
 from app.core.config import settings
+from app.core.single_flight import SingleFlight
 from .commodities import Commodities
 from .stock import CoreStock
 from .crypto import DigitalCryptoCurrencies
@@ -30,10 +32,21 @@ from .forex import ForeignExchange
 from .fundamental import Fundamental
 from .intelligence import Intelligence
 from .options import Options
+from .rate_limiter import LimitResponseError, RateLimiter, get_rate_limiter
 from .technical_indicators import TechnicalIndicators
+from .transport import (
+    TransportConfig,
+    create_session,
+    decode_json,
+    elapsed_ms,
+    transport_metrics,
+)
 
 logger = logging.getLogger(__name__)
 
+# 프로세스 전역 in-flight 요청 병합 (클라이언트 인스턴스 간 공유)
+_request_flight = SingleFlight("alpha_vantage")
+
 
 class AlphaVantageClient:
     """
@@ -46,6 +59,9 @@ class AlphaVantageClient:
     - 자동 에러 처리 및 로깅
     - 모듈별 API 구성
     - 환경변수를 통한 API 키 관리
+    - 프로세스 전역 속도 제한 (우선순위 큐, 한도 응답 시 대기 후 재시도)
+    - 동일 요청 병합 (동시에 실행 중인 같은 요청은 응답 공유)
+    - 커넥션 풀/타임아웃 설정, 큰 응답은 워커 스레드에서 JSON 디코딩
 
     문서: https://www.alphavantage.co/documentation/
 
@@ -65,14 +81,27 @@ class AlphaVantageClient:
     """
 
     BASE_URL = "https://www.alphavantage.co/query"
-
-    def __init__(self, api_key: Optional[str] = None):
+    # 한도 초과 응답(Note/Information) 시 재시도 횟수 / 전체 요청 중단 시간(초)
+    LIMIT_RETRIES = 2
+    LIMIT_BACKOFF_SECONDS = 20.0
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        transport: Optional[TransportConfig] = None,
+        base_url: Optional[str] = None,
+    ):
         """
         Alpha Vantage API 클라이언트 초기화
 
         Args:
             api_key: Alpha Vantage API 키. 제공되지 않으면
                     ALPHA_VANTAGE_API_KEY 환경변수에서 가져옵니다.
+            rate_limiter: 속도 제한기. 제공되지 않으면 프로세스 전역 제한기를 사용합니다.
+            transport: 커넥션 풀/타임아웃 설정. 제공되지 않으면 설정값을 사용합니다.
+            base_url: API 주소. 제공되지 않으면 ALPHA_VANTAGE_BASE_URL 설정값을 사용합니다
+                     (로컬 리플레이 서버 등).
 
         Raises:
             ValueError: API 키가 제공되지 않고 ALPHA_VANTAGE_API_KEY
@@ -95,7 +124,10 @@ class AlphaVantageClient:
             )
 
         self.api_key = api_key
+        self.BASE_URL = base_url or settings.ALPHA_VANTAGE_BASE_URL
         self.session: aiohttp.ClientSession | None = None
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.transport = transport or TransportConfig.from_settings()
 
         # Initialize API handlers
         self.stock = CoreStock(self)
@@ -111,7 +143,7 @@ class AlphaVantageClient:
     async def _get_session(self) -> aiohttp.ClientSession:
         """aiohttp 세션을 가져오거나 생성합니다"""
         if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession()
+            self.session = create_session(self.transport)
         return self.session
 
     async def close(self):
@@ -139,32 +171,120 @@ class AlphaVantageClient:
             API 응답 데이터
 
         Raises:
-            ValueError: API 에러 메시지나 요청 제한이 발생한 경우
+            ValueError: API 에러 메시지를 받은 경우
+            RateLimitExceeded: 일일 한도 소진, 큐 대기 시간 초과 또는 재시도 후에도
+                요청 제한 응답 (``LimitResponseError``, ValueError 하위 클래스)
             aiohttp.ClientError: HTTP 요청 에러가 발생한 경우
         """
         # Add API key to parameters
         params["apikey"] = self.api_key
 
+        # 동일한 요청이 이미 실행 중이면 응답을 공유 (중복 API 호출 방지)
+        data = await _request_flight.do(
+            self._request_key(params), lambda: self._send_request(params)
+        )
+        return data  # type: ignore[return-value]
+
+    async def _make_csv_request(self, params: dict[str, Any]) -> bytes:
+        """
+        ``datatype=csv`` 로 API 요청을 수행하고 원시 CSV 본문을 반환합니다
+
+        에러/요청 제한 응답은 CSV 요청이어도 JSON으로 오므로 ``_make_request`` 와
+        동일하게 처리됩니다.
+
+        Args:
+            params: API 요청 파라미터
+
+        Returns:
+            CSV 응답 본문
+
+        Raises:
+            ValueError: API 에러 메시지, 요청 제한 또는 CSV 대신 JSON 응답을 받은 경우
+        """
+        params["apikey"] = self.api_key
+        params["datatype"] = "csv"
+
+        body = await _request_flight.do(
+            self._request_key(params), lambda: self._send_request(params)
+        )
+        if not isinstance(body, bytes):
+            message = body.get("Information") or body.get("message") or list(body)[:3]
+            raise ValueError(
+                f"Alpha Vantage API returned JSON instead of CSV: {message}"
+            )
+        return body
+
+    @staticmethod
+    def _request_key(params: dict[str, Any]) -> tuple[tuple[str, str], ...]:
+        return tuple(sorted((k, str(v)) for k, v in params.items() if k != "apikey"))
+
+    async def _send_request(self, params: dict[str, Any]) -> dict[str, Any] | bytes:
+        """속도 제한기 토큰을 획득한 뒤 요청 전송 (한도 응답 시 재시도)
+
+        ``datatype=csv`` 요청은 JSON(에러/한도) 응답이 아니면 원시 본문을 반환합니다.
+        """
         session = await self._get_session()
 
-        try:
-            async with session.get(self.BASE_URL, params=params) as response:
-                response.raise_for_status()
-                data = await response.json()
+        endpoint = str(params.get("function", "unknown"))
+        csv_requested = params.get("datatype") == "csv"
+        if csv_requested:
+            endpoint = f"{endpoint}:csv"
+
+        for attempt in range(self.LIMIT_RETRIES + 1):
+            await self.rate_limiter.acquire()
+            started = time.perf_counter()
+            size = 0
+            try:
+                async with session.get(self.BASE_URL, params=params) as response:
+                    response.raise_for_status()
+                    raw = await response.read()
+                size = len(raw)
+                latency_ms = elapsed_ms(started)
+
+                if csv_requested and not raw.lstrip().startswith(b"{"):
+                    transport_metrics.record(endpoint, latency_ms, size)
+                    return raw
+
+                decode_started = time.perf_counter()
+                data = await decode_json(raw, self.transport.decode_offload_bytes)
+                transport_metrics.record(
+                    endpoint, latency_ms, size, elapsed_ms(decode_started)
+                )
 
                 # Check for API errors
                 if "Error Message" in data:
                     raise ValueError(
                         f"Alpha Vantage API Error: {data['Error Message']}"
                     )
-                if "Note" in data:
-                    raise ValueError(f"Alpha Vantage API Limit: {data['Note']}")
 
-                return data
-
-        except aiohttp.ClientError as e:
-            logger.error(f"HTTP error for request: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Error for request: {e}")
-            raise
+                limit_message = self._limit_message(data)
+                if limit_message is None:
+                    return data
+                if attempt == self.LIMIT_RETRIES:
+                    raise LimitResponseError(
+                        f"Alpha Vantage API Limit: {limit_message}"
+                    )
+                # 실패 대신 한도가 풀릴 때까지 큐에서 대기 후 재시도
+                self.rate_limiter.penalize(self.LIMIT_BACKOFF_SECONDS)
+
+            except (aiohttp.ClientError, TimeoutError) as e:
+                transport_metrics.record(
+                    endpoint, elapsed_ms(started), size, failed=True
+                )
+                logger.error(f"HTTP error for request: {e}")
+                raise
+            except Exception as e:
+                logger.error(f"Error for request: {e}")
+                raise
+
+        raise AssertionError("unreachable")
+
+    @staticmethod
+    def _limit_message(data: dict[str, Any]) -> Optional[str]:
+        """요청 한도 초과 응답이면 메시지 반환"""
+        if "Note" in data:
+            return str(data["Note"])
+        information = data.get("Information")
+        if isinstance(information, str) and "rate limit" in information.lower():
+            return information
+        return None
@@ -0,0 +1,82 @@
+"""
+Alpha Vantage CSV 응답 파서
+
+``datatype=csv`` 시계열 응답을 Python dict/객체를 거치지 않고 타입이 지정된
+``pyarrow.Table`` 로 변환합니다. 컬럼 이름은 snake_case로 정규화되며
+(``adjusted close`` -> ``adjusted_close``), 시간 컬럼(``timestamp``)은 지정한
+이름으로 바뀌고 오름차순으로 정렬됩니다.
+
+사용 예제:
+    >>> table = parse_time_series_csv(raw, time_column="date")
+    >>> table.column_names
+    ['date', 'open', 'high', 'low', 'close', 'adjusted_close', 'volume', ...]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+
+import pyarrow as pa
+import pyarrow.csv as pacsv
+
+# 시계열 CSV 컬럼 타입 (응답에 없는 컬럼은 무시)
+PRICE_COLUMN_TYPES: dict[str, pa.DataType] = {
+    "open": pa.float64(),
+    "high": pa.float64(),
+    "low": pa.float64(),
+    "close": pa.float64(),
+    "adjusted_close": pa.float64(),
+    "volume": pa.int64(),
+    "dividend_amount": pa.float64(),
+    "split_coefficient": pa.float64(),
+}
+
+_SOURCE_TIME_COLUMN = "timestamp"
+
+
+def normalize_column(name: str) -> str:
+    """CSV 헤더를 snake_case 컬럼 이름으로 변환"""
+    return name.strip().lower().replace(" ", "_")
+
+
+def parse_time_series_csv(raw: bytes, time_column: str = "date") -> pa.Table:
+    """시계열 CSV 본문을 Arrow Table로 변환
+
+    Args:
+        raw: ``datatype=csv`` 응답 본문
+        time_column: 시간 컬럼 이름 (일별 ``date``, 인트라데이 ``datetime``)
+
+    Returns:
+        시간 오름차순으로 정렬된 ``pyarrow.Table`` (시간 컬럼은 ``timestamp[s]``)
+
+    Raises:
+        ValueError: 헤더가 없거나 시간 컬럼이 없는 경우
+    """
+    body = raw.lstrip()
+    header, _, _ = body.partition(b"\n")
+    columns = [normalize_column(name) for name in header.decode().split(",")]
+    if _SOURCE_TIME_COLUMN not in columns:
+        raise ValueError(f"Alpha Vantage CSV 응답에 timestamp 컬럼이 없음: {header[:200]!r}")
+
+    names = [time_column if name == _SOURCE_TIME_COLUMN else name for name in columns]
+    column_types = {
+        name: PRICE_COLUMN_TYPES[name] for name in names if name in PRICE_COLUMN_TYPES
+    }
+    column_types[time_column] = pa.timestamp("s")
+
+    table = pacsv.read_csv(
+        io.BytesIO(body),
+        read_options=pacsv.ReadOptions(column_names=names, skip_rows=1),
+        convert_options=pacsv.ConvertOptions(column_types=column_types),
+    )
+    return table.sort_by(time_column)
+
+
+async def decode_time_series_csv(
+    raw: bytes, time_column: str = "date", offload_bytes: int = 0
+) -> pa.Table:
+    """CSV 파싱 (``offload_bytes`` 이상이면 워커 스레드에서 실행)"""
+    if offload_bytes and len(raw) >= offload_bytes:
+        return await asyncio.to_thread(parse_time_series_csv, raw, time_column)
+    return parse_time_series_csv(raw, time_column)
@@ -0,0 +1,339 @@
+"""
+Alpha Vantage 요청 속도 제한기
+
+프로세스 전역 토큰 버킷(분당 한도 + 버스트)과 일일 한도로 Alpha Vantage 요청을
+조절합니다. 토큰이 없으면 요청은 실패하지 않고 우선순위 큐에서 대기합니다.
+
+우선순위 (높은 순):
+- INTERACTIVE: API 요청 처리 중 호출 (기본값)
+- BACKTEST: 백테스트 데이터 수집
+- BACKGROUND: 스케줄러/증분 업데이트 등 백그라운드 갱신
+
+우선순위는 ``request_priority`` 컨텍스트 매니저로 지정하며, 그 안에서 생성된
+태스크(asyncio.gather 등)에도 전파됩니다. ``count_requests`` 컨텍스트 안에서는
+실제로 토큰을 받아 나간 요청 수를 집계합니다 (캐시 적중은 0회).
+
+사용 예제:
+    >>> with request_priority(RequestPriority.BACKGROUND):
+    ...     await market_service.stock.get_daily_prices("AAPL")
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+from enum import IntEnum
+from typing import Any
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RequestPriority(IntEnum):
+    """요청 우선순위 (값이 작을수록 먼저 처리)"""
+
+    INTERACTIVE = 0
+    BACKTEST = 1
+    BACKGROUND = 2
+
+
+class RateLimitExceeded(Exception):
+    """일일 한도 소진 또는 대기 시간 초과로 요청이 거부된 경우"""
+
+
+class LimitResponseError(RateLimitExceeded, ValueError):
+    """재시도 후에도 Alpha Vantage가 요청 한도 응답(Note/Information)을 반환한 경우"""
+
+
+_current_priority: ContextVar[RequestPriority] = ContextVar(
+    "alpha_vantage_request_priority", default=RequestPriority.INTERACTIVE
+)
+
+
+@contextmanager
+def request_priority(priority: RequestPriority) -> Iterator[None]:
+    """현재 컨텍스트의 Alpha Vantage 요청 우선순위 지정"""
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def current_priority() -> RequestPriority:
+    return _current_priority.get()
+
+
+@dataclass
+class RequestCounter:
+    """``count_requests`` 컨텍스트에서 실제로 나간 요청 수"""
+
+    count: int = 0
+
+
+_request_counter: ContextVar[RequestCounter | None] = ContextVar(
+    "alpha_vantage_request_counter", default=None
+)
+
+
+@contextmanager
+def count_requests() -> Iterator[RequestCounter]:
+    """현재 컨텍스트(와 그 안에서 생성된 태스크)의 Alpha Vantage 요청 수 집계"""
+    counter = RequestCounter()
+    token = _request_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _request_counter.reset(token)
+
+
+def record_request() -> None:
+    """현재 ``count_requests`` 컨텍스트에 요청 1회 기록 (토큰 획득 시 호출)"""
+    counter = _request_counter.get()
+    if counter is not None:
+        counter.count += 1
+
+
+@dataclass
+class PriorityStats:
+    """우선순위별 대기 통계"""
+
+    acquired: int = 0
+    queued: int = 0
+    rejected: int = 0
+    total_wait_ms: float = 0.0
+    max_wait_ms: float = 0.0
+
+    def snapshot(self) -> dict[str, float | int]:
+        return {
+            "acquired": self.acquired,
+            "queued": self.queued,
+            "rejected": self.rejected,
+            "avg_wait_ms": round(self.total_wait_ms / self.acquired, 3)
+            if self.acquired
+            else 0.0,
+            "max_wait_ms": round(self.max_wait_ms, 3),
+        }
+
+
+class RateLimiter:
+    """우선순위 큐를 가진 비동기 토큰 버킷
+
+    Args:
+        requests_per_minute: 분당 요청 수 (토큰 충전 속도)
+        requests_per_day: 일일 요청 한도 (0이면 무제한, UTC 자정 초기화)
+        burst: 버킷 용량 (연속 요청 허용 수)
+        queue_timeout: 큐 최대 대기 시간(초, None이면 무제한)
+        clock: 단조 시계 (테스트용)
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float,
+        requests_per_day: int = 0,
+        burst: int = 1,
+        queue_timeout: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+
+        self.rate = requests_per_minute / 60.0
+        self.capacity = float(max(1, min(burst, int(requests_per_minute) or 1)))
+        self.requests_per_day = requests_per_day
+        self.queue_timeout = queue_timeout
+        self._clock = clock
+
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._day: date = datetime.now(UTC).date()
+        self._day_count = 0
+
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._dispatcher: asyncio.Task[None] | None = None
+
+        self._stats = {priority: PriorityStats() for priority in RequestPriority}
+        self._throttled = 0
+
+    # ===== 토큰 관리 =====
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def _delay_until_token(self) -> float:
+        """다음 토큰까지 남은 시간(초)"""
+        now = self._clock()
+        blocked = max(0.0, self._blocked_until - now)
+        missing = max(0.0, 1.0 - self._tokens)
+        return max(blocked, missing / self.rate)
+
+    def _try_take(self) -> bool:
+        self._refill()
+        if self._clock() < self._blocked_until or self._tokens < 1.0:
+            return False
+        self._tokens -= 1.0
+        self._day_count += 1
+        return True
+
+    def _check_daily_quota(self, priority: RequestPriority) -> None:
+        today = datetime.now(UTC).date()
+        if today != self._day:
+            self._day = today
+            self._day_count = 0
+        if self.requests_per_day and self._day_count >= self.requests_per_day:
+            self._stats[priority].rejected += 1
+            raise RateLimitExceeded(
+                f"Alpha Vantage daily quota exhausted ({self.requests_per_day} requests)"
+            )
+
+    # ===== 획득 =====
+
+    async def acquire(
+        self,
+        priority: RequestPriority | None = None,
+        timeout: float | None = None,
+    ) -> float:
+        """요청 토큰 획득 (없으면 우선순위 순서로 대기)
+
+        Args:
+            priority: 우선순위 (None이면 현재 컨텍스트 값)
+            timeout: 최대 대기 시간(초, None이면 ``queue_timeout``)
+
+        Returns:
+            대기 시간(ms)
+
+        Raises:
+            RateLimitExceeded: 일일 한도 소진 또는 대기 시간 초과
+        """
+        priority = current_priority() if priority is None else priority
+        stats = self._stats[priority]
+        self._check_daily_quota(priority)
+
+        started = self._clock()
+        if not self._waiters and self._try_take():
+            stats.acquired += 1
+            record_request()
+            return 0.0
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._sequence), future))
+        stats.queued += 1
+        self._ensure_dispatcher()
+
+        timeout = self.queue_timeout if timeout is None else timeout
+        try:
+            await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            stats.rejected += 1
+            self._drop_dispatcher_if_idle()
+            raise RateLimitExceeded(
+                f"Alpha Vantage request waited longer than {timeout:.0f}s in queue "
+                f"(priority={priority.name})"
+            ) from None
+
+        wait_ms = (self._clock() - started) * 1000
+        stats.acquired += 1
+        stats.total_wait_ms += wait_ms
+        stats.max_wait_ms = max(stats.max_wait_ms, wait_ms)
+        record_request()
+        return wait_ms
+
+    def _ensure_dispatcher(self) -> None:
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.get_running_loop().create_task(self._dispatch())
+
+    def _drop_dispatcher_if_idle(self) -> None:
+        """남은 대기자가 모두 취소되었으면 디스패처 종료"""
+        if all(future.done() for *_, future in self._waiters):
+            self._waiters.clear()
+            if self._dispatcher is not None and not self._dispatcher.done():
+                self._dispatcher.cancel()
+
+    async def _dispatch(self) -> None:
+        """토큰이 충전될 때마다 우선순위가 가장 높은 대기자를 깨움"""
+        while self._waiters:
+            priority, _, future = self._waiters[0]
+            if future.done():  # 타임아웃/취소된 대기자
+                heapq.heappop(self._waiters)
+                continue
+            # 대기 중 일일 한도가 소진(또는 자정이 지나 초기화)됐을 수 있으므로 재확인
+            try:
+                self._check_daily_quota(RequestPriority(priority))
+            except RateLimitExceeded as e:
+                heapq.heappop(self._waiters)
+                future.set_exception(e)
+                continue
+            if self._try_take():
+                heapq.heappop(self._waiters)
+                future.set_result(None)
+                continue
+            await asyncio.sleep(max(self._delay_until_token(), 0.001))
+
+    def penalize(self, seconds: float) -> None:
+        """Alpha Vantage가 한도 초과 응답을 보낸 경우 모든 요청을 잠시 중단"""
+        self._throttled += 1
+        self._tokens = 0.0
+        self._updated = self._clock()
+        self._blocked_until = max(self._blocked_until, self._clock() + seconds)
+        logger.warning(f"⏳ Alpha Vantage 한도 응답, {seconds:.0f}초 동안 요청 중단")
+
+    def remaining_today(self) -> int | None:
+        """오늘 남은 요청 수 (일일 한도가 없으면 None)"""
+        if not self.requests_per_day:
+            return None
+        if datetime.now(UTC).date() != self._day:
+            return self.requests_per_day
+        return max(0, self.requests_per_day - self._day_count)
+
+    # ===== 통계 =====
+
+    def get_metrics(self) -> dict[str, Any]:
+        self._refill()
+        return {
+            "requests_per_minute": round(self.rate * 60, 3),
+            "requests_per_day": self.requests_per_day,
+            "burst": int(self.capacity),
+            "tokens": round(self._tokens, 3),
+            "queue_depth": sum(1 for *_, f in self._waiters if not f.done()),
+            "daily_used": self._day_count,
+            "throttled": self._throttled,
+            "priorities": {
+                priority.name.lower(): stats.snapshot()
+                for priority, stats in self._stats.items()
+            },
+        }
+
+    def reset_metrics(self) -> None:
+        self._stats = {priority: PriorityStats() for priority in RequestPriority}
+        self._throttled = 0
+
+
+_rate_limiter: RateLimiter | None = None
+
+
+def get_rate_limiter() -> RateLimiter:
+    """설정값으로 생성한 프로세스 전역 속도 제한기"""
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = RateLimiter(
+            requests_per_minute=settings.ALPHA_VANTAGE_REQUESTS_PER_MINUTE,
+            requests_per_day=settings.ALPHA_VANTAGE_REQUESTS_PER_DAY,
+            burst=settings.ALPHA_VANTAGE_BURST,
+            queue_timeout=settings.ALPHA_VANTAGE_QUEUE_TIMEOUT_SECONDS or None,
+        )
+    return _rate_limiter
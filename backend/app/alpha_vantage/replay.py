@@ -0,0 +1,588 @@
+"""
+Alpha Vantage 응답 리플레이 서버 (오프라인 부하 테스트용)
+
+녹화된 응답(fixture)을 function/symbol 키로 제공하는 로컬 aiohttp 앱입니다.
+``ALPHA_VANTAGE_BASE_URL`` (또는 ``AlphaVantageClient(base_url=...)``)을 서버 주소로
+지정하면 실제 API 없이 전체 시장 데이터 경로(속도 제한, 요청 병합, 캐시)를 실행할 수
+있습니다.
+
+- fixture 레이아웃: ``<root>/<FUNCTION>/<SYMBOL>[_<interval>].json`` (``datatype=csv`` 는 ``.csv``)
+- fixture가 없으면 심볼별로 결정적인 합성 응답 생성 (시계열/암호화폐/기술 지표/기업 개요/시세/대량 시세)
+- ``record_api_key`` 를 지정하면 fixture가 없는 요청을 실제 API로 전달하고 응답을 저장
+- 지연(``latency_ms`` ± ``jitter_ms``), HTTP 500 비율(``error_rate``),
+  한도 초과 "Note" 응답 비율(``limit_rate``) 주입
+
+사용 예제:
+    >>> async with ReplayServer(config=ReplayConfig(latency_ms=50, limit_rate=0.02)) as server:
+    ...     client = AlphaVantageClient(api_key="replay", base_url=server.url)
+    ...     await client.stock.daily_adjusted("AAPL")
+    ...     print(server.stats.snapshot())
+
+    $ python -m app.alpha_vantage.replay --fixtures fixtures/av --port 8765 --latency-ms 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import zlib
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import aiohttp
+from aiohttp import web
+
+logger = logging.getLogger(__name__)
+
+UPSTREAM_URL = "https://www.alphavantage.co/query"
+LIMIT_NOTE = (
+    "Thank you for using Alpha Vantage! Our standard API rate limit is 25 requests per day. "
+    "Please subscribe to any of the premium plans to instantly remove all daily rate limits."
+)
+
+_INTERVAL_STEPS = {
+    "1min": timedelta(minutes=1),
+    "5min": timedelta(minutes=5),
+    "15min": timedelta(minutes=15),
+    "30min": timedelta(minutes=30),
+    "60min": timedelta(hours=1),
+    "daily": timedelta(days=1),
+    "weekly": timedelta(weeks=1),
+    "monthly": timedelta(days=30),
+}
+
+# function -> (응답 키, 봉 간격, 조정 컬럼 포함 여부)
+_STOCK_SERIES: dict[str, tuple[str, str, bool]] = {
+    "TIME_SERIES_DAILY": ("Time Series (Daily)", "daily", False),
+    "TIME_SERIES_DAILY_ADJUSTED": ("Time Series (Daily)", "daily", True),
+    "TIME_SERIES_WEEKLY": ("Weekly Time Series", "weekly", False),
+    "TIME_SERIES_WEEKLY_ADJUSTED": ("Weekly Adjusted Time Series", "weekly", True),
+    "TIME_SERIES_MONTHLY": ("Monthly Time Series", "monthly", False),
+    "TIME_SERIES_MONTHLY_ADJUSTED": ("Monthly Adjusted Time Series", "monthly", True),
+}
+_CRYPTO_SERIES: dict[str, tuple[str, str]] = {
+    "DIGITAL_CURRENCY_DAILY": ("Time Series (Digital Currency Daily)", "daily"),
+    "DIGITAL_CURRENCY_WEEKLY": ("Time Series (Digital Currency Weekly)", "weekly"),
+    "DIGITAL_CURRENCY_MONTHLY": ("Time Series (Digital Currency Monthly)", "monthly"),
+}
+# 여러 값을 반환하는 기술 지표 (그 외 지표는 function 이름 하나의 값)
+_INDICATOR_VALUES: dict[str, tuple[str, ...]] = {
+    "MACD": ("MACD", "MACD_Hist", "MACD_Signal"),
+    "MACDEXT": ("MACD", "MACD_Hist", "MACD_Signal"),
+    "BBANDS": ("Real Upper Band", "Real Middle Band", "Real Lower Band"),
+    "STOCH": ("SlowK", "SlowD"),
+    "STOCHF": ("FastK", "FastD"),
+    "AROON": ("Aroon Down", "Aroon Up"),
+    "MAMA": ("MAMA", "FAMA"),
+}
+_INDICATORS = {
+    "SMA",
+    "EMA",
+    "WMA",
+    "DEMA",
+    "TEMA",
+    "TRIMA",
+    "KAMA",
+    "T3",
+    "VWAP",
+    "RSI",
+    "ADX",
+    "ADXR",
+    "CCI",
+    "ATR",
+    "NATR",
+    "OBV",
+    "MOM",
+    "ROC",
+    "WILLR",
+    "MFI",
+    "TRANGE",
+    *_INDICATOR_VALUES,
+}
+
+
+@dataclass
+class ReplayConfig:
+    """리플레이 서버 동작 설정
+
+    Args:
+        latency_ms: 응답 지연 (ms)
+        jitter_ms: 지연 편차 (균등 분포, ms)
+        error_rate: HTTP 500 응답 비율 (0~1)
+        limit_rate: 한도 초과 "Note" 응답 비율 (0~1)
+        synthesize: fixture가 없을 때 합성 응답 생성 여부
+        compact_bars: ``outputsize=compact`` 합성 봉 수
+        full_bars: ``outputsize=full`` 합성 봉 수
+        seed: 지연/오류 주입 난수 시드
+    """
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    limit_rate: float = 0.0
+    synthesize: bool = True
+    compact_bars: int = 100
+    full_bars: int = 1000
+    seed: int | None = None
+
+
+@dataclass
+class ReplayStats:
+    """리플레이 서버 요청 통계 (업스트림 호출 수)"""
+
+    requests: int = 0
+    fixtures: int = 0
+    synthesized: int = 0
+    recorded: int = 0
+    missing: int = 0
+    injected_errors: int = 0
+    injected_limits: int = 0
+    by_function: Counter[str] = field(default_factory=Counter)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "fixtures": self.fixtures,
+            "synthesized": self.synthesized,
+            "recorded": self.recorded,
+            "missing": self.missing,
+            "injected_errors": self.injected_errors,
+            "injected_limits": self.injected_limits,
+            "by_function": dict(self.by_function.most_common()),
+        }
+
+
+class FixtureStore:
+    """``<root>/<FUNCTION>/<SYMBOL>[_<interval>].<json|csv>`` 형태의 녹화 응답 저장소"""
+
+    def __init__(self, root: str | Path | None):
+        self.root = Path(root) if root else None
+
+    @staticmethod
+    def key(params: dict[str, str]) -> tuple[str, str]:
+        function = params.get("function", "UNKNOWN").upper()
+        subject = (
+            params.get("symbol")
+            or params.get("from_symbol")
+            or params.get("from_currency")
+            or params.get("keywords")
+            or "_"
+        ).upper()
+        if params.get("interval"):
+            subject = f"{subject}_{params['interval']}"
+        return function, subject
+
+    def path(self, params: dict[str, str]) -> Path | None:
+        if self.root is None:
+            return None
+        function, subject = self.key(params)
+        suffix = "csv" if params.get("datatype") == "csv" else "json"
+        return self.root / function / f"{subject}.{suffix}"
+
+    def load(self, params: dict[str, str]) -> bytes | None:
+        path = self.path(params)
+        if path is None or not path.exists():
+            return None
+        return path.read_bytes()
+
+    def save(self, params: dict[str, str], body: bytes) -> None:
+        path = self.path(params)
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(body)
+
+
+# ===== 합성 응답 =====
+
+
+def _bars(
+    subject: str, count: int, step: timedelta, end: datetime
+) -> list[tuple[datetime, float, float, float, float, int]]:
+    """심볼별로 결정적인 랜덤 워크 OHLCV (오래된 봉부터)"""
+    rng = random.Random(zlib.crc32(subject.encode()))
+    price = 20 + rng.random() * 480
+    start = end - step * (count - 1)
+    bars = []
+    for i in range(count):
+        open_ = price
+        close = max(1.0, open_ * (1 + rng.gauss(0, 0.015)))
+        high = max(open_, close) * (1 + rng.random() * 0.01)
+        low = min(open_, close) * (1 - rng.random() * 0.01)
+        bars.append(
+            (start + step * i, open_, high, low, close, rng.randint(100_000, 5_000_000))
+        )
+        price = close
+    return bars
+
+
+def _series_end(step: timedelta) -> datetime:
+    now = datetime.now().replace(microsecond=0)
+    if step >= timedelta(days=1):
+        return now.replace(hour=0, minute=0, second=0)
+    minutes = int(step.total_seconds() // 60)
+    return now.replace(second=0, minute=now.minute - now.minute % minutes)
+
+
+def _format_ts(ts: datetime, step: timedelta) -> str:
+    return ts.strftime("%Y-%m-%d" if step >= timedelta(days=1) else "%Y-%m-%d %H:%M:%S")
+
+
+def synthesize(params: dict[str, str], config: ReplayConfig) -> bytes | None:
+    """function에 맞는 합성 응답 본문 (지원하지 않는 function이면 None)"""
+    function = params.get("function", "").upper()
+    symbol = (params.get("symbol") or params.get("from_currency") or "SYNTH").upper()
+    count = (
+        config.compact_bars
+        if params.get("outputsize") == "compact"
+        else config.full_bars
+    )
+    csv = params.get("datatype") == "csv"
+
+    if function in _STOCK_SERIES or function == "TIME_SERIES_INTRADAY":
+        if function == "TIME_SERIES_INTRADAY":
+            interval = params.get("interval", "5min")
+            key, adjusted = f"Time Series ({interval})", False
+        else:
+            key, interval, adjusted = _STOCK_SERIES[function]
+        step = _INTERVAL_STEPS.get(interval, timedelta(days=1))
+        bars = _bars(f"{symbol}:{interval}", count, step, _series_end(step))
+        if csv:
+            header = "timestamp,open,high,low,close," + (
+                "adjusted_close,volume,dividend_amount,split_coefficient"
+                if adjusted
+                else "volume"
+            )
+            lines = [header]
+            for ts, o, h, lo, c, v in reversed(bars):
+                tail = f"{c:.4f},{v},0.0000,1.0" if adjusted else f"{v}"
+                lines.append(
+                    f"{_format_ts(ts, step)},{o:.4f},{h:.4f},{lo:.4f},{c:.4f},{tail}"
+                )
+            return ("\r\n".join(lines) + "\r\n").encode()
+
+        series: dict[str, dict[str, str]] = {}
+        for ts, o, h, lo, c, v in reversed(bars):
+            values = {
+                "1. open": f"{o:.4f}",
+                "2. high": f"{h:.4f}",
+                "3. low": f"{lo:.4f}",
+                "4. close": f"{c:.4f}",
+            }
+            if adjusted:
+                values.update(
+                    {
+                        "5. adjusted close": f"{c:.4f}",
+                        "6. volume": str(v),
+                        "7. dividend amount": "0.0000",
+                        "8. split coefficient": "1.0",
+                    }
+                )
+            else:
+                values["5. volume"] = str(v)
+            series[_format_ts(ts, step)] = values
+        return _json(
+            {
+                "Meta Data": {"1. Information": function, "2. Symbol": symbol},
+                key: series,
+            }
+        )
+
+    if function in _CRYPTO_SERIES or function == "CRYPTO_INTRADAY":
+        if function == "CRYPTO_INTRADAY":
+            interval = params.get("interval", "5min")
+            key = f"Time Series Crypto ({interval})"
+        else:
+            key, interval = _CRYPTO_SERIES[function]
+        step = _INTERVAL_STEPS.get(interval, timedelta(days=1))
+        bars = _bars(
+            f"{symbol}:{params.get('market', 'USD')}:{interval}",
+            count,
+            step,
+            _series_end(step),
+        )
+        series = {
+            _format_ts(ts, step): {
+                "1. open": f"{o:.4f}",
+                "2. high": f"{h:.4f}",
+                "3. low": f"{lo:.4f}",
+                "4. close": f"{c:.4f}",
+                "5. volume": f"{v / 1000:.4f}",
+            }
+            for ts, o, h, lo, c, v in reversed(bars)
+        }
+        return _json({"Meta Data": {"2. Digital Currency Code": symbol}, key: series})
+
+    if function in _INDICATORS:
+        interval = params.get("interval", "daily")
+        step = _INTERVAL_STEPS.get(interval, timedelta(days=1))
+        bars = _bars(f"{symbol}:{interval}", count, step, _series_end(step))
+        names = _INDICATOR_VALUES.get(function, (function,))
+        series = {
+            _format_ts(ts, step): {
+                name: f"{c * (1 + 0.01 * (1 - i)):.4f}" for i, name in enumerate(names)
+            }
+            for ts, _, _, _, c, _ in reversed(bars)
+        }
+        return _json(
+            {
+                "Meta Data": {"1: Symbol": symbol},
+                f"Technical Analysis: {function}": series,
+            }
+        )
+
+    if function == "GLOBAL_QUOTE":
+        ts, o, h, lo, c, v = _bars(
+            f"{symbol}:daily", 2, timedelta(days=1), _series_end(timedelta(days=1))
+        )[-1]
+        return _json(
+            {
+                "Global Quote": {
+                    "01. symbol": symbol,
+                    "02. open": f"{o:.4f}",
+                    "03. high": f"{h:.4f}",
+                    "04. low": f"{lo:.4f}",
+                    "05. price": f"{c:.4f}",
+                    "06. volume": str(v),
+                    "07. latest trading day": ts.strftime("%Y-%m-%d"),
+                    "08. previous close": f"{o:.4f}",
+                    "09. change": f"{c - o:.4f}",
+                    "10. change percent": f"{(c - o) / o * 100:.4f}%",
+                }
+            }
+        )
+
+    if function == "REALTIME_BULK_QUOTES":
+        quotes = []
+        for name in filter(None, (part.strip() for part in symbol.split(","))):
+            ts, o, h, lo, c, v = _bars(
+                f"{name}:daily", 2, timedelta(days=1), _series_end(timedelta(days=1))
+            )[-1]
+            quotes.append(
+                {
+                    "symbol": name,
+                    "timestamp": ts.strftime("%Y-%m-%d 16:00:00.000"),
+                    "open": f"{o:.4f}",
+                    "high": f"{h:.4f}",
+                    "low": f"{lo:.4f}",
+                    "close": f"{c:.4f}",
+                    "volume": str(v),
+                    "previous_close": f"{o:.4f}",
+                    "change": f"{c - o:.4f}",
+                    "change_percent": f"{(c - o) / o * 100:.4f}",
+                }
+            )
+        return _json({"endpoint": "Realtime Bulk Quotes", "data": quotes})
+
+    if function == "OVERVIEW":
+        rng = random.Random(zlib.crc32(symbol.encode()))
+        return _json(
+            {
+                "Symbol": symbol,
+                "AssetType": "Common Stock",
+                "Name": f"{symbol} Replay Inc",
+                "Description": "Synthetic company overview served by the replay server.",
+                "Exchange": "NASDAQ",
+                "Currency": "USD",
+                "Country": "USA",
+                "Sector": "TECHNOLOGY",
+                "Industry": "SOFTWARE",
+                "MarketCapitalization": str(rng.randint(10**9, 10**12)),
+                "PERatio": f"{rng.uniform(5, 60):.2f}",
+                "EPS": f"{rng.uniform(0.5, 12):.2f}",
+                "DividendYield": f"{rng.uniform(0, 0.04):.4f}",
+                "BookValue": f"{rng.uniform(5, 80):.2f}",
+                "ProfitMargin": f"{rng.uniform(0.02, 0.35):.4f}",
+            }
+        )
+
+    return None
+
+
+def _json(payload: dict[str, Any]) -> bytes:
+    return json.dumps(payload).encode()
+
+
+# ===== 서버 =====
+
+
+class ReplayServer:
+    """fixture/합성 응답을 제공하는 로컬 Alpha Vantage 호환 서버
+
+    Args:
+        fixtures: fixture 루트 디렉터리 (None이면 합성 응답만 사용)
+        config: 지연/오류/한도 주입 설정
+        record_api_key: 지정하면 fixture가 없는 요청을 실제 API로 전달하고 저장
+        upstream_url: 녹화 모드의 실제 API 주소
+    """
+
+    def __init__(
+        self,
+        fixtures: str | Path | None = None,
+        config: ReplayConfig | None = None,
+        record_api_key: str | None = None,
+        upstream_url: str = UPSTREAM_URL,
+    ):
+        self.store = FixtureStore(fixtures)
+        self.config = config or ReplayConfig()
+        self.record_api_key = record_api_key
+        self.upstream_url = upstream_url
+        self.stats = ReplayStats()
+        self.url = ""
+        self._rng = random.Random(self.config.seed)
+        self._runner: web.AppRunner | None = None
+        self._upstream: aiohttp.ClientSession | None = None
+
+    def create_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/query", self.handle)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """서버 시작 (port=0이면 임의 포트) 후 ``/query`` URL 반환"""
+        self._runner = web.AppRunner(self.create_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_host, bound_port = self._runner.addresses[0][:2]
+        self.url = f"http://{bound_host}:{bound_port}/query"
+        logger.info(f"🎞️ Alpha Vantage 리플레이 서버 시작: {self.url}")
+        return self.url
+
+    async def stop(self) -> None:
+        if self._upstream is not None:
+            await self._upstream.close()
+            self._upstream = None
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> ReplayServer:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.stop()
+
+    async def handle(self, request: web.Request) -> web.Response:
+        params = dict(request.query)
+        self.stats.requests += 1
+        self.stats.by_function[params.get("function", "UNKNOWN")] += 1
+
+        config = self.config
+        delay_ms = config.latency_ms + self._rng.uniform(
+            -config.jitter_ms, config.jitter_ms
+        )
+        if delay_ms > 0:
+            await asyncio.sleep(delay_ms / 1000)
+
+        if config.error_rate and self._rng.random() < config.error_rate:
+            self.stats.injected_errors += 1
+            return web.Response(status=500, text="injected upstream error")
+        if config.limit_rate and self._rng.random() < config.limit_rate:
+            self.stats.injected_limits += 1
+            return web.json_response({"Note": LIMIT_NOTE})
+
+        body = await self._resolve(params)
+        if body is None:
+            self.stats.missing += 1
+            function, subject = self.store.key(params)
+            return web.json_response(
+                {
+                    "Error Message": f"Invalid API call. No replay fixture for {function}/{subject}."
+                }
+            )
+
+        content_type = (
+            "text/csv" if params.get("datatype") == "csv" else "application/json"
+        )
+        return web.Response(body=body, content_type=content_type)
+
+    async def _resolve(self, params: dict[str, str]) -> bytes | None:
+        body = self.store.load(params)
+        if body is not None:
+            self.stats.fixtures += 1
+            return body
+
+        if self.record_api_key:
+            body = await self._record(params)
+            if body is not None:
+                return body
+
+        if self.config.synthesize:
+            body = synthesize(params, self.config)
+            if body is not None:
+                self.stats.synthesized += 1
+        return body
+
+    async def _record(self, params: dict[str, str]) -> bytes | None:
+        """실제 API 응답을 받아 fixture로 저장 (에러/한도 응답은 저장하지 않음)"""
+        if self._upstream is None:
+            self._upstream = aiohttp.ClientSession()
+        upstream_params = {**params, "apikey": self.record_api_key or ""}
+        async with self._upstream.get(
+            self.upstream_url, params=upstream_params
+        ) as response:
+            response.raise_for_status()
+            body = await response.read()
+
+        if body.lstrip().startswith(b"{"):
+            payload = json.loads(body)
+            if (
+                "Error Message" in payload
+                or "Note" in payload
+                or "Information" in payload
+            ):
+                logger.warning(f"⚠️ 녹화 건너뜀 ({params.get('function')}): {list(payload)}")
+                return None
+        self.store.save(params, body)
+        self.stats.recorded += 1
+        return body
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Alpha Vantage replay server")
+    parser.add_argument("--fixtures", help="fixture 디렉터리")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--limit-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--no-synthesize", action="store_true", help="fixture가 없으면 에러 응답"
+    )
+    parser.add_argument("--record-api-key", help="fixture가 없는 요청을 실제 API로 녹화")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    config = ReplayConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        limit_rate=args.limit_rate,
+        synthesize=not args.no_synthesize,
+    )
+
+    async def serve() -> None:
+        server = ReplayServer(args.fixtures, config, record_api_key=args.record_api_key)
+        await server.start(args.host, args.port)
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await server.stop()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
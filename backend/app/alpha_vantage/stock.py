@@ -8,7 +8,7 @@ Alpha Vantage API 클라이언트 - 코어 주식 모듈
 - 인트라데이 시계열 데이터
 - 일별/주별/월별 시계열 데이터
 - 주가 조정 데이터
-- 실시간 주가 조회
+- 실시간 주가 조회 (단건/대량)
 - 심볼 검색
 - 시장 상태 확인
 """
@@ -18,12 +18,16 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any, Literal, Optional
 
 from .base import BaseAPIHandler
+from .csv_format import decode_time_series_csv
 
 if TYPE_CHECKING:
-    pass  # Remove circular import reference
+    import pyarrow as pa
 
 logger = logging.getLogger(__name__)
 
+# REALTIME_BULK_QUOTES 요청당 최대 심볼 수
+BULK_QUOTES_MAX_SYMBOLS = 100
+
 
 class CoreStock(BaseAPIHandler):
     """
@@ -39,6 +43,7 @@ class CoreStock(BaseAPIHandler):
     - TIME_SERIES_WEEKLY: 주별 데이터
     - TIME_SERIES_MONTHLY: 월별 데이터
     - GLOBAL_QUOTE: 실시간 주가
+    - REALTIME_BULK_QUOTES: 최대 100개 심볼 실시간 주가
     - SYMBOL_SEARCH: 심볼 검색
     - MARKET_STATUS: 시장 상태
 
@@ -81,6 +86,37 @@ class CoreStock(BaseAPIHandler):
             ValueError: 필수 파라미터가 빠진 경우
         """
 
+        params = self._build_core_stock_params(
+            function,
+            symbol=symbol,
+            keywords=keywords,
+            interval=interval,
+            adjusted=adjusted,
+            extended_hours=extended_hours,
+            outputsize=outputsize,
+            **kwargs,
+        )
+        data = await self._make_request(params)
+
+        # Parse response based on function type
+        return self._parse_core_stock_response(data, function, symbol, interval)
+
+    def _build_core_stock_params(
+        self,
+        function: str,
+        symbol: Optional[str] = None,
+        keywords: Optional[str] = None,
+        interval: Optional[str] = None,
+        adjusted: Optional[bool] = None,
+        extended_hours: Optional[bool] = None,
+        outputsize: Optional[str] = "full",
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """필수 파라미터를 검증하고 요청 파라미터를 구성합니다
+
+        Raises:
+            ValueError: 필수 파라미터가 빠진 경우
+        """
         # Validate required parameters
         if function == "SYMBOL_SEARCH" and not keywords:
             raise ValueError("keywords parameter is required for SYMBOL_SEARCH")
@@ -114,11 +150,53 @@ class CoreStock(BaseAPIHandler):
         # Add any additional parameters (None 값 필터링)
         filtered_kwargs = {k: v for k, v in kwargs.items() if v is not None}
         params.update(filtered_kwargs)
+        return params
 
-        data = await self._make_request(params)
+    async def time_series_table(
+        self,
+        function: str,
+        symbol: str,
+        interval: Optional[str] = None,
+        adjusted: Optional[bool] = None,
+        extended_hours: Optional[bool] = None,
+        outputsize: Optional[str] = "full",
+        **kwargs: Any,
+    ) -> "pa.Table":
+        """
+        시계열 데이터를 CSV(``datatype=csv``)로 받아 Arrow Table로 반환합니다
 
-        # Parse response based on function type
-        return self._parse_core_stock_response(data, function, symbol, interval)
+        JSON 응답을 dict로 디코딩한 뒤 행 단위로 변환하는 대신 CSV 본문을
+        타입이 지정된 컬럼으로 바로 파싱합니다 (큰 응답은 워커 스레드에서 파싱).
+
+        Args:
+            function: 시계열 API 함수 이름 (e.g., "TIME_SERIES_DAILY_ADJUSTED")
+            symbol: 주식 심볼
+            interval: 시간 간격 (INTRADAY용)
+            adjusted: 주가 조정 여부
+            extended_hours: 연장 거래 시간 포함 여부
+            outputsize: 출력 크기 ("compact" 또는 "full")
+            **kwargs: 추가 파라미터 (month 등)
+
+        Returns:
+            시간 오름차순 ``pyarrow.Table`` (인트라데이는 ``datetime``, 그 외 ``date`` 컬럼)
+        """
+        params = self._build_core_stock_params(
+            function,
+            symbol=symbol,
+            interval=interval,
+            adjusted=adjusted,
+            extended_hours=extended_hours,
+            outputsize=outputsize,
+            **kwargs,
+        )
+        raw = await self._make_csv_request(params)
+
+        time_column = "datetime" if function == "TIME_SERIES_INTRADAY" else "date"
+        table = await decode_time_series_csv(
+            raw, time_column, self.client.transport.decode_offload_bytes
+        )
+        logger.info(f"Parsed {table.num_rows} CSV rows for {function}")
+        return table
 
     def _parse_core_stock_response(
         self,
@@ -151,7 +229,7 @@ class CoreStock(BaseAPIHandler):
         elif function == "MARKET_STATUS":
             return data  # Return as-is for market status
         elif function == "REALTIME_BULK_QUOTES":
-            return data  # Return as-is for bulk quotes
+            return self._parse_bulk_quotes(data)
         elif function.startswith("TIME_SERIES"):
             return self._parse_time_series(
                 data,
@@ -200,6 +278,38 @@ class CoreStock(BaseAPIHandler):
             "change_percent": quote.get("10. change percent", ""),
         }
 
+    def _parse_bulk_quotes(self, data: dict[str, Any]) -> list[dict[str, Any]]:
+        """
+        대량 실시간 주가 응답을 파싱합니다
+
+        Args:
+            data: API 원시 응답 데이터 (``data`` 키에 심볼별 항목 리스트)
+
+        Returns:
+            심볼별 주가 정보 리스트 (``_parse_global_quote``와 같은 형식)
+        """
+        quotes = []
+        for item in data.get("data") or []:
+            symbol = str(item.get("symbol", "")).upper()
+            if not symbol:
+                continue
+            timestamp = str(item.get("timestamp", ""))
+            quotes.append(
+                {
+                    "symbol": symbol,
+                    "open": self._safe_float(item.get("open", 0)),
+                    "high": self._safe_float(item.get("high", 0)),
+                    "low": self._safe_float(item.get("low", 0)),
+                    "price": self._safe_float(item.get("close", 0)),
+                    "volume": self._safe_int(item.get("volume", 0)),
+                    "latest_trading_day": timestamp[:10],
+                    "previous_close": self._safe_float(item.get("previous_close", 0)),
+                    "change": self._safe_float(item.get("change", 0)),
+                    "change_percent": str(item.get("change_percent", "")),
+                }
+            )
+        return quotes
+
     def _parse_time_series(
         self,
         data: dict[str, Any],
@@ -388,6 +498,56 @@ class CoreStock(BaseAPIHandler):
         )
         return result if isinstance(result, list) else []
 
+    async def daily_adjusted_table(
+        self,
+        symbol: str,
+        outputsize: Optional[Literal["compact", "full"]] = "full",
+    ) -> "pa.Table":
+        """
+        일별 조정 시계열 데이터를 CSV로 받아 Arrow Table로 반환합니다
+
+        ``daily_adjusted`` 와 같은 데이터이며, 행 단위 dict 변환 없이 대량 적재할 때 사용합니다.
+
+        Returns:
+            date, open, high, low, close, adjusted_close, volume, dividend_amount,
+            split_coefficient 컬럼의 ``pyarrow.Table``
+
+        사용 예제:
+            >>> table = await client.stock.daily_adjusted_table("AAPL")
+            >>> print(f"조정된 일별 데이터: {table.num_rows}개")
+        """
+        return await self.time_series_table(
+            "TIME_SERIES_DAILY_ADJUSTED", symbol=symbol, outputsize=outputsize
+        )
+
+    async def intraday_table(
+        self,
+        symbol: str,
+        interval: Literal["1min", "5min", "15min", "30min", "60min"],
+        adjusted: Optional[bool] = None,
+        extended_hours: Optional[bool] = None,
+        month: Optional[str] = None,
+        outputsize: Optional[Literal["compact", "full"]] = "full",
+    ) -> "pa.Table":
+        """
+        인트라데이 시계열 데이터를 CSV로 받아 Arrow Table로 반환합니다
+
+        Args:
+            month: 특정월의 과거데이터 쿼리 (YYYY-MM 형식, None이면 최근 데이터)
+
+        Returns:
+            datetime, open, high, low, close, volume 컬럼의 ``pyarrow.Table``
+        """
+        return await self.time_series_table(
+            "TIME_SERIES_INTRADAY",
+            symbol=symbol,
+            interval=interval,
+            adjusted=adjusted,
+            extended_hours=extended_hours,
+            outputsize=outputsize,
+            month=month,
+        )
+
     async def weekly(
         self,
         symbol: str,
@@ -460,10 +620,36 @@ class CoreStock(BaseAPIHandler):
         result = await self._call_core_stock_api("GLOBAL_QUOTE", symbol=symbol)
         return result if isinstance(result, dict) else {}
 
-    async def bulk_quotes(self) -> dict[str, Any]:
-        """Get bulk real-time quotes"""
-        result = await self._call_core_stock_api("REALTIME_BULK_QUOTES")
-        return result if isinstance(result, dict) else {}
+    async def bulk_quotes(self, symbols: list[str]) -> list[dict[str, Any]]:
+        """
+        여러 심볼의 실시간 주가를 한 번에 가져옵니다 (Premium)
+
+        요청 한 번에 최대 ``BULK_QUOTES_MAX_SYMBOLS``개 심볼을 조회합니다.
+        응답에 없는 심볼(잘못된 심볼 등)은 결과에서 빠집니다.
+
+        Args:
+            symbols: 주식 심볼 리스트 (e.g., ["AAPL", "MSFT"])
+
+        Returns:
+            심볼별 주가 정보 리스트 (``quote``와 같은 형식)
+
+        Raises:
+            ValueError: 심볼이 없거나 최대 개수를 넘는 경우
+
+        사용 예제:
+            >>> quotes = await client.stock.bulk_quotes(["AAPL", "MSFT"])
+            >>> prices = {q["symbol"]: q["price"] for q in quotes}
+        """
+        if not symbols:
+            raise ValueError("symbols parameter is required for REALTIME_BULK_QUOTES")
+        if len(symbols) > BULK_QUOTES_MAX_SYMBOLS:
+            raise ValueError(
+                f"REALTIME_BULK_QUOTES accepts at most {BULK_QUOTES_MAX_SYMBOLS} symbols"
+            )
+        result = await self._call_core_stock_api(
+            "REALTIME_BULK_QUOTES", symbol=",".join(symbols)
+        )
+        return result if isinstance(result, list) else []
 
     async def search(self, keywords: str) -> dict[str, Any]:
         """
@@ -0,0 +1,158 @@
+"""
+Alpha Vantage HTTP 전송 계층
+
+- 커넥션 풀(keep-alive, 호스트별 연결 수 제한, DNS 캐시)과 명시적 타임아웃을 가진
+  ``aiohttp.ClientSession`` 생성
+- 응답 JSON 디코딩 (orjson 사용, 미설치 시 표준 json). 큰 응답(full outputsize 등)은
+  이벤트 루프 스레드를 막지 않도록 워커 스레드에서 디코딩
+- 엔드포인트(function)별 지연 시간/응답 크기/디코딩 시간 집계
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import aiohttp
+
+from app.core.config import settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson 미설치 환경
+    orjson = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TransportConfig:
+    """HTTP 커넥션 풀/타임아웃 설정"""
+
+    pool_size: int = 100
+    pool_per_host: int = 20
+    keepalive_seconds: float = 30.0
+    dns_cache_seconds: int = 300
+    connect_timeout: float = 10.0
+    read_timeout: float = 60.0
+    total_timeout: float = 120.0
+    decode_offload_bytes: int = 256 * 1024
+
+    @classmethod
+    def from_settings(cls) -> TransportConfig:
+        return cls(
+            pool_size=settings.ALPHA_VANTAGE_POOL_SIZE,
+            pool_per_host=settings.ALPHA_VANTAGE_POOL_PER_HOST,
+            keepalive_seconds=settings.ALPHA_VANTAGE_KEEPALIVE_SECONDS,
+            dns_cache_seconds=settings.ALPHA_VANTAGE_DNS_CACHE_SECONDS,
+            connect_timeout=settings.ALPHA_VANTAGE_CONNECT_TIMEOUT_SECONDS,
+            read_timeout=settings.ALPHA_VANTAGE_READ_TIMEOUT_SECONDS,
+            total_timeout=settings.ALPHA_VANTAGE_TOTAL_TIMEOUT_SECONDS,
+            decode_offload_bytes=settings.ALPHA_VANTAGE_DECODE_OFFLOAD_BYTES,
+        )
+
+
+def create_session(config: TransportConfig) -> aiohttp.ClientSession:
+    """풀/타임아웃이 설정된 세션 생성 (실행 중인 이벤트 루프에서 호출)"""
+    connector = aiohttp.TCPConnector(
+        limit=config.pool_size,
+        limit_per_host=config.pool_per_host,
+        keepalive_timeout=config.keepalive_seconds,
+        use_dns_cache=config.dns_cache_seconds > 0,
+        ttl_dns_cache=config.dns_cache_seconds or None,
+    )
+    timeout = aiohttp.ClientTimeout(
+        total=config.total_timeout,
+        connect=config.connect_timeout,
+        sock_read=config.read_timeout,
+    )
+    return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+
+def loads(raw: bytes) -> Any:
+    """JSON 디코딩 (orjson 우선)"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+async def decode_json(raw: bytes, offload_bytes: int) -> Any:
+    """응답 본문 디코딩 (``offload_bytes`` 이상이면 워커 스레드에서 실행)"""
+    if offload_bytes and len(raw) >= offload_bytes:
+        return await asyncio.to_thread(loads, raw)
+    return loads(raw)
+
+
+@dataclass
+class EndpointStats:
+    """엔드포인트별 요청 통계"""
+
+    requests: int = 0
+    errors: int = 0
+    total_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+    total_bytes: int = 0
+    max_bytes: int = 0
+    total_decode_ms: float = 0.0
+
+    def snapshot(self) -> dict[str, float | int]:
+        count = self.requests or 1
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "avg_latency_ms": round(self.total_latency_ms / count, 3),
+            "max_latency_ms": round(self.max_latency_ms, 3),
+            "avg_bytes": round(self.total_bytes / count),
+            "max_bytes": self.max_bytes,
+            "avg_decode_ms": round(self.total_decode_ms / count, 3),
+        }
+
+
+@dataclass
+class TransportMetrics:
+    """function 파라미터(엔드포인트)별 지연/크기 집계"""
+
+    _endpoints: dict[str, EndpointStats] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def record(
+        self,
+        endpoint: str,
+        latency_ms: float,
+        size: int = 0,
+        decode_ms: float = 0.0,
+        failed: bool = False,
+    ) -> None:
+        with self._lock:
+            stats = self._endpoints.setdefault(endpoint, EndpointStats())
+            stats.requests += 1
+            stats.errors += int(failed)
+            stats.total_latency_ms += latency_ms
+            stats.max_latency_ms = max(stats.max_latency_ms, latency_ms)
+            stats.total_bytes += size
+            stats.max_bytes = max(stats.max_bytes, size)
+            stats.total_decode_ms += decode_ms
+
+    def snapshot(self) -> dict[str, dict[str, float | int]]:
+        with self._lock:
+            return {
+                name: stats.snapshot()
+                for name, stats in sorted(self._endpoints.items())
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+
+# 프로세스 전역 전송 통계 (클라이언트 인스턴스 간 공유)
+transport_metrics = TransportMetrics()
+
+
+def elapsed_ms(started: float) -> float:
+    return (time.perf_counter() - started) * 1000
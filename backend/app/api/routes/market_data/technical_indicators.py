@@ -6,8 +6,10 @@ Technical Indicator API Routes
 import logging
 from typing import Literal
 from fastapi import APIRouter, HTTPException, Query, Path
+from fastapi.responses import StreamingResponse
 
 from app.schemas.market_data.technical_indicator import (
+    BatchIndicatorsRequest,
     TechnicalIndicatorResponse,
     IndicatorListResponse,
 )
@@ -54,6 +56,48 @@ async def get_indicator_list():
         raise HTTPException(status_code=500, detail=f"지표 목록 조회 실패: {str(e)}")
 
 
+@router.post(
+    "/batch",
+    response_class=StreamingResponse,
+    description=(
+        "여러 심볼 × 여러 지표를 저장된 OHLCV로 한 번에 계산합니다. "
+        "결과는 (시각, 심볼) 행 × 지표 출력 컬럼의 열 지향 데이터로, "
+        "심볼 묶음 단위 Arrow IPC 스트림 또는 NDJSON으로 스트리밍됩니다."
+    ),
+)
+async def compute_indicators_batch(request: BatchIndicatorsRequest):
+    """여러 심볼 × 여러 지표 일괄 계산"""
+    try:
+        ti_service = service_factory.get_technical_indicator_service()
+
+        logger.info(
+            f"지표 일괄 계산 요청: {len(request.symbols)} symbols, "
+            f"{len(request.indicators)} indicators, interval={request.interval}"
+        )
+
+        batch = await ti_service.compute_batch(
+            symbols=request.symbols,
+            specs=[spec.model_dump(exclude_none=True) for spec in request.indicators],
+            interval=request.interval,
+            start=request.start,
+            end=request.end,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"지표 일괄 계산 실패: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"지표 일괄 계산 실패: {str(e)}")
+
+    if request.format == "ndjson":
+        return StreamingResponse(
+            batch.iter_ndjson(request.limit), media_type="application/x-ndjson"
+        )
+    return StreamingResponse(
+        batch.iter_ipc_stream(request.limit),
+        media_type="application/vnd.apache.arrow.stream",
+    )
+
+
 @router.get(
     "/{symbol}/sma",
     response_model=TechnicalIndicatorResponse,
@@ -4,7 +4,6 @@ ML Model Training API - Phase 3.2 ML Integration
 Endpoints for training, evaluating, and managing ML models.
 """
 
-import asyncio
 import logging
 from pathlib import Path
 
@@ -25,6 +24,38 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+# ==================== DuckDB Helpers ====================
+
+
+def _load_training_prices(
+    db_manager: DatabaseManager, symbol: str, limit: int
+) -> pd.DataFrame:
+    """Load the most recent daily bars for a symbol (runs on a DuckDB reader thread)."""
+    query = """
+        SELECT date, open, high, low, close, volume
+        FROM daily_prices
+        WHERE symbol = ?
+        ORDER BY date DESC
+        LIMIT ?
+    """
+    return db_manager.thread_cursor().execute(query, [symbol, limit]).fetch_df()
+
+
+def _count_symbol_rows(
+    db_manager: DatabaseManager, symbols: list[str]
+) -> dict[str, int]:
+    """Count daily_prices rows per symbol (runs on a DuckDB reader thread)."""
+    conn = db_manager.thread_cursor()
+    counts: dict[str, int] = {}
+    for symbol in symbols:
+        result = conn.execute(
+            "SELECT COUNT(*) as cnt FROM daily_prices WHERE symbol = ?",
+            [symbol],
+        ).fetchone()
+        counts[symbol] = int(result[0]) if result else 0
+    return counts
+
+
 # ==================== Request/Response Models ====================
 
 
@@ -111,21 +142,17 @@ async def _train_model_background(
             f"{lookback_days} days lookback"
         )
 
-        # 1. Load data from DuckDB
+        # 1. Load data from DuckDB (reader executor, off the event loop)
         db_manager = service_factory.get_database_manager()
-        conn = db_manager.duckdb_conn
 
         all_data = []
         for symbol in symbols:
-            query = """
-                SELECT date, open, high, low, close, volume
-                FROM daily_prices
-                WHERE symbol = ?
-                ORDER BY date DESC
-                LIMIT ?
-            """
-            df = await asyncio.to_thread(
-                conn.execute(query, [symbol, lookback_days + 50]).fetch_df
+            df = await db_manager.async_manager.run_read(
+                "ml_training_prices",
+                _load_training_prices,
+                db_manager,
+                symbol,
+                lookback_days + 50,
             )
 
             if not df.empty:
@@ -247,15 +274,12 @@ async def train_model(
     try:
         # Validate symbols exist in database
         db_manager: DatabaseManager = service_factory.get_database_manager()
-        conn = db_manager.duckdb_conn
+        row_counts = await db_manager.async_manager.run_read(
+            "ml_symbol_row_counts", _count_symbol_rows, db_manager, request.symbols
+        )
 
         for symbol in request.symbols:
-            result = conn.execute(
-                "SELECT COUNT(*) as cnt FROM daily_prices WHERE symbol = ?",
-                [symbol],
-            ).fetchone()
-
-            if result[0] == 0:  # type: ignore
+            if row_counts[symbol] == 0:
                 raise HTTPException(
                     status_code=404,
                     detail=f"No data found for symbol: {symbol}",
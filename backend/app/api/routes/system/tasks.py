@@ -25,6 +25,7 @@ class TaskResult(BaseModel):
     total: int = 0
     success: int = 0
     failed: int = 0
+    deferred: int = 0
     errors: list[str] = []
 
 
@@ -39,6 +40,7 @@ async def run_stock_delta_update(background_tasks: BackgroundTasks):
 
     - Daily: 최근 100개 데이터 (compact)
     - Weekly/Monthly: 전체 데이터 (full)
+    - 경과 시간 × 심볼 중요도 순으로 일일 예산 내에서 실행, 남은 항목은 deferred
     """
     try:
         logger.info("📡 Triggering stock delta update task...")
@@ -48,10 +50,11 @@ async def run_stock_delta_update(background_tasks: BackgroundTasks):
 
         return TaskResult(
             status="completed",
-            message=f"Delta update completed: {result['success']} success, {result['failed']} failed",
+            message=f"Delta update completed: {result['success']} success, {result['failed']} failed, {result['deferred']} deferred",
             total=result["total"],
             success=result["success"],
             failed=result["failed"],
+            deferred=result["deferred"],
             errors=result["errors"][:10],  # 최대 10개 에러만 반환
         )
 
@@ -82,10 +85,11 @@ async def run_stock_force_update(background_tasks: BackgroundTasks):
 
         return TaskResult(
             status="completed",
-            message=f"Forced full update completed: {result['success']} success, {result['failed']} failed",
-            total=result.get("total_symbols", 0),
+            message=f"Forced full update completed: {result['success']} success, {result['failed']} failed, {result['deferred']} deferred",
+            total=result["total"],
             success=result["success"],
             failed=result["failed"],
+            deferred=result["deferred"],
             errors=result["errors"][:10],  # 최대 10개 에러만 반환
         )
 
@@ -131,3 +135,104 @@ async def get_stock_update_status():
         raise HTTPException(
             status_code=500, detail=f"Failed to get update status: {str(e)}"
         )
+
+
+@router.post(
+    "/cache-maintenance",
+    description="DuckDB 캐시 만료/용량 정리를 즉시 실행합니다.",
+)
+async def run_cache_maintenance():
+    """
+    만료 행 삭제, data_type별 용량 한도 초과분 LRU 정리, CHECKPOINT 실행
+    """
+    try:
+        from app.services.service_factory import service_factory
+
+        maintenance = service_factory.get_database_manager().cache_maintenance
+        result = await maintenance.run()
+
+        return {
+            "status": "completed",
+            "expired_rows": result.expired_rows,
+            "evicted_rows": result.evicted_rows,
+            "evicted_bytes": result.evicted_bytes,
+            "access_updates": result.access_updates,
+            "checkpointed": result.checkpointed,
+            "duration_ms": round(result.duration_ms, 3),
+        }
+
+    except Exception as e:
+        logger.error(f"❌ Cache maintenance failed: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500, detail=f"Failed to run cache maintenance: {str(e)}"
+        )
+
+
+@router.get(
+    "/cache-maintenance/stats",
+    description="DuckDB 캐시 정리 누적 통계를 조회합니다.",
+)
+async def get_cache_maintenance_stats():
+    """
+    누적 만료/정리 행 수(data_type별), 회수 용량, 대기 중인 접근 시각 갱신 수
+    """
+    from app.services.service_factory import service_factory
+
+    maintenance = service_factory.get_database_manager().cache_maintenance
+    return {"status": "ok", **maintenance.get_stats()}
+
+
+@router.get(
+    "/alpha-vantage/rate-limit",
+    description="Alpha Vantage 요청 속도 제한기 상태와 우선순위별 대기 통계를 조회합니다.",
+)
+async def get_alpha_vantage_rate_limit():
+    """
+    남은 토큰, 큐 깊이, 일일 사용량, 우선순위별 대기 시간/거부 수
+    """
+    from app.alpha_vantage import get_rate_limiter
+
+    return {"status": "ok", **get_rate_limiter().get_metrics()}
+
+
+@router.get(
+    "/single-flight/stats",
+    description="동시 요청 병합(single-flight) 그룹별 실행/병합 횟수를 조회합니다.",
+)
+async def get_single_flight_stats():
+    """
+    그룹(alpha_vantage, market_data_cache, technical_indicators)별 실행 수, 병합된 호출 수, 오류 수
+    """
+    from app.core.single_flight import single_flight_stats
+
+    return {"status": "ok", "groups": single_flight_stats()}
+
+
+@router.get(
+    "/alpha-vantage/transport",
+    description="Alpha Vantage 엔드포인트(function)별 응답 지연/크기/디코딩 시간을 조회합니다.",
+)
+async def get_alpha_vantage_transport_metrics():
+    """
+    function별 요청 수, 오류 수, 평균/최대 지연(ms), 평균/최대 응답 크기, 평균 JSON 디코딩 시간
+    """
+    from app.alpha_vantage.transport import transport_metrics
+
+    return {"status": "ok", "endpoints": transport_metrics.snapshot()}
+
+
+@router.get(
+    "/indicator-cache/stats",
+    description="지표 결과 캐시(전략/피처/API 공유)의 지표별 적중률과 메모리/spill 사용량을 조회합니다.",
+)
+async def get_indicator_cache_stats():
+    """
+    지표 식별자(pandas.SMA, engine.RSI 등)별 메모리/spill 적중 수, 미스 수, spill 수, 적중률
+    """
+    from app.core.indicator_cache import indicator_cache
+
+    return {
+        "status": "ok",
+        **indicator_cache.usage(),
+        "indicators": indicator_cache.snapshot(),
+    }
@@ -53,7 +53,9 @@ async def health_check():
 
         # DuckDB 데이터 상태 확인
         duckdb_symbols = (
-            database_manager.get_available_symbols() if duckdb_connected else []
+            await database_manager.async_manager.get_available_symbols()
+            if duckdb_connected
+            else []
         )
 
         # MongoDB 백테스트 카운트
@@ -488,7 +490,7 @@ async def get_portfolio_history(
     """
     try:
         db_manager = service_factory.get_database_manager()
-        df = db_manager.get_portfolio_history(backtest_id)
+        df = await db_manager.async_manager.get_portfolio_history(backtest_id)
 
         if df is None or df.empty:
             raise HTTPException(
@@ -519,7 +521,7 @@ async def get_trades_history(
     """
     try:
         db_manager = service_factory.get_database_manager()
-        df = db_manager.get_trades_history(backtest_id)
+        df = await db_manager.async_manager.get_trades_history(backtest_id)
 
         if df is None or df.empty:
             raise HTTPException(
@@ -0,0 +1,68 @@
+"""
+캐시 적중 통계
+
+시장 데이터 캐시 계층(통합 캐시, 시계열 캐시, 지표 캐시, 일별 주가 커버리지)의
+적중/미스를 data_type별로 집계합니다. 프로세스 전역 카운터이며, 벤치마크나
+모니터링에서 ``cache_stats.snapshot()`` 으로 조회합니다.
+
+single-flight로 병합된 호출은 실제로 캐시를 조회한 호출만 집계됩니다
+(병합 수는 ``single_flight_stats`` 참고).
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+
+
+@dataclass
+class CacheCounter:
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def snapshot(self) -> dict[str, float | int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hit_ratio, 4),
+        }
+
+
+@dataclass
+class CacheStats:
+    """data_type별 캐시 적중/미스 카운터"""
+
+    _counters: dict[str, CacheCounter] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def record(self, data_type: str, hit: bool) -> None:
+        with self._lock:
+            counter = self._counters.setdefault(data_type, CacheCounter())
+            if hit:
+                counter.hits += 1
+            else:
+                counter.misses += 1
+
+    def total(self) -> CacheCounter:
+        with self._lock:
+            return CacheCounter(
+                hits=sum(c.hits for c in self._counters.values()),
+                misses=sum(c.misses for c in self._counters.values()),
+            )
+
+    def snapshot(self) -> dict[str, dict[str, float | int]]:
+        with self._lock:
+            return {name: c.snapshot() for name, c in sorted(self._counters.items())}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+
+
+# 프로세스 전역 캐시 통계
+cache_stats = CacheStats()
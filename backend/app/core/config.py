@@ -23,6 +23,110 @@ class Settings(CommonSettings):
 
     # DuckDB 파일 경로 - 환경변수에서 읽어옴, 기본값 설정
     DUCKDB_PATH: str = getenv("DUCKDB_PATH", "./app/data/quant.duckdb")
+    # DuckDB 읽기 전용 executor 스레드 수 (스레드별 커서 풀 크기)
+    DUCKDB_READER_THREADS: int = int(getenv("DUCKDB_READER_THREADS", "4"))
+    # 파티션 Parquet 가격 저장소 경로 / upsert 시 자동 동기화 여부 (변경된 연도 파티션만)
+    PRICE_STORE_PATH: str = getenv("PRICE_STORE_PATH", "./app/data/price_store")
+    PRICE_STORE_AUTO_SYNC: bool = (
+        getenv("PRICE_STORE_AUTO_SYNC", "true").lower() == "true"
+    )
+    # DuckDB 캐시 페이로드 코덱: auto(data_type별 선택) | json | json+zstd | arrow+zstd
+    CACHE_PAYLOAD_CODEC: str = getenv("CACHE_PAYLOAD_CODEC", "auto")
+    # DuckDB 캐시 정리 주기(초, 0이면 비활성화) / 만료 행 유예 시간 / 키별 캐시 테이블 최대 보존 시간
+    CACHE_MAINTENANCE_INTERVAL_SECONDS: int = int(
+        getenv("CACHE_MAINTENANCE_INTERVAL_SECONDS", "900")
+    )
+    CACHE_EXPIRED_GRACE_HOURS: int = int(getenv("CACHE_EXPIRED_GRACE_HOURS", "24"))
+    CACHE_TABLE_MAX_AGE_HOURS: int = int(getenv("CACHE_TABLE_MAX_AGE_HOURS", "168"))
+    # data_type(또는 캐시 테이블)별 용량 한도: 기본값 + "crypto_intraday=512,news=64" 형식 재정의
+    CACHE_BUDGET_MB: int = int(getenv("CACHE_BUDGET_MB", "256"))
+    CACHE_BUDGETS_MB: str = getenv("CACHE_BUDGETS_MB", "")
+    # 통합 캐시 stale-while-revalidate 유예 시간: 기본값 + "news=0.5,fundamental=12" 형식 재정의
+    CACHE_SWR_GRACE_HOURS: float = float(getenv("CACHE_SWR_GRACE_HOURS", "6"))
+    CACHE_SWR_GRACE: str = getenv("CACHE_SWR_GRACE", "")
+    # 프로세스 내 L1 캐시: data_type별 항목(행) 수 예산 + "stock_intraday=500000" 형식 재정의
+    L1_CACHE_ENABLED: bool = getenv("L1_CACHE_ENABLED", "true").lower() == "true"
+    L1_CACHE_MAX_ITEMS: int = int(getenv("L1_CACHE_MAX_ITEMS", "200000"))
+    L1_CACHE_BUDGETS: str = getenv("L1_CACHE_BUDGETS", "")
+    L1_CACHE_TTL_SECONDS: float = float(getenv("L1_CACHE_TTL_SECONDS", "300"))
+    L1_CACHE_NEGATIVE_TTL_SECONDS: float = float(
+        getenv("L1_CACHE_NEGATIVE_TTL_SECONDS", "30")
+    )
+    # 관심종목/대시보드 공유 호가 캐시 (심볼별 TTL, 최대 심볼 수)
+    QUOTE_CACHE_TTL_SECONDS: float = float(getenv("QUOTE_CACHE_TTL_SECONDS", "60"))
+    QUOTE_CACHE_MAX_SYMBOLS: int = int(getenv("QUOTE_CACHE_MAX_SYMBOLS", "10000"))
+    # 기술적 지표 로컬 계산: 저장된 OHLCV 사용 여부 / 일봉 수정주가 보정 /
+    # Alpha Vantage 교차 검증 표본 비율(0이면 비활성화) / 교차 검증 허용 상대 오차
+    INDICATOR_LOCAL_ENABLED: bool = (
+        getenv("INDICATOR_LOCAL_ENABLED", "true").lower() == "true"
+    )
+    INDICATOR_ADJUST_PRICES: bool = (
+        getenv("INDICATOR_ADJUST_PRICES", "true").lower() == "true"
+    )
+    INDICATOR_CROSS_CHECK_SAMPLE: float = float(
+        getenv("INDICATOR_CROSS_CHECK_SAMPLE", "0")
+    )
+    INDICATOR_CROSS_CHECK_RTOL: float = float(
+        getenv("INDICATOR_CROSS_CHECK_RTOL", "0.001")
+    )
+    # 지표 결과 캐시 (입력 시계열 지문 기반, 전략/피처/API 공유): 사용 여부 /
+    # 메모리 원소(float) 수 예산 / 밀려난 항목 DuckDB spill 여부
+    INDICATOR_CACHE_ENABLED: bool = (
+        getenv("INDICATOR_CACHE_ENABLED", "true").lower() == "true"
+    )
+    INDICATOR_CACHE_MAX_ELEMENTS: int = int(
+        getenv("INDICATOR_CACHE_MAX_ELEMENTS", "5000000")
+    )
+    INDICATOR_CACHE_SPILL_ENABLED: bool = (
+        getenv("INDICATOR_CACHE_SPILL_ENABLED", "true").lower() == "true"
+    )
+    # Alpha Vantage API 주소 (오프라인 부하 테스트 시 로컬 리플레이 서버 주소로 교체)
+    ALPHA_VANTAGE_BASE_URL: str = getenv(
+        "ALPHA_VANTAGE_BASE_URL", "https://www.alphavantage.co/query"
+    )
+    # Alpha Vantage 요청 한도 (플랜별): 분당 요청 수 / 일일 요청 수(0이면 무제한) / 버스트 / 큐 대기 한도(초, 0이면 무제한)
+    ALPHA_VANTAGE_REQUESTS_PER_MINUTE: float = float(
+        getenv("ALPHA_VANTAGE_REQUESTS_PER_MINUTE", "75")
+    )
+    ALPHA_VANTAGE_REQUESTS_PER_DAY: int = int(
+        getenv("ALPHA_VANTAGE_REQUESTS_PER_DAY", "0")
+    )
+    ALPHA_VANTAGE_BURST: int = int(getenv("ALPHA_VANTAGE_BURST", "5"))
+    ALPHA_VANTAGE_QUEUE_TIMEOUT_SECONDS: float = float(
+        getenv("ALPHA_VANTAGE_QUEUE_TIMEOUT_SECONDS", "300")
+    )
+    # 커버리지 갱신 스케줄러: 실행 주기(초, 0이면 비활성화) / 동시 실행 수 /
+    # 일일 호출 예산(0이면 일일 한도 × 배분 비율, 둘 다 0이면 무제한) / 최근 백테스트 집계 기간(일)
+    REFRESH_SCHEDULER_INTERVAL_SECONDS: int = int(
+        getenv("REFRESH_SCHEDULER_INTERVAL_SECONDS", "1800")
+    )
+    REFRESH_CONCURRENCY: int = int(getenv("REFRESH_CONCURRENCY", "4"))
+    REFRESH_DAILY_BUDGET: int = int(getenv("REFRESH_DAILY_BUDGET", "0"))
+    REFRESH_QUOTA_SHARE: float = float(getenv("REFRESH_QUOTA_SHARE", "0.5"))
+    REFRESH_BACKTEST_LOOKBACK_DAYS: int = int(
+        getenv("REFRESH_BACKTEST_LOOKBACK_DAYS", "14")
+    )
+    # Alpha Vantage HTTP 커넥션 풀 / DNS 캐시(초) / 타임아웃(초) / 워커 스레드 JSON 디코딩 기준(바이트)
+    ALPHA_VANTAGE_POOL_SIZE: int = int(getenv("ALPHA_VANTAGE_POOL_SIZE", "100"))
+    ALPHA_VANTAGE_POOL_PER_HOST: int = int(getenv("ALPHA_VANTAGE_POOL_PER_HOST", "20"))
+    ALPHA_VANTAGE_KEEPALIVE_SECONDS: float = float(
+        getenv("ALPHA_VANTAGE_KEEPALIVE_SECONDS", "30")
+    )
+    ALPHA_VANTAGE_DNS_CACHE_SECONDS: int = int(
+        getenv("ALPHA_VANTAGE_DNS_CACHE_SECONDS", "300")
+    )
+    ALPHA_VANTAGE_CONNECT_TIMEOUT_SECONDS: float = float(
+        getenv("ALPHA_VANTAGE_CONNECT_TIMEOUT_SECONDS", "10")
+    )
+    ALPHA_VANTAGE_READ_TIMEOUT_SECONDS: float = float(
+        getenv("ALPHA_VANTAGE_READ_TIMEOUT_SECONDS", "60")
+    )
+    ALPHA_VANTAGE_TOTAL_TIMEOUT_SECONDS: float = float(
+        getenv("ALPHA_VANTAGE_TOTAL_TIMEOUT_SECONDS", "120")
+    )
+    ALPHA_VANTAGE_DECODE_OFFLOAD_BYTES: int = int(
+        getenv("ALPHA_VANTAGE_DECODE_OFFLOAD_BYTES", "262144")
+    )
     DATA_QUALITY_WEBHOOK_URL: str | None = getenv("DATA_QUALITY_WEBHOOK_URL", None)
 
     # GenAI / RAG configuration
@@ -0,0 +1,342 @@
+"""
+지표 결과 캐시 (content-addressed)
+
+같은 입력 시계열에 같은 지표를 여러 곳(전략 ``TechnicalIndicators``, FeatureEngineer
+계산기, API 로컬 계산)에서 반복 계산하지 않도록 결과 배열을
+(입력 시계열 지문, 지표 식별자, 파라미터) 키로 공유합니다.
+
+- 지문: 입력 배열을 float64로 맞춘 값의 blake2b 해시. 인덱스/심볼/호출 위치와 무관하게
+  값이 같으면 같은 키이며, 결과는 위치 기준 배열이라 호출자가 자신의 인덱스를 붙입니다.
+- 지표 식별자는 구현 단위로 구분합니다 (예: ``pandas.EMA`` 의 adjust 여부,
+  ``pandas.RSI`` 단순평균 vs ``engine.RSI`` Wilder). 수치가 다른 구현끼리는 공유하지 않습니다.
+- 메모리 LRU (원소 수 예산) → 밀려난 항목은 DuckDB ``indicator_result_cache`` 로 spill하고,
+  메모리 미스 시 spill 저장소에서 복원합니다.
+- 지표 식별자별 적중 통계 (memory_hits / spill_hits / misses / spills)
+
+입력이 같으면 결과도 같으므로 TTL이 없고, 가격이 바뀌면 지문이 달라져 미스가 납니다.
+spill 테이블은 캐시 정리기의 키별 캐시 테이블 규칙(최대 보존 시간/용량 한도)으로 정리됩니다.
+
+사용 예제:
+    >>> outputs = indicator_cache.get_or_compute(
+    ...     "pandas.SMA", [close], {"window": 20},
+    ...     lambda: {"value": close.rolling(20).mean().to_numpy()},
+    ... )
+    >>> indicator_cache.snapshot()["pandas.SMA"]["hit_ratio"]
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+import numpy as np
+import pandas as pd
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+Outputs = dict[str, np.ndarray]
+
+
+class SpillStore(Protocol):
+    """spill 저장소 (DatabaseManager가 구현)"""
+
+    def load_indicator_result(self, key: str) -> bytes | None:
+        ...
+
+    def spill_indicator_results(self, rows: list[tuple[str, str, bytes]]) -> None:
+        ...
+
+    def indicator_result_keys(self) -> list[str]:
+        ...
+
+
+@dataclass
+class IndicatorCacheCounter:
+    memory_hits: int = 0
+    spill_hits: int = 0
+    misses: int = 0
+    spills: int = 0
+    uncacheable: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        hits = self.memory_hits + self.spill_hits
+        total = hits + self.misses
+        return hits / total if total else 0.0
+
+    def snapshot(self) -> dict[str, float | int]:
+        return {**self.__dict__, "hit_ratio": round(self.hit_ratio, 4)}
+
+
+@dataclass
+class _Entry:
+    indicator: str
+    outputs: Outputs
+    size: int
+
+
+class IndicatorCache:
+    """원소 수 예산을 가진 LRU 지표 결과 캐시 + DuckDB spill
+
+    Args:
+        max_elements: 메모리에 보관할 결과 원소(float) 수 합계 상한
+        enabled: False면 항상 계산 (저장하지 않음)
+        spill_enabled: False면 밀려난 항목을 버림
+    """
+
+    def __init__(
+        self,
+        max_elements: int = 5_000_000,
+        enabled: bool = True,
+        spill_enabled: bool = True,
+    ):
+        self.max_elements = max_elements
+        self.enabled = enabled
+        self.spill_enabled = spill_enabled
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._size = 0
+        self._counters: dict[str, IndicatorCacheCounter] = {}
+        self._store: SpillStore | None = None
+        # spill 저장소에 있는 키 (없는 키는 DuckDB 조회 생략)
+        self._spilled: set[str] = set()
+        # reader 스레드(API)와 이벤트 루프(전략/피처)에서 동시에 호출됨
+        self._lock = threading.Lock()
+
+    # ===== spill 저장소 =====
+
+    def attach_spill(self, store: SpillStore) -> bool:
+        """spill 저장소 연결 (이미 연결되어 있으면 무시). 저장된 키 목록을 불러옴"""
+        if not self.spill_enabled or self._store is not None:
+            return False
+        try:
+            keys = store.indicator_result_keys()
+        except Exception as e:
+            logger.warning(f"⚠️ 지표 결과 spill 저장소 연결 실패: {e}")
+            return False
+        with self._lock:
+            self._store = store
+            self._spilled = set(keys)
+        return True
+
+    def detach_spill(self, store: SpillStore | None = None) -> None:
+        """spill 저장소 연결 해제 (store를 지정하면 같은 저장소일 때만)"""
+        with self._lock:
+            if store is None or self._store is store:
+                self._store = None
+                self._spilled = set()
+
+    # ===== 조회/저장 =====
+
+    @staticmethod
+    def make_key(
+        indicator: str, inputs: Sequence[Any], params: Mapping[str, Any]
+    ) -> str | None:
+        """입력 값 지문 + 지표 + 파라미터 키 (float64로 변환할 수 없으면 None)"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(indicator.encode())
+        digest.update(json.dumps(params, sort_keys=True, default=str).encode())
+        for values in inputs:
+            try:
+                array = np.ascontiguousarray(np.asarray(values, dtype=np.float64))
+            except (TypeError, ValueError):
+                return None
+            digest.update(str(array.shape).encode())
+            digest.update(array.tobytes())
+        return f"{indicator}:{digest.hexdigest()}"
+
+    def get_or_compute(
+        self,
+        indicator: str,
+        inputs: Sequence[Any],
+        params: Mapping[str, Any],
+        compute: Callable[[], Mapping[str, Any]],
+    ) -> Outputs:
+        """캐시된 결과 반환, 없으면 계산 후 저장
+
+        Args:
+            indicator: 구현 단위 지표 식별자 (예: ``pandas.SMA``, ``engine.RSI``)
+            inputs: 계산에 쓰는 입력 시계열 (값만 지문에 사용)
+            params: 결과에 영향을 주는 파라미터
+            compute: 출력 이름 → 배열을 반환하는 계산 함수
+
+        Returns:
+            출력 이름 → float64 배열 (호출자 소유 복사본)
+        """
+        key = self.make_key(indicator, inputs, params) if self.enabled else None
+        if key is None:
+            if self.enabled:
+                self._record(indicator, "uncacheable")
+            return _as_outputs(compute())
+
+        cached = self._get(indicator, key)
+        if cached is not None:
+            return {name: values.copy() for name, values in cached.items()}
+
+        outputs = _as_outputs(compute())
+        self._put(indicator, key, {n: v.copy() for n, v in outputs.items()})
+        return outputs
+
+    def _get(self, indicator: str, key: str) -> Outputs | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._count(indicator, "memory_hits")
+                return entry.outputs
+            store = self._store if key in self._spilled else None
+
+        payload = None
+        if store is not None:
+            try:
+                payload = store.load_indicator_result(key)
+            except Exception as e:
+                logger.warning(f"⚠️ 지표 결과 spill 조회 실패 ({indicator}): {e}")
+
+        if payload is None:
+            with self._lock:
+                self._spilled.discard(key)
+                self._count(indicator, "misses")
+            return None
+
+        outputs = _decode(payload)
+        with self._lock:
+            self._count(indicator, "spill_hits")
+        self._put(indicator, key, outputs)
+        return outputs
+
+    def _put(self, indicator: str, key: str, outputs: Outputs) -> None:
+        for values in outputs.values():
+            values.flags.writeable = False
+        entry = _Entry(indicator, outputs, sum(v.size for v in outputs.values()))
+        if entry.size > self.max_elements:
+            return
+
+        evicted: list[tuple[str, _Entry]] = []
+        with self._lock:
+            if key in self._entries:
+                self._size -= self._entries.pop(key).size
+            self._entries[key] = entry
+            self._size += entry.size
+            while self._size > self.max_elements:
+                old_key, old = self._entries.popitem(last=False)
+                self._size -= old.size
+                evicted.append((old_key, old))
+            store = self._store
+
+        if store is None or not evicted:
+            return
+        rows = [
+            (old_key, old.indicator, _encode(old.outputs))
+            for old_key, old in evicted
+            if old_key not in self._spilled
+        ]
+        if not rows:
+            return
+        try:
+            store.spill_indicator_results(rows)
+        except Exception as e:
+            logger.warning(f"⚠️ 지표 결과 spill 실패: {e}")
+            return
+        with self._lock:
+            for old_key, old_indicator, _ in rows:
+                self._spilled.add(old_key)
+                self._count(old_indicator, "spills")
+
+    # ===== 통계 =====
+
+    def _count(self, indicator: str, name: str) -> None:
+        """카운터 증가 (lock 보유 상태에서 호출)"""
+        counter = self._counters.setdefault(indicator, IndicatorCacheCounter())
+        setattr(counter, name, getattr(counter, name) + 1)
+
+    def _record(self, indicator: str, name: str) -> None:
+        with self._lock:
+            self._count(indicator, name)
+
+    def snapshot(self) -> dict[str, dict[str, float | int]]:
+        """지표 식별자별 적중 통계 + 메모리 항목 수"""
+        with self._lock:
+            entries: dict[str, int] = {}
+            for entry in self._entries.values():
+                entries[entry.indicator] = entries.get(entry.indicator, 0) + 1
+            return {
+                name: {**counter.snapshot(), "entries": entries.get(name, 0)}
+                for name, counter in sorted(self._counters.items())
+            }
+
+    def usage(self) -> dict[str, int | bool]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "elements": self._size,
+                "max_elements": self.max_elements,
+                "spilled_keys": len(self._spilled),
+                "spill_attached": self._store is not None,
+            }
+
+    def clear(self) -> None:
+        """메모리 항목과 카운터 초기화 (spill 저장소 연결은 유지)"""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self._counters.clear()
+
+
+def _as_outputs(outputs: Mapping[str, Any]) -> Outputs:
+    return {
+        name: np.asarray(values, dtype=np.float64) for name, values in outputs.items()
+    }
+
+
+def _encode(outputs: Outputs) -> bytes:
+    buffer = io.BytesIO()
+    np.savez(buffer, **outputs)
+    return buffer.getvalue()
+
+
+def _decode(payload: bytes) -> Outputs:
+    with np.load(io.BytesIO(payload), allow_pickle=False) as data:
+        return {name: data[name] for name in data.files}
+
+
+def cached_series(
+    indicator: str,
+    data: pd.Series,
+    params: Mapping[str, Any],
+    compute: Callable[[], Mapping[str, pd.Series]],
+) -> dict[str, pd.Series]:
+    """pandas 계산 결과를 캐시하고 입력 인덱스/이름을 다시 붙여 반환
+
+    Args:
+        indicator: 구현 단위 지표 식별자 (예: ``pandas.SMA``)
+        data: 입력 시계열 (값만 지문에 사용)
+        params: 결과에 영향을 주는 파라미터
+        compute: 출력 이름 → 입력과 같은 길이의 Series를 반환하는 계산 함수
+    """
+    outputs = indicator_cache.get_or_compute(
+        indicator,
+        [data],
+        params,
+        lambda: {name: s.to_numpy(dtype=np.float64) for name, s in compute().items()},
+    )
+    return {
+        name: pd.Series(values, index=data.index, name=data.name)
+        for name, values in outputs.items()
+    }
+
+
+# 프로세스 전역 지표 결과 캐시
+indicator_cache = IndicatorCache(
+    max_elements=settings.INDICATOR_CACHE_MAX_ELEMENTS,
+    enabled=settings.INDICATOR_CACHE_ENABLED,
+    spill_enabled=settings.INDICATOR_CACHE_SPILL_ENABLED,
+)
@@ -0,0 +1,265 @@
+"""
+프로세스 내 L1 캐시
+
+DuckDB/MongoDB 캐시 앞단에서 변환이 끝난 결과(모델 리스트, DataFrame 등)를
+그대로 보관합니다. 적중 시 DuckDB 조회, JSON 파싱, Pydantic 모델 생성을 모두
+건너뜁니다.
+
+- data_type별 LRU + 항목 수 예산 (리스트/프레임은 행 수, 그 외는 1로 계산)
+- 항목별 TTL (상한 ``L1_CACHE_TTL_SECONDS``)
+- "데이터 없음" 결과의 negative caching (``L1_CACHE_NEGATIVE_TTL_SECONDS``)
+- 쓰기 경로에서 호출하는 ``invalidate`` 훅 (data_type / cache_key / symbol 기준)
+
+리스트는 얕은 복사본을 반환하므로 리스트 자체를 수정해도 캐시에 영향이 없지만,
+내부 모델 객체는 호출자 간에 공유됩니다.
+
+사용 예제:
+    >>> hit, value = l1_cache.get("stock_daily", ("AAPL",))
+    >>> if not hit:
+    ...     value = await load()
+    ...     l1_cache.set("stock_daily", ("AAPL",), value, ttl_seconds=3600, symbol="AAPL")
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def parse_item_budgets(spec: str) -> dict[str, int]:
+    """``"stock_intraday=500000,news=2000"`` → ``{data_type: 항목 수}``"""
+    budgets: dict[str, int] = {}
+    for entry in spec.split(","):
+        if not entry.strip():
+            continue
+        name, _, value = entry.partition("=")
+        try:
+            budgets[name.strip()] = int(value)
+        except ValueError:
+            logger.warning(f"⚠️ 잘못된 L1 캐시 예산 설정 무시: {entry}")
+    return budgets
+
+
+def _weight(value: Any) -> int:
+    """예산 계산용 크기 (행 수, 최소 1)"""
+    if value is None or isinstance(value, (str, bytes, dict)):
+        return 1
+    try:
+        return max(1, len(value))
+    except TypeError:
+        return 1
+
+
+def _is_empty(value: Any) -> bool:
+    if value is None:
+        return True
+    try:
+        return len(value) == 0
+    except TypeError:
+        return False
+
+
+@dataclass
+class _Entry:
+    value: Any
+    expires_at: float
+    weight: int
+    cache_key: str | None
+    symbol: str | None
+
+
+@dataclass
+class L1Counter:
+    hits: int = 0
+    negative_hits: int = 0
+    misses: int = 0
+    sets: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    def snapshot(self) -> dict[str, int]:
+        return dict(self.__dict__)
+
+
+@dataclass
+class _Partition:
+    budget: int
+    entries: OrderedDict[Hashable, _Entry] = field(default_factory=OrderedDict)
+    weight: int = 0
+    counter: L1Counter = field(default_factory=L1Counter)
+
+
+class L1Cache:
+    """data_type별 예산을 가진 TTL + LRU 메모리 캐시
+
+    Args:
+        default_budget: data_type별 기본 항목 수 예산
+        budgets: data_type별 예산 재정의
+        max_ttl_seconds: 항목 TTL 상한
+        negative_ttl_seconds: "데이터 없음" 항목 TTL
+        enabled: False면 항상 미스 (저장하지 않음)
+    """
+
+    def __init__(
+        self,
+        default_budget: int = 200_000,
+        budgets: dict[str, int] | None = None,
+        max_ttl_seconds: float = 300.0,
+        negative_ttl_seconds: float = 30.0,
+        enabled: bool = True,
+    ):
+        self.default_budget = default_budget
+        self.budgets = dict(budgets or {})
+        self.max_ttl_seconds = max_ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.enabled = enabled
+        self._partitions: dict[str, _Partition] = {}
+        # DuckDB 쓰기 훅은 writer 스레드에서 호출됨
+        self._lock = threading.Lock()
+
+    def _partition(self, data_type: str) -> _Partition:
+        partition = self._partitions.get(data_type)
+        if partition is None:
+            budget = self.budgets.get(data_type, self.default_budget)
+            partition = self._partitions[data_type] = _Partition(budget=budget)
+        return partition
+
+    def get(self, data_type: str, key: Hashable) -> tuple[bool, Any]:
+        """(적중 여부, 값) 반환. negative 항목 적중 시 값은 저장된 빈 결과"""
+        if not self.enabled:
+            return False, None
+        with self._lock:
+            partition = self._partition(data_type)
+            entry = partition.entries.get(key)
+            if entry is None:
+                partition.counter.misses += 1
+                return False, None
+            if entry.expires_at <= time.monotonic():
+                self._remove(partition, key)
+                partition.counter.expirations += 1
+                partition.counter.misses += 1
+                return False, None
+
+            partition.entries.move_to_end(key)
+            if _is_empty(entry.value):
+                partition.counter.negative_hits += 1
+            else:
+                partition.counter.hits += 1
+            value = entry.value
+        return True, list(value) if isinstance(value, list) else value
+
+    def set(
+        self,
+        data_type: str,
+        key: Hashable,
+        value: Any,
+        ttl_seconds: float | None = None,
+        cache_key: str | None = None,
+        symbol: str | None = None,
+    ) -> None:
+        """값 저장. 빈 값은 negative 항목으로 ``negative_ttl_seconds`` 동안 보관"""
+        if not self.enabled:
+            return
+        if _is_empty(value):
+            ttl = self.negative_ttl_seconds
+        else:
+            ttl = min(ttl_seconds or self.max_ttl_seconds, self.max_ttl_seconds)
+        if ttl <= 0:
+            return
+
+        stored = list(value) if isinstance(value, list) else value
+        entry = _Entry(
+            value=stored,
+            expires_at=time.monotonic() + ttl,
+            weight=_weight(stored),
+            cache_key=cache_key,
+            symbol=symbol,
+        )
+        with self._lock:
+            partition = self._partition(data_type)
+            if entry.weight > partition.budget:
+                return
+            if key in partition.entries:
+                self._remove(partition, key)
+            partition.entries[key] = entry
+            partition.weight += entry.weight
+            partition.counter.sets += 1
+
+            while partition.weight > partition.budget:
+                oldest = next(iter(partition.entries))
+                self._remove(partition, oldest)
+                partition.counter.evictions += 1
+
+    def invalidate(
+        self,
+        data_type: str | None = None,
+        cache_key: str | None = None,
+        symbol: str | None = None,
+    ) -> int:
+        """조건에 맞는 항목 삭제 (쓰기 경로 훅). 삭제된 항목 수 반환
+
+        인자를 모두 생략하면 전체를 비웁니다.
+        """
+        removed = 0
+        with self._lock:
+            if data_type is not None:
+                found = self._partitions.get(data_type)
+                partitions = [found] if found is not None else []
+            else:
+                partitions = list(self._partitions.values())
+
+            for partition in partitions:
+                stale = [
+                    key
+                    for key, entry in partition.entries.items()
+                    if (cache_key is None or entry.cache_key == cache_key)
+                    and (symbol is None or entry.symbol == symbol)
+                ]
+                for key in stale:
+                    self._remove(partition, key)
+                partition.counter.invalidations += len(stale)
+                removed += len(stale)
+        return removed
+
+    @staticmethod
+    def _remove(partition: _Partition, key: Hashable) -> None:
+        entry = partition.entries.pop(key)
+        partition.weight -= entry.weight
+
+    def snapshot(self) -> dict[str, dict[str, int]]:
+        """data_type별 카운터와 현재 항목 수/사용량"""
+        with self._lock:
+            return {
+                name: {
+                    **partition.counter.snapshot(),
+                    "entries": len(partition.entries),
+                    "weight": partition.weight,
+                    "budget": partition.budget,
+                }
+                for name, partition in sorted(self._partitions.items())
+            }
+
+    def clear(self) -> None:
+        """항목과 카운터 초기화"""
+        with self._lock:
+            self._partitions.clear()
+
+
+# 프로세스 전역 L1 캐시
+l1_cache = L1Cache(
+    default_budget=settings.L1_CACHE_MAX_ITEMS,
+    budgets=parse_item_budgets(settings.L1_CACHE_BUDGETS),
+    max_ttl_seconds=settings.L1_CACHE_TTL_SECONDS,
+    negative_ttl_seconds=settings.L1_CACHE_NEGATIVE_TTL_SECONDS,
+    enabled=settings.L1_CACHE_ENABLED,
+)
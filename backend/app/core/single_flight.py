@@ -0,0 +1,108 @@
+"""
+Single-flight 요청 병합
+
+같은 키로 동시에 들어온 비동기 호출을 하나의 실행으로 합칩니다. 처음 호출이
+작업 태스크를 만들고, 실행 중에 들어온 호출은 같은 태스크의 결과(또는 예외)를
+공유합니다. 작업이 끝나면 키는 즉시 해제되므로 결과를 캐시하지는 않습니다.
+
+작업은 별도 태스크로 실행되므로 먼저 호출한 쪽이 취소되어도 나머지 대기자는
+결과를 받습니다. 공유된 결과 객체는 호출자 간에 같은 인스턴스입니다.
+
+사용 예제:
+    >>> flight = SingleFlight("alpha_vantage")
+    >>> data = await flight.do(("TIME_SERIES_DAILY", "AAPL"), lambda: fetch("AAPL"))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import logging
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+_registry: dict[str, SingleFlight] = {}
+
+
+class SingleFlight:
+    """키별 in-flight 작업 병합기
+
+    Args:
+        name: 통계 조회용 이름 (``single_flight_stats``)
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: dict[Hashable, asyncio.Task[Any]] = {}
+        self._stats = {"executions": 0, "coalesced": 0, "errors": 0}
+        _registry[name] = self
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """``key`` 로 실행 중인 작업이 있으면 그 결과를 기다리고, 없으면 ``func`` 실행
+
+        Raises:
+            작업에서 발생한 예외 (모든 대기자에게 전달)
+        """
+        task = self._calls.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(func())
+            self._calls[key] = task
+            self._stats["executions"] += 1
+            task.add_done_callback(lambda done, key=key: self._release(key, done))
+        else:
+            self._stats["coalesced"] += 1
+            logger.debug(f"single-flight 병합 ({self.name}): {key}")
+        return await asyncio.shield(task)
+
+    def _release(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # 대기자가 모두 취소된 경우에도 예외를 회수하여 경고 방지
+        if not task.cancelled() and task.exception() is not None:
+            self._stats["errors"] += 1
+
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    def get_stats(self) -> dict[str, int]:
+        return {**self._stats, "in_flight": self.in_flight()}
+
+
+def coalesce(flight: SingleFlight) -> Callable[[F], F]:
+    """비동기 메서드 데코레이터: 같은 인자(``self`` 제외)의 동시 호출을 병합
+
+    인자는 해시 가능해야 합니다. ``self`` 를 키에서 제외하므로 서비스 인스턴스가
+    달라도 같은 호출이면 병합됩니다.
+    """
+
+    def decorator(func: F) -> F:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = (
+                func.__qualname__,
+                *(
+                    (name, value)
+                    for name, value in bound.arguments.items()
+                    if name != "self"
+                ),
+            )
+            return await flight.do(key, lambda: func(*args, **kwargs))
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def single_flight_stats() -> dict[str, dict[str, int]]:
+    """등록된 모든 single-flight 그룹의 통계"""
+    return {name: flight.get_stats() for name, flight in _registry.items()}
@@ -13,6 +13,8 @@ from mysingle_quant import create_fastapi_app
 from mysingle_quant.core import get_mongodb_url
 from app.utils import seed_strategy_templates
 from app.core.init_test_user import ensure_dev_test_superuser
+from app.tasks.lease import TaskLease
+from app.tasks.refresh_scheduler import refresh_scheduler
 
 # 로깅 설정 초기화
 setup_logging()
@@ -29,7 +31,14 @@ async def lifespan(app: FastAPI):
         from app.services.service_factory import service_factory
 
         # Initialize DuckDB and pre-initialize services
-        service_factory.get_database_manager()
+        database_manager = service_factory.get_database_manager()
+        # 주기 작업은 워커마다 시작하되 리스를 보유한 워커 하나만 실제로 실행
+        database_manager.cache_maintenance.start(
+            lease=TaskLease.for_interval(
+                "cache_maintenance", settings.CACHE_MAINTENANCE_INTERVAL_SECONDS
+            )
+        )
+        refresh_scheduler.start()
         service_factory.get_market_data_service()
         service_factory.get_strategy_service()
         service_factory.get_backtest_service()
@@ -61,6 +70,7 @@ async def lifespan(app: FastAPI):
     try:
         from app.services.service_factory import service_factory
 
+        await refresh_scheduler.stop()
         await service_factory.cleanup()
     except Exception as e:
         logger.error(f"❌ Shutdown error: {e}")
@@ -10,6 +10,8 @@ from .market_data import (
     MonthlyPrice,
     IntradayPrice,
     StockDataCoverage,
+    CoverageRefreshCheckpoint,
+    BackgroundTaskLease,
     MarketRegime,
     MarketData,
     # Crypto data
@@ -88,6 +90,8 @@ collections = [
     MonthlyPrice,
     IntradayPrice,
     StockDataCoverage,
+    CoverageRefreshCheckpoint,
+    BackgroundTaskLease,
     MarketData,
     # 시장 데이터 - 암호화폐
     CryptoExchangeRate,
@@ -170,6 +174,8 @@ __all__ = [
     "MonthlyPrice",
     "IntradayPrice",
     "StockDataCoverage",
+    "CoverageRefreshCheckpoint",
+    "BackgroundTaskLease",
     "MarketData",
     "MarketRegime",
     # Monitoring
@@ -9,6 +9,8 @@ from .stock import (
     WeeklyPrice,
     MonthlyPrice,
     StockDataCoverage,
+    CoverageRefreshCheckpoint,
+    BackgroundTaskLease,
 )
 from .crypto import (
     CryptoExchangeRate,
@@ -58,6 +60,8 @@ __all__ = [
     "MonthlyPrice",
     "IntradayPrice",
     "StockDataCoverage",
+    "CoverageRefreshCheckpoint",
+    "BackgroundTaskLease",
     # Crypto models
     "CryptoExchangeRate",
     "CryptoIntradayPrice",
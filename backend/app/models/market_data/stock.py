@@ -3,9 +3,11 @@ Stock-related data models
 주식 관련 데이터 모델들
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Optional
+from beanie import Document
 from pydantic import Field, field_validator
+from pymongo import ASCENDING, IndexModel
 from decimal import Decimal, InvalidOperation
 
 from .base import BaseMarketDataDocument, DataQualityMixin
@@ -113,7 +115,11 @@ class DailyPrice(BaseMarketDataDocument, DataQualityMixin):
     class Settings:
         name = "stock_price_daily"
         indexes = [
-            [("symbol", 1), ("date", 1)],  # 복합 인덱스 (고유성 보장)
+            IndexModel(
+                [("symbol", ASCENDING), ("date", ASCENDING)],
+                unique=True,
+                name="symbol_date_unique",
+            ),  # bulk upsert 키
             "symbol",
             "date",
             "volume",
@@ -208,7 +214,11 @@ class WeeklyPrice(BaseMarketDataDocument, DataQualityMixin):
     class Settings:
         name = "stock_price_weekly"
         indexes = [
-            [("symbol", 1), ("date", 1)],  # 복합 인덱스 (고유성 보장)
+            IndexModel(
+                [("symbol", ASCENDING), ("date", ASCENDING)],
+                unique=True,
+                name="symbol_date_unique",
+            ),  # bulk upsert 키
             "symbol",
             "date",
             "volume",
@@ -278,7 +288,11 @@ class MonthlyPrice(BaseMarketDataDocument, DataQualityMixin):
     class Settings:
         name = "stock_price_monthly"
         indexes = [
-            [("symbol", 1), ("date", 1)],  # 복합 인덱스 (고유성 보장)
+            IndexModel(
+                [("symbol", ASCENDING), ("date", ASCENDING)],
+                unique=True,
+                name="symbol_date_unique",
+            ),  # bulk upsert 키
             "symbol",
             "date",
             "volume",
@@ -351,3 +365,42 @@ class StockDataCoverage(BaseMarketDataDocument):
             "last_date",
             "is_active",
         ]
+
+
+class CoverageRefreshCheckpoint(Document):
+    """커버리지 갱신 스케줄러 진행 상태 (작업별 단일 문서)
+
+    재시작 시 남은 계획(pending)과 당일 API 사용량(calls_used)부터 이어서 실행합니다.
+    """
+
+    job: str = Field(..., description="작업 이름")
+    day: str = Field(..., description="사용량 집계 기준일 (UTC, YYYY-MM-DD)")
+    calls_used: int = Field(default=0, description="당일 사용한 API 호출 수", ge=0)
+    pending: List[str] = Field(
+        default_factory=list, description="남은 계획 (SYMBOL:data_type, 실행 순서)"
+    )
+    completed: int = Field(default=0, description="당일 완료 항목 수", ge=0)
+    failed: int = Field(default=0, description="당일 실패 항목 수", ge=0)
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc), description="수정 시간"
+    )
+
+    class Settings:
+        name = "coverage_refresh_checkpoints"
+        indexes = [IndexModel([("job", ASCENDING)], unique=True, name="job_unique")]
+
+
+class BackgroundTaskLease(Document):
+    """주기 작업 리스 (작업별 단일 문서)
+
+    여러 워커 프로세스 중 리스를 보유한 프로세스만 주기 작업을 실행합니다.
+    보유자가 갱신하지 않고 expires_at이 지나면 다른 프로세스가 가져갑니다.
+    """
+
+    name: str = Field(..., description="작업 이름")
+    owner: str = Field(..., description="보유 프로세스 (host:pid:token)")
+    expires_at: datetime = Field(..., description="리스 만료 시각 (UTC)")
+
+    class Settings:
+        name = "background_task_leases"
+        indexes = [IndexModel([("name", ASCENDING)], unique=True, name="name_unique")]
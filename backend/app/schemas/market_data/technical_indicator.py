@@ -5,7 +5,7 @@ Technical Indicator API schemas
 
 from datetime import datetime
 from typing import Optional, List, Dict, Any, Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from decimal import Decimal
 
 from .base import DataResponse, SymbolParams
@@ -113,6 +113,42 @@ class MultipleIndicatorsRequest(BaseModel):
     obv: Optional[bool] = Field(None, description="OBV 포함 여부")
 
 
+class BatchIndicatorSpec(BaseModel):
+    """일괄 계산 지표 명세 (지표 파라미터는 추가 필드로 전달)"""
+
+    model_config = ConfigDict(extra="allow")
+
+    indicator: str = Field(..., description="지표 타입 (SMA, EMA, RSI, MACD 등)")
+    name: Optional[str] = Field(
+        None, description="출력 컬럼 이름 (기본값: 지표(파라미터), 예: RSI(time_period=14))"
+    )
+
+
+class BatchIndicatorsRequest(BaseModel):
+    """여러 심볼 × 여러 지표 일괄 계산 요청"""
+
+    symbols: List[str] = Field(
+        ..., min_length=1, max_length=500, description="주식 심볼 목록"
+    )
+    indicators: List[BatchIndicatorSpec] = Field(
+        ...,
+        min_length=1,
+        max_length=20,
+        description='지표 명세 목록 (예: [{"indicator": "RSI", "time_period": 14}])',
+    )
+    interval: Literal["1min", "5min", "15min", "30min", "60min", "daily"] = Field(
+        "daily", description="시간 간격 (저장된 OHLCV가 있는 간격만 지원)"
+    )
+    start: Optional[datetime] = Field(None, description="출력 시작 시각")
+    end: Optional[datetime] = Field(None, description="출력 종료 시각")
+    limit: Optional[int] = Field(
+        None, ge=1, description="심볼별 최근 N개 봉만 반환 (None이면 전체 구간)"
+    )
+    format: Literal["arrow", "ndjson"] = Field(
+        "arrow", description="응답 형식 (Arrow IPC 스트림 또는 열 지향 NDJSON)"
+    )
+
+
 # Response Data Models
 class IndicatorDataPoint(BaseModel):
     """지표 데이터 포인트"""
@@ -0,0 +1,488 @@
+"""DuckDB 비동기 파사드
+
+DatabaseManager의 동기 메서드를 전용 executor(reader 풀 / 단일 writer lane)에서
+실행하여 이벤트 루프 스레드에서 DuckDB 호출이 일어나지 않도록 합니다.
+작업별 큐 대기 시간, 실행 지연, 큐 깊이를 집계합니다.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Literal, TypeVar
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    from app.services.database_manager import (
+        BulkUpsertResult,
+        DatabaseManager,
+        PricePanel,
+        UnifiedCacheEntry,
+    )
+    from app.services.price_store import DateLike
+    from app.services.timeseries_cache import SeriesMeta
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+Lane = Literal["read", "write"]
+
+
+@dataclass
+class OperationStats:
+    """작업별 실행 통계"""
+
+    calls: int = 0
+    errors: int = 0
+    total_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+    total_queue_wait_ms: float = 0.0
+    max_queue_wait_ms: float = 0.0
+
+    def record(self, queue_wait_ms: float, latency_ms: float, failed: bool) -> None:
+        self.calls += 1
+        if failed:
+            self.errors += 1
+        self.total_latency_ms += latency_ms
+        self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+        self.total_queue_wait_ms += queue_wait_ms
+        self.max_queue_wait_ms = max(self.max_queue_wait_ms, queue_wait_ms)
+
+    def snapshot(self) -> dict[str, float | int]:
+        calls = self.calls or 1
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "avg_latency_ms": round(self.total_latency_ms / calls, 3),
+            "max_latency_ms": round(self.max_latency_ms, 3),
+            "avg_queue_wait_ms": round(self.total_queue_wait_ms / calls, 3),
+            "max_queue_wait_ms": round(self.max_queue_wait_ms, 3),
+        }
+
+
+class AsyncDatabaseManager:
+    """DatabaseManager 비동기 파사드
+
+    읽기 작업은 DatabaseManager의 bounded reader executor에서, 쓰기 작업은 단일
+    writer lane에서 실행됩니다. 각 워커 스레드는 ``thread_cursor()`` 로 자신의
+    커서를 사용하므로 이벤트 루프와 DuckDB 연결 객체를 공유하지 않습니다.
+
+    사용 예제:
+        >>> adb = database_manager.async_manager
+        >>> df = await adb.get_daily_prices("AAPL", start_date="2024-01-01")
+        >>> adb.get_metrics()["queue_depth"]
+    """
+
+    def __init__(self, database_manager: DatabaseManager):
+        self._db = database_manager
+        self._lock = threading.Lock()
+        self._queue_depth: dict[str, int] = {"read": 0, "write": 0}
+        self._max_queue_depth: dict[str, int] = {"read": 0, "write": 0}
+        self._in_flight: dict[str, int] = {"read": 0, "write": 0}
+        self._stats: dict[str, OperationStats] = {}
+
+    @property
+    def database_manager(self) -> DatabaseManager:
+        """래핑된 동기 DatabaseManager"""
+        return self._db
+
+    # ===== executor 실행 / 메트릭 =====
+
+    async def _submit(
+        self,
+        lane: Lane,
+        operation: str,
+        func: Callable[..., T],
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        submitted_at = time.perf_counter()
+        state = {"started": False}
+
+        with self._lock:
+            self._queue_depth[lane] += 1
+            self._max_queue_depth[lane] = max(
+                self._max_queue_depth[lane], self._queue_depth[lane]
+            )
+
+        def _task() -> T:
+            started_at = time.perf_counter()
+            with self._lock:
+                state["started"] = True
+                self._queue_depth[lane] -= 1
+                self._in_flight[lane] += 1
+
+            failed = False
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                failed = True
+                raise
+            finally:
+                finished_at = time.perf_counter()
+                with self._lock:
+                    self._in_flight[lane] -= 1
+                    self._stats.setdefault(operation, OperationStats()).record(
+                        queue_wait_ms=(started_at - submitted_at) * 1000,
+                        latency_ms=(finished_at - started_at) * 1000,
+                        failed=failed,
+                    )
+
+        runner = self._db.run_read if lane == "read" else self._db.run_write
+        try:
+            return await runner(_task)
+        finally:
+            # 실행 전에 취소된 작업은 큐 깊이에서 제외
+            with self._lock:
+                if not state["started"]:
+                    self._queue_depth[lane] -= 1
+
+    async def run_read(
+        self, operation: str, func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        """임의의 읽기 작업을 reader executor에서 실행 (메트릭 집계 포함)
+
+        ``func`` 는 ``database_manager.thread_cursor()`` 로 커서를 얻어야 합니다.
+        """
+        return await self._submit("read", operation, func, *args, **kwargs)
+
+    async def run_write(
+        self, operation: str, func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        """임의의 쓰기 작업을 writer lane에서 실행 (메트릭 집계 포함)"""
+        return await self._submit("write", operation, func, *args, **kwargs)
+
+    def get_metrics(self) -> dict[str, Any]:
+        """큐 깊이와 작업별 지연 통계 반환"""
+        with self._lock:
+            return {
+                "queue_depth": dict(self._queue_depth),
+                "max_queue_depth": dict(self._max_queue_depth),
+                "in_flight": dict(self._in_flight),
+                "operations": {
+                    name: stats.snapshot() for name, stats in self._stats.items()
+                },
+            }
+
+    def reset_metrics(self) -> None:
+        """누적 통계 초기화 (현재 큐 깊이는 유지)"""
+        with self._lock:
+            self._max_queue_depth = dict(self._queue_depth)
+            self._stats.clear()
+
+    # ===== 연결 =====
+
+    async def connect(self) -> None:
+        await self.run_write("connect", self._db.connect)
+
+    # ===== 주가 데이터 =====
+
+    async def insert_stock_info(self, symbol: str, info: dict) -> None:
+        await self.run_write(
+            "insert_stock_info", self._db.insert_stock_info, symbol, info
+        )
+
+    async def insert_daily_prices(self, df: pd.DataFrame) -> int:
+        return await self.run_write(
+            "insert_daily_prices", self._db.insert_daily_prices, df
+        )
+
+    async def insert_intraday_prices(self, df: pd.DataFrame, interval_type: str) -> int:
+        return await self.run_write(
+            "insert_intraday_prices",
+            self._db.insert_intraday_prices,
+            df,
+            interval_type,
+        )
+
+    async def upsert_daily_prices(self, data: Any) -> BulkUpsertResult:
+        return await self.run_write(
+            "upsert_daily_prices", self._db.upsert_daily_prices, data
+        )
+
+    async def upsert_intraday_prices(
+        self, data: Any, interval_type: str
+    ) -> BulkUpsertResult:
+        return await self.run_write(
+            "upsert_intraday_prices",
+            self._db.upsert_intraday_prices,
+            data,
+            interval_type,
+        )
+
+    async def record_portfolio_forecast(self, **kwargs: Any) -> None:
+        await self.run_write(
+            "record_portfolio_forecast", self._db.record_portfolio_forecast, **kwargs
+        )
+
+    async def get_daily_prices(
+        self,
+        symbol: str,
+        start_date: str | None = None,
+        end_date: str | None = None,
+    ) -> pd.DataFrame:
+        return await self.run_read(
+            "get_daily_prices", self._db.get_daily_prices, symbol, start_date, end_date
+        )
+
+    async def get_available_symbols(self) -> list[str]:
+        return await self.run_read(
+            "get_available_symbols", self._db.get_available_symbols
+        )
+
+    async def get_data_range(self, symbol: str) -> tuple[str | None, str | None]:
+        return await self.run_read("get_data_range", self._db.get_data_range, symbol)
+
+    async def get_prices_arrow(
+        self,
+        symbols: list[str],
+        start: DateLike | None = None,
+        end: DateLike | None = None,
+        columns: list[str] | None = None,
+        interval: str = "daily",
+    ) -> pa.Table:
+        return await self.run_read(
+            "get_prices_arrow",
+            self._db.get_prices_arrow,
+            symbols,
+            start,
+            end,
+            columns,
+            interval,
+        )
+
+    async def get_price_panel(
+        self,
+        symbols: list[str],
+        start: DateLike | None = None,
+        end: DateLike | None = None,
+        field: str = "close",
+        **options: Any,
+    ) -> PricePanel:
+        return await self.run_read(
+            "get_price_panel",
+            self._db.get_price_panel,
+            symbols,
+            start,
+            end,
+            field,
+            **options,
+        )
+
+    async def get_price_panels(
+        self,
+        symbols: list[str],
+        start: DateLike | None = None,
+        end: DateLike | None = None,
+        fields: list[str] | tuple[str, ...] = ("close",),
+        **options: Any,
+    ) -> dict[str, PricePanel]:
+        return await self.run_read(
+            "get_price_panels",
+            self._db.get_price_panels,
+            symbols,
+            start,
+            end,
+            fields,
+            **options,
+        )
+
+    async def get_recent_prices(
+        self,
+        symbols: list[str],
+        bars: int,
+        fields: list[str] | tuple[str, ...] = ("close",),
+        interval: str = "daily",
+    ) -> dict[str, pd.DataFrame]:
+        return await self.run_read(
+            "get_recent_prices",
+            self._db.get_recent_prices,
+            symbols,
+            bars,
+            fields,
+            interval,
+        )
+
+    async def sync_price_store(
+        self, symbols: list[str] | None = None, interval: str = "daily"
+    ) -> int:
+        return await self.run_write(
+            "sync_price_store", self._db.sync_price_store, symbols, interval
+        )
+
+    # ===== 백테스트 결과 =====
+
+    async def save_backtest_result(self, result_data: dict) -> str:
+        return await self.run_write(
+            "save_backtest_result", self._db.save_backtest_result, result_data
+        )
+
+    async def save_portfolio_history(
+        self, backtest_id: str, portfolio_history: list[dict]
+    ) -> int:
+        return await self.run_write(
+            "save_portfolio_history",
+            self._db.save_portfolio_history,
+            backtest_id,
+            portfolio_history,
+        )
+
+    async def save_trades_history(self, backtest_id: str, trades: list[dict]) -> int:
+        return await self.run_write(
+            "save_trades_history", self._db.save_trades_history, backtest_id, trades
+        )
+
+    async def get_portfolio_history(self, backtest_id: str) -> pd.DataFrame | None:
+        return await self.run_read(
+            "get_portfolio_history", self._db.get_portfolio_history, backtest_id
+        )
+
+    async def get_trades_history(self, backtest_id: str) -> pd.DataFrame | None:
+        return await self.run_read(
+            "get_trades_history", self._db.get_trades_history, backtest_id
+        )
+
+    # ===== 캐시 =====
+
+    async def store_cache_data(
+        self, cache_key: str, data: list[dict], table_name: str = "cache_data"
+    ) -> bool:
+        return await self.run_write(
+            "store_cache_data",
+            self._db.store_cache_data,
+            cache_key,
+            data,
+            table_name,
+        )
+
+    async def get_cache_data(
+        self, cache_key: str, table_name: str = "cache_data", ttl_hours: int = 24
+    ) -> list[dict] | None:
+        return await self.run_read(
+            "get_cache_data",
+            self._db.get_cache_data,
+            cache_key,
+            table_name,
+            ttl_hours,
+        )
+
+    async def clear_cache(
+        self, cache_key: str | None = None, table_name: str = "cache_data"
+    ) -> bool:
+        return await self.run_write(
+            "clear_cache", self._db.clear_cache, cache_key, table_name
+        )
+
+    async def store_unified_cache(
+        self,
+        cache_key: str,
+        data: list[dict] | dict,
+        data_type: str,
+        symbol: str | None = None,
+        ttl_hours: int = 24,
+        metadata: dict | None = None,
+    ) -> bool:
+        return await self.run_write(
+            "store_unified_cache",
+            self._db.store_unified_cache,
+            cache_key,
+            data,
+            data_type,
+            symbol,
+            ttl_hours,
+            metadata,
+        )
+
+    async def get_unified_cache(
+        self,
+        cache_key: str,
+        data_type: str,
+        symbol: str | None = None,
+        ignore_ttl: bool = False,
+    ) -> list[dict] | None:
+        return await self.run_read(
+            "get_unified_cache",
+            self._db.get_unified_cache,
+            cache_key,
+            data_type,
+            symbol,
+            ignore_ttl,
+        )
+
+    async def get_unified_cache_entry(
+        self,
+        cache_key: str,
+        data_type: str,
+        symbol: str | None = None,
+        max_stale_hours: float = 0.0,
+    ) -> UnifiedCacheEntry | None:
+        return await self.run_read(
+            "get_unified_cache_entry",
+            self._db.get_unified_cache_entry,
+            cache_key,
+            data_type,
+            symbol,
+            max_stale_hours,
+        )
+
+    async def migrate_cache_payloads(self, table_name: str = "unified_cache") -> int:
+        return await self.run_write(
+            "migrate_cache_payloads", self._db.migrate_cache_payloads, table_name
+        )
+
+    # ===== 시계열 캐시 =====
+
+    async def get_series_meta(
+        self, data_type: str, series_key: str
+    ) -> SeriesMeta | None:
+        return await self.run_read(
+            "get_series_meta",
+            self._db.timeseries_cache.get_meta,
+            data_type,
+            series_key,
+        )
+
+    async def read_series(
+        self,
+        data_type: str,
+        series_key: str,
+        start: Any | None = None,
+        end: Any | None = None,
+        limit: int | None = None,
+        descending: bool = True,
+    ) -> list[dict[str, Any]]:
+        return await self.run_read(
+            "read_series",
+            self._db.timeseries_cache.read,
+            data_type,
+            series_key,
+            start,
+            end,
+            limit,
+            descending,
+        )
+
+    async def append_series(
+        self,
+        data_type: str,
+        series_key: str,
+        symbol: str | None,
+        records: list[Any],
+        ttl_hours: float = 24,
+        complete: bool = False,
+    ) -> int:
+        return await self.run_write(
+            "append_series",
+            self._db.timeseries_cache.append,
+            data_type,
+            series_key,
+            symbol,
+            records,
+            ttl_hours,
+            complete,
+        )
@@ -15,6 +15,8 @@ from tenacity import (
     before_sleep_log,
 )
 
+from app.alpha_vantage import RequestPriority, request_priority
+
 if TYPE_CHECKING:
     from app.services.market_data import MarketDataService
 
@@ -31,6 +33,7 @@ class DataCollector:
     - asyncio.gather를 통한 병렬 처리 (10x 성능 향상)
     - Retry 로직 (일시적 네트워크 오류 대응)
     - Circuit Breaker 적용 (장애 격리)
+    - 로컬 가격 저장소(DuckDB/MongoDB) 우선 조회, Coverage 공백만 외부 API로 채움
 
     원래 Phase 2에서는 순차 처리였으나, 성능을 위해 Phase 3.2 기능을 조기 도입
 
@@ -96,9 +99,10 @@ class DataCollector:
                 logger.error(f"Failed to fetch {symbol}: {e}")
                 return symbol, None
 
-        # 병렬 수집 (asyncio.gather)
-        tasks = [fetch_symbol_data(symbol) for symbol in symbols]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # 병렬 수집 (asyncio.gather), 공백 채우기용 외부 API 호출은 대화형 요청보다 낮은 우선순위
+        with request_priority(RequestPriority.BACKTEST):
+            tasks = [fetch_symbol_data(symbol) for symbol in symbols]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # 결과 딕셔너리 구성
         market_data = {}
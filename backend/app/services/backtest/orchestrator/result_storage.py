@@ -105,6 +105,7 @@ class ResultStorage:
         # DuckDB 고성능 저장 (Phase 3.2 선행 구현)
         # MongoDB는 메타데이터 저장에 적합하지만, 대용량 시계열 데이터는 DuckDB가 10-100배 빠름
         if self.database_manager:
+            async_db = self.database_manager.async_manager
             try:
                 # 1. 백테스트 결과 메타데이터 저장
                 result_data = {
@@ -121,7 +122,7 @@ class ResultStorage:
                     "max_drawdown": performance.max_drawdown,
                     "parameters": {},
                 }
-                backtest_id = self.database_manager.save_backtest_result(result_data)
+                backtest_id = await async_db.save_backtest_result(result_data)
 
                 # 2. 포트폴리오 히스토리 저장 (Phase 3.2 선행: DuckDB 컬럼형 저장으로 분석 성능 향상)
                 if portfolio_values:
@@ -139,7 +140,7 @@ class ResultStorage:
                             }
                         )
 
-                    self.database_manager.save_portfolio_history(
+                    await async_db.save_portfolio_history(
                         backtest_id, portfolio_history
                     )
 
@@ -160,7 +161,7 @@ class ResultStorage:
                             }
                         )
 
-                    self.database_manager.save_trades_history(backtest_id, trades_data)
+                    await async_db.save_trades_history(backtest_id, trades_data)
 
                 logger.info(
                     f"✅ DuckDB 저장 완료: {backtest_id} "
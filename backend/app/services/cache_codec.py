@@ -0,0 +1,179 @@
+"""DuckDB 캐시 페이로드 코덱
+
+캐시 테이블의 ``data_json`` TEXT 대신 ``payload`` BLOB + ``codec`` 컬럼에 압축된
+바이너리를 저장합니다. data_type별로 코덱을 선택합니다.
+
+- ``arrow+zstd``: 동일한 키를 가진 레코드 리스트(시계열)를 Arrow IPC 스트림으로
+  컬럼 단위 직렬화 (IPC 버퍼 zstd 압축). 조회 시 ``to_pylist()`` 한 번으로 복원됩니다.
+- ``json+zstd``: 중첩 구조 등 그 외 데이터. ``json.dumps`` 의 ``default`` 훅으로
+  직렬화 불가능한 값만 변환하므로 재귀 순회가 필요 없습니다.
+- ``json``: 기존처럼 ``data_json`` 에 텍스트로 저장 (``CACHE_PAYLOAD_CODEC=json`` 롤백용)
+
+``codec`` 컬럼이 NULL인 행은 코덱 도입 이전의 레거시 JSON 행입니다.
+
+두 바이너리 코덱 모두 기존 JSON 텍스트 경로(``json.dumps`` + ``json.loads``)와 같은
+값을 돌려줍니다 (datetime/date → ISO 문자열, Decimal → float, 그 외 객체 → str).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import struct
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Literal
+
+import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+Codec = Literal["json", "json+zstd", "arrow+zstd"]
+
+CODECS: tuple[str, ...] = ("json", "json+zstd", "arrow+zstd")
+
+# 컬럼형 직렬화가 유리한 시계열 data_type (unified_cache data_type / 캐시 테이블명)
+TABULAR_DATA_TYPES: frozenset[str] = frozenset(
+    {
+        "crypto_intraday",
+        "crypto_daily",
+        "crypto_weekly",
+        "crypto_monthly",
+        "stock_intraday",
+        "gdp",
+        "inflation",
+        "interest_rate",
+        "employment",
+        "market_data_cache",
+    }
+)
+
+# 행 수가 적으면 Arrow 스키마 오버헤드가 더 크므로 JSON 사용
+ARROW_MIN_ROWS = 16
+
+_ZSTD = "zstd"
+_SIZE_HEADER = struct.Struct("<Q")
+_PRIMITIVE_TYPES = (str, int, float, bool)
+
+
+def select_codec(data_type: str, preference: str = "auto") -> Codec:
+    """data_type과 설정값(``CACHE_PAYLOAD_CODEC``)으로 저장 코덱 결정"""
+    if preference in CODECS:
+        return preference  # type: ignore[return-value]
+    if preference != "auto":
+        logger.warning(f"⚠️ 알 수 없는 캐시 코덱 설정: {preference}, auto 사용")
+    return "arrow+zstd" if data_type in TABULAR_DATA_TYPES else "json+zstd"
+
+
+def encode_payload(data: list[Any], codec: Codec) -> tuple[Codec, str, bytes | None]:
+    """레코드 리스트를 ``(실제 코덱, data_json, payload)`` 로 인코딩
+
+    ``arrow+zstd`` 로 표현할 수 없는 데이터(키가 다른 레코드, 중첩 값, 혼합 타입,
+    소량 데이터)는 ``json+zstd`` 로 대체됩니다. ``json`` 은 기존처럼 ``data_json``
+    에 텍스트를 저장하고 payload는 None입니다.
+    """
+    records = [_to_record(item) for item in data]
+
+    if codec == "arrow+zstd" and len(records) >= ARROW_MIN_ROWS:
+        payload = _encode_arrow(records)
+        if payload is not None:
+            return "arrow+zstd", "", payload
+        codec = "json+zstd"
+
+    text = json.dumps(records, default=_json_default)
+    if codec == "json":
+        return "json", text, None
+
+    raw = text.encode("utf-8")
+    compressed = pa.compress(raw, codec=_ZSTD, asbytes=True)
+    return "json+zstd", "", _SIZE_HEADER.pack(len(raw)) + compressed
+
+
+def decode_payload(
+    codec: str | None, data_json: str | None, payload: bytes | None
+) -> list[Any]:
+    """저장된 행을 레코드 리스트로 복원 (``codec`` 이 NULL이면 레거시 JSON)"""
+    if not codec or codec == "json":
+        value = json.loads(data_json or "null")
+        return value if isinstance(value, list) else [value]
+    if payload is None:
+        raise ValueError(f"{codec} 행에 payload가 없습니다")
+
+    if codec == "arrow+zstd":
+        return pa.ipc.open_stream(payload).read_all().to_pylist()
+    if codec == "json+zstd":
+        (size,) = _SIZE_HEADER.unpack_from(payload)
+        raw = pa.decompress(
+            payload[_SIZE_HEADER.size :],
+            decompressed_size=size,
+            codec=_ZSTD,
+            asbytes=True,
+        )
+        return json.loads(raw)
+    raise ValueError(f"지원하지 않는 캐시 코덱: {codec}")
+
+
+def _to_record(item: Any) -> Any:
+    if isinstance(item, dict):
+        return item
+    if hasattr(item, "model_dump"):  # Pydantic 모델
+        return item.model_dump()
+    if hasattr(item, "dict"):  # Pydantic v1 스타일
+        return item.dict()
+    return item
+
+
+def _json_default(obj: Any) -> Any:
+    """``json.dumps`` 가 처리하지 못하는 값만 변환 (datetime → ISO, Decimal → float)"""
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    if hasattr(obj, "dict"):
+        return obj.dict()
+    return str(obj)
+
+
+def _scalar(value: Any) -> Any:
+    """Arrow 컬럼용 스칼라 변환 (JSON 경로와 같은 결과)"""
+    if value is None or type(value) in _PRIMITIVE_TYPES:
+        return value
+    if isinstance(value, (dict, list, tuple)) or hasattr(value, "model_dump"):
+        raise TypeError("중첩 값은 Arrow 코덱으로 저장하지 않음")
+    if isinstance(value, Enum) and isinstance(value, _PRIMITIVE_TYPES):
+        return value.value
+    if isinstance(value, _PRIMITIVE_TYPES):
+        return value
+    return _json_default(value)
+
+
+def _encode_arrow(records: list[Any]) -> bytes | None:
+    if not all(isinstance(record, dict) for record in records):
+        return None
+    keys = list(records[0])
+    if any(record.keys() != records[0].keys() for record in records):
+        return None
+
+    try:
+        arrays = []
+        for key in keys:
+            values = [record[key] for record in records]
+            if not all(v is None or type(v) in _PRIMITIVE_TYPES for v in values):
+                values = [_scalar(v) for v in values]
+            array = pa.array(values)
+            if pa.types.is_nested(array.type):
+                return None
+            arrays.append(array)
+        table = pa.Table.from_arrays(arrays, names=[str(key) for key in keys])
+
+        sink = pa.BufferOutputStream()
+        options = pa.ipc.IpcWriteOptions(compression=_ZSTD)
+        with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+    except (pa.ArrowException, TypeError, ValueError, OverflowError) as e:
+        logger.debug(f"Arrow 캐시 인코딩 불가, JSON 코덱 사용: {e}")
+        return None
@@ -0,0 +1,373 @@
+"""DuckDB 캐시 만료/용량 정리
+
+``unified_cache`` 와 키별 캐시 테이블(``market_data_cache`` 등)에 대해 주기적으로:
+
+1. HIT 시 메모리에 기록해 둔 접근 시각을 ``last_accessed_at`` 에 일괄 반영
+2. 만료 행 삭제 (``expires_at`` + 유예 시간 경과 / 키별 테이블은 최대 보존 시간 경과)
+3. data_type(키별 테이블은 테이블명)별 용량 한도를 넘으면 오래 쓰이지 않은 행부터 삭제 (LRU)
+4. 삭제가 있었으면 ``CHECKPOINT`` 로 WAL을 반영하고 빈 블록을 회수
+
+작업은 writer lane에서 실행되어 다른 쓰기와 직렬화됩니다. 주기 실행에 작업 리스를 넘기면
+여러 워커 프로세스 중 리스 보유자만 정리를 실행합니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+import duckdb
+
+from app.core.config import settings
+
+if TYPE_CHECKING:
+    from app.services.database_manager import DatabaseManager
+    from app.tasks.lease import TaskLease
+
+logger = logging.getLogger(__name__)
+
+_MB = 1024 * 1024
+
+# 행 크기 (payload BLOB + 레거시 JSON 텍스트)
+_ROW_SIZE_SQL = "COALESCE(octet_length(payload), 0) + COALESCE(strlen(data_json), 0)"
+# LRU 기준 시각 (HIT 기록이 없으면 마지막 저장 시각)
+_RECENCY_SQL = "COALESCE(last_accessed_at, updated_at, created_at)"
+
+
+def parse_budgets(spec: str) -> dict[str, int]:
+    """``"crypto_intraday=512,news=64"`` → ``{data_type: 바이트}``"""
+    budgets: dict[str, int] = {}
+    for entry in spec.split(","):
+        if not entry.strip():
+            continue
+        name, _, value = entry.partition("=")
+        try:
+            budgets[name.strip()] = int(float(value) * _MB)
+        except ValueError:
+            logger.warning(f"⚠️ 잘못된 캐시 용량 설정 무시: {entry}")
+    return budgets
+
+
+@dataclass
+class CacheMaintenanceResult:
+    """정리 1회 실행 결과"""
+
+    expired_rows: int = 0
+    evicted_rows: dict[str, int] = field(default_factory=dict)
+    evicted_bytes: int = 0
+    access_updates: int = 0
+    checkpointed: bool = False
+    duration_ms: float = 0.0
+
+    @property
+    def total_evicted(self) -> int:
+        return sum(self.evicted_rows.values())
+
+
+class CacheMaintenance:
+    """캐시 테이블 만료/LRU 정리기
+
+    사용 예제:
+        >>> maintenance = database_manager.cache_maintenance
+        >>> maintenance.start()  # 이벤트 루프에서 주기 실행
+        >>> await maintenance.run()  # 즉시 1회 실행
+        >>> maintenance.get_stats()["evicted_rows"]
+    """
+
+    def __init__(
+        self,
+        database_manager: DatabaseManager,
+        interval_seconds: int | None = None,
+        default_budget_bytes: int | None = None,
+        budgets: dict[str, int] | None = None,
+        expired_grace: timedelta | None = None,
+        table_max_age: timedelta | None = None,
+    ):
+        self._db = database_manager
+        self.interval_seconds = (
+            settings.CACHE_MAINTENANCE_INTERVAL_SECONDS
+            if interval_seconds is None
+            else interval_seconds
+        )
+        self.default_budget_bytes = (
+            settings.CACHE_BUDGET_MB * _MB
+            if default_budget_bytes is None
+            else default_budget_bytes
+        )
+        self.budgets = (
+            parse_budgets(settings.CACHE_BUDGETS_MB) if budgets is None else budgets
+        )
+        self.expired_grace = expired_grace or timedelta(
+            hours=settings.CACHE_EXPIRED_GRACE_HOURS
+        )
+        self.table_max_age = table_max_age or timedelta(
+            hours=settings.CACHE_TABLE_MAX_AGE_HOURS
+        )
+
+        self._access_lock = threading.Lock()
+        self._pending_access: dict[str, dict[str, datetime]] = {}
+        self._stats_lock = threading.Lock()
+        self._stats: dict[str, Any] = {
+            "runs": 0,
+            "failures": 0,
+            "expired_rows": 0,
+            "evicted_rows": {},
+            "evicted_bytes": 0,
+            "access_updates": 0,
+            "checkpoints": 0,
+            "last_run_at": None,
+            "last_duration_ms": None,
+            "last_error": None,
+        }
+        self._task: asyncio.Task | None = None
+        self._lease: TaskLease | None = None
+
+    def budget_for(self, data_type: str) -> int:
+        return self.budgets.get(data_type, self.default_budget_bytes)
+
+    # ===== 접근 기록 =====
+
+    def record_access(self, table_name: str, row_id: str) -> None:
+        """캐시 HIT 기록 (다음 정리 실행 때 ``last_accessed_at`` 에 반영)"""
+        accessed_at = datetime.now(UTC)
+        with self._access_lock:
+            self._pending_access.setdefault(table_name, {})[row_id] = accessed_at
+
+    def _flush_access(self, conn: duckdb.DuckDBPyConnection) -> int:
+        with self._access_lock:
+            pending, self._pending_access = self._pending_access, {}
+
+        updated = 0
+        for table_name, accesses in pending.items():
+            conn.executemany(
+                f"UPDATE {table_name} SET last_accessed_at = ? WHERE id = ?",
+                [[accessed_at, row_id] for row_id, accessed_at in accesses.items()],
+            )
+            updated += len(accesses)
+        return updated
+
+    # ===== 정리 =====
+
+    def run_once(self) -> CacheMaintenanceResult:
+        """만료/LRU 정리 1회 실행 (writer lane 또는 동기 컨텍스트에서 호출)"""
+        started = time.perf_counter()
+        result = CacheMaintenanceResult()
+        conn = self._db.thread_cursor()
+
+        try:
+            result.access_updates = self._flush_access(conn)
+            now = datetime.now(UTC)
+
+            conn.execute("BEGIN TRANSACTION")
+            try:
+                result.expired_rows += self._delete_count(
+                    conn,
+                    "DELETE FROM unified_cache WHERE expires_at < ?",
+                    [now - self.expired_grace],
+                )
+                for data_type in self._over_budget(conn, "unified_cache", "data_type"):
+                    self._evict(conn, result, "unified_cache", data_type)
+
+                for table_name in self._cache_tables(conn):
+                    result.expired_rows += self._delete_count(
+                        conn,
+                        f"DELETE FROM {table_name} WHERE updated_at < ?",
+                        [now - self.table_max_age],
+                    )
+                    if self._over_budget(conn, table_name, None):
+                        self._evict(conn, result, table_name, None)
+
+                # 시계열 캐시는 증분 갱신용으로 만료 후에도 보관, 최대 보관 기간 경과 시 삭제
+                result.expired_rows += self._db.timeseries_cache.purge_expired(
+                    conn, now - self.table_max_age
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+            if result.expired_rows or result.total_evicted:
+                result.checkpointed = self._checkpoint(conn)
+        except Exception as e:
+            with self._stats_lock:
+                self._stats["failures"] += 1
+                self._stats["last_error"] = str(e)
+            logger.error(f"❌ 캐시 정리 실패: {e}")
+            raise
+
+        result.duration_ms = (time.perf_counter() - started) * 1000
+        self._record(result)
+        if result.expired_rows or result.total_evicted:
+            logger.info(
+                f"🧹 캐시 정리 완료: 만료 {result.expired_rows}행, "
+                f"용량 초과 {result.total_evicted}행 ({result.evicted_bytes / _MB:.1f}MB), "
+                f"{result.duration_ms:.0f}ms"
+            )
+        return result
+
+    @staticmethod
+    def _delete_count(
+        conn: duckdb.DuckDBPyConnection, query: str, params: list[Any]
+    ) -> int:
+        row = conn.execute(query, params).fetchone()
+        return int(row[0]) if row else 0
+
+    @staticmethod
+    def _cache_tables(conn: duckdb.DuckDBPyConnection) -> list[str]:
+        """키별 캐시 테이블 목록 (``last_accessed_at`` 이 보강된 테이블만)"""
+        rows = conn.execute(
+            """
+            SELECT DISTINCT table_name FROM information_schema.columns
+            WHERE column_name = 'cache_key' AND table_name <> 'unified_cache'
+              AND table_name IN (
+                  SELECT table_name FROM information_schema.columns
+                  WHERE column_name = 'last_accessed_at'
+              )
+            ORDER BY table_name
+            """
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def _over_budget(
+        self, conn: duckdb.DuckDBPyConnection, table_name: str, group_column: str | None
+    ) -> list[str]:
+        """용량 한도를 넘은 data_type 목록 (group_column이 없으면 테이블 단위)"""
+        if group_column is None:
+            row = conn.execute(
+                f"SELECT COALESCE(SUM({_ROW_SIZE_SQL}), 0) FROM {table_name}"
+            ).fetchone()
+            return [table_name] if row and row[0] > self.budget_for(table_name) else []
+
+        rows = conn.execute(
+            f"""
+            SELECT {group_column}, SUM({_ROW_SIZE_SQL}) FROM {table_name}
+            GROUP BY {group_column}
+            """
+        ).fetchall()
+        return [name for name, size in rows if size > self.budget_for(name)]
+
+    def _evict(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        result: CacheMaintenanceResult,
+        table_name: str,
+        data_type: str | None,
+    ) -> None:
+        """최근 사용 순으로 누적 크기가 한도를 넘는 행 삭제"""
+        label = data_type or table_name
+        where = "WHERE data_type = ?" if data_type is not None else ""
+        params: list[Any] = [data_type] if data_type is not None else []
+        victims = f"""
+            SELECT id, size FROM (
+                SELECT id, {_ROW_SIZE_SQL} AS size,
+                       SUM({_ROW_SIZE_SQL}) OVER (
+                           ORDER BY {_RECENCY_SQL} DESC, id
+                           ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW
+                       ) AS retained
+                FROM {table_name} {where}
+            ) WHERE retained > ?
+        """
+        params.append(self.budget_for(label))
+
+        row = conn.execute(
+            f"SELECT COUNT(*), COALESCE(SUM(size), 0) FROM ({victims})", params
+        ).fetchone()
+        if not row or not row[0]:
+            return
+        conn.execute(
+            f"DELETE FROM {table_name} WHERE id IN (SELECT id FROM ({victims}))",
+            params,
+        )
+        result.evicted_rows[label] = result.evicted_rows.get(label, 0) + int(row[0])
+        result.evicted_bytes += int(row[1])
+
+    @staticmethod
+    def _checkpoint(conn: duckdb.DuckDBPyConnection) -> bool:
+        try:
+            conn.execute("CHECKPOINT")
+            return True
+        except duckdb.Error as e:
+            # 다른 트랜잭션이 진행 중이면 다음 주기에 재시도
+            logger.debug(f"캐시 정리 CHECKPOINT 보류: {e}")
+            return False
+
+    def _record(self, result: CacheMaintenanceResult) -> None:
+        with self._stats_lock:
+            stats = self._stats
+            stats["runs"] += 1
+            stats["expired_rows"] += result.expired_rows
+            for label, count in result.evicted_rows.items():
+                stats["evicted_rows"][label] = (
+                    stats["evicted_rows"].get(label, 0) + count
+                )
+            stats["evicted_bytes"] += result.evicted_bytes
+            stats["access_updates"] += result.access_updates
+            stats["checkpoints"] += int(result.checkpointed)
+            stats["last_run_at"] = datetime.now(UTC).isoformat()
+            stats["last_duration_ms"] = round(result.duration_ms, 3)
+            stats["last_error"] = None
+
+    def get_stats(self) -> dict[str, Any]:
+        """누적 정리 통계 반환"""
+        with self._access_lock:
+            pending = sum(len(accesses) for accesses in self._pending_access.values())
+        with self._stats_lock:
+            stats = dict(self._stats)
+            stats["evicted_rows"] = dict(self._stats["evicted_rows"])
+        stats["pending_access_updates"] = pending
+        stats["running"] = self._task is not None and not self._task.done()
+        return stats
+
+    # ===== 백그라운드 실행 =====
+
+    async def run(self) -> CacheMaintenanceResult:
+        """writer lane에서 정리 1회 실행"""
+        return await self._db.async_manager.run_write(
+            "cache_maintenance", self.run_once
+        )
+
+    def start(self, lease: TaskLease | None = None) -> bool:
+        """이벤트 루프에 주기 정리 태스크 등록 (이미 실행 중이거나 비활성화면 False)
+
+        Args:
+            lease: 프로세스 간 작업 리스 (주어지면 보유한 주기에만 정리 실행)
+        """
+        if self.interval_seconds <= 0:
+            logger.info("캐시 정리 태스크 비활성화 (CACHE_MAINTENANCE_INTERVAL_SECONDS=0)")
+            return False
+        if self._task is not None and not self._task.done():
+            return False
+        self._lease = lease
+        self._task = asyncio.get_running_loop().create_task(
+            self._run_forever(), name="duckdb-cache-maintenance"
+        )
+        logger.info(f"🧹 캐시 정리 태스크 시작 ({self.interval_seconds}s 주기)")
+        return True
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        if self._lease is not None:
+            await self._lease.release()
+
+    async def _run_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            if self._lease is not None and not await self._lease.acquire():
+                # 다른 워커 프로세스가 정리 담당
+                continue
+            try:
+                await self.run()
+            except Exception as e:
+                # 실패 통계는 run_once에서 기록, 다음 주기에 재시도
+                logger.debug(f"캐시 정리 주기 실행 실패: {e}")
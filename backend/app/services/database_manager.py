@@ -3,26 +3,170 @@
 주식 시계열 데이터와 메타데이터를 저장하기 위한 DuckDB 스키마
 """
 
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
+import asyncio
+import functools
+import json
 import logging
+import threading
+import uuid
+from dataclasses import dataclass
 from pathlib import Path
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 
 import duckdb
+import numpy as np
 import pandas as pd
 
 from app.core.config import settings
+from app.core.indicator_cache import indicator_cache
+from app.core.l1_cache import l1_cache
+from app.services.async_database_manager import AsyncDatabaseManager
+from app.services.cache_codec import decode_payload, encode_payload, select_codec
+from app.services.cache_maintenance import CacheMaintenance
+from app.services.price_store import DateLike, PriceStore
+from app.services.timeseries_cache import TimeSeriesCache
+
+if TYPE_CHECKING:
+    import pyarrow as pa
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# 코덱 도입 이후 캐시 테이블에 추가된 컬럼 (기존 테이블은 연결 시 ALTER로 보강)
+_CACHE_EXTRA_COLUMNS: dict[str, str] = {
+    "payload": "BLOB",
+    "codec": "VARCHAR",
+    "last_accessed_at": "TIMESTAMP",
+}
+
+
+@dataclass
+class BulkUpsertResult:
+    """Bulk upsert 결과 (신규/갱신 건수)"""
+
+    inserted: int
+    updated: int
+
+    @property
+    def total(self) -> int:
+        return self.inserted + self.updated
+
+
+@dataclass
+class UnifiedCacheEntry:
+    """통합 캐시 행 (만료 여부 포함)"""
+
+    data: list[dict]
+    expires_at: datetime | None
+
+    @property
+    def is_fresh(self) -> bool:
+        return self.expires_at is None or self.expires_at > datetime.now(UTC)
+
+
+@dataclass
+class PricePanel:
+    """날짜 × 심볼 정렬 가격 행렬
+
+    ``values[i, j]`` 는 ``index[i]`` 시점 ``symbols[j]`` 의 값이며 결측은 NaN입니다.
+    """
+
+    values: np.ndarray
+    index: pd.DatetimeIndex
+    symbols: list[str]
+    field: str
+
+    def column(self, symbol: str) -> np.ndarray:
+        return self.values[:, self.symbols.index(symbol)]
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.values, index=self.index, columns=self.symbols)
+
+
+def _log_spill_failure(future: Any) -> None:
+    if not future.cancelled() and future.exception() is not None:
+        logger.warning(f"⚠️ 지표 결과 spill 저장 실패: {future.exception()}")
+
+
+def _ffill(values: np.ndarray, limit: int | None = None) -> np.ndarray:
+    """행 방향 forward-fill (NaN을 직전 유효값으로 채움, 선행 NaN은 유지)"""
+    if values.size == 0:
+        return values
+    rows = np.arange(values.shape[0])[:, None]
+    last_valid = np.where(~np.isnan(values), rows, 0)
+    np.maximum.accumulate(last_valid, axis=0, out=last_valid)
+    filled = values[last_valid, np.arange(values.shape[1])]
+    if limit is not None:
+        filled[(rows - last_valid) > limit] = np.nan
+    return filled
+
 
 class DatabaseManager:
     """DuckDB 데이터베이스 관리 클래스"""
 
-    def __init__(self, db_path: str | None = None):
+    # 가격 테이블 upsert 스펙: 키 컬럼 / 값 컬럼(누락 시 기본값 SQL 표현식)
+    _DAILY_PRICE_KEYS: tuple[str, ...] = ("symbol", "date")
+    _DAILY_PRICE_VALUES: dict[str, str | None] = {
+        "open": None,
+        "high": None,
+        "low": None,
+        "close": None,
+        "adjusted_close": "close",
+        "volume": None,
+        "dividend_amount": "0",
+        "split_coefficient": "1",
+    }
+    _INTRADAY_PRICE_KEYS: tuple[str, ...] = ("symbol", "datetime", "interval_type")
+    _INTRADAY_PRICE_VALUES: dict[str, str | None] = {
+        "open": None,
+        "high": None,
+        "low": None,
+        "close": None,
+        "volume": None,
+    }
+
+    def __init__(
+        self,
+        db_path: str | None = None,
+        reader_threads: int | None = None,
+        price_store_path: str | None = None,
+    ):
         self.db_path = db_path or settings.DUCKDB_PATH
         self.connection: duckdb.DuckDBPyConnection | None = None
 
+        # 스레드별 커서 풀 (공유 DB 인스턴스에서 파생된 독립 커서)
+        self._connect_lock = threading.RLock()
+        self._thread_local = threading.local()
+        self._cursors: list[duckdb.DuckDBPyConnection] = []
+        self._cursor_lock = threading.Lock()
+        self._connection_generation = 0
+
+        # 읽기 전용 bounded executor + 단일 writer lane
+        self.reader_threads = max(1, reader_threads or settings.DUCKDB_READER_THREADS)
+        self._reader_executor: ThreadPoolExecutor | None = None
+        self._writer_executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        self._async_manager: AsyncDatabaseManager | None = None
+
+        # payload/codec/last_accessed_at 컬럼이 확인된 캐시 테이블
+        self._ready_cache_tables: set[str] = set()
+        # 캐시 테이블 DDL 직렬화 (reader 스레드의 첫 조회가 동시에 준비할 수 있음)
+        self._cache_tables_lock = threading.RLock()
+
+        # 파티션 Parquet 가격 저장소 (인메모리 DB는 명시적으로 지정한 경우에만 사용)
+        if price_store_path is None and self.db_path != ":memory:":
+            price_store_path = settings.PRICE_STORE_PATH
+        self.price_store = PriceStore(self, price_store_path)
+
+        # 시계열 data_type용 typed 캐시 테이블 (unified_cache 대체)
+        self.timeseries_cache = TimeSeriesCache(self)
+
+        # 캐시 만료/용량 정리 (백그라운드 태스크는 start()로 시작)
+        self.cache_maintenance = CacheMaintenance(self)
+
         # 데이터베이스 디렉토리 생성
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
 
@@ -35,6 +179,13 @@ class DatabaseManager:
             raise RuntimeError("DuckDB connection not established")
         return self.connection
 
+    @property
+    def async_manager(self) -> AsyncDatabaseManager:
+        """이벤트 루프용 비동기 파사드 (lazy 생성)"""
+        if self._async_manager is None:
+            self._async_manager = AsyncDatabaseManager(self)
+        return self._async_manager
+
     def __enter__(self):
         """컨텍스트 매니저 진입"""
         self.connect()
@@ -42,15 +193,21 @@ class DatabaseManager:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """컨텍스트 매니저 종료"""
-        self.close()
+        self.shutdown()
 
     def connect(self) -> None:
         """데이터베이스 연결"""
-        if self.connection is None:
+        with self._connect_lock:
+            if self.connection is not None:
+                return
+
             logger.info(f"Connecting to DuckDB at: {self.db_path}")
             try:
                 # 기존 연결이 있다면 종료
                 self.close()
+                with self._cache_tables_lock:
+                    self._ready_cache_tables.clear()
+                self.timeseries_cache.reset()
                 # 새 연결 생성
                 self.connection = duckdb.connect(self.db_path)
                 self._create_tables()
@@ -66,16 +223,98 @@ class DatabaseManager:
                 else:
                     raise
 
+            # 지표 결과 캐시 spill 저장소로 등록 (이미 등록된 매니저가 있으면 무시)
+            indicator_cache.attach_spill(self)
+
     def close(self) -> None:
-        """데이터베이스 연결 종료"""
-        if self.connection:
+        """데이터베이스 연결 종료 (스레드별 커서 포함)"""
+        with self._connect_lock:
+            self._close_cursors()
+            if self.connection:
+                try:
+                    self.connection.close()
+                    logger.info("🔒 DuckDB connection closed")
+                except Exception as e:
+                    logger.warning(f"⚠️ Error closing DuckDB connection: {e}")
+                finally:
+                    self.connection = None
+
+    def shutdown(self) -> None:
+        """연결 종료 후 reader/writer executor 정리"""
+        indicator_cache.detach_spill(self)
+        self.close()
+        with self._executor_lock:
+            for executor in (self._reader_executor, self._writer_executor):
+                if executor is not None:
+                    executor.shutdown(wait=False, cancel_futures=True)
+            self._reader_executor = None
+            self._writer_executor = None
+
+    # ===== 스레드별 커서 풀 / executor =====
+
+    def thread_cursor(self) -> duckdb.DuckDBPyConnection:
+        """현재 스레드 전용 DuckDB 커서 반환
+
+        DuckDB 연결 객체는 스레드 간 공유가 안전하지 않으므로, 공유 DB 인스턴스에서
+        ``cursor()`` 로 파생한 독립 커서를 스레드마다 하나씩 만들어 재사용합니다.
+        연결이 재생성되면(close → connect) 기존 커서는 폐기되고 새로 발급됩니다.
+        """
+        connection = self.duckdb_conn
+        local = self._thread_local
+        cursor = getattr(local, "cursor", None)
+        if cursor is None or local.generation != self._connection_generation:
+            with self._cursor_lock:
+                cursor = connection.cursor()
+                self._cursors.append(cursor)
+            local.cursor = cursor
+            local.generation = self._connection_generation
+        return cursor
+
+    def _close_cursors(self) -> None:
+        """발급된 모든 스레드별 커서 종료"""
+        with self._cursor_lock:
+            cursors, self._cursors = self._cursors, []
+            self._connection_generation += 1
+        for cursor in cursors:
             try:
-                self.connection.close()
-                logger.info("🔒 DuckDB connection closed")
+                cursor.close()
             except Exception as e:
-                logger.warning(f"⚠️ Error closing DuckDB connection: {e}")
-            finally:
-                self.connection = None
+                logger.debug(f"DuckDB cursor close failed: {e}")
+
+    def _get_reader_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._reader_executor is None:
+                self._reader_executor = ThreadPoolExecutor(
+                    max_workers=self.reader_threads,
+                    thread_name_prefix="duckdb-reader",
+                )
+            return self._reader_executor
+
+    def _get_writer_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._writer_executor is None:
+                self._writer_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="duckdb-writer"
+                )
+            return self._writer_executor
+
+    async def run_read(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """읽기 작업을 bounded reader executor에서 실행
+
+        ``func`` 는 워커 스레드에서 실행되며 :meth:`thread_cursor` 로 커서를 얻어야 합니다.
+        이벤트 루프를 블로킹하지 않고 여러 읽기 쿼리를 병렬로 처리합니다.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_reader_executor(), functools.partial(func, *args, **kwargs)
+        )
+
+    async def run_write(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """쓰기 작업을 단일 writer lane에서 순차 실행 (쓰기 충돌 방지)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_writer_executor(), functools.partial(func, *args, **kwargs)
+        )
 
     def _create_tables(self) -> None:
         """테이블 생성"""
@@ -277,6 +516,12 @@ class DatabaseManager:
         # 기술적 지표 캐시 테이블 생성
         self._create_technical_indicators_cache_table()
 
+        # 증분 지표 상태 테이블 생성
+        self._create_indicator_stream_state_table()
+
+        # 지표 결과 캐시 spill 테이블 생성
+        self._create_indicator_result_cache_table()
+
         # 인덱스 생성 (모든 테이블 생성 후)
         self._create_indexes()
 
@@ -325,7 +570,9 @@ class DatabaseManager:
         if not self.connection:
             raise RuntimeError("데이터베이스 연결 실패")
 
-        self.connection.execute(
+        conn = self.thread_cursor()
+
+        conn.execute(
             """
             INSERT OR REPLACE INTO stocks
             (symbol, name, sector, industry, market_cap, country, currency, exchange, updated_at)
@@ -349,104 +596,481 @@ class DatabaseManager:
         logger.info(f"주식 정보 저장됨: {symbol}")
 
     def insert_daily_prices(self, df: pd.DataFrame) -> int:
-        """일일 주가 데이터 삽입"""
+        """일일 주가 데이터 삽입 (bulk upsert 경로 사용)"""
+        result = self.upsert_daily_prices(df)
+        return result.total
+
+    def insert_intraday_prices(self, df: pd.DataFrame, interval_type: str) -> int:
+        """인트라데이 주가 데이터 삽입 (bulk upsert 경로 사용)"""
+        result = self.upsert_intraday_prices(df, interval_type)
+        return result.total
+
+    def upsert_daily_prices(self, data: Any) -> BulkUpsertResult:
+        """일일 주가 데이터 bulk upsert
+
+        DataFrame(또는 Arrow Table)을 DuckDB에 등록한 뒤 한 번의
+        ``INSERT ... ON CONFLICT DO UPDATE`` 로 ``daily_prices`` 에 병합합니다.
+
+        Args:
+            data: ``symbol`` 과 OHLCV 컬럼을 가진 DataFrame 또는 Arrow Table.
+                DataFrame은 ``date`` 컬럼이 없으면 인덱스를 날짜로 사용합니다.
+                ``adjusted_close``/``dividend_amount``/``split_coefficient`` 는
+                없으면 각각 close/0/1로 채워집니다.
+
+        Returns:
+            신규 삽입/갱신 건수
+        """
+        return self._bulk_upsert_prices(
+            data,
+            table_name="daily_prices",
+            key_columns=self._DAILY_PRICE_KEYS,
+            value_columns=self._DAILY_PRICE_VALUES,
+            time_column="date",
+            time_cast="DATE",
+            store_interval="daily",
+        )
+
+    def upsert_intraday_prices(self, data: Any, interval_type: str) -> BulkUpsertResult:
+        """인트라데이 주가 데이터 bulk upsert
+
+        Args:
+            data: ``symbol`` 과 OHLCV 컬럼을 가진 DataFrame 또는 Arrow Table.
+                DataFrame은 ``datetime`` 컬럼이 없으면 인덱스를 시각으로 사용합니다.
+            interval_type: 인트라데이 간격 ('1min', '5min', ...)
+
+        Returns:
+            신규 삽입/갱신 건수
+        """
+        return self._bulk_upsert_prices(
+            data,
+            table_name="intraday_prices",
+            key_columns=self._INTRADAY_PRICE_KEYS,
+            value_columns=self._INTRADAY_PRICE_VALUES,
+            time_column="datetime",
+            time_cast="TIMESTAMP",
+            constants={"interval_type": interval_type},
+            store_interval=interval_type,
+        )
+
+    def _bulk_upsert_prices(
+        self,
+        data: Any,
+        table_name: str,
+        key_columns: tuple[str, ...],
+        value_columns: dict[str, str | None],
+        time_column: str,
+        time_cast: str,
+        constants: dict[str, Any] | None = None,
+        store_interval: str | None = None,
+    ) -> BulkUpsertResult:
+        """DataFrame/Arrow 데이터를 가격 테이블에 set 기반으로 병합"""
         self._ensure_connected()
         if not self.connection:
             raise RuntimeError("데이터베이스에 연결되지 않음")
 
-        if df.empty:
-            return 0
+        if data is None or len(data) == 0:
+            return BulkUpsertResult(inserted=0, updated=0)
+
+        constants = constants or {}
+        # 입력 행 순번 (배치 내부 중복 키는 마지막 행 유지)
+        ordinal = "_row_ordinal"
+
+        if isinstance(data, pd.DataFrame):
+            source = data
+            if time_column not in source.columns:
+                # 인덱스를 시간 컬럼으로 변환 (기존 insert_* 메서드와 동일한 입력 형식)
+                source = source.reset_index(names=time_column)
+            available = set(source.columns)
+            source = source.assign(**{ordinal: np.arange(len(source))})
+        else:
+            import pyarrow as pa
+
+            source = data  # pyarrow.Table
+            available = set(source.column_names)
+            source = source.append_column(ordinal, pa.array(np.arange(len(source))))
+
+        missing = [c for c in ("symbol", time_column) if c not in available]
+        if missing:
+            raise ValueError(f"{table_name} upsert에 필요한 컬럼 누락: {missing}")
 
-        # 필요한 컬럼만 선택하고 정렬
-        required_columns = [
-            "symbol",
-            "open",
-            "high",
-            "low",
-            "close",
-            "adjusted_close",
-            "volume",
-            "dividend_amount",
-            "split_coefficient",
+        select_exprs = [
+            "CAST(symbol AS VARCHAR) AS symbol",
+            f"CAST({time_column} AS {time_cast}) AS {time_column}",
         ]
+        for column, value in constants.items():
+            literal = str(value).replace("'", "''")
+            select_exprs.append(f"'{literal}' AS {column}")
+        for column, fallback in value_columns.items():
+            if column in available:
+                select_exprs.append(column)
+            elif fallback is not None:
+                select_exprs.append(f"{fallback} AS {column}")
+            else:
+                select_exprs.append(f"NULL AS {column}")
 
-        # 인덱스를 date 컬럼으로 변환
-        df_copy = df.copy()
-        df_copy["date"] = df_copy.index.to_series().dt.date
+        all_columns = ["symbol", time_column, *constants.keys(), *value_columns]
+        key_list = ", ".join(key_columns)
+        source_view = f"_bulk_src_{uuid.uuid4().hex}"
+        stage_table = f"_bulk_stage_{uuid.uuid4().hex}"
 
-        # 필요한 컬럼만 선택
-        df_insert = df_copy[["date"] + required_columns].copy()
+        conn = self.thread_cursor()
+        conn.register(source_view, source)
+        try:
+            conn.execute("BEGIN TRANSACTION")
+            try:
+                # 배치 내부 중복 키는 하나의 행으로 정리 (ON CONFLICT는 같은 행을 두 번 갱신 불가)
+                conn.execute(
+                    f"""
+                    CREATE TEMP TABLE {stage_table} AS
+                    SELECT DISTINCT ON ({key_list}) * EXCLUDE ({ordinal})
+                    FROM (
+                        SELECT {", ".join([*select_exprs, ordinal])}
+                        FROM {source_view}
+                    )
+                    WHERE symbol IS NOT NULL AND {time_column} IS NOT NULL
+                    ORDER BY {key_list}, {ordinal} DESC
+                    """
+                )
+                staged_row = conn.execute(
+                    f"SELECT COUNT(*) FROM {stage_table}"
+                ).fetchone()
+                staged = int(staged_row[0]) if staged_row else 0
 
-        # ON CONFLICT DO UPDATE 대신 INSERT OR REPLACE 사용
-        rows_inserted = 0
-        for _, row in df_insert.iterrows():
-            self.connection.execute(
-                """
-                INSERT OR REPLACE INTO daily_prices
-                (symbol, date, open, high, low, close, adjusted_close, volume,
-                 dividend_amount, split_coefficient)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                [
-                    row["symbol"],
-                    row["date"],
-                    row["open"],
-                    row["high"],
-                    row["low"],
-                    row["close"],
-                    row["adjusted_close"],
-                    row["volume"],
-                    row["dividend_amount"],
-                    row["split_coefficient"],
-                ],
-            )
-            rows_inserted += 1
+                join_condition = " AND ".join(
+                    f"t.{column} = s.{column}" for column in key_columns
+                )
+                existing_row = conn.execute(
+                    f"""
+                    SELECT COUNT(*) FROM {stage_table} s
+                    JOIN {table_name} t ON {join_condition}
+                    """
+                ).fetchone()
+                updated = int(existing_row[0]) if existing_row else 0
+
+                update_set = ", ".join(
+                    f"{column} = excluded.{column}" for column in value_columns
+                )
+                conn.execute(
+                    f"""
+                    INSERT INTO {table_name} ({", ".join(all_columns)})
+                    SELECT {", ".join(all_columns)} FROM {stage_table}
+                    ON CONFLICT ({key_list}) DO UPDATE SET {update_set}
+                    """
+                )
+                # 변경된 (심볼, 연도) → 가격 저장소는 해당 연도 파티션만 재작성
+                touched: dict[str, set[int]] = {}
+                for symbol, year in conn.execute(
+                    f"SELECT DISTINCT symbol, year({time_column}) FROM {stage_table}"
+                ).fetchall():
+                    touched.setdefault(symbol, set()).add(int(year))
+                conn.execute(f"DROP TABLE {stage_table}")
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        finally:
+            conn.unregister(source_view)
+
+        for symbol in touched:
+            l1_cache.invalidate(symbol=symbol)
+
+        result = BulkUpsertResult(inserted=staged - updated, updated=updated)
+        logger.info(
+            f"{table_name} bulk upsert 완료: 신규 {result.inserted}건, 갱신 {result.updated}건"
+        )
 
-        logger.info(f"일일 주가 데이터 {rows_inserted}건 저장됨")
-        return rows_inserted
+        if (
+            store_interval
+            and settings.PRICE_STORE_AUTO_SYNC
+            and self.price_store.enabled
+        ):
+            try:
+                self.price_store.sync_partitions(touched, interval=store_interval)
+            except Exception as e:
+                # 저장소는 미러이므로 실패해도 upsert 결과는 유지 (다음 동기화에서 복구)
+                logger.warning(f"⚠️ 가격 저장소 동기화 실패 ({store_interval}): {e}")
+        return result
 
-    def insert_intraday_prices(self, df: pd.DataFrame, interval_type: str) -> int:
-        """인트라데이 주가 데이터 삽입"""
-        if not self.connection:
-            raise RuntimeError("데이터베이스에 연결되지 않음")
+    def sync_price_store(
+        self, symbols: list[str] | None = None, interval: str = "daily"
+    ) -> int:
+        """DuckDB 가격 테이블을 파티션 Parquet 저장소로 재작성 (백필/복구용)"""
+        self._ensure_connected()
+        return self.price_store.sync(symbols, interval=interval)
 
-        if df.empty:
-            return 0
+    def get_prices_arrow(
+        self,
+        symbols: list[str],
+        start: DateLike | None = None,
+        end: DateLike | None = None,
+        columns: list[str] | None = None,
+        interval: str = "daily",
+    ) -> "pa.Table":
+        """다중 심볼 가격 데이터를 Arrow 테이블로 조회 (float64 컬럼)
+
+        파티션 Parquet 저장소에서 읽고, 저장소에 없는 심볼은 ``daily_prices`` /
+        ``intraday_prices`` 에서 같은 스키마로 읽습니다. 반환된 테이블의 컬럼은
+        ``column.to_numpy()`` 로 행 단위 Python 객체 없이 NumPy 버퍼로 변환됩니다.
 
-        # 필요한 컬럼만 선택
-        required_columns = ["symbol", "open", "high", "low", "close", "volume"]
+        Args:
+            symbols: 조회할 심볼 목록
+            start: 시작 시점 (포함)
+            end: 종료 시점 (포함)
+            columns: 값 컬럼 목록 (None이면 전체)
+            interval: 'daily' 또는 인트라데이 간격
+
+        Returns:
+            ``pyarrow.Table`` (symbol, 시간 컬럼, 요청 컬럼)
+        """
+        self._ensure_connected()
+        return self.price_store.get_prices_arrow(
+            symbols, start=start, end=end, columns=columns, interval=interval
+        )
 
-        # 인덱스를 datetime 컬럼으로 변환
-        df_copy = df.copy()
-        df_copy["datetime"] = df_copy.index
-        df_copy["interval_type"] = interval_type
+    def get_price_panel(
+        self,
+        symbols: list[str],
+        start: DateLike | None = None,
+        end: DateLike | None = None,
+        field: str = "close",
+        *,
+        ffill: bool = False,
+        ffill_limit: int | None = None,
+        calendar: str | list[DateLike] | pd.DatetimeIndex = "union",
+        lookback: int | None = None,
+        interval: str = "daily",
+    ) -> PricePanel:
+        """다중 심볼 가격을 날짜 × 심볼 행렬로 조회
 
-        # 필요한 컬럼만 선택
-        df_insert = df_copy[["datetime", "interval_type"] + required_columns].copy()
+        Args:
+            symbols: 심볼 목록 (열 순서)
+            start: 시작 시점 (포함)
+            end: 종료 시점 (포함)
+            field: 가격 컬럼 ('close', 'adjusted_close', 'volume', ...)
+            ffill: 결측을 직전 값으로 채울지 여부
+            ffill_limit: forward-fill 최대 연속 행 수
+            calendar: 행 기준 달력
+                - 'union': 한 심볼이라도 데이터가 있는 시점
+                - 'intersection': 모든 심볼에 데이터가 있는 시점
+                - 'business': start~end 평일 달력 (daily 전용)
+                - 시점 목록/DatetimeIndex: 지정 달력 (ffill 시 직전 값 as-of 적용)
+            lookback: 최근 N개 시점만 반환 (start 미지정 시 조회 범위도 제한)
+            interval: 'daily' 또는 인트라데이 간격
+
+        Returns:
+            PricePanel (values: float64 ndarray, index, symbols)
+        """
+        return self.get_price_panels(
+            symbols,
+            start,
+            end,
+            fields=[field],
+            ffill=ffill,
+            ffill_limit=ffill_limit,
+            calendar=calendar,
+            lookback=lookback,
+            interval=interval,
+        )[field]
+
+    def get_price_panels(
+        self,
+        symbols: list[str],
+        start: DateLike | None = None,
+        end: DateLike | None = None,
+        fields: list[str] | tuple[str, ...] = ("close",),
+        *,
+        ffill: bool = False,
+        ffill_limit: int | None = None,
+        calendar: str | list[DateLike] | pd.DatetimeIndex = "union",
+        lookback: int | None = None,
+        interval: str = "daily",
+    ) -> dict[str, PricePanel]:
+        """여러 가격 컬럼을 같은 달력으로 정렬한 패널 묶음 조회 (단일 쿼리)
+
+        인자는 :meth:`get_price_panel` 과 동일하며 필드별 PricePanel을 반환합니다.
+        """
+        symbols = list(dict.fromkeys(symbols))
+        fields = list(dict.fromkeys(fields))
+        time_column = "date" if interval == "daily" else "datetime"
 
-        rows_inserted = 0
-        for _, row in df_insert.iterrows():
-            self.connection.execute(
-                """
-                INSERT OR REPLACE INTO intraday_prices
-                (symbol, datetime, interval_type, open, high, low, close, volume)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                [
-                    row["symbol"],
-                    row["datetime"],
-                    row["interval_type"],
-                    row["open"],
-                    row["high"],
-                    row["low"],
-                    row["close"],
-                    row["volume"],
-                ],
+        if lookback is not None and start is None:
+            start = self._lookback_start(symbols, end, lookback, interval)
+
+        table = self.get_prices_arrow(symbols, start, end, fields, interval)
+
+        # long → wide: 시점/심볼 코드로 한 번에 scatter (pandas pivot 없이)
+        times = table.column(time_column).to_pandas(date_as_object=False).to_numpy()
+        dates, row_codes = np.unique(times, return_inverse=True)
+        col_codes = pd.Index(symbols).get_indexer(
+            table.column("symbol").to_numpy(zero_copy_only=False)
+        )
+        observed = np.zeros((len(dates), len(symbols)), dtype=bool)
+        observed[row_codes, col_codes] = True
+
+        matrices: dict[str, np.ndarray] = {}
+        for field in fields:
+            matrix = np.full((len(dates), len(symbols)), np.nan)
+            matrix[row_codes, col_codes] = table.column(field).to_numpy(
+                zero_copy_only=False
+            )
+            matrices[field] = matrix
+
+        index = pd.DatetimeIndex(dates, name=time_column)
+        if isinstance(calendar, str) and calendar == "intersection":
+            keep = observed.all(axis=1)
+            index = index[keep]
+            matrices = {f: m[keep] for f, m in matrices.items()}
+        elif not (isinstance(calendar, str) and calendar == "union"):
+            if isinstance(calendar, str):
+                if calendar != "business":
+                    raise ValueError(f"지원하지 않는 calendar 옵션: {calendar}")
+                if len(index) == 0 and (start is None or end is None):
+                    target = pd.DatetimeIndex([], name=time_column)
+                else:
+                    target = pd.bdate_range(
+                        start if start is not None else index[0],
+                        end if end is not None else index[-1],
+                        name=time_column,
+                    )
+            else:
+                target = pd.DatetimeIndex(calendar, name=time_column)
+
+            # 관측 시점과 목표 달력의 합집합에서 ffill 후 목표 시점만 선택 (as-of 정렬)
+            combined = index.union(target)
+            positions = combined.get_indexer(index)
+            expanded: dict[str, np.ndarray] = {}
+            for field, matrix in matrices.items():
+                full = np.full((len(combined), len(symbols)), np.nan)
+                full[positions] = matrix
+                expanded[field] = full
+            matrices = expanded
+            index = combined
+            if ffill:
+                matrices = {f: _ffill(m, ffill_limit) for f, m in matrices.items()}
+                ffill = False
+            selector = combined.get_indexer(target)
+            index = target
+            matrices = {f: m[selector] for f, m in matrices.items()}
+
+        if ffill:
+            matrices = {f: _ffill(m, ffill_limit) for f, m in matrices.items()}
+
+        if lookback is not None:
+            index = index[-lookback:] if lookback > 0 else index[:0]
+            matrices = {f: m[len(m) - len(index) :] for f, m in matrices.items()}
+
+        return {
+            field: PricePanel(
+                values=matrix, index=index, symbols=list(symbols), field=field
             )
-            rows_inserted += 1
+            for field, matrix in matrices.items()
+        }
 
-        logger.info(f"인트라데이 주가 데이터 {rows_inserted}건 저장됨")
-        return rows_inserted
+    def _lookback_start(
+        self,
+        symbols: list[str],
+        end: DateLike | None,
+        lookback: int,
+        interval: str,
+    ) -> datetime | None:
+        """최근 lookback개 시점의 시작 시각 (데이터가 부족하면 None)"""
+        if lookback <= 0 or not symbols:
+            return None
+        table, time_column = (
+            ("daily_prices", "date")
+            if interval == "daily"
+            else ("intraday_prices", "datetime")
+        )
+        conditions = [f"symbol IN ({', '.join('?' for _ in symbols)})"]
+        params: list[Any] = list(symbols)
+        if interval != "daily":
+            conditions.append("interval_type = ?")
+            params.append(interval)
+        if end is not None:
+            conditions.append(f"{time_column} <= ?")
+            params.append(pd.Timestamp(end).to_pydatetime())
+        params.append(lookback - 1)
+
+        row = (
+            self.thread_cursor()
+            .execute(
+                f"""
+                SELECT {time_column} FROM (
+                    SELECT DISTINCT {time_column} FROM {table}
+                    WHERE {" AND ".join(conditions)}
+                )
+                ORDER BY {time_column} DESC
+                LIMIT 1 OFFSET ?
+                """,
+                params,
+            )
+            .fetchone()
+        )
+        return pd.Timestamp(row[0]).to_pydatetime() if row else None
+
+    def get_recent_prices(
+        self,
+        symbols: list[str],
+        bars: int,
+        fields: list[str] | tuple[str, ...] = ("close",),
+        interval: str = "daily",
+    ) -> dict[str, pd.DataFrame]:
+        """심볼별 최근 N개 봉을 한 번의 쿼리로 조회
+
+        :meth:`get_price_panels` 의 ``lookback`` 은 합집합 달력의 최근 N개 시점이라
+        거래가 멈춘/늦은 심볼은 봉이 적거나 없습니다. 이 메서드는 심볼마다 자신의
+        최근 N개 봉을 반환하므로 심볼별 ``ORDER BY ... DESC LIMIT N`` 조회와 같습니다.
+
+        Args:
+            symbols: 심볼 목록
+            bars: 심볼별 최대 봉 수
+            fields: 가격 컬럼 (float64로 변환)
+            interval: 'daily' 또는 인트라데이 간격
+
+        Returns:
+            심볼 → 시간 인덱스 오름차순 DataFrame (데이터가 없는 심볼은 제외)
+        """
+        self._ensure_connected()
+        symbols = list(dict.fromkeys(symbols))
+        if bars <= 0 or not symbols:
+            return {}
+        table, time_column, value_columns = (
+            ("daily_prices", "date", self._DAILY_PRICE_VALUES)
+            if interval == "daily"
+            else ("intraday_prices", "datetime", self._INTRADAY_PRICE_VALUES)
+        )
+        unknown = [field for field in fields if field not in value_columns]
+        if unknown:
+            raise ValueError(f"지원하지 않는 가격 컬럼: {unknown}")
+        conditions = [f"symbol IN ({', '.join('?' for _ in symbols)})"]
+        params: list[Any] = list(symbols)
+        if interval != "daily":
+            conditions.append("interval_type = ?")
+            params.append(interval)
+        params.append(bars)
+        casts = ", ".join(f"CAST({field} AS DOUBLE) AS {field}" for field in fields)
+
+        frame = (
+            self.thread_cursor()
+            .execute(
+                f"""
+                SELECT symbol, {time_column}, {casts}
+                FROM {table}
+                WHERE {" AND ".join(conditions)}
+                QUALIFY ROW_NUMBER() OVER (
+                    PARTITION BY symbol ORDER BY {time_column} DESC
+                ) <= ?
+                ORDER BY symbol, {time_column}
+                """,
+                params,
+            )
+            .fetch_df()
+        )
+        frame[time_column] = pd.to_datetime(frame[time_column])
+        return {
+            str(symbol): group.drop(columns="symbol").set_index(time_column)
+            for symbol, group in frame.groupby("symbol", sort=False)
+        }
 
     def record_portfolio_forecast(
         self,
@@ -465,7 +1089,9 @@ class DatabaseManager:
         if not self.connection:
             raise RuntimeError("데이터베이스에 연결되지 않음")
 
-        self.connection.execute(
+        conn = self.thread_cursor()
+
+        conn.execute(
             """
             INSERT INTO portfolio_forecast_history (
                 as_of,
@@ -501,6 +1127,8 @@ class DatabaseManager:
             logger.warning("데이터베이스 연결 실패 - 빈 DataFrame 반환")
             return pd.DataFrame()
 
+        conn = self.thread_cursor()
+
         try:
             base_query = "SELECT * FROM daily_prices WHERE symbol = ?"
             params = [symbol]
@@ -515,7 +1143,7 @@ class DatabaseManager:
 
             base_query += " ORDER BY date"
 
-            df = self.connection.execute(base_query, params).df()
+            df = conn.execute(base_query, params).df()
 
             if not df.empty:
                 # date 컬럼을 인덱스로 설정
@@ -535,8 +1163,10 @@ class DatabaseManager:
             logger.warning("데이터베이스 연결 실패 - 빈 목록 반환")
             return []
 
+        conn = self.thread_cursor()
+
         try:
-            result = self.connection.execute(
+            result = conn.execute(
                 "SELECT DISTINCT symbol FROM daily_prices ORDER BY symbol"
             ).fetchall()
 
@@ -553,8 +1183,10 @@ class DatabaseManager:
             logger.warning("데이터베이스 연결 실패 - None 반환")
             return None, None
 
+        conn = self.thread_cursor()
+
         try:
-            result = self.connection.execute(
+            result = conn.execute(
                 "SELECT MIN(date) as min_date, MAX(date) as max_date FROM daily_prices WHERE symbol = ?",
                 [symbol],
             ).fetchone()
@@ -574,12 +1206,14 @@ class DatabaseManager:
         if not self.connection:
             raise RuntimeError("데이터베이스에 연결되지 않음")
 
+        conn = self.thread_cursor()
+
         import json
         import uuid
 
         result_id = str(uuid.uuid4())
 
-        self.connection.execute(
+        conn.execute(
             """
             INSERT INTO backtest_results
             (id, strategy_name, symbols, start_date, end_date, initial_cash,
@@ -615,6 +1249,8 @@ class DatabaseManager:
         if not self.connection:
             raise RuntimeError("데이터베이스에 연결되지 않음")
 
+        conn = self.thread_cursor()
+
         if not portfolio_history:
             logger.warning(f"No portfolio history to save for {backtest_id}")
             return 0
@@ -624,7 +1260,7 @@ class DatabaseManager:
             df = pd.DataFrame(portfolio_history)
             df["backtest_id"] = backtest_id
 
-            self.connection.execute(
+            conn.execute(
                 """
                 INSERT INTO backtest_portfolio_history
                 (backtest_id, timestamp, total_value, cash, positions_value, return_pct)
@@ -647,6 +1283,8 @@ class DatabaseManager:
         if not self.connection:
             raise RuntimeError("데이터베이스에 연결되지 않음")
 
+        conn = self.thread_cursor()
+
         if not trades:
             logger.warning(f"No trades to save for {backtest_id}")
             return 0
@@ -666,7 +1304,7 @@ class DatabaseManager:
             # DuckDB는 Python DataFrame을 SQL에서 직접 참조 가능
             trades_df = pd.DataFrame(trades_with_id)  # type: ignore # noqa: F841
 
-            self.connection.execute(
+            conn.execute(
                 """
                 INSERT INTO backtest_trades
                 (backtest_id, trade_id, timestamp, symbol, side, quantity,
@@ -691,8 +1329,10 @@ class DatabaseManager:
         if not self.connection:
             raise RuntimeError("데이터베이스에 연결되지 않음")
 
+        conn = self.thread_cursor()
+
         try:
-            df = self.connection.execute(
+            df = conn.execute(
                 """
                 SELECT timestamp, total_value, cash, positions_value, return_pct
                 FROM backtest_portfolio_history
@@ -718,8 +1358,10 @@ class DatabaseManager:
         if not self.connection:
             raise RuntimeError("데이터베이스에 연결되지 않음")
 
+        conn = self.thread_cursor()
+
         try:
-            df = self.connection.execute(
+            df = conn.execute(
                 """
                 SELECT trade_id, timestamp, symbol, side, quantity,
                        price, commission, total_amount
@@ -745,44 +1387,60 @@ class DatabaseManager:
     def store_cache_data(
         self, cache_key: str, data: list[dict], table_name: str = "cache_data"
     ) -> bool:
-        """DuckDB 캐시에 데이터 저장"""
+        """DuckDB 캐시에 데이터 저장
+
+        항목 리스트 전체를 한 행에 저장하며, 코덱은 ``table_name`` 기준으로
+        선택됩니다 (``CACHE_PAYLOAD_CODEC`` 참고).
+        """
         self._ensure_connected()
         if not self.connection:
             raise RuntimeError("데이터베이스에 연결되지 않음")
 
+        conn = self.thread_cursor()
+        l1_cache.invalidate(table_name, cache_key=cache_key)
+
         try:
             # 캐시 테이블이 없으면 생성
-            self._create_cache_table(table_name)
+            self._create_cache_table(table_name, conn)
 
-            # 기존 캐시 데이터 삭제
-            self.connection.execute(
-                f"DELETE FROM {table_name} WHERE cache_key = ?", [cache_key]
-            )
-
-            # 새 데이터 삽입
+            codec = None
             if data:
-                import json
-                import uuid
-                from datetime import datetime
+                codec, data_json, payload = encode_payload(
+                    data, select_codec(table_name, settings.CACHE_PAYLOAD_CODEC)
+                )
 
-                for item in data:
-                    self.connection.execute(
+            # 삭제 + 삽입을 한 트랜잭션으로 (동시 조회가 빈 캐시를 보지 않도록)
+            conn.execute("BEGIN TRANSACTION")
+            try:
+                conn.execute(
+                    f"DELETE FROM {table_name} WHERE cache_key = ?", [cache_key]
+                )
+                if data:
+                    now = datetime.now(UTC)
+                    conn.execute(
                         f"""
                         INSERT INTO {table_name}
-                        (id, cache_key, data_json, created_at, updated_at)
-                        VALUES (?, ?, ?, ?, ?)
+                        (id, cache_key, data_json, payload, codec,
+                         created_at, updated_at)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
                     """,
                         [
                             str(uuid.uuid4()),
                             cache_key,
-                            json.dumps(item),
-                            datetime.now(UTC),
-                            datetime.now(UTC),
+                            data_json,
+                            payload,
+                            codec,
+                            now,
+                            now,
                         ],
                     )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
 
-                logger.info(f"DuckDB 캐시 저장 완료: {cache_key} ({len(data)} 항목)")
-                return True
+            if data:
+                logger.info(f"DuckDB 캐시 저장 완료: {cache_key} ({len(data)} 항목, {codec})")
             return True
 
         except Exception as e:
@@ -797,15 +1455,19 @@ class DatabaseManager:
         if not self.connection:
             raise RuntimeError("데이터베이스에 연결되지 않음")
 
+        conn = self.thread_cursor()
+
         try:
-            from datetime import datetime, timedelta
+            from datetime import timedelta
+
+            self._create_cache_table(table_name, conn)
 
             # TTL 체크
             ttl_threshold = datetime.now(UTC) - timedelta(hours=ttl_hours)
 
-            results = self.connection.execute(
+            results = conn.execute(
                 f"""
-                SELECT data_json FROM {table_name}
+                SELECT id, data_json, payload, codec FROM {table_name}
                 WHERE cache_key = ? AND updated_at > ?
                 ORDER BY created_at
             """,
@@ -813,9 +1475,14 @@ class DatabaseManager:
             ).fetchall()
 
             if results:
-                import json
-
-                data = [json.loads(row[0]) for row in results]
+                data: list[dict] = []
+                for row_id, data_json, payload, codec in results:
+                    if codec is None:
+                        # 레거시 행: 항목 하나당 JSON 한 행
+                        data.append(json.loads(data_json))
+                    else:
+                        data.extend(decode_payload(codec, data_json, payload))
+                    self.cache_maintenance.record_access(table_name, row_id)
                 logger.info(f"DuckDB 캐시 조회 성공: {cache_key} ({len(data)} 항목)")
                 return data
             else:
@@ -834,14 +1501,17 @@ class DatabaseManager:
         if not self.connection:
             raise RuntimeError("데이터베이스에 연결되지 않음")
 
+        conn = self.thread_cursor()
+        l1_cache.invalidate(table_name, cache_key=cache_key)
+
         try:
             if cache_key:
-                self.connection.execute(
+                conn.execute(
                     f"DELETE FROM {table_name} WHERE cache_key = ?", [cache_key]
                 )
                 logger.info(f"DuckDB 캐시 삭제: {cache_key}")
             else:
-                self.connection.execute(f"DELETE FROM {table_name}")
+                conn.execute(f"DELETE FROM {table_name}")
                 logger.info(f"DuckDB 캐시 전체 삭제: {table_name}")
             return True
 
@@ -849,39 +1519,97 @@ class DatabaseManager:
             logger.error(f"DuckDB 캐시 삭제 실패: {e}")
             return False
 
-    def _create_cache_table(self, table_name: str) -> None:
+    def _create_cache_table(
+        self, table_name: str, conn: duckdb.DuckDBPyConnection | None = None
+    ) -> None:
         """캐시 테이블 생성"""
         self._ensure_connected()
         if not self.connection:
             raise RuntimeError("데이터베이스에 연결되지 않음")
+        conn = conn or self.connection
+        if table_name in self._ready_cache_tables:
+            return
 
-        # CREATE TABLE IF NOT EXISTS를 사용하여 기존 데이터 보존
-        self.connection.execute(
-            f"""
-            CREATE TABLE IF NOT EXISTS {table_name} (
-                id VARCHAR PRIMARY KEY,
-                cache_key VARCHAR NOT NULL,
-                data_json TEXT NOT NULL,
-                created_at TIMESTAMP NOT NULL,
-                updated_at TIMESTAMP NOT NULL
+        with self._cache_tables_lock:
+            if table_name in self._ready_cache_tables:
+                return
+
+            # CREATE TABLE IF NOT EXISTS를 사용하여 기존 데이터 보존
+            conn.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {table_name} (
+                    id VARCHAR PRIMARY KEY,
+                    cache_key VARCHAR NOT NULL,
+                    data_json TEXT NOT NULL,     -- 레거시 JSON (바이너리 코덱 행은 '')
+                    payload BLOB,                -- 코덱으로 인코딩된 항목 리스트
+                    codec VARCHAR,               -- NULL이면 레거시 JSON 행
+                    created_at TIMESTAMP NOT NULL,
+                    updated_at TIMESTAMP NOT NULL,
+                    last_accessed_at TIMESTAMP   -- 마지막 HIT 시각 (LRU 정리용)
+                )
+            """
             )
-        """
-        )
 
-        # 인덱스 생성
-        self.connection.execute(
-            f"""
-            CREATE INDEX IF NOT EXISTS idx_{table_name}_cache_key
-            ON {table_name}(cache_key)
-        """
-        )
+            # 인덱스 생성
+            conn.execute(
+                f"""
+                CREATE INDEX IF NOT EXISTS idx_{table_name}_cache_key
+                ON {table_name}(cache_key)
+            """
+            )
 
-        self.connection.execute(
-            f"""
-            CREATE INDEX IF NOT EXISTS idx_{table_name}_updated_at
-            ON {table_name}(updated_at)
+            conn.execute(
+                f"""
+                CREATE INDEX IF NOT EXISTS idx_{table_name}_updated_at
+                ON {table_name}(updated_at)
+            """
+            )
+
+            self._ensure_cache_columns(table_name, conn)
+
+    def _ensure_cache_columns(
+        self, table_name: str, conn: duckdb.DuckDBPyConnection | None = None
+    ) -> None:
+        """기존 캐시 테이블에 payload/codec/last_accessed_at 컬럼 추가 (레거시 스키마 마이그레이션)
+
+        인덱스가 걸린 테이블은 ALTER TABLE이 거부되므로 인덱스를 잠시 삭제한 뒤
+        컬럼을 추가하고 동일한 정의로 다시 생성합니다.
         """
-        )
+        if table_name in self._ready_cache_tables:
+            return
+        conn = conn or self.duckdb_conn
+
+        with self._cache_tables_lock:
+            if table_name in self._ready_cache_tables:
+                return
+
+            columns = {
+                row[0]
+                for row in conn.execute(
+                    "SELECT column_name FROM information_schema.columns "
+                    "WHERE table_name = ?",
+                    [table_name],
+                ).fetchall()
+            }
+            missing = [c for c in _CACHE_EXTRA_COLUMNS if c not in columns]
+            if missing:
+                indexes = conn.execute(
+                    "SELECT index_name, sql FROM duckdb_indexes() WHERE table_name = ?",
+                    [table_name],
+                ).fetchall()
+                for index_name, _ in indexes:
+                    conn.execute(f"DROP INDEX IF EXISTS {index_name}")
+                for column in missing:
+                    conn.execute(
+                        f"ALTER TABLE {table_name} "
+                        f"ADD COLUMN {column} {_CACHE_EXTRA_COLUMNS[column]}"
+                    )
+                for _, index_sql in indexes:
+                    if index_sql:
+                        conn.execute(index_sql)
+                logger.info(f"🔧 캐시 테이블 컬럼 추가: {table_name} {missing}")
+
+            self._ready_cache_tables.add(table_name)
 
     def _create_unified_cache_table(self) -> None:
         """통합 캐시 테이블 생성 - 모든 마켓 데이터 타입을 지원"""
@@ -896,17 +1624,21 @@ class DatabaseManager:
                 cache_key VARCHAR NOT NULL,
                 data_type VARCHAR NOT NULL,  -- 'stock', 'fundamental', 'news', 'economic_indicator' 등
                 symbol VARCHAR,              -- 심볼 (있는 경우)
-                data_json TEXT NOT NULL,     -- JSON 직렬화된 데이터
+                data_json TEXT NOT NULL,     -- JSON 직렬화된 데이터 (바이너리 코덱 행은 '')
+                payload BLOB,                -- 코덱으로 인코딩된 데이터
+                codec VARCHAR,               -- 'json+zstd', 'arrow+zstd' (NULL이면 레거시 JSON)
                 metadata JSON,               -- 추가 메타데이터 (검색 조건, 필터 등)
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 expires_at TIMESTAMP,        -- TTL 관리
+                last_accessed_at TIMESTAMP,  -- 마지막 HIT 시각 (LRU 정리용)
 
                 -- 복합 유니크 키로 중복 방지
                 UNIQUE(cache_key, data_type, symbol)
             )
         """
         )
+        self._ensure_cache_columns("unified_cache", self.connection)
 
         # 기존 cache 테이블들도 유지 (하위 호환성)
         self._create_cache_table("market_data_cache")
@@ -938,6 +1670,98 @@ class DatabaseManager:
 
         logger.info("기술적 지표 캐시 테이블 생성 완료")
 
+    def _create_indicator_stream_state_table(self) -> None:
+        """증분(스트리밍) 지표 상태 테이블 생성"""
+        self._ensure_connected()
+        if not self.connection:
+            raise RuntimeError("데이터베이스에 연결되지 않음")
+
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS indicator_stream_state (
+                symbol VARCHAR NOT NULL,
+                interval VARCHAR NOT NULL,        -- 'daily', '5min', etc.
+                indicator_key VARCHAR NOT NULL,   -- 'RSI(series_type=close,time_period=14)'
+                state_json TEXT NOT NULL,         -- 직렬화된 지표 상태
+                as_of TIMESTAMP,                  -- 마지막으로 반영한 봉 시각
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (symbol, interval, indicator_key)
+            )
+        """
+        )
+
+    def _create_indicator_result_cache_table(self) -> None:
+        """지표 결과 캐시 spill 테이블 생성
+
+        키별 캐시 테이블과 같은 컬럼 구성이라 캐시 정리기가 최대 보존 시간/용량 한도
+        (``CACHE_BUDGETS_MB`` 의 ``indicator_result_cache``)로 함께 정리합니다.
+        """
+        self._ensure_connected()
+        if not self.connection:
+            raise RuntimeError("데이터베이스에 연결되지 않음")
+
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS indicator_result_cache (
+                id VARCHAR PRIMARY KEY,           -- 'pandas.SMA:<입력 지문 해시>'
+                cache_key VARCHAR NOT NULL,       -- id와 동일 (캐시 정리기 규칙)
+                indicator VARCHAR NOT NULL,       -- 구현 단위 지표 식별자
+                data_json TEXT NOT NULL,          -- 항상 '' (바이너리 payload만 사용)
+                payload BLOB,                     -- 출력 배열 (npz)
+                codec VARCHAR,
+                created_at TIMESTAMP NOT NULL,
+                updated_at TIMESTAMP NOT NULL,
+                last_accessed_at TIMESTAMP        -- 마지막 HIT 시각 (LRU 정리용)
+            )
+        """
+        )
+
+    # ===== 지표 결과 캐시 spill (app.core.indicator_cache) =====
+
+    def indicator_result_keys(self) -> list[str]:
+        """spill된 지표 결과 키 목록"""
+        rows = (
+            self.thread_cursor()
+            .execute("SELECT id FROM indicator_result_cache")
+            .fetchall()
+        )
+        return [row[0] for row in rows]
+
+    def load_indicator_result(self, key: str) -> bytes | None:
+        """spill된 지표 결과 payload 조회 (호출 스레드 커서 사용)"""
+        row = (
+            self.thread_cursor()
+            .execute("SELECT payload FROM indicator_result_cache WHERE id = ?", [key])
+            .fetchone()
+        )
+        if row is None or row[0] is None:
+            return None
+        self.cache_maintenance.record_access("indicator_result_cache", key)
+        return bytes(row[0])
+
+    def spill_indicator_results(self, rows: list[tuple[str, str, bytes]]) -> None:
+        """메모리에서 밀려난 지표 결과 저장 (writer lane에 제출 후 바로 반환)
+
+        Args:
+            rows: (키, 지표 식별자, payload) 목록
+        """
+        future = self._get_writer_executor().submit(self._store_indicator_results, rows)
+        future.add_done_callback(_log_spill_failure)
+
+    def _store_indicator_results(self, rows: list[tuple[str, str, bytes]]) -> None:
+        now = datetime.now(UTC)
+        self.thread_cursor().executemany(
+            """
+            INSERT OR REPLACE INTO indicator_result_cache
+            (id, cache_key, indicator, data_json, payload, codec, created_at, updated_at)
+            VALUES (?, ?, ?, '', ?, 'npz', ?, ?)
+            """,
+            [
+                [key, key, indicator, payload, now, now]
+                for key, indicator, payload in rows
+            ],
+        )
+
     # ===== 통합 캐시 관리 메서드들 =====
 
     def store_unified_cache(
@@ -963,55 +1787,59 @@ class DatabaseManager:
         if not self.connection:
             raise RuntimeError("데이터베이스에 연결되지 않음")
 
+        conn = self.thread_cursor()
+
         try:
-            import json
-            import uuid
-            from datetime import datetime, timedelta
+            from datetime import timedelta
 
             # 단일 데이터를 리스트로 변환
             if isinstance(data, dict):
                 data = [data]
 
-            # 디버깅: 데이터 타입 확인
-            logger.info(
-                f"📦 store_unified_cache 데이터 타입: {type(data)}, 길이: {len(data) if isinstance(data, list) else 'N/A'}"
-            )
-            if isinstance(data, list) and len(data) > 0:
-                logger.info(f"📦 첫 번째 항목 타입: {type(data[0])}")
-
-            # 기존 캐시 삭제
-            self.connection.execute(
-                """
-                DELETE FROM unified_cache
-                WHERE cache_key = ? AND data_type = ? AND (symbol = ? OR symbol IS NULL)
-                """,
-                [cache_key, data_type, symbol],
-            )
-
             # 새 데이터 삽입
             expires_at = datetime.now(UTC) + timedelta(hours=ttl_hours)
 
-            # ✅ 전체 배열을 하나의 JSON으로 직렬화
-            serializable_data = [self._make_json_serializable(item) for item in data]
-
-            self.connection.execute(
-                """
-                INSERT INTO unified_cache
-                (id, cache_key, data_type, symbol, data_json, metadata, expires_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                [
-                    str(uuid.uuid4()),
-                    cache_key,
-                    data_type,
-                    symbol,
-                    json.dumps(serializable_data),  # 전체 배열을 한 번에 저장
-                    json.dumps(metadata) if metadata else None,
-                    expires_at,
-                ],
+            # ✅ 전체 배열을 data_type별 코덱으로 한 번에 직렬화
+            codec, data_json, payload = encode_payload(
+                data, select_codec(data_type, settings.CACHE_PAYLOAD_CODEC)
             )
 
-            logger.info(f"통합 캐시 저장: {data_type}.{cache_key} ({len(data)} 항목)")
+            # 기존 행 삭제와 삽입을 한 트랜잭션으로 (동시 조회 시 빈 캐시가 보이지 않도록)
+            conn.execute("BEGIN TRANSACTION")
+            try:
+                conn.execute(
+                    """
+                    DELETE FROM unified_cache
+                    WHERE cache_key = ? AND data_type = ? AND (symbol = ? OR symbol IS NULL)
+                    """,
+                    [cache_key, data_type, symbol],
+                )
+                conn.execute(
+                    """
+                    INSERT INTO unified_cache
+                    (id, cache_key, data_type, symbol, data_json, payload, codec, metadata, expires_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    [
+                        str(uuid.uuid4()),
+                        cache_key,
+                        data_type,
+                        symbol,
+                        data_json,
+                        payload,
+                        codec,
+                        json.dumps(metadata) if metadata else None,
+                        expires_at,
+                    ],
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            # 커밋 후 L1 무효화 (이전 값이 다시 L1에 채워지지 않도록)
+            l1_cache.invalidate(data_type, cache_key=cache_key)
+
+            logger.info(f"통합 캐시 저장: {data_type}.{cache_key} ({len(data)} 항목, {codec})")
             return True
 
         except Exception as e:
@@ -1030,10 +1858,9 @@ class DatabaseManager:
         if not self.connection:
             raise RuntimeError("데이터베이스에 연결되지 않음")
 
-        try:
-            import json
-            from datetime import datetime
+        conn = self.thread_cursor()
 
+        try:
             # TTL 체크 조건
             ttl_condition = (
                 "" if ignore_ttl else "AND (expires_at IS NULL OR expires_at > ?)"
@@ -1043,17 +1870,19 @@ class DatabaseManager:
                 params.append(datetime.now(UTC))
 
             query = f"""
-                SELECT data_json FROM unified_cache
+                SELECT id, data_json, payload, codec FROM unified_cache
                 WHERE cache_key = ? AND data_type = ? AND (symbol = ? OR symbol IS NULL)
                 {ttl_condition}
                 ORDER BY created_at
             """
 
-            results = self.connection.execute(query, params).fetchall()
+            results = conn.execute(query, params).fetchall()
 
             if results:
-                # ✅ 첫 번째 행의 JSON을 파싱 (배열로 저장되어 있음)
-                data = json.loads(results[0][0])
+                # ✅ 첫 번째 행에 전체 배열이 저장되어 있음
+                row_id, data_json, payload, codec = results[0]
+                data = decode_payload(codec, data_json, payload)
+                self.cache_maintenance.record_access("unified_cache", row_id)
                 logger.info(f"통합 캐시 HIT: {data_type}.{cache_key} ({len(data)} 항목)")
                 return data
             else:
@@ -1064,33 +1893,138 @@ class DatabaseManager:
             logger.error(f"통합 캐시 조회 실패: {e}")
             return None
 
-    def _make_json_serializable(self, obj) -> Any:
-        """객체를 JSON 직렬화 가능하도록 변환"""
-        import json
-        from datetime import datetime
-        from decimal import Decimal
+    def get_unified_cache_entry(
+        self,
+        cache_key: str,
+        data_type: str,
+        symbol: str | None = None,
+        max_stale_hours: float = 0.0,
+    ) -> UnifiedCacheEntry | None:
+        """만료 후 ``max_stale_hours`` 이내의 행까지 만료 시각과 함께 조회
 
-        if isinstance(obj, dict):
-            return {
-                key: self._make_json_serializable(value) for key, value in obj.items()
-            }
-        elif isinstance(obj, list):
-            return [self._make_json_serializable(item) for item in obj]
-        elif isinstance(obj, datetime):
-            return obj.isoformat()
-        elif isinstance(obj, Decimal):
-            return float(obj)
-        elif hasattr(obj, "model_dump"):  # Pydantic 모델
-            return self._make_json_serializable(obj.model_dump())
-        elif hasattr(obj, "dict"):  # Pydantic v1 스타일
-            return self._make_json_serializable(obj.dict())
+        stale-while-revalidate 용도이며, 만료 여부는 ``entry.is_fresh`` 로 판단합니다.
+        """
+        self._ensure_connected()
+        if not self.connection:
+            raise RuntimeError("데이터베이스에 연결되지 않음")
+
+        conn = self.thread_cursor()
+
+        try:
+            oldest_expiry = datetime.now(UTC) - timedelta(hours=max_stale_hours)
+            row = conn.execute(
+                """
+                SELECT id, data_json, payload, codec, expires_at FROM unified_cache
+                WHERE cache_key = ? AND data_type = ? AND (symbol = ? OR symbol IS NULL)
+                AND (expires_at IS NULL OR expires_at > ?)
+                ORDER BY created_at
+                LIMIT 1
+                """,
+                [cache_key, data_type, symbol, oldest_expiry],
+            ).fetchone()
+            if not row:
+                return None
+
+            row_id, data_json, payload, codec, expires_at = row
+            self.cache_maintenance.record_access("unified_cache", row_id)
+            if expires_at is not None and expires_at.tzinfo is None:
+                expires_at = expires_at.replace(tzinfo=UTC)
+            return UnifiedCacheEntry(
+                data=decode_payload(codec, data_json, payload), expires_at=expires_at
+            )
+
+        except Exception as e:
+            logger.error(f"통합 캐시 조회 실패: {e}")
+            return None
+
+    def migrate_cache_payloads(self, table_name: str = "unified_cache") -> int:
+        """레거시 JSON 캐시 행을 현재 코덱(``CACHE_PAYLOAD_CODEC``)으로 재인코딩
+
+        - ``unified_cache``: 행별로 data_type에 맞는 코덱으로 변환
+        - 키별 캐시 테이블(``market_data_cache`` 등): 항목당 한 행이던 레거시 행을
+          cache_key별 한 행으로 합쳐 저장
+
+        조회 경로는 레거시 행도 그대로 읽으므로 서비스 중단 없이 실행할 수 있습니다.
+
+        Returns:
+            변환된 cache_key(행) 수
+        """
+        from itertools import groupby
+
+        self._ensure_connected()
+        if not self.connection:
+            raise RuntimeError("데이터베이스에 연결되지 않음")
+
+        conn = self.thread_cursor()
+        if table_name == "unified_cache":
+            self._ensure_cache_columns(table_name, conn)
         else:
-            # 기본 JSON 직렬화 시도
-            try:
-                json.dumps(obj)
-                return obj
-            except (TypeError, ValueError):
-                return str(obj)
+            self._create_cache_table(table_name, conn)
+
+        preference = settings.CACHE_PAYLOAD_CODEC
+        migrated = 0
+        conn.execute("BEGIN TRANSACTION")
+        try:
+            if table_name == "unified_cache":
+                rows = conn.execute(
+                    "SELECT id, data_type, data_json FROM unified_cache WHERE codec IS NULL"
+                ).fetchall()
+                updates = []
+                for row_id, data_type, data_json in rows:
+                    codec, text, payload = encode_payload(
+                        decode_payload(None, data_json, None),
+                        select_codec(data_type, preference),
+                    )
+                    updates.append([text, payload, codec, row_id])
+                if updates:
+                    conn.executemany(
+                        "UPDATE unified_cache SET data_json = ?, payload = ?, codec = ? WHERE id = ?",
+                        updates,
+                    )
+                migrated = len(updates)
+            else:
+                codec_choice = select_codec(table_name, preference)
+                rows = conn.execute(
+                    f"""
+                    SELECT cache_key, data_json, created_at, updated_at FROM {table_name}
+                    WHERE codec IS NULL
+                    ORDER BY cache_key, created_at
+                    """
+                ).fetchall()
+                for cache_key, group in groupby(rows, key=lambda row: row[0]):
+                    group_rows = list(group)
+                    codec, text, payload = encode_payload(
+                        [json.loads(row[1]) for row in group_rows], codec_choice
+                    )
+                    conn.execute(
+                        f"DELETE FROM {table_name} WHERE cache_key = ? AND codec IS NULL",
+                        [cache_key],
+                    )
+                    conn.execute(
+                        f"""
+                        INSERT INTO {table_name}
+                        (id, cache_key, data_json, payload, codec,
+                         created_at, updated_at)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        [
+                            str(uuid.uuid4()),
+                            cache_key,
+                            text,
+                            payload,
+                            codec,
+                            min(row[2] for row in group_rows),
+                            min(row[3] for row in group_rows),
+                        ],
+                    )
+                    migrated += 1
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+        logger.info(f"🔧 캐시 페이로드 마이그레이션 완료: {table_name} ({migrated} 행)")
+        return migrated
 
 
 def get_database() -> DatabaseManager:
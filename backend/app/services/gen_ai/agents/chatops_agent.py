@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, time
@@ -174,10 +173,9 @@ class ChatOpsAgent:
         duckdb_last_updated: Optional[datetime] = None
 
         try:
-            self.database_manager.connect()
 
             def _query_duckdb() -> tuple[int, Optional[datetime]]:
-                conn = self.database_manager.duckdb_conn
+                conn = self.database_manager.thread_cursor()
                 result = conn.execute(
                     "SELECT COUNT(*) AS cnt, MAX(date) AS last_date FROM daily_prices"
                 ).fetchone()
@@ -190,8 +188,11 @@ class ChatOpsAgent:
                     last_dt = None
                 return int(total_count or 0), last_dt
 
-            duckdb_row_count, duckdb_last_updated = await asyncio.to_thread(
-                _query_duckdb
+            (
+                duckdb_row_count,
+                duckdb_last_updated,
+            ) = await self.database_manager.async_manager.run_read(
+                "chatops_cache_status", _query_duckdb
             )
         except Exception as exc:  # pragma: no cover - database connectivity
             duckdb_status = "error"
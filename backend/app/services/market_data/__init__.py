@@ -133,7 +133,7 @@ class MarketDataService:
 
             if self.database_manager:
                 try:
-                    self.database_manager.connect()
+                    await self.database_manager.async_manager.connect()
                     duckdb_status = "connected"
                 except Exception:
                     duckdb_status = "disconnected"
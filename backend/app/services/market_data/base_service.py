@@ -1,19 +1,79 @@
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta, UTC
-from typing import Any, Dict, List, Optional, Type
+from datetime import date, datetime, timedelta, UTC
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Type
 from decimal import Decimal
 import asyncio
 import logging
 from dataclasses import dataclass
 from enum import Enum
 
-from app.alpha_vantage import AlphaVantageClient
+from app.alpha_vantage import AlphaVantageClient, RequestPriority, request_priority
+from app.core.cache_stats import cache_stats
+from app.core.config import settings
+from app.core.l1_cache import l1_cache
+from app.core.single_flight import SingleFlight
 from app.services.database_manager import DatabaseManager
 from app.models.market_data.base import BaseMarketDataDocument, DataQualityScore
 
 
 logger = logging.getLogger(__name__)
 
+# 같은 캐시 키의 동시 캐시 미스 병합 (외부 호출 + DuckDB 쓰기 1회)
+cache_flight = SingleFlight("market_data_cache")
+
+# stale-while-revalidate: 캐시 키별 진행 중인 백그라운드 갱신 (키당 1개)
+_revalidations: dict[tuple[Any, ...], asyncio.Task[Any]] = {}
+
+# data_type(또는 접두사)별 만료 후 유예 시간. 유예 안이면 만료 데이터를 즉시 반환하고
+# 백그라운드에서 갱신합니다. 만료 행은 CACHE_EXPIRED_GRACE_HOURS 후 정리되므로
+# 그보다 긴 값은 효과가 없습니다.
+DEFAULT_STALE_GRACE_HOURS: dict[str, float] = {
+    "realtime_quote": 0.02,
+    "crypto_exchange_rate": 0.02,
+    "news": 1.0,
+    "sentiment": 1.0,
+    "fundamental": 24.0,
+}
+
+
+def parse_stale_grace(spec: str) -> dict[str, float]:
+    """``"news=0.5,fundamental=12"`` → ``{data_type: 유예 시간(h)}``"""
+    grace: dict[str, float] = {}
+    for entry in spec.split(","):
+        if not entry.strip():
+            continue
+        name, _, value = entry.partition("=")
+        try:
+            grace[name.strip()] = float(value)
+        except ValueError:
+            logger.warning(f"⚠️ 잘못된 stale 유예 설정 무시: {entry}")
+    return grace
+
+
+# Alpha Vantage compact 응답의 봉 수
+COMPACT_BARS = 100
+
+_INTERVAL_MINUTES = {"1min": 1, "5min": 5, "15min": 15, "30min": 30, "60min": 60}
+
+
+def compact_window(interval: str) -> Optional[timedelta]:
+    """인트라데이 compact 응답이 커버하는 기간 (알 수 없는 간격은 None)"""
+    minutes = _INTERVAL_MINUTES.get(interval)
+    return timedelta(minutes=minutes * (COMPACT_BARS - 1)) if minutes else None
+
+
+def trading_days_between(start: date, end: date) -> int:
+    """start 이후 end까지(포함)의 평일 수 (휴장일은 무시한 근사치)"""
+    if end <= start:
+        return 0
+    days = (end - start).days
+    weeks, remainder = divmod(days, 7)
+    count = weeks * 5
+    for offset in range(1, remainder + 1):
+        if (start.weekday() + offset) % 7 < 5:
+            count += 1
+    return count
+
 
 @dataclass
 class CacheResult:
@@ -47,6 +107,22 @@ class CacheStrategy:
         self.mongodb_ttl = timedelta(hours=mongodb_ttl_hours)
         self.force_refresh_threshold = timedelta(hours=force_refresh_threshold_hours)
         self.max_retries = max_cache_miss_retries
+        self.stale_grace_hours = {
+            **DEFAULT_STALE_GRACE_HOURS,
+            **parse_stale_grace(settings.CACHE_SWR_GRACE),
+        }
+
+    def stale_grace(self, data_type: str) -> timedelta:
+        """stale-while-revalidate 유예 시간 (정확한 이름 → 가장 긴 접두사 → 기본값)"""
+        hours = self.stale_grace_hours.get(data_type)
+        if hours is None:
+            prefixes = [p for p in self.stale_grace_hours if data_type.startswith(p)]
+            hours = (
+                self.stale_grace_hours[max(prefixes, key=len)]
+                if prefixes
+                else settings.CACHE_SWR_GRACE_HOURS
+            )
+        return timedelta(hours=max(0.0, hours))
 
 
 class DataQualityValidator:
@@ -147,6 +223,13 @@ class BaseMarketDataService(ABC):
         Returns:
             캐시된 데이터 리스트 또는 None
         """
+        # 0. L1 캐시 확인 (store_data/store_cache_data가 무효화)
+        l1_key = (cache_key, model_class.__name__, start_date, end_date)
+        hit, cached = l1_cache.get("market_data_cache", l1_key)
+        if hit:
+            return cached or None
+
+        l1_ttl = self.cache_strategy.duckdb_ttl.total_seconds()
         try:
             # 1. DuckDB 캐시 확인 (고속)
             duckdb_data = await self._get_from_duckdb_cache(
@@ -161,6 +244,13 @@ class BaseMarketDataService(ABC):
                     item_copy = item.copy()
                     item_copy.pop("id", None)  # DuckDB UUID ID 제거
                     processed_data.append(model_class(**item_copy))
+                l1_cache.set(
+                    "market_data_cache",
+                    l1_key,
+                    processed_data,
+                    l1_ttl,
+                    cache_key=cache_key,
+                )
                 return processed_data
 
             # 2. MongoDB 캐시 확인 (보조)
@@ -169,11 +259,19 @@ class BaseMarketDataService(ABC):
             )
             if mongodb_data:
                 logger.info(f"Cache HIT (MongoDB): {cache_key}")
-                # MongoDB 데이터를 DuckDB에 백업
+                # MongoDB 데이터를 DuckDB에 백업 (L1 무효화 후 저장)
                 await self._store_to_duckdb_cache(cache_key, mongodb_data)
+                l1_cache.set(
+                    "market_data_cache",
+                    l1_key,
+                    mongodb_data,
+                    l1_ttl,
+                    cache_key=cache_key,
+                )
                 return mongodb_data
 
             logger.info(f"Cache MISS: {cache_key}")
+            l1_cache.set("market_data_cache", l1_key, [], cache_key=cache_key)
             return None
 
         except Exception as e:
@@ -197,6 +295,7 @@ class BaseMarketDataService(ABC):
         Returns:
             저장 성공 여부
         """
+        l1_cache.invalidate(table_name, cache_key=cache_key)
         try:
             if not data:
                 return True
@@ -241,7 +340,7 @@ class BaseMarketDataService(ABC):
             )
 
             # DuckDB에서 캐시 데이터 조회
-            cached_data = self._db_manager.get_cache_data(
+            cached_data = await self._db_manager.async_manager.get_cache_data(
                 cache_key=cache_key,
                 table_name="market_data_cache",
                 ttl_hours=int(ttl_hours),
@@ -364,7 +463,7 @@ class BaseMarketDataService(ABC):
                 records.append(record)
 
             # DuckDB에 저장
-            success = self._db_manager.store_cache_data(
+            success = await self._db_manager.async_manager.store_cache_data(
                 cache_key=cache_key, data=records, table_name=table_name
             )
 
@@ -453,98 +552,111 @@ class BaseMarketDataService(ABC):
         Returns:
             데이터 리스트
         """
+        # L1: 변환이 끝난 모델 리스트 (DuckDB 조회/JSON 파싱/모델 생성 생략)
+        l1_key = (cache_key, symbol)
+        hit, cached = l1_cache.get(data_type, l1_key)
+        if hit:
+            return cached
+
+        # 같은 캐시 키로 동시에 들어온 조회는 한 번만 실행하고 결과 공유
+        result, fresh = await cache_flight.do(
+            ("unified", data_type, cache_key, symbol),
+            lambda: self._load_with_unified_cache(
+                cache_key,
+                data_type,
+                model_class,
+                refresh_callback,
+                symbol,
+                ttl_hours,
+                **refresh_kwargs,
+            ),
+        )
+        if fresh:
+            # 만료 데이터는 L1에 넣지 않음 (백그라운드 갱신 결과를 가리지 않도록)
+            l1_cache.set(
+                data_type,
+                l1_key,
+                result,
+                ttl_seconds=ttl_hours * 3600,
+                cache_key=cache_key,
+                symbol=symbol,
+            )
+        return result
+
+    async def _load_with_unified_cache(
+        self,
+        cache_key: str,
+        data_type: str,
+        model_class: Type[Any],
+        refresh_callback,
+        symbol: str | None = None,
+        ttl_hours: int = 24,
+        **refresh_kwargs,
+    ) -> tuple[List[Any], bool]:
+        """통합 캐시 조회/갱신 본체 (``get_data_with_unified_cache`` 참고)
+
+        Returns:
+            (모델 리스트, 최신 데이터 여부). 만료 후 유예 시간 안의 데이터는 즉시
+            반환하고(False) 백그라운드 갱신을 예약합니다.
+        """
         try:
-            # 1. 통합 캐시 확인
-            if not self._db_manager:
-                self._db_manager = DatabaseManager()
-            self._db_manager.connect()
+            # 1. 통합 캐시 확인 (유예 시간 안의 만료 행 포함)
+            async_db = self.db_manager.async_manager
+            await async_db.connect()
 
-            cached_data = self._db_manager.get_unified_cache(
+            grace = self.cache_strategy.stale_grace(data_type)
+            entry = await async_db.get_unified_cache_entry(
                 cache_key=cache_key,
                 data_type=data_type,
                 symbol=symbol,
-                ignore_ttl=False,
+                max_stale_hours=grace.total_seconds() / 3600,
             )
 
-            if cached_data:
-                logger.info(f"통합 캐시 HIT: {data_type}.{cache_key}")
-                # JSON 데이터를 모델 객체로 변환
-                result = []
-                for item in cached_data:
-                    try:
-                        # ID 필드 제거 (새로운 ObjectId 생성을 위해)
-                        item_copy = item.copy()
-                        item_copy.pop("id", None)
-
-                        # Decimal 필드 안전 변환
-                        item_copy = self._restore_decimal_fields(item_copy)
-
-                        model_instance = model_class(**item_copy)
-                        result.append(model_instance)
-                    except Exception as model_error:
-                        logger.warning(
-                            f"Failed to create model from cached data: {model_error}"
-                        )
-                        continue
-                return result
+            cache_stats.record(data_type, bool(entry and entry.data))
+            if entry and entry.data:
+                result = self._build_models(entry.data, model_class, "cached")
+                if entry.is_fresh:
+                    logger.info(f"통합 캐시 HIT: {data_type}.{cache_key}")
+                    return result, True
 
-            # 2. 캐시 미스 시 외부 소스에서 갱신
-            logger.info(f"통합 캐시 MISS: {data_type}.{cache_key}")
-            fresh_data = await refresh_callback(**refresh_kwargs)
-
-            if fresh_data:
-                # 통합 캐시에 저장 (dict 리스트)
-                success = self._db_manager.store_unified_cache(
-                    cache_key=cache_key,
-                    data=fresh_data,
-                    data_type=data_type,
-                    symbol=symbol,
-                    ttl_hours=ttl_hours,
-                    metadata={"refresh_kwargs": refresh_kwargs},
+                logger.info(
+                    f"통합 캐시 STALE: {data_type}.{cache_key} "
+                    f"(expired {entry.expires_at}), 백그라운드 갱신"
                 )
-
-                if success:
-                    logger.info(f"통합 캐시 저장 완료: {data_type}.{cache_key}")
-                else:
-                    logger.warning(f"통합 캐시 저장 실패: {data_type}.{cache_key}")
-
-                # dict를 모델로 변환
-                result = []
-                for item in fresh_data:
-                    try:
-                        if isinstance(item, dict):
-                            # ID 필드 제거
-                            item_copy = item.copy()
-                            item_copy.pop("id", None)
-                            # Decimal 필드 복원
-                            item_copy = self._restore_decimal_fields(item_copy)
-                            model_instance = model_class(**item_copy)
-                            result.append(model_instance)
-                        else:
-                            # 이미 모델 인스턴스인 경우
-                            result.append(item)
-                    except Exception as model_error:
-                        logger.warning(
-                            f"Failed to create model from fresh data: {model_error}"
-                        )
-                        continue
-
-                return result
-            else:
-                logger.warning(
-                    f"No data received from source for {data_type}.{cache_key}"
+                self._schedule_revalidation(
+                    cache_key,
+                    data_type,
+                    model_class,
+                    refresh_callback,
+                    symbol,
+                    ttl_hours,
+                    refresh_kwargs,
                 )
-                return []
+                return result, False
+
+            # 2. 캐시 미스 시 외부 소스에서 갱신
+            logger.info(f"통합 캐시 MISS: {data_type}.{cache_key}")
+            return (
+                await self._refresh_unified_cache(
+                    cache_key,
+                    data_type,
+                    model_class,
+                    refresh_callback,
+                    symbol,
+                    ttl_hours,
+                    refresh_kwargs,
+                ),
+                True,
+            )
 
         except Exception as e:
             logger.error(f"통합 캐시 데이터 조회 실패 ({data_type}.{cache_key}): {e}")
             # 최후의 수단으로 만료된 캐시라도 반환
             try:
-                if not self._db_manager:
-                    self._db_manager = DatabaseManager()
-                self._db_manager.connect()
+                async_db = self.db_manager.async_manager
+                await async_db.connect()
 
-                stale_data = self._db_manager.get_unified_cache(
+                stale_data = await async_db.get_unified_cache(
                     cache_key=cache_key,
                     data_type=data_type,
                     symbol=symbol,
@@ -554,20 +666,235 @@ class BaseMarketDataService(ABC):
                     logger.info(
                         f"Returning stale cache data for {data_type}.{cache_key}"
                     )
-                    result = []
-                    for item in stale_data:
-                        try:
-                            item_copy = item.copy()
-                            item_copy.pop("id", None)
-                            item_copy = self._restore_decimal_fields(item_copy)
-                            result.append(model_class(**item_copy))
-                        except Exception:
-                            continue
-                    return result
+                    return self._build_models(stale_data, model_class, "stale"), False
             except Exception:
                 pass
+            return [], False
+
+    async def _refresh_unified_cache(
+        self,
+        cache_key: str,
+        data_type: str,
+        model_class: Type[Any],
+        refresh_callback,
+        symbol: str | None,
+        ttl_hours: int,
+        refresh_kwargs: Dict[str, Any],
+    ) -> List[Any]:
+        """외부 소스 조회 후 통합 캐시 교체 (삭제+삽입은 한 트랜잭션)"""
+        async_db = self.db_manager.async_manager
+        fresh_data = await refresh_callback(**refresh_kwargs)
+
+        if not fresh_data:
+            logger.warning(f"No data received from source for {data_type}.{cache_key}")
             return []
 
+        # 통합 캐시에 저장 (dict 리스트)
+        success = await async_db.store_unified_cache(
+            cache_key=cache_key,
+            data=fresh_data,
+            data_type=data_type,
+            symbol=symbol,
+            ttl_hours=ttl_hours,
+            metadata={"refresh_kwargs": refresh_kwargs},
+        )
+
+        if success:
+            logger.info(f"통합 캐시 저장 완료: {data_type}.{cache_key}")
+        else:
+            logger.warning(f"통합 캐시 저장 실패: {data_type}.{cache_key}")
+
+        return self._build_models(fresh_data, model_class, "fresh")
+
+    def _schedule_revalidation(
+        self,
+        cache_key: str,
+        data_type: str,
+        model_class: Type[Any],
+        refresh_callback,
+        symbol: str | None,
+        ttl_hours: int,
+        refresh_kwargs: Dict[str, Any],
+    ) -> None:
+        """캐시 키당 하나의 백그라운드 갱신 태스크 예약 (진행 중이면 무시)"""
+        key = (data_type, cache_key, symbol)
+        running = _revalidations.get(key)
+        if running is not None and not running.done():
+            return
+
+        async def _revalidate() -> None:
+            try:
+                with request_priority(RequestPriority.BACKGROUND):
+                    await self._refresh_unified_cache(
+                        cache_key,
+                        data_type,
+                        model_class,
+                        refresh_callback,
+                        symbol,
+                        ttl_hours,
+                        refresh_kwargs,
+                    )
+                logger.info(f"🔄 백그라운드 갱신 완료: {data_type}.{cache_key}")
+            except Exception as e:
+                logger.warning(f"⚠️ 백그라운드 갱신 실패 ({data_type}.{cache_key}): {e}")
+
+        def _release(done: asyncio.Task[Any]) -> None:
+            if _revalidations.get(key) is done:
+                del _revalidations[key]
+
+        task = asyncio.create_task(_revalidate())
+        _revalidations[key] = task
+        task.add_done_callback(_release)
+
+    def _build_models(
+        self, items: List[Any], model_class: Type[Any], origin: str
+    ) -> List[Any]:
+        """캐시/응답 dict를 모델로 변환 (이미 모델인 항목은 그대로, 실패 항목은 건너뜀)"""
+        result = []
+        for item in items:
+            if not isinstance(item, dict):
+                result.append(item)
+                continue
+            try:
+                # ID 필드 제거 (새로운 ObjectId 생성을 위해), Decimal 필드 복원
+                item_copy = item.copy()
+                item_copy.pop("id", None)
+                result.append(model_class(**self._restore_decimal_fields(item_copy)))
+            except Exception as model_error:
+                logger.warning(
+                    f"Failed to create model from {origin} data: {model_error}"
+                )
+        return result
+
+    async def get_series_with_cache(
+        self,
+        series_key: str,
+        data_type: str,
+        model_class: Type[Any],
+        refresh_callback: Callable[[], Awaitable[List[Any]]],
+        symbol: str | None = None,
+        ttl_hours: float = 24,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        limit: int | None = None,
+        full_history: bool = False,
+        incremental_callback: Callable[[], Awaitable[List[Any]]] | None = None,
+        incremental_window: timedelta | None = None,
+    ) -> List[Any]:
+        """
+        시계열 캐시(typed 테이블)를 사용한 구간 조회
+
+        만료 시 저장된 마지막 봉 이후만 기록하며, 마지막 봉이 ``incremental_window``
+        안에 있으면 ``incremental_callback`` (compact 응답 등)으로 갱신합니다.
+
+        Args:
+            series_key: 시계열 키 (심볼/마켓/간격 등, outputsize 제외)
+            data_type: 시계열 data_type (``SERIES_SPECS``)
+            model_class: 데이터 모델 클래스
+            refresh_callback: 전체 데이터 조회 콜백
+            symbol: 심볼 (옵션)
+            ttl_hours: TTL (시간 단위)
+            start: 시작 시점 (포함)
+            end: 종료 시점 (포함)
+            limit: 최신 봉 기준 최대 개수
+            full_history: 전체 이력 요청 여부 (compact만 저장된 경우 전체 조회)
+            incremental_callback: 최신 구간만 조회하는 콜백 (옵션)
+            incremental_window: incremental_callback이 커버하는 기간
+
+        Returns:
+            최신 봉부터 정렬된 모델 리스트
+        """
+        async_db = self.db_manager.async_manager
+        await async_db.connect()
+
+        # 갱신(외부 호출 + 저장)만 병합하고, 구간 조회는 호출자별로 수행
+        has_data = await cache_flight.do(
+            ("series", data_type, series_key, full_history),
+            lambda: self._refresh_series(
+                series_key,
+                data_type,
+                refresh_callback,
+                symbol,
+                ttl_hours,
+                full_history,
+                incremental_callback,
+                incremental_window,
+            ),
+        )
+        if not has_data:
+            return []
+
+        rows = await async_db.read_series(data_type, series_key, start, end, limit)
+        result = []
+        for item in rows:
+            try:
+                result.append(model_class(**self._restore_decimal_fields(item)))
+            except Exception as model_error:
+                logger.warning(
+                    f"Failed to create model from series cache: {model_error}"
+                )
+        return result
+
+    async def _refresh_series(
+        self,
+        series_key: str,
+        data_type: str,
+        refresh_callback: Callable[[], Awaitable[List[Any]]],
+        symbol: str | None,
+        ttl_hours: float,
+        full_history: bool,
+        incremental_callback: Callable[[], Awaitable[List[Any]]] | None,
+        incremental_window: timedelta | None,
+    ) -> bool:
+        """만료/미적재 시계열 갱신 (저장된 데이터가 있으면 True)"""
+        async_db = self.db_manager.async_manager
+        meta = await async_db.get_series_meta(data_type, series_key)
+        needs_full = meta is None or (full_history and not meta.complete)
+        stale = needs_full or not meta.is_fresh()
+        cache_stats.record(data_type, not stale)
+
+        if stale:
+            callback = refresh_callback
+            if (
+                not needs_full
+                and meta.last_ts is not None
+                and incremental_callback is not None
+                and incremental_window is not None
+                and meta.last_ts
+                >= datetime.now(UTC).replace(tzinfo=None) - incremental_window
+            ):
+                callback = incremental_callback
+            logger.info(
+                f"시계열 캐시 MISS: {data_type}.{series_key} "
+                f"({'full' if callback is refresh_callback else 'incremental'})"
+            )
+
+            try:
+                fresh_data = await callback()
+            except Exception as e:
+                if meta is None:
+                    raise
+                logger.error(f"시계열 갱신 실패, 저장된 데이터 반환 ({data_type}.{series_key}): {e}")
+                fresh_data = []
+
+            if fresh_data:
+                await async_db.append_series(
+                    data_type,
+                    series_key,
+                    symbol,
+                    fresh_data,
+                    ttl_hours,
+                    callback is refresh_callback and full_history,
+                )
+            elif meta is None:
+                logger.warning(
+                    f"No data received from source for {data_type}.{series_key}"
+                )
+                return False
+        else:
+            logger.info(f"시계열 캐시 HIT: {data_type}.{series_key}")
+        return True
+
     def _restore_decimal_fields(self, data: dict) -> dict:
         """JSON에서 복원된 데이터의 Decimal 필드를 복구"""
         from decimal import Decimal
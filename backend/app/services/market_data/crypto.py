@@ -8,7 +8,11 @@ from datetime import datetime
 from decimal import Decimal
 import logging
 
-from app.services.market_data.base_service import BaseMarketDataService
+from app.services.market_data.base_service import (
+    COMPACT_BARS,
+    BaseMarketDataService,
+    compact_window,
+)
 from app.models.market_data.crypto import (
     CryptoExchangeRate,
     CryptoIntradayPrice,
@@ -94,22 +98,39 @@ class CryptoService(BaseMarketDataService):
         market: str,
         interval: Literal["1min", "5min", "15min", "30min", "60min"],
         outputsize: str = "compact",
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
     ) -> List[CryptoIntradayPrice]:
-        """암호화폐 인트라데이 가격 조회"""
-        cache_key = f"crypto_intraday_{symbol}_{market}_{interval}_{outputsize}"
+        """암호화폐 인트라데이 가격 조회
+
+        compact 응답(최근 100봉)으로 저장된 시계열 뒤에 새 봉만 이어 붙입니다.
+        """
+        series_key = f"{symbol}_{market}_{interval}"
+        full_history = outputsize == "full"
 
         async def refresh_callback():
             return await self._fetch_intraday_prices_from_alpha_vantage(
                 symbol, market, interval, outputsize
             )
 
-        results = await self.get_data_with_unified_cache(
-            cache_key=cache_key,
-            model_class=CryptoIntradayPrice,
+        async def incremental_callback():
+            return await self._fetch_intraday_prices_from_alpha_vantage(
+                symbol, market, interval, "compact"
+            )
+
+        results = await self.get_series_with_cache(
+            series_key=series_key,
             data_type="crypto_intraday",
-            symbol=f"{symbol}_{market}",
+            model_class=CryptoIntradayPrice,
             refresh_callback=refresh_callback,
+            symbol=f"{symbol}_{market}",
             ttl_hours=1,  # 인트라데이 데이터는 1시간 TTL
+            start=start,
+            end=end,
+            limit=None if full_history or start or end else COMPACT_BARS,
+            full_history=full_history,
+            incremental_callback=incremental_callback,
+            incremental_window=compact_window(interval),
         )
 
         return cast(List[CryptoIntradayPrice], results)
@@ -118,20 +139,23 @@ class CryptoService(BaseMarketDataService):
         self,
         symbol: str,
         market: str = "USD",
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
     ) -> List[CryptoDailyPrice]:
         """암호화폐 일일 가격 데이터 조회"""
-        cache_key = f"crypto_daily_{symbol}_{market}"
 
         async def refresh_callback():
             return await self._fetch_daily_prices_from_alpha_vantage(symbol, market)
 
-        results = await self.get_data_with_unified_cache(
-            cache_key=cache_key,
-            model_class=CryptoDailyPrice,
+        results = await self.get_series_with_cache(
+            series_key=f"{symbol}_{market}",
             data_type="crypto_daily",
-            symbol=f"{symbol}_{market}",
+            model_class=CryptoDailyPrice,
             refresh_callback=refresh_callback,
+            symbol=f"{symbol}_{market}",
             ttl_hours=6,  # 일일 데이터는 6시간 TTL
+            start=start,
+            end=end,
         )
 
         return cast(List[CryptoDailyPrice], results)
@@ -140,20 +164,23 @@ class CryptoService(BaseMarketDataService):
         self,
         symbol: str,
         market: str = "USD",
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
     ) -> List[CryptoWeeklyPrice]:
         """암호화폐 주간 가격 데이터 조회"""
-        cache_key = f"crypto_weekly_{symbol}_{market}"
 
         async def refresh_callback():
             return await self._fetch_weekly_prices_from_alpha_vantage(symbol, market)
 
-        results = await self.get_data_with_unified_cache(
-            cache_key=cache_key,
-            model_class=CryptoWeeklyPrice,
+        results = await self.get_series_with_cache(
+            series_key=f"{symbol}_{market}",
             data_type="crypto_weekly",
-            symbol=f"{symbol}_{market}",
+            model_class=CryptoWeeklyPrice,
             refresh_callback=refresh_callback,
+            symbol=f"{symbol}_{market}",
             ttl_hours=24,  # 주간 데이터는 24시간 TTL
+            start=start,
+            end=end,
         )
 
         return cast(List[CryptoWeeklyPrice], results)
@@ -162,20 +189,23 @@ class CryptoService(BaseMarketDataService):
         self,
         symbol: str,
         market: str = "USD",
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
     ) -> List[CryptoMonthlyPrice]:
         """암호화폐 월간 가격 데이터 조회"""
-        cache_key = f"crypto_monthly_{symbol}_{market}"
 
         async def refresh_callback():
             return await self._fetch_monthly_prices_from_alpha_vantage(symbol, market)
 
-        results = await self.get_data_with_unified_cache(
-            cache_key=cache_key,
-            model_class=CryptoMonthlyPrice,
+        results = await self.get_series_with_cache(
+            series_key=f"{symbol}_{market}",
             data_type="crypto_monthly",
-            symbol=f"{symbol}_{market}",
+            model_class=CryptoMonthlyPrice,
             refresh_callback=refresh_callback,
+            symbol=f"{symbol}_{market}",
             ttl_hours=168,  # 월간 데이터는 1주일(168시간) TTL
+            start=start,
+            end=end,
         )
 
         return cast(List[CryptoMonthlyPrice], results)
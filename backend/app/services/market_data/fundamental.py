@@ -763,7 +763,7 @@ class FundamentalService(BaseMarketDataService):
                     )
                     # 원본 데이터를 딕셔너리로 저장
                     if self._db_manager:
-                        return self._db_manager.store_cache_data(
+                        return await self._db_manager.async_manager.store_cache_data(
                             cache_key=cache_key,
                             data=[data],
                             table_name="fundamental_cache",
@@ -3,7 +3,10 @@ Technical Indicator Service Package
 기술적 지표 서비스 패키지 - 통합 인터페이스
 
 이 패키지는 기술적 지표를 카테고리별로 분리하여 관리합니다:
-- base: 공통 로직 (캐싱, 메타데이터 저장)
+- base: 공통 로직 (로컬 계산, 캐싱, 메타데이터 저장)
+- engine: 저장된 OHLCV 기반 벡터화 지표 계산 (NumPy)
+- streaming: 새 봉 단위 증분 지표 상태 (DuckDB 저장)
+- batch: 여러 심볼 × 여러 지표 일괄 계산 (가격 패널 1회 조회)
 - trend: 추세 지표 (SMA, EMA, WMA, DEMA, TEMA)
 - momentum: 모멘텀 지표 (RSI, MACD, STOCH)
 - volatility: 변동성 지표 (BBANDS, ATR, ADX)
@@ -12,7 +15,8 @@ TechnicalIndicatorService 클래스는 모든 지표를 통합하여 제공하
 기존 코드와 100% 호환됩니다 (delegation pattern).
 """
 
-from typing import Optional, Dict, List, Literal
+from datetime import datetime
+from typing import Any, Optional, Dict, List, Literal, Mapping, Sequence
 
 from app.services.database_manager import DatabaseManager
 from app.schemas.market_data.technical_indicator import TechnicalIndicatorData
@@ -20,6 +24,8 @@ from app.schemas.market_data.technical_indicator import TechnicalIndicatorData
 from .trend import TrendIndicatorService
 from .momentum import MomentumIndicatorService
 from .volatility import VolatilityIndicatorService
+from .streaming import StreamingIndicatorService
+from .batch import BatchIndicatorService, IndicatorBatch
 
 
 class TechnicalIndicatorService:
@@ -43,6 +49,7 @@ class TechnicalIndicatorService:
         self._trend_service = TrendIndicatorService(database_manager)
         self._momentum_service = MomentumIndicatorService(database_manager)
         self._volatility_service = VolatilityIndicatorService(database_manager)
+        self._batch_service = BatchIndicatorService(database_manager)
 
     # ========== Trend Indicators (추세 지표) ==========
 
@@ -211,6 +218,19 @@ class TechnicalIndicatorService:
         """평균방향지수(ADX) 조회"""
         return await self._volatility_service.get_adx(symbol, interval, time_period)
 
+    # ========== Batch (일괄 계산) ==========
+
+    async def compute_batch(
+        self,
+        symbols: Sequence[str],
+        specs: Sequence[Mapping[str, Any]],
+        interval: str = "daily",
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> IndicatorBatch:
+        """여러 심볼 × 여러 지표 일괄 계산 (저장된 OHLCV, 벡터화 1회)"""
+        return await self._batch_service.compute(symbols, specs, interval, start, end)
+
     # ========== Utility Methods ==========
 
     async def get_indicator_list(self) -> Dict[str, List[str]]:
@@ -243,4 +263,7 @@ __all__ = [
     "TrendIndicatorService",
     "MomentumIndicatorService",
     "VolatilityIndicatorService",
+    "StreamingIndicatorService",
+    "BatchIndicatorService",
+    "IndicatorBatch",
 ]
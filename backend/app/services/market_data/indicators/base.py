@@ -3,25 +3,159 @@ Base Technical Indicator Service
 기술적 지표 서비스 기본 클래스 - 공통 로직 (캐싱, 파싱)
 """
 
+import asyncio
 import json
 import logging
-from datetime import datetime, timedelta, UTC
+import random
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta, UTC
 from typing import Optional, List, Dict, Any, Literal
 from decimal import Decimal
 
+import numpy as np
+
+from app.core.cache_stats import cache_stats
+from app.core.indicator_cache import indicator_cache
+from app.core.config import settings
+from app.core.single_flight import SingleFlight
 from app.services.database_manager import DatabaseManager
-from app.alpha_vantage import AlphaVantageClient
+from app.services.market_data.base_service import trading_days_between
+from app.alpha_vantage import AlphaVantageClient, RequestPriority, request_priority
 from app.models.market_data.technical_indicator import TechnicalIndicator
 from app.schemas.market_data.technical_indicator import (
     IndicatorDataPoint,
+    TechnicalIndicatorData,
 )
 
+from . import engine
+
 logger = logging.getLogger(__name__)
 
+# 같은 지표/파라미터의 동시 조회 병합 (API 호출 + 캐시 쓰기 1회)
+indicator_flight = SingleFlight("technical_indicators")
+
+# 저장된 OHLCV로 계산 가능한 간격 (weekly/monthly는 Alpha Vantage 사용)
+LOCAL_INTERVALS = frozenset({"1min", "5min", "15min", "30min", "60min", "daily"})
+_PRICE_COLUMNS = ("open", "high", "low", "close")
+
+# 마지막 저장 봉이 이보다 많은 거래일 뒤처지면 로컬 계산 대신 Alpha Vantage 사용
+# (일봉은 봉 1개, 인트라데이는 장 시간을 모델링하지 않으므로 세션 1개 단위)
+LOCAL_MAX_SESSIONS_BEHIND = 1
+
+# 엔진 출력 이름 → Alpha Vantage 응답 키 (교차 검증용, 기본값은 {"value": 지표명})
+_AV_OUTPUT_KEYS: Dict[str, Dict[str, str]] = {
+    "MACD": {"macd": "macd", "signal": "macd_signal", "histogram": "macd_hist"},
+    "STOCH": {"slowk": "slowk", "slowd": "slowd"},
+    "BBANDS": {
+        "upper": "real_upper_band",
+        "middle": "real_middle_band",
+        "lower": "real_lower_band",
+    },
+}
+
+# 교차 검증에 사용하는 최근 시점 수 (초기값 차이가 수렴한 구간만 비교)
+CROSS_CHECK_POINTS = 100
+
+
+@dataclass
+class ParityStats:
+    """지표별 로컬 계산 ↔ Alpha Vantage 교차 검증 통계"""
+
+    checks: int = 0
+    failures: int = 0
+    compared_points: int = 0
+    mismatched_points: int = 0
+    max_rel_error: float = 0.0
+
+    def snapshot(self) -> Dict[str, float | int]:
+        return {
+            "checks": self.checks,
+            "failures": self.failures,
+            "compared_points": self.compared_points,
+            "mismatched_points": self.mismatched_points,
+            "max_rel_error": self.max_rel_error,
+        }
+
+
+indicator_parity: Dict[str, ParityStats] = {}
+_cross_checks: Dict[str, asyncio.Task[Any]] = {}
+
+
+@dataclass
+class PriceArrays:
+    """지표 계산용 단일 심볼 가격 배열 (시간 오름차순)
+
+    Attributes:
+        times: 봉 시각 (일봉은 자정 datetime)
+        prices: 가격 컬럼 → float64 배열 (보정 계수 적용 후)
+        factors: 봉별 수정주가 보정 계수 (보정하지 않으면 1)
+    """
+
+    times: List[datetime]
+    prices: Dict[str, np.ndarray]
+    factors: np.ndarray
+
+
+def read_price_arrays(
+    db_manager: DatabaseManager,
+    symbol: str,
+    columns: List[str],
+    interval: str,
+    start: Optional[datetime] = None,
+) -> PriceArrays:
+    """저장된 가격을 지표 계산용 배열로 조회 (reader 스레드에서 호출)
+
+    일봉이고 ``INDICATOR_ADJUST_PRICES`` 가 켜져 있으면 OHLC에
+    adjusted_close/close 비율을 곱해 Alpha Vantage 지표와 같은 수정주가 기준으로
+    환산합니다. 거래량은 보정하지 않습니다.
+    """
+    adjust = interval == "daily" and settings.INDICATOR_ADJUST_PRICES
+    selected = list(
+        dict.fromkeys([*columns, "close", "adjusted_close"] if adjust else columns)
+    )
+    time_column = "date" if interval == "daily" else "datetime"
+
+    table = db_manager.get_prices_arrow(
+        [symbol], start=start, columns=selected, interval=interval
+    )
+    times = [
+        moment if isinstance(moment, datetime) else datetime.combine(moment, time.min)
+        for moment in table.column(time_column).to_pylist()
+    ]
+    prices = {
+        name: table.column(name).to_numpy(zero_copy_only=False).astype(np.float64)
+        for name in selected
+    }
+
+    factors = np.ones(len(times))
+    if adjust:
+        prices, factors = adjust_prices(prices)
+    return PriceArrays(times=times, prices=prices, factors=factors)
+
+
+def adjust_prices(
+    prices: Dict[str, np.ndarray],
+) -> tuple[Dict[str, np.ndarray], np.ndarray]:
+    """OHLC에 adjusted_close/close 보정 계수 적용 (``(T,)`` 배열과 ``(T, N)`` 패널 공통)
+
+    Returns:
+        (보정된 가격 컬럼, 보정 계수 - 계산할 수 없는 칸은 1)
+    """
+    close = prices["close"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where(close > 0, prices["adjusted_close"] / close, 1.0)
+    factors = np.where(np.isfinite(ratio), ratio, 1.0)
+    adjusted = {
+        name: values * factors if name in _PRICE_COLUMNS else values
+        for name, values in prices.items()
+    }
+    return adjusted, factors
+
 
 class BaseIndicatorService:
     """기술적 지표 서비스 기본 클래스
 
+    저장된 OHLCV가 충분하면 로컬 엔진(:mod:`.engine`)으로 계산하고, 그렇지 않으면
     Alpha Vantage API에서 기술적 지표를 가져오고 DuckDB에 캐싱합니다.
     MongoDB에는 메타데이터만 저장하고, 시계열 데이터는 DuckDB에서 관리합니다.
 
@@ -55,6 +189,224 @@ class BaseIndicatorService:
             self._db_manager = DatabaseManager()
         return self._db_manager
 
+    # ===== 로컬 계산 =====
+
+    async def _compute_local(
+        self,
+        symbol: str,
+        indicator_type: str,
+        interval: str,
+        parameters: Dict[str, Any],
+    ) -> Optional[TechnicalIndicatorData]:
+        """저장된 OHLCV로 지표 계산 (불가능하면 None → Alpha Vantage 경로 사용)
+
+        일봉/인트라데이 가격이 룩백보다 길게 저장되어 있고 엔진이 지원하는 파라미터인
+        경우에만 계산합니다. ``INDICATOR_CROSS_CHECK_SAMPLE`` 비율만큼 백그라운드에서
+        Alpha Vantage 결과와 비교해 ``indicator_parity`` 통계에 기록합니다.
+
+        Args:
+            symbol: 주식 심볼
+            indicator_type: 지표 타입 (SMA, MACD, ...)
+            interval: 시간 간격
+            parameters: 지표 파라미터
+
+        Returns:
+            기술적 지표 데이터 또는 None
+        """
+        if (
+            not settings.INDICATOR_LOCAL_ENABLED
+            or interval not in LOCAL_INTERVALS
+            or not engine.supports(indicator_type, parameters)
+        ):
+            return None
+
+        try:
+            result = await self.db_manager.async_manager.run_read(
+                "indicator_local_compute",
+                self._compute_local_rows,
+                symbol,
+                indicator_type,
+                interval,
+                parameters,
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ 로컬 지표 계산 실패 ({symbol} {indicator_type}): {e}")
+            return None
+        if result is None:
+            return None
+
+        times, outputs = result
+        data_points = self._to_data_points(times, outputs, interval)
+        if not data_points:
+            return None
+        cache_stats.record("technical_indicator_local", True)
+        logger.debug(
+            f"Computed {indicator_type} locally for {symbol}: {len(data_points)} points"
+        )
+
+        if (
+            settings.INDICATOR_CROSS_CHECK_SAMPLE > 0
+            and random.random() < settings.INDICATOR_CROSS_CHECK_SAMPLE
+        ):
+            self._schedule_cross_check(
+                symbol, indicator_type, interval, parameters, data_points
+            )
+
+        single = "value" in outputs
+        return TechnicalIndicatorData(
+            symbol=symbol,
+            indicator_type=indicator_type,
+            interval=interval,
+            parameters=parameters,
+            data=data_points,
+            data_points_count=len(data_points),
+            latest_value=data_points[0].value if single else None,
+            latest_date=data_points[0].timestamp or data_points[0].date,
+        )
+
+    def _compute_local_rows(
+        self,
+        symbol: str,
+        indicator_type: str,
+        interval: str,
+        parameters: Dict[str, Any],
+    ) -> Optional[tuple[list[datetime], Dict[str, np.ndarray]]]:
+        """가격 조회 + 엔진 계산 (reader 스레드에서 실행)
+
+        저장된 가격이 룩백보다 짧거나 마지막 봉이 현재 시각보다
+        ``LOCAL_MAX_SESSIONS_BEHIND`` 거래일 넘게 뒤처져 있으면 None을 반환합니다.
+        """
+        columns = engine.required_inputs(indicator_type, parameters)
+        arrays = read_price_arrays(self.db_manager, symbol, columns, interval)
+        if len(arrays.times) <= engine.lookback(indicator_type, parameters):
+            cache_stats.record("technical_indicator_local", False)
+            return None
+        behind = trading_days_between(arrays.times[-1].date(), datetime.now(UTC).date())
+        if behind > LOCAL_MAX_SESSIONS_BEHIND:
+            # 갱신되지 않은 가격으로 계산하면 최신 지표 값이 빠지므로 Alpha Vantage 사용
+            cache_stats.record("technical_indicator_local", False)
+            logger.info(
+                f"⏭️ 저장된 {interval} 가격이 {behind}거래일 뒤처짐 "
+                f"({symbol}, 마지막 봉 {arrays.times[-1]}), Alpha Vantage 사용"
+            )
+            return None
+        # 입력(보정 후 가격)과 파라미터가 같으면 이전 계산 결과 재사용 (지표 결과 캐시)
+        outputs = indicator_cache.get_or_compute(
+            f"engine.{indicator_type}",
+            [arrays.prices[column] for column in columns],
+            parameters,
+            lambda: engine.compute(indicator_type, arrays.prices, parameters),
+        )
+        return arrays.times, outputs
+
+    @staticmethod
+    def _to_data_points(
+        times: list[datetime], outputs: Dict[str, np.ndarray], interval: str
+    ) -> List[IndicatorDataPoint]:
+        """엔진 출력 → IndicatorDataPoint 목록 (최신 순, 룩백 구간 제외)"""
+        names = list(outputs)
+        matrix = np.column_stack([outputs[name] for name in names])
+        valid = np.isfinite(matrix).all(axis=1)
+        single = names == ["value"]
+        daily = interval == "daily"
+
+        points: List[IndicatorDataPoint] = []
+        for row in np.flatnonzero(valid)[::-1]:
+            moment = times[row]
+            values = [Decimal(str(v)) for v in matrix[row].tolist()]
+            points.append(
+                IndicatorDataPoint(
+                    date=moment if daily else None,
+                    timestamp=None if daily else moment,
+                    value=values[0] if single else None,
+                    values=None if single else dict(zip(names, values)),
+                )
+            )
+        return points
+
+    # ===== Alpha Vantage 교차 검증 =====
+
+    def _schedule_cross_check(
+        self,
+        symbol: str,
+        indicator_type: str,
+        interval: str,
+        parameters: Dict[str, Any],
+        data_points: List[IndicatorDataPoint],
+    ) -> None:
+        """같은 지표/파라미터당 하나의 백그라운드 교차 검증 태스크 예약"""
+        key = self._generate_cache_key(symbol, indicator_type, interval, parameters)
+        running = _cross_checks.get(key)
+        if running is not None and not running.done():
+            return
+
+        async def _check() -> None:
+            stats = indicator_parity.setdefault(indicator_type, ParityStats())
+            try:
+                with request_priority(RequestPriority.BACKGROUND):
+                    reference = await getattr(
+                        self.alpha_vantage.ti, indicator_type.lower()
+                    )(symbol=symbol, interval=interval, **parameters)
+            except Exception as e:
+                stats.failures += 1
+                logger.warning(f"⚠️ 지표 교차 검증 실패 ({key}): {e}")
+                return
+            self._record_parity(stats, indicator_type, data_points, reference)
+
+        def _release(done: asyncio.Task[Any]) -> None:
+            if _cross_checks.get(key) is done:
+                del _cross_checks[key]
+
+        task = asyncio.create_task(_check())
+        _cross_checks[key] = task
+        task.add_done_callback(_release)
+
+    @staticmethod
+    def _record_parity(
+        stats: ParityStats,
+        indicator_type: str,
+        data_points: List[IndicatorDataPoint],
+        reference: List[Dict[str, Any]],
+    ) -> None:
+        """최근 시점의 로컬 값과 Alpha Vantage 값 비교 결과 기록"""
+        key_map = _AV_OUTPUT_KEYS.get(indicator_type, {"value": indicator_type.lower()})
+        expected = {
+            (item.get("datetime") or item.get("date")): item for item in reference
+        }
+
+        local: List[float] = []
+        remote: List[float] = []
+        for point in data_points[:CROSS_CHECK_POINTS]:
+            item = expected.get(point.timestamp or point.date)
+            if item is None:
+                continue
+            values = point.values or {"value": point.value}
+            for name, av_key in key_map.items():
+                if values.get(name) is not None and item.get(av_key) is not None:
+                    local.append(float(values[name]))
+                    remote.append(float(item[av_key]))
+
+        stats.checks += 1
+        if not remote:
+            return
+        ours, theirs = np.asarray(local), np.asarray(remote)
+        scale = max(float(np.abs(theirs).max()), 1e-12)
+        rel_error = np.abs(ours - theirs) / scale
+        mismatched = int((rel_error > settings.INDICATOR_CROSS_CHECK_RTOL).sum())
+        stats.compared_points += len(remote)
+        stats.mismatched_points += mismatched
+        stats.max_rel_error = max(stats.max_rel_error, float(rel_error.max()))
+        if mismatched:
+            logger.warning(
+                f"⚠️ {indicator_type} 로컬 계산과 Alpha Vantage 값 불일치: "
+                f"{mismatched}/{len(remote)} (최대 상대 오차 {rel_error.max():.2e})"
+            )
+
+    @staticmethod
+    def get_parity_stats() -> Dict[str, Dict[str, float | int]]:
+        """지표별 교차 검증 통계"""
+        return {name: stats.snapshot() for name, stats in indicator_parity.items()}
+
     def _generate_cache_key(
         self,
         symbol: str,
@@ -89,26 +441,13 @@ class BaseIndicatorService:
             캐시된 데이터 또는 None
         """
         try:
-            if not self.db_manager.connection:
-                self.db_manager.connect()
-
-            if not self.db_manager.connection:
-                logger.warning("DuckDB connection not available for cache check")
-                return None
-
-            query = """
-                SELECT date, timestamp, value, values_json
-                FROM technical_indicators_cache
-                WHERE cache_key = ?
-                AND cached_at >= ?
-                ORDER BY COALESCE(timestamp, date) DESC
-            """
             cutoff_time = datetime.now(UTC) - timedelta(hours=self.cache_ttl_hours)
 
-            result = self.db_manager.connection.execute(
-                query, [cache_key, cutoff_time.isoformat()]
-            ).fetchall()
+            result = await self.db_manager.async_manager.run_read(
+                "indicator_cache_read", self._read_cache_rows, cache_key, cutoff_time
+            )
 
+            cache_stats.record("technical_indicator", bool(result))
             if not result:
                 return None
 
@@ -156,28 +495,10 @@ class BaseIndicatorService:
             parameters: 지표 파라미터
         """
         try:
-            if not self.db_manager.connection:
-                self.db_manager.connect()
-
-            if not self.db_manager.connection:
-                logger.warning("DuckDB connection not available for caching")
-                return
-
-            # 기존 캐시 삭제
-            delete_query = "DELETE FROM technical_indicators_cache WHERE cache_key = ?"
-            self.db_manager.connection.execute(delete_query, [cache_key])
-
-            # 새 데이터 삽입
-            insert_query = """
-                INSERT INTO technical_indicators_cache
-                (cache_key, symbol, indicator_type, interval, parameters_json,
-                 date, timestamp, value, values_json, cached_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """
-
             params_json = json.dumps(parameters)
             now = datetime.now(UTC).isoformat()
 
+            rows: List[List[Any]] = []
             for point in data:
                 values_json = None
                 if point.values:
@@ -210,26 +531,65 @@ class BaseIndicatorService:
                     continue
 
                 # DuckDB용 파라미터 준비
-                params = [
-                    cache_key,
-                    symbol,
-                    indicator_type,
-                    interval,
-                    params_json,
-                    date_str,
-                    timestamp_str,
-                    float(point.value) if point.value else None,  # Decimal -> float
-                    values_json,
-                    now,
-                ]
-
-                self.db_manager.connection.execute(insert_query, params)
-
-            logger.info(f"Cached {len(data)} points for {cache_key}")
+                rows.append(
+                    [
+                        cache_key,
+                        symbol,
+                        indicator_type,
+                        interval,
+                        params_json,
+                        date_str,
+                        timestamp_str,
+                        float(point.value) if point.value else None,  # Decimal -> float
+                        values_json,
+                        now,
+                    ]
+                )
+
+            # 기존 캐시 삭제 + 새 데이터 삽입 (writer lane)
+            await self.db_manager.async_manager.run_write(
+                "indicator_cache_write", self._write_cache_rows, cache_key, rows
+            )
+
+            logger.info(f"Cached {len(rows)} points for {cache_key}")
 
         except Exception as e:
             logger.error(f"Cache save error for {cache_key}: {e}")
 
+    def _read_cache_rows(self, cache_key: str, cutoff_time: datetime) -> List[tuple]:
+        """캐시된 지표 행 조회 (reader 스레드에서 실행)"""
+        query = """
+            SELECT date, timestamp, value, values_json
+            FROM technical_indicators_cache
+            WHERE cache_key = ?
+            AND cached_at >= ?
+            ORDER BY COALESCE(timestamp, date) DESC
+        """
+        conn = self.db_manager.thread_cursor()
+        return conn.execute(query, [cache_key, cutoff_time.isoformat()]).fetchall()
+
+    def _write_cache_rows(self, cache_key: str, rows: List[List[Any]]) -> None:
+        """지표 캐시 교체 (writer 스레드에서 단일 트랜잭션으로 실행)"""
+        insert_query = """
+            INSERT INTO technical_indicators_cache
+            (cache_key, symbol, indicator_type, interval, parameters_json,
+             date, timestamp, value, values_json, cached_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """
+        conn = self.db_manager.thread_cursor()
+        conn.execute("BEGIN TRANSACTION")
+        try:
+            conn.execute(
+                "DELETE FROM technical_indicators_cache WHERE cache_key = ?",
+                [cache_key],
+            )
+            if rows:
+                conn.executemany(insert_query, rows)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
     async def _save_metadata_to_mongodb(
         self,
         symbol: str,
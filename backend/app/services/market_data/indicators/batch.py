@@ -0,0 +1,309 @@
+"""
+Batch Technical Indicators
+여러 심볼 × 여러 지표 일괄 계산 - 가격 패널 한 번 조회 + 지표별 벡터화 계산 1회
+
+스크리닝처럼 심볼 수백 개에 지표 몇 개를 계산할 때 심볼/지표마다 요청·캐시 조회를
+반복하지 않도록, 필요한 가격 컬럼을 날짜 × 심볼 패널로 한 번에 읽고 로컬
+엔진(:mod:`.engine`)으로 모든 심볼을 한 번에 계산합니다.
+
+결과(:class:`IndicatorBatch`)는 (시각, 심볼) 행 × 지표 출력 컬럼의 열 지향 데이터이며
+Arrow IPC 스트림 또는 NDJSON으로 심볼 묶음 단위로 나눠 전송할 수 있습니다.
+
+지표 명세 형식(:mod:`.streaming` 과 동일): ``{"indicator": "RSI", "time_period": 14}``
+(선택적으로 ``"name"`` 으로 출력 컬럼 이름 지정)
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+import math
+import time
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from app.core.config import settings
+from app.services.database_manager import DatabaseManager
+
+from . import engine
+from .base import LOCAL_INTERVALS, adjust_prices
+from .streaming import indicator_key
+
+logger = logging.getLogger(__name__)
+
+# 한 요청에서 허용하는 최대 심볼/지표 수
+MAX_BATCH_SYMBOLS = 500
+MAX_BATCH_INDICATORS = 20
+
+# 스트리밍 시 레코드 배치 하나에 담는 심볼 수
+SYMBOLS_PER_BATCH = 64
+
+
+@dataclass
+class IndicatorBatch:
+    """일괄 계산 결과 (날짜 × 심볼 행렬 묶음)
+
+    Attributes:
+        symbols: 심볼 목록 (행렬 열 순서)
+        interval: 'daily' 또는 인트라데이 간격
+        index: 출력 구간 시각 (행렬 행 순서)
+        columns: 출력 컬럼 이름 → ``(T, N)`` 값 행렬 (룩백 구간은 NaN)
+        observed: ``(T, N)`` 실제 봉 존재 여부 (합집합 달력에서 봉이 없는 칸은 False)
+    """
+
+    symbols: list[str]
+    interval: str
+    index: pd.DatetimeIndex
+    columns: dict[str, np.ndarray]
+    observed: np.ndarray
+
+    @property
+    def time_column(self) -> str:
+        return "date" if self.interval == "daily" else "datetime"
+
+    @property
+    def schema(self) -> pa.Schema:
+        time_type = pa.date32() if self.interval == "daily" else pa.timestamp("us")
+        return pa.schema(
+            [(self.time_column, time_type), ("symbol", pa.string())]
+            + [(name, pa.float64()) for name in self.columns]
+        )
+
+    def record_batches(
+        self, limit: Optional[int] = None, symbols_per_batch: int = SYMBOLS_PER_BATCH
+    ) -> Iterator[pa.RecordBatch]:
+        """심볼 묶음 단위 long 포맷 레코드 배치 (심볼, 시각 오름차순)
+
+        Args:
+            limit: 심볼별 최근 N개 봉만 포함 (None이면 출력 구간 전체)
+            symbols_per_batch: 배치 하나에 담는 심볼 수
+        """
+        schema = self.schema
+        times = self.index.to_numpy()
+        for begin in range(0, len(self.symbols), symbols_per_batch):
+            rows_list: list[np.ndarray] = []
+            cols_list: list[np.ndarray] = []
+            for j in range(begin, min(begin + symbols_per_batch, len(self.symbols))):
+                rows = np.flatnonzero(self.observed[:, j])
+                if limit is not None:
+                    rows = rows[len(rows) - limit :] if limit > 0 else rows[:0]
+                rows_list.append(rows)
+                cols_list.append(np.full(len(rows), j))
+            rows = np.concatenate(rows_list)
+            cols = np.concatenate(cols_list)
+            if len(rows) == 0:
+                continue
+
+            symbols = np.asarray(self.symbols, dtype=object)[cols]
+            arrays = [
+                pa.array(times[rows]).cast(schema.field(0).type),
+                pa.array(symbols, type=pa.string()),
+            ]
+            arrays += [
+                pa.array(values[rows, cols], type=pa.float64(), from_pandas=True)
+                for values in self.columns.values()
+            ]
+            yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+    def to_table(self, limit: Optional[int] = None) -> pa.Table:
+        return pa.Table.from_batches(list(self.record_batches(limit)), self.schema)
+
+    def iter_ipc_stream(self, limit: Optional[int] = None) -> Iterator[bytes]:
+        """Arrow IPC 스트림 바이트 청크 (스키마 → 레코드 배치 → 종료 표시)"""
+        buffer = io.BytesIO()
+        with pa.ipc.new_stream(buffer, self.schema) as writer:
+            for batch in self.record_batches(limit):
+                writer.write_batch(batch)
+                yield _drain(buffer)
+        yield _drain(buffer)
+
+    def iter_ndjson(self, limit: Optional[int] = None) -> Iterator[bytes]:
+        """레코드 배치별 열 지향 JSON 한 줄 (NaN은 null)"""
+        for batch in self.record_batches(limit):
+            payload: dict[str, list[Any]] = {}
+            for name, column in zip(batch.schema.names, batch.columns):
+                values = column.to_pylist()
+                if pa.types.is_floating(column.type):
+                    values = [None if v is None or math.isnan(v) else v for v in values]
+                elif not pa.types.is_string(column.type):
+                    values = [v.isoformat() for v in values]
+                payload[name] = values
+            yield (json.dumps(payload) + "\n").encode()
+
+
+def _drain(buffer: io.BytesIO) -> bytes:
+    data = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    return data
+
+
+def _output_name(spec: Mapping[str, Any], output: str) -> str:
+    name = spec.get("name") or indicator_key(
+        spec["indicator"].upper(), _spec_params(spec)
+    )
+    return name if output == "value" else f"{name}.{output}"
+
+
+def _spec_params(spec: Mapping[str, Any]) -> dict[str, Any]:
+    return {k: v for k, v in spec.items() if k not in ("indicator", "name")}
+
+
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """tz-aware 시각은 UTC로 변환 후 tz 제거 (저장된 봉 시각은 naive)"""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(UTC).replace(tzinfo=None)
+
+
+class BatchIndicatorService:
+    """여러 심볼 × 여러 지표 일괄 계산 서비스
+
+    저장된 OHLCV(DuckDB/Parquet)만 사용하며 Alpha Vantage를 호출하지 않습니다.
+    심볼마다 상장일/거래정지일이 달라 합집합 달력에는 빈 칸이 생기므로, 각 심볼의
+    실제 봉을 열 끝에 맞춰 모은 패널로 계산한 뒤 원래 시점으로 되돌립니다. 지표는
+    전체 저장 이력으로 계산하고 ``start`` 이후만 반환하므로 단일 심볼 로컬 계산과
+    같은 값입니다.
+    """
+
+    def __init__(self, database_manager: Optional[DatabaseManager] = None):
+        self._db_manager = database_manager
+
+    @property
+    def db_manager(self) -> DatabaseManager:
+        """데이터베이스 매니저 lazy loading"""
+        if self._db_manager is None:
+            self._db_manager = DatabaseManager()
+        return self._db_manager
+
+    async def compute(
+        self,
+        symbols: Sequence[str],
+        specs: Sequence[Mapping[str, Any]],
+        interval: str = "daily",
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> IndicatorBatch:
+        """지표 일괄 계산
+
+        Args:
+            symbols: 심볼 목록
+            specs: 지표 명세 목록
+            interval: 'daily' 또는 인트라데이 간격
+            start: 출력 시작 시각 (계산은 전체 이력 사용, tz-aware면 UTC로 변환)
+            end: 출력/계산 종료 시각 (tz-aware면 UTC로 변환)
+
+        Returns:
+            IndicatorBatch
+
+        Raises:
+            ValueError: 지원하지 않는 간격/지표/파라미터 또는 한도 초과
+        """
+        symbols = list(dict.fromkeys(s.upper().strip() for s in symbols))
+        specs = [dict(spec, indicator=spec["indicator"].upper()) for spec in specs]
+        self._validate(symbols, specs, interval)
+
+        return await self.db_manager.async_manager.run_read(
+            "indicator_batch_compute",
+            self._compute,
+            symbols,
+            specs,
+            interval,
+            _naive_utc(start),
+            _naive_utc(end),
+        )
+
+    @staticmethod
+    def _validate(
+        symbols: list[str], specs: list[dict[str, Any]], interval: str
+    ) -> None:
+        if interval not in LOCAL_INTERVALS:
+            raise ValueError(f"일괄 계산을 지원하지 않는 간격: {interval}")
+        if not symbols or len(symbols) > MAX_BATCH_SYMBOLS:
+            raise ValueError(f"심볼 수는 1~{MAX_BATCH_SYMBOLS}개여야 합니다")
+        if not specs or len(specs) > MAX_BATCH_INDICATORS:
+            raise ValueError(f"지표 수는 1~{MAX_BATCH_INDICATORS}개여야 합니다")
+
+        names: set[str] = set()
+        for spec in specs:
+            params = _spec_params(spec)
+            if not engine.supports(spec["indicator"], params):
+                raise ValueError(f"로컬 계산을 지원하지 않는 지표/파라미터: {spec['indicator']}")
+            for output in engine.get_spec(spec["indicator"]).outputs:
+                name = _output_name(spec, output)
+                if name in names:
+                    raise ValueError(f"출력 컬럼 이름 중복: {name}")
+                names.add(name)
+
+    def _compute(
+        self,
+        symbols: list[str],
+        specs: list[dict[str, Any]],
+        interval: str,
+        start: Optional[datetime],
+        end: Optional[datetime],
+    ) -> IndicatorBatch:
+        """패널 조회 + 지표 계산 (reader 스레드에서 실행)"""
+        started = time.perf_counter()
+        adjust = interval == "daily" and settings.INDICATOR_ADJUST_PRICES
+        inputs = [
+            column
+            for spec in specs
+            for column in engine.required_inputs(spec["indicator"], _spec_params(spec))
+        ]
+        fields = list(dict.fromkeys(inputs))
+        read_fields = list(
+            dict.fromkeys([*fields, "close", "adjusted_close"] if adjust else fields)
+        )
+
+        panels = self.db_manager.get_price_panels(
+            symbols, end=end, fields=read_fields, interval=interval
+        )
+        raw = {field: panel.values for field, panel in panels.items()}
+        index = panels[read_fields[0]].index
+        observed = np.logical_and.reduce([np.isfinite(raw[f]) for f in fields])
+
+        # 심볼별 실제 봉을 열 끝에 맞춰 모음 (앞쪽 NaN은 엔진이 늦은 상장처럼 처리)
+        rows = np.cumsum(observed, axis=0) - 1 + (len(index) - observed.sum(axis=0))
+        target = (rows[observed], np.nonzero(observed)[1])
+        prices: dict[str, np.ndarray] = {}
+        for field, matrix in raw.items():
+            packed = np.full(matrix.shape, np.nan)
+            packed[target] = matrix[observed]
+            prices[field] = packed
+        if adjust:
+            prices, _ = adjust_prices(prices)
+
+        keep = index >= pd.Timestamp(start) if start is not None else slice(None)
+        columns: dict[str, np.ndarray] = {}
+        for spec in specs:
+            if len(index) == 0:
+                empty = np.empty((0, len(symbols)))
+                outputs = dict.fromkeys(
+                    engine.get_spec(spec["indicator"]).outputs, empty
+                )
+            else:
+                outputs = engine.compute(spec["indicator"], prices, _spec_params(spec))
+            for output, packed in outputs.items():
+                values = np.full(packed.shape, np.nan)
+                values[observed] = packed[target]
+                columns[_output_name(spec, output)] = values[keep]
+
+        logger.info(
+            f"📊 지표 일괄 계산: {len(symbols)} symbols × {len(specs)} indicators, "
+            f"{len(index)} rows ({(time.perf_counter() - started) * 1000:.0f}ms)"
+        )
+        return IndicatorBatch(
+            symbols=symbols,
+            interval=interval,
+            index=index[keep],
+            columns=columns,
+            observed=observed[keep],
+        )
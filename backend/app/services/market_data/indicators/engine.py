@@ -0,0 +1,547 @@
+"""
+Local Technical Indicator Engine
+저장된 OHLCV로 기술적 지표를 계산하는 벡터화 엔진 (NumPy)
+
+모든 함수는 시간 축이 0번 축인 ``(T,)`` 또는 ``(T, N)`` float64 배열을 받아 같은
+모양의 배열을 반환합니다 (``PricePanel.values`` 와 같은 배치). 열마다 첫 유효
+행(모든 입력이 유한한 첫 시점)부터 계산하므로 상장일이 다른 심볼을 한 행렬로
+넘길 수 있으며, 룩백 구간은 NaN으로 채워집니다. 중간 결측은 그대로 전파되므로
+패널을 넘길 때는 ``ffill`` 또는 ``calendar="intersection"`` 으로 정렬합니다.
+EMA/Wilder 재귀는 :mod:`.kernels` 의 재귀 필터 커널로 모든 열을 한 번에 계산합니다.
+
+초기값/룩백 규칙은 Alpha Vantage가 사용하는 TA-Lib 기본 동작을 따릅니다:
+- EMA 계열: 첫 ``n`` 개 평균으로 시작, k = 2/(n+1)
+- RSI/ATR/ADX: Wilder 평활 (k = 1/n)
+- MACD: 빠른/느린 EMA를 같은 시점에서 시작, 모든 출력은 시그널 룩백 이후부터
+- STOCH/BBANDS: 단순이동평균(matype=0)만 지원
+
+사용 예제:
+    >>> out = compute("MACD", {"close": closes})
+    >>> out["macd"], out["signal"], out["histogram"]
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .kernels import recursive_filter
+
+
+# ===== 열 정렬 =====
+
+
+def _as_matrix(values: Any) -> np.ndarray:
+    array = np.asarray(values, dtype=np.float64)
+    return array.reshape(len(array), -1)
+
+
+def _align(inputs: Sequence[Any]) -> tuple[list[np.ndarray], np.ndarray]:
+    """열마다 첫 유효 행을 0행으로 당겨 정렬
+
+    Returns:
+        (정렬된 입력 행렬 목록, 열별 시작 행)
+    """
+    matrices = [_as_matrix(values) for values in inputs]
+    rows, cols = matrices[0].shape
+    valid = np.logical_and.reduce([np.isfinite(m) for m in matrices])
+    start = np.where(valid.any(axis=0), valid.argmax(axis=0), rows)
+    if not start.any():
+        return matrices, start
+
+    source = np.arange(rows)[:, None] + start[None, :]
+    inside = source < rows
+    source = np.minimum(source, rows - 1)
+    columns = np.arange(cols)[None, :]
+    aligned = [np.where(inside, m[source, columns], np.nan) for m in matrices]
+    return aligned, start
+
+
+def _unalign(output: np.ndarray, start: np.ndarray, squeeze: bool) -> np.ndarray:
+    """:func:`_align` 의 역변환 (원래 행 위치로 되돌림)"""
+    if start.any():
+        rows, cols = output.shape
+        target = np.arange(rows)[:, None] + start[None, :]
+        inside = target < rows
+        restored = np.full_like(output, np.nan)
+        columns = np.broadcast_to(np.arange(cols), (rows, cols))
+        restored[target[inside], columns[inside]] = output[inside]
+        output = restored
+    return output[:, 0] if squeeze else output
+
+
+def _apply(
+    core: Callable[..., np.ndarray | tuple[np.ndarray, ...]],
+    inputs: Sequence[Any],
+    *args: Any,
+) -> Any:
+    """입력을 열별로 정렬해 ``core`` 를 실행하고 결과를 원래 위치로 복원"""
+    squeeze = np.ndim(inputs[0]) == 1
+    aligned, start = _align(inputs)
+    result = core(*aligned, *args)
+    if isinstance(result, tuple):
+        return tuple(_unalign(r, start, squeeze) for r in result)
+    return _unalign(result, start, squeeze)
+
+
+# ===== 정렬된 행렬용 기본 연산 =====
+
+# 창 단위 계산의 임시 배열 크기 상한 (원소 수)
+_CHUNK_ELEMENTS = 1 << 22
+
+
+def _empty(x: np.ndarray) -> np.ndarray:
+    return np.full(x.shape, np.nan)
+
+
+def _sma_core(x: np.ndarray, n: int, first: int = 0) -> np.ndarray:
+    out = _empty(x)
+    if n < 1 or len(x) - first < n:
+        return out
+    body = x[first:]
+    base = body[0]
+    csum = np.cumsum(body - base, axis=0)
+    window = csum[n - 1 :].copy()
+    window[1:] -= csum[:-n]
+    out[first + n - 1 :] = window / n + base
+    return out
+
+
+def _ema_core(x: np.ndarray, n: int, first: int = 0) -> np.ndarray:
+    start = first + n - 1
+    if n < 1 or start >= len(x):
+        return _empty(x)
+    seed = x[first : start + 1].mean(axis=0)
+    return recursive_filter(x, 2.0 / (n + 1), start, seed)
+
+
+def _wilder_core(x: np.ndarray, n: int, first: int = 0) -> np.ndarray:
+    """Wilder 평활 (첫 n개 평균으로 시작, k = 1/n)"""
+    start = first + n - 1
+    if n < 1 or start >= len(x):
+        return _empty(x)
+    return recursive_filter(x, 1.0 / n, start, x[first : start + 1].mean(axis=0))
+
+
+def _wma_core(x: np.ndarray, n: int) -> np.ndarray:
+    out = _empty(x)
+    if n < 1 or len(x) < n:
+        return out
+    weights = np.arange(1, n + 1, dtype=np.float64) / (n * (n + 1) / 2)
+    out[n - 1 :] = sliding_window_view(x, n, axis=0) @ weights
+    return out
+
+
+def _dema_core(x: np.ndarray, n: int) -> np.ndarray:
+    e1 = _ema_core(x, n)
+    e2 = _ema_core(e1, n, first=n - 1)
+    return 2.0 * e1 - e2
+
+
+def _tema_core(x: np.ndarray, n: int) -> np.ndarray:
+    e1 = _ema_core(x, n)
+    e2 = _ema_core(e1, n, first=n - 1)
+    e3 = _ema_core(e2, n, first=2 * (n - 1))
+    return 3.0 * e1 - 3.0 * e2 + e3
+
+
+def _macd_core(
+    x: np.ndarray, fast: int, slow: int, signal: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    if slow < fast:
+        fast, slow = slow, fast
+    # 빠른 EMA도 느린 EMA와 같은 시점(slow-1)에서 시작하도록 초기 구간을 맞춤
+    fast_ema = _ema_core(x, fast, first=slow - fast)
+    slow_ema = _ema_core(x, slow)
+    line = fast_ema - slow_ema
+    signal_line = _ema_core(line, signal, first=slow - 1)
+    hist = line - signal_line
+    line[: slow + signal - 2] = np.nan
+    return line, signal_line, hist
+
+
+def _rsi_core(x: np.ndarray, n: int) -> np.ndarray:
+    if n < 1 or len(x) <= n:
+        return _empty(x)
+    change = np.vstack([np.full((1, x.shape[1]), np.nan), np.diff(x, axis=0)])
+    avg_gain = _wilder_core(np.clip(change, 0.0, None), n, first=1)
+    avg_loss = _wilder_core(np.clip(-change, 0.0, None), n, first=1)
+    total = avg_gain + avg_loss
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = np.where(total != 0, 100.0 * avg_gain / total, 0.0)
+    rsi[np.isnan(total)] = np.nan
+    return rsi
+
+
+def _true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    tr = _empty(high)
+    prev_close = close[:-1]
+    tr[1:] = np.maximum.reduce(
+        [
+            high[1:] - low[1:],
+            np.abs(high[1:] - prev_close),
+            np.abs(low[1:] - prev_close),
+        ]
+    )
+    return tr
+
+
+def _atr_core(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, n: int
+) -> np.ndarray:
+    if n < 1 or len(high) <= n:
+        return _empty(high)
+    return _wilder_core(_true_range(high, low, close), n, first=1)
+
+
+def _adx_core(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, n: int
+) -> np.ndarray:
+    if n < 2 or len(high) < 2 * n:
+        return _empty(high)
+    up = _empty(high)
+    down = _empty(high)
+    up[1:] = high[1:] - high[:-1]
+    down[1:] = low[:-1] - low[1:]
+    plus_dm = np.where((up > down) & (up > 0), up, 0.0)
+    minus_dm = np.where((down > up) & (down > 0), down, 0.0)
+    tr = _true_range(high, low, close)
+
+    # Wilder 누적합(S - S/n + v)을 평균 형태로 계산: 첫 n-1개 합 / n 에서 시작
+    def wilder(values: np.ndarray) -> np.ndarray:
+        return recursive_filter(values, 1.0 / n, n - 1, values[1:n].sum(axis=0) / n)
+
+    smooth_plus, smooth_minus, smooth_tr = wilder(plus_dm), wilder(minus_dm), wilder(tr)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        plus_di = np.where(smooth_tr != 0, 100.0 * smooth_plus / smooth_tr, 0.0)
+        minus_di = np.where(smooth_tr != 0, 100.0 * smooth_minus / smooth_tr, 0.0)
+        di_sum = plus_di + minus_di
+        dx = np.where(di_sum != 0, 100.0 * np.abs(plus_di - minus_di) / di_sum, 0.0)
+    dx[np.isnan(smooth_tr)] = np.nan
+    dx[:n] = np.nan
+    return recursive_filter(dx, 1.0 / n, 2 * n - 1, dx[n : 2 * n].mean(axis=0))
+
+
+def _obv_core(close: np.ndarray, volume: np.ndarray) -> np.ndarray:
+    signed = np.sign(np.diff(close, axis=0)) * volume[1:]
+    return np.cumsum(np.vstack([volume[:1], signed]), axis=0)
+
+
+def _rolling(x: np.ndarray, n: int, reducer: Callable[..., np.ndarray]) -> np.ndarray:
+    out = _empty(x)
+    if len(x) >= n:
+        out[n - 1 :] = reducer(sliding_window_view(x, n, axis=0), axis=-1)
+    return out
+
+
+def _stoch_core(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    fastk: int,
+    slowk: int,
+    slowd: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    highest = _rolling(high, fastk, np.max)
+    lowest = _rolling(low, fastk, np.min)
+    spread = highest - lowest
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fast_k = np.where(spread != 0, 100.0 * (close - lowest) / spread, 0.0)
+    fast_k[np.isnan(spread)] = np.nan
+    slow_k = _sma_core(fast_k, slowk, first=fastk - 1)
+    slow_d = _sma_core(slow_k, slowd, first=fastk + slowk - 2)
+    slow_k[: fastk + slowk + slowd - 3] = np.nan
+    return slow_k, slow_d
+
+
+def _rolling_std(x: np.ndarray, n: int) -> np.ndarray:
+    """창 단위 모표준편차 (누적합 공식의 상쇄 오차를 피하려고 창마다 직접 계산)"""
+    out = _empty(x)
+    if len(x) < n:
+        return out
+    windows = sliding_window_view(x, n, axis=0)
+    step = max(1, _CHUNK_ELEMENTS // (x.shape[1] * n))
+    for lo in range(0, len(windows), step):
+        out[n - 1 + lo : n - 1 + lo + step] = windows[lo : lo + step].std(axis=-1)
+    return out
+
+
+def _bbands_core(
+    x: np.ndarray, n: int, nbdevup: float, nbdevdn: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    middle = _sma_core(x, n)
+    std = _rolling_std(x, n)
+    return middle + nbdevup * std, middle, middle - nbdevdn * std
+
+
+# ===== 공개 함수 =====
+
+
+def sma(values: Any, time_period: int = 20) -> np.ndarray:
+    """단순이동평균"""
+    return _apply(_sma_core, [values], time_period)
+
+
+def ema(values: Any, time_period: int = 20) -> np.ndarray:
+    """지수이동평균 (첫 n개 평균으로 시작)"""
+    return _apply(_ema_core, [values], time_period)
+
+
+def wma(values: Any, time_period: int = 20) -> np.ndarray:
+    """선형 가중이동평균 (최근 값 가중치 n)"""
+    return _apply(_wma_core, [values], time_period)
+
+
+def dema(values: Any, time_period: int = 20) -> np.ndarray:
+    """이중지수이동평균: 2·EMA - EMA(EMA)"""
+    return _apply(_dema_core, [values], time_period)
+
+
+def tema(values: Any, time_period: int = 20) -> np.ndarray:
+    """삼중지수이동평균: 3·EMA - 3·EMA² + EMA³"""
+    return _apply(_tema_core, [values], time_period)
+
+
+def wilder(values: Any, time_period: int = 14) -> np.ndarray:
+    """Wilder 평활 이동평균 (RSI/ATR 내부 평균, 첫 n개 평균으로 시작)"""
+    return _apply(_wilder_core, [values], time_period)
+
+
+def macd(
+    values: Any, fastperiod: int = 12, slowperiod: int = 26, signalperiod: int = 9
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """MACD (macd, signal, histogram)"""
+    return _apply(_macd_core, [values], fastperiod, slowperiod, signalperiod)
+
+
+def rsi(values: Any, time_period: int = 14) -> np.ndarray:
+    """Wilder RSI"""
+    return _apply(_rsi_core, [values], time_period)
+
+
+def trange(high: Any, low: Any, close: Any) -> np.ndarray:
+    """True Range (첫 행은 NaN)"""
+    return _apply(_true_range, [high, low, close])
+
+
+def atr(high: Any, low: Any, close: Any, time_period: int = 14) -> np.ndarray:
+    """Wilder ATR"""
+    return _apply(_atr_core, [high, low, close], time_period)
+
+
+def adx(high: Any, low: Any, close: Any, time_period: int = 14) -> np.ndarray:
+    """Wilder ADX"""
+    return _apply(_adx_core, [high, low, close], time_period)
+
+
+def obv(close: Any, volume: Any) -> np.ndarray:
+    """On-Balance Volume (첫 값은 첫 거래량)"""
+    return _apply(_obv_core, [close, volume])
+
+
+def stoch(
+    high: Any,
+    low: Any,
+    close: Any,
+    fastkperiod: int = 5,
+    slowkperiod: int = 3,
+    slowdperiod: int = 3,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Slow Stochastic (slowk, slowd) - SMA 평활"""
+    return _apply(
+        _stoch_core, [high, low, close], fastkperiod, slowkperiod, slowdperiod
+    )
+
+
+def bbands(
+    values: Any, time_period: int = 20, nbdevup: float = 2.0, nbdevdn: float = 2.0
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """볼린저밴드 (upper, middle, lower) - SMA + 모표준편차"""
+    return _apply(_bbands_core, [values], time_period, nbdevup, nbdevdn)
+
+
+# ===== 레지스트리 =====
+
+
+@dataclass(frozen=True)
+class IndicatorSpec:
+    """지표 계산 명세
+
+    Attributes:
+        name: 지표 타입 (SMA, MACD, ...)
+        inputs: 가격 입력 ("series"는 ``series_type`` 파라미터로 선택)
+        outputs: 출력 이름 (단일 출력은 "value")
+        func: 계산 함수
+        params: 계산 함수에 넘기는 파라미터와 기본값
+        lookback: 파라미터별 첫 유효 출력 행 번호
+        unsupported: 로컬 계산을 지원하지 않는 파라미터 값 (예: SMA 외 matype)
+    """
+
+    name: str
+    inputs: tuple[str, ...]
+    outputs: tuple[str, ...]
+    func: Callable[..., Any]
+    params: dict[str, Any]
+    lookback: Callable[..., int]
+    unsupported: dict[str, Callable[[Any], bool]] = field(default_factory=dict)
+
+
+def _non_sma(matype: Any) -> bool:
+    return matype is not None and int(matype) != 0
+
+
+def _lb_window(time_period: int, **_: Any) -> int:
+    return time_period - 1
+
+
+def _lb_wilder(time_period: int) -> int:
+    return time_period
+
+
+def _lb_macd(fastperiod: int, slowperiod: int, signalperiod: int) -> int:
+    return max(fastperiod, slowperiod) + signalperiod - 2
+
+
+def _lb_stoch(fastkperiod: int, slowkperiod: int, slowdperiod: int) -> int:
+    return fastkperiod + slowkperiod + slowdperiod - 3
+
+
+_SERIES = ("series",)
+_HLC = ("high", "low", "close")
+_VALUE = ("value",)
+
+INDICATORS: dict[str, IndicatorSpec] = {
+    spec.name: spec
+    for spec in (
+        IndicatorSpec("SMA", _SERIES, _VALUE, sma, {"time_period": 20}, _lb_window),
+        IndicatorSpec("EMA", _SERIES, _VALUE, ema, {"time_period": 20}, _lb_window),
+        IndicatorSpec("WMA", _SERIES, _VALUE, wma, {"time_period": 20}, _lb_window),
+        IndicatorSpec(
+            "DEMA",
+            _SERIES,
+            _VALUE,
+            dema,
+            {"time_period": 20},
+            lambda time_period: 2 * (time_period - 1),
+        ),
+        IndicatorSpec(
+            "TEMA",
+            _SERIES,
+            _VALUE,
+            tema,
+            {"time_period": 20},
+            lambda time_period: 3 * (time_period - 1),
+        ),
+        IndicatorSpec(
+            "MACD",
+            _SERIES,
+            ("macd", "signal", "histogram"),
+            macd,
+            {"fastperiod": 12, "slowperiod": 26, "signalperiod": 9},
+            _lb_macd,
+        ),
+        IndicatorSpec("RSI", _SERIES, _VALUE, rsi, {"time_period": 14}, _lb_wilder),
+        IndicatorSpec(
+            "STOCH",
+            _HLC,
+            ("slowk", "slowd"),
+            stoch,
+            {"fastkperiod": 5, "slowkperiod": 3, "slowdperiod": 3},
+            _lb_stoch,
+            {"slowkmatype": _non_sma, "slowdmatype": _non_sma},
+        ),
+        IndicatorSpec(
+            "BBANDS",
+            _SERIES,
+            ("upper", "middle", "lower"),
+            bbands,
+            {"time_period": 20, "nbdevup": 2.0, "nbdevdn": 2.0},
+            _lb_window,
+            {"matype": _non_sma},
+        ),
+        IndicatorSpec("ATR", _HLC, _VALUE, atr, {"time_period": 14}, _lb_wilder),
+        IndicatorSpec("OBV", ("close", "volume"), _VALUE, obv, {}, lambda: 0),
+        IndicatorSpec(
+            "ADX",
+            _HLC,
+            _VALUE,
+            adx,
+            {"time_period": 14},
+            lambda time_period: 2 * time_period - 1,
+        ),
+    )
+}
+
+
+def get_spec(indicator: str) -> IndicatorSpec:
+    try:
+        return INDICATORS[indicator.upper()]
+    except KeyError:
+        raise ValueError(f"지원하지 않는 지표: {indicator}") from None
+
+
+def supports(indicator: str, parameters: Mapping[str, Any]) -> bool:
+    """로컬 엔진으로 계산 가능한 지표/파라미터 조합인지 여부"""
+    spec = INDICATORS.get(indicator.upper())
+    if spec is None:
+        return False
+    return not any(
+        check(parameters[name])
+        for name, check in spec.unsupported.items()
+        if name in parameters
+    )
+
+
+def _call_params(spec: IndicatorSpec, parameters: Mapping[str, Any]) -> dict[str, Any]:
+    return {
+        name: type(default)(parameters[name])
+        if parameters.get(name) is not None
+        else default
+        for name, default in spec.params.items()
+    }
+
+
+def required_inputs(indicator: str, parameters: Mapping[str, Any]) -> list[str]:
+    """계산에 필요한 가격 컬럼 목록"""
+    series = parameters.get("series_type") or "close"
+    return [series if name == "series" else name for name in get_spec(indicator).inputs]
+
+
+def lookback(indicator: str, parameters: Mapping[str, Any] | None = None) -> int:
+    """첫 유효 출력 전 필요한 행 수 (출력이 하나라도 나오려면 lookback + 1행 필요)"""
+    spec = get_spec(indicator)
+    return spec.lookback(**_call_params(spec, parameters or {}))
+
+
+def compute(
+    indicator: str,
+    prices: Mapping[str, Any],
+    parameters: Mapping[str, Any] | None = None,
+) -> dict[str, np.ndarray]:
+    """가격 배열로 지표 계산
+
+    Args:
+        indicator: 지표 타입 (SMA, EMA, WMA, DEMA, TEMA, MACD, RSI, STOCH,
+            BBANDS, ATR, ADX, OBV)
+        prices: 가격 컬럼명 → ``(T,)`` 또는 ``(T, N)`` 배열
+        parameters: 서비스 파라미터 (``series_type``, ``time_period`` 등, 없으면 기본값)
+
+    Returns:
+        출력 이름 → 입력과 같은 모양의 배열
+
+    Raises:
+        ValueError: 지원하지 않는 지표 또는 파라미터 (예: SMA 외 matype)
+    """
+    parameters = parameters or {}
+    spec = get_spec(indicator)
+    if not supports(indicator, parameters):
+        raise ValueError(f"{spec.name}: 로컬 엔진이 지원하지 않는 파라미터 {parameters}")
+    inputs = [prices[name] for name in required_inputs(indicator, parameters)]
+    result = spec.func(*inputs, **_call_params(spec, parameters))
+    if not isinstance(result, tuple):
+        result = (result,)
+    return dict(zip(spec.outputs, result))
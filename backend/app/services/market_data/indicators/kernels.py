@@ -0,0 +1,109 @@
+"""
+Recursive Filter Kernels
+EMA 계열/Wilder 평활용 1차 선형 재귀 필터 커널 (시간 × 심볼 float64 블록)
+
+EMA, DEMA, TEMA, MACD, Wilder RSI/ATR/ADX는 모두 같은 1차 재귀식
+``y[t] = (1-alpha)·y[t-1] + alpha·x[t]`` 의 조합입니다. 이 모듈은 이 재귀식을
+``(T, N)`` 행렬의 모든 열(심볼)에 대해 한 번의 호출로 계산합니다.
+
+열 수에 따라 계산 방식을 고릅니다:
+- 좁은 행렬 (``_WIDE_COLUMNS`` 미만): 시간 축 필터.
+  SciPy가 있으면 ``scipy.signal.lfilter`` (C 구현)를 씁니다. 없으면 NumPy 블록 커널을 씁니다.
+  블록 커널은 시간 축을 ``_BLOCK`` 행 단위로 나눕니다. 블록 안은 감쇠 가중치 하삼각
+  행렬 곱 한 번으로 계산하고, 블록 사이에는 마지막 값만 이월합니다.
+  가중치가 모두 1 이하라 긴 시계열에서도 오차가 누적되지 않습니다.
+  (누적합이나 감쇠 거듭제곱 나눗셈을 쓰는 닫힌 형식과 다른 점입니다.)
+- 넓은 행렬 (유니버스 패널): 행 단위 벡터 재귀. 행마다 파이썬 반복 비용이 열 수만큼
+  분산되고 원소당 연산이 가장 적어, 시간 축 필터나 행렬 곱보다 빠릅니다.
+
+결측 규칙은 방식과 무관하게 같습니다: 유한하지 않은 입력을 만난 열은 그 이후 모두 NaN.
+
+사용 예제:
+    >>> out = recursive_filter(panel, 2.0 / (n + 1), n - 1, panel[:n].mean(axis=0))
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from scipy.signal import lfilter
+except ImportError:  # pragma: no cover - SciPy 미설치 환경
+    lfilter = None
+
+# 이 열 수 이상이면 행 단위 벡터 재귀 사용
+_WIDE_COLUMNS = 256
+
+# NumPy 블록 커널의 블록 길이 (행). 블록당 연산량은 길이에 비례, 파이썬 반복은 반비례
+_BLOCK = 64
+
+
+def recursive_filter(
+    x: np.ndarray, alpha: float, start: int, seed: np.ndarray
+) -> np.ndarray:
+    """1차 재귀 필터 y[t] = (1-alpha)·y[t-1] + alpha·x[t] (y[start] = seed)
+
+    Args:
+        x: ``(T, N)`` 입력 행렬 (``start`` 이후 행만 사용)
+        alpha: 새 값 가중치 (EMA 2/(n+1), Wilder 1/n)
+        start: 초기값을 놓는 행
+        seed: ``(N,)`` 열별 초기값
+
+    Returns:
+        ``(T, N)`` 결과 (``start`` 이전 행은 NaN)
+    """
+    out = np.full(x.shape, np.nan)
+    if start >= len(x):
+        return out
+    out[start] = seed
+    body = x[start + 1 :]
+    if len(body) == 0:
+        return out
+
+    finite = np.isfinite(body)
+    clean = bool(finite.all())
+    if x.shape[1] >= _WIDE_COLUMNS:
+        filtered = _row_filter(body, alpha, out[start])
+    elif lfilter is not None:
+        zi = (1.0 - alpha) * out[start : start + 1]
+        filtered, _ = lfilter([alpha], [1.0, alpha - 1.0], body, axis=0, zi=zi)
+    else:
+        filtered = _blocked_filter(
+            body if clean else np.where(finite, body, 0.0), alpha, out[start]
+        )
+    if not clean:
+        filtered[np.logical_or.accumulate(~finite, axis=0)] = np.nan
+    out[start + 1 :] = filtered
+    return out
+
+
+def _row_filter(body: np.ndarray, alpha: float, prev: np.ndarray) -> np.ndarray:
+    """행 단위 벡터 재귀 (넓은 행렬용)"""
+    decay = 1.0 - alpha
+    out = np.empty(body.shape)
+    for t, row in enumerate(body):
+        prev = decay * prev + alpha * row
+        out[t] = prev
+    return out
+
+
+def _blocked_filter(body: np.ndarray, alpha: float, prev: np.ndarray) -> np.ndarray:
+    """NumPy 블록 커널 (입력은 모두 유한)
+
+    블록 안의 j번째 행: ``y[j] = decay^(j+1)·prev + Σ_{k≤j} alpha·decay^(j-k)·x[k]``
+    """
+    rows = len(body)
+    size = min(rows, _BLOCK)
+    decay = 1.0 - alpha
+    lag = np.subtract.outer(np.arange(size), np.arange(size))
+    weights = np.where(lag >= 0, alpha * decay ** np.maximum(lag, 0), 0.0)
+    carry = decay ** np.arange(1, size + 1, dtype=np.float64)
+
+    out = np.empty(body.shape)
+    for lo in range(0, rows, size):
+        block = body[lo : lo + size]
+        m = len(block)
+        filtered = weights[:m, :m] @ block + carry[:m, None] * prev
+        out[lo : lo + m] = filtered
+        prev = filtered[-1]
+    return out
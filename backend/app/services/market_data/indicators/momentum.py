@@ -11,7 +11,9 @@ from app.schemas.market_data.technical_indicator import (
     IndicatorDataPoint,
     TechnicalIndicatorData,
 )
-from .base import BaseIndicatorService
+from app.core.single_flight import coalesce
+
+from .base import BaseIndicatorService, indicator_flight
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +27,7 @@ class MomentumIndicatorService(BaseIndicatorService):
     - STOCH: 스토캐스틱 오실레이터
     """
 
+    @coalesce(indicator_flight)
     async def get_rsi(
         self,
         symbol: str,
@@ -50,6 +53,11 @@ class MomentumIndicatorService(BaseIndicatorService):
             "series_type": series_type,
         }
 
+        # 저장된 OHLCV로 로컬 계산 (가능하면 캐시 조회/API 호출 생략)
+        local_data = await self._compute_local(symbol, "RSI", interval, parameters)
+        if local_data is not None:
+            return local_data
+
         cache_key = self._generate_cache_key(symbol, "RSI", interval, parameters)
 
         # 캐시 확인
@@ -123,6 +131,7 @@ class MomentumIndicatorService(BaseIndicatorService):
             ),
         )
 
+    @coalesce(indicator_flight)
     async def get_macd(
         self,
         symbol: str,
@@ -154,6 +163,11 @@ class MomentumIndicatorService(BaseIndicatorService):
             "signalperiod": signalperiod,
         }
 
+        # 저장된 OHLCV로 로컬 계산 (가능하면 캐시 조회/API 호출 생략)
+        local_data = await self._compute_local(symbol, "MACD", interval, parameters)
+        if local_data is not None:
+            return local_data
+
         cache_key = self._generate_cache_key(symbol, "MACD", interval, parameters)
 
         # 캐시 확인
@@ -235,6 +249,7 @@ class MomentumIndicatorService(BaseIndicatorService):
             ),
         )
 
+    @coalesce(indicator_flight)
     async def get_stoch(
         self,
         symbol: str,
@@ -269,6 +284,11 @@ class MomentumIndicatorService(BaseIndicatorService):
             "slowdmatype": slowdmatype,
         }
 
+        # 저장된 OHLCV로 로컬 계산 (가능하면 캐시 조회/API 호출 생략)
+        local_data = await self._compute_local(symbol, "STOCH", interval, parameters)
+        if local_data is not None:
+            return local_data
+
         cache_key = self._generate_cache_key(symbol, "STOCH", interval, parameters)
 
         # 캐시 확인
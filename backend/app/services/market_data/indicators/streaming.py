@@ -0,0 +1,719 @@
+"""
+Streaming Technical Indicators
+증분(스트리밍) 지표 상태 - 새 봉 하나당 O(1) 갱신
+
+각 지표 객체는 ``update(bar)`` 로 새 봉을 반영하고 현재 값을 반환합니다(룩백 구간은
+None). 상태는 ``to_dict()`` / ``from_dict()`` 로 JSON 직렬화되며,
+:class:`StreamingIndicatorService` 가 심볼/간격/파라미터별로 DuckDB
+``indicator_stream_state`` 테이블에 저장합니다.
+
+초기 상태는 ``seed(history)`` 가 로컬 엔진(:mod:`.engine`)으로 전체 이력을 한 번에
+계산해 마지막 행에서 복원하므로, 같은 입력이면 배치 계산과 같은 값을 이어서 냅니다.
+
+지원 지표: EMA, RSI(Wilder), MACD, BBANDS(Welford), ATR, OBV
+
+사용 예제:
+    >>> rsi = StreamingRSI.seed({"close": closes}, time_period=14)
+    >>> rsi.update({"close": 101.2})
+    >>> StreamingIndicator.from_dict(rsi.to_dict()).value == rsi.value
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable, Mapping, Sequence
+from datetime import UTC, datetime
+from typing import Any, ClassVar, Optional
+
+import numpy as np
+
+from app.services.database_manager import DatabaseManager
+
+from . import engine
+from .base import PriceArrays, read_price_arrays
+
+logger = logging.getLogger(__name__)
+
+Bar = Mapping[str, Any] | float
+
+# 보정 계수 변화 허용 오차 (배당/분할로 과거 수정주가가 바뀌면 상태를 다시 시드)
+_FACTOR_RTOL = 1e-9
+
+
+def indicator_key(kind: str, params: Mapping[str, Any]) -> str:
+    """지표 종류 + 파라미터로 만든 상태 키 (예: ``RSI(series_type=close,time_period=14)``)"""
+    args = ",".join(f"{name}={value}" for name, value in sorted(params.items()))
+    return f"{kind}({args})"
+
+
+def _price(bar: Bar, column: str) -> float:
+    if isinstance(bar, Mapping):
+        value = bar.get(column)
+        return math.nan if value is None else float(value)
+    return float(bar)
+
+
+def _columns(history: Mapping[str, Any], columns: Sequence[str]) -> list[np.ndarray]:
+    """필요한 컬럼만 float64로 꺼내고 결측 행 제거"""
+    arrays = [np.asarray(history[c], dtype=np.float64).ravel() for c in columns]
+    valid = np.logical_and.reduce([np.isfinite(a) for a in arrays])
+    return [a[valid] for a in arrays]
+
+
+class _Smoother:
+    """첫 n개 평균으로 시작하는 1차 재귀 평균 (EMA: k=2/(n+1), Wilder: k=1/n)"""
+
+    __slots__ = ("period", "alpha", "count", "total", "value")
+
+    def __init__(self, period: int, alpha: float):
+        self.period = period
+        self.alpha = alpha
+        self.count = 0
+        self.total = 0.0
+        self.value: Optional[float] = None
+
+    def update(self, x: float) -> Optional[float]:
+        if self.value is None:
+            self.count += 1
+            self.total += x
+            if self.count == self.period:
+                self.value = self.total / self.period
+            return self.value
+        self.value = (1.0 - self.alpha) * self.value + self.alpha * x
+        return self.value
+
+    def restore(
+        self, values: np.ndarray, batch: Callable[[np.ndarray, int], np.ndarray]
+    ) -> None:
+        """배치 계산 결과의 마지막 값으로 상태 복원 (이력이 짧으면 누적 상태만 보관)"""
+        if len(values) >= self.period:
+            self.count = self.period
+            self.total = 0.0
+            self.value = float(batch(values, self.period)[-1])
+        else:
+            self.count = len(values)
+            self.total = float(values.sum())
+            self.value = None
+
+    def get_state(self) -> dict[str, Any]:
+        return {"count": self.count, "total": self.total, "value": self.value}
+
+    def set_state(self, state: Mapping[str, Any]) -> None:
+        self.count = int(state["count"])
+        self.total = float(state["total"])
+        self.value = None if state["value"] is None else float(state["value"])
+
+
+class StreamingIndicator(ABC):
+    """증분 지표 기본 클래스
+
+    서브클래스는 ``kind``/``inputs``/``outputs`` 를 정의하고 ``update``,
+    ``value``, ``_seed``, ``get_state``/``set_state`` 를 구현합니다.
+    """
+
+    kind: ClassVar[str]
+    inputs: ClassVar[tuple[str, ...]] = ("series",)
+    outputs: ClassVar[tuple[str, ...]] = ("value",)
+    registry: ClassVar[dict[str, type[StreamingIndicator]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        StreamingIndicator.registry[cls.kind] = cls
+
+    def __init__(self, **params: Any):
+        self.params: dict[str, Any] = params
+
+    @property
+    def key(self) -> str:
+        return indicator_key(self.kind, self.params)
+
+    @property
+    def columns(self) -> list[str]:
+        """필요한 가격 컬럼 (``series`` 는 ``series_type`` 으로 치환)"""
+        series = self.params.get("series_type", "close")
+        return [series if name == "series" else name for name in self.inputs]
+
+    @property
+    @abstractmethod
+    def value(self) -> Any:
+        """현재 지표 값 (룩백 구간이면 None)"""
+
+    @property
+    def ready(self) -> bool:
+        return self.value is not None
+
+    @abstractmethod
+    def update(self, bar: Bar) -> Any:
+        """새 봉 반영 후 현재 값 반환 (필요한 가격이 없으면 상태 유지)"""
+
+    @abstractmethod
+    def _seed(self, *arrays: np.ndarray) -> None:
+        """``columns`` 순서의 이력 배열로 초기 상태 계산"""
+
+    @abstractmethod
+    def get_state(self) -> dict[str, Any]:
+        """JSON 직렬화 가능한 상태"""
+
+    @abstractmethod
+    def set_state(self, state: Mapping[str, Any]) -> None:
+        """``get_state`` 결과로 상태 복원"""
+
+    @classmethod
+    def seed(cls, history: Mapping[str, Any], **params: Any) -> StreamingIndicator:
+        """전체 이력을 한 번의 벡터 연산으로 계산해 마지막 상태 생성
+
+        Args:
+            history: 가격 컬럼명 → 시간 오름차순 배열 (결측 행은 건너뜀)
+            **params: 지표 파라미터
+        """
+        indicator = cls(**params)
+        indicator._seed(*_columns(history, indicator.columns))
+        return indicator
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"kind": self.kind, "params": self.params, "state": self.get_state()}
+
+    @staticmethod
+    def from_dict(data: Mapping[str, Any]) -> StreamingIndicator:
+        indicator = create(data["kind"], **data["params"])
+        indicator.set_state(data["state"])
+        return indicator
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.key}, value={self.value})"
+
+
+def create(kind: str, **params: Any) -> StreamingIndicator:
+    """지표 종류로 증분 지표 생성"""
+    try:
+        cls = StreamingIndicator.registry[kind.upper()]
+    except KeyError:
+        raise ValueError(f"지원하지 않는 증분 지표: {kind}") from None
+    return cls(**params)
+
+
+class StreamingEMA(StreamingIndicator):
+    """지수이동평균"""
+
+    kind = "EMA"
+
+    def __init__(self, time_period: int = 20, series_type: str = "close"):
+        super().__init__(time_period=int(time_period), series_type=series_type)
+        self._ema = _Smoother(int(time_period), 2.0 / (int(time_period) + 1))
+
+    @property
+    def value(self) -> Optional[float]:
+        return self._ema.value
+
+    def update(self, bar: Bar) -> Optional[float]:
+        x = _price(bar, self.columns[0])
+        if math.isnan(x):
+            return self.value
+        return self._ema.update(x)
+
+    def _seed(self, values: np.ndarray) -> None:
+        self._ema.restore(values, engine.ema)
+
+    def get_state(self) -> dict[str, Any]:
+        return self._ema.get_state()
+
+    def set_state(self, state: Mapping[str, Any]) -> None:
+        self._ema.set_state(state)
+
+
+class StreamingRSI(StreamingIndicator):
+    """Wilder RSI"""
+
+    kind = "RSI"
+
+    def __init__(self, time_period: int = 14, series_type: str = "close"):
+        super().__init__(time_period=int(time_period), series_type=series_type)
+        period = int(time_period)
+        self._prev: Optional[float] = None
+        self._gain = _Smoother(period, 1.0 / period)
+        self._loss = _Smoother(period, 1.0 / period)
+
+    @property
+    def value(self) -> Optional[float]:
+        gain, loss = self._gain.value, self._loss.value
+        if gain is None or loss is None:
+            return None
+        total = gain + loss
+        return 100.0 * gain / total if total != 0 else 0.0
+
+    def update(self, bar: Bar) -> Optional[float]:
+        x = _price(bar, self.columns[0])
+        if math.isnan(x):
+            return self.value
+        if self._prev is not None:
+            change = x - self._prev
+            self._gain.update(max(change, 0.0))
+            self._loss.update(max(-change, 0.0))
+        self._prev = x
+        return self.value
+
+    def _seed(self, values: np.ndarray) -> None:
+        if len(values) == 0:
+            return
+        change = np.diff(values)
+        self._gain.restore(np.clip(change, 0.0, None), engine.wilder)
+        self._loss.restore(np.clip(-change, 0.0, None), engine.wilder)
+        self._prev = float(values[-1])
+
+    def get_state(self) -> dict[str, Any]:
+        return {
+            "prev": self._prev,
+            "gain": self._gain.get_state(),
+            "loss": self._loss.get_state(),
+        }
+
+    def set_state(self, state: Mapping[str, Any]) -> None:
+        self._prev = state["prev"]
+        self._gain.set_state(state["gain"])
+        self._loss.set_state(state["loss"])
+
+
+class StreamingMACD(StreamingIndicator):
+    """MACD (빠른 EMA는 느린 EMA와 같은 봉에서 값이 나오도록 늦게 시작)"""
+
+    kind = "MACD"
+    outputs = ("macd", "signal", "histogram")
+
+    def __init__(
+        self,
+        fastperiod: int = 12,
+        slowperiod: int = 26,
+        signalperiod: int = 9,
+        series_type: str = "close",
+    ):
+        super().__init__(
+            fastperiod=int(fastperiod),
+            slowperiod=int(slowperiod),
+            signalperiod=int(signalperiod),
+            series_type=series_type,
+        )
+        fast, slow = sorted((int(fastperiod), int(slowperiod)))
+        self._offset = slow - fast
+        self._count = 0
+        self._line: Optional[float] = None
+        self._fast = _Smoother(fast, 2.0 / (fast + 1))
+        self._slow = _Smoother(slow, 2.0 / (slow + 1))
+        self._signal = _Smoother(int(signalperiod), 2.0 / (int(signalperiod) + 1))
+
+    @property
+    def value(self) -> Optional[dict[str, float]]:
+        signal = self._signal.value
+        if signal is None or self._line is None:
+            return None
+        return {
+            "macd": self._line,
+            "signal": signal,
+            "histogram": self._line - signal,
+        }
+
+    def update(self, bar: Bar) -> Optional[dict[str, float]]:
+        x = _price(bar, self.columns[0])
+        if math.isnan(x):
+            return self.value
+        self._count += 1
+        slow = self._slow.update(x)
+        fast = self._fast.update(x) if self._count > self._offset else None
+        if slow is not None and fast is not None:
+            self._line = fast - slow
+            self._signal.update(self._line)
+        return self.value
+
+    def _seed(self, values: np.ndarray) -> None:
+        self._count = len(values)
+        fast_input = values[self._offset :]
+        self._slow.restore(values, engine.ema)
+        self._fast.restore(fast_input, engine.ema)
+        if len(values) < self._slow.period:
+            self._signal.restore(values[:0], engine.ema)
+            return
+        line = (
+            engine.ema(fast_input, self._fast.period)
+            - engine.ema(values, self._slow.period)[self._offset :]
+        )
+        line = line[np.isfinite(line)]
+        self._line = float(line[-1])
+        self._signal.restore(line, engine.ema)
+
+    def get_state(self) -> dict[str, Any]:
+        return {
+            "count": self._count,
+            "line": self._line,
+            "fast": self._fast.get_state(),
+            "slow": self._slow.get_state(),
+            "signal": self._signal.get_state(),
+        }
+
+    def set_state(self, state: Mapping[str, Any]) -> None:
+        self._count = int(state["count"])
+        self._line = state["line"]
+        self._fast.set_state(state["fast"])
+        self._slow.set_state(state["slow"])
+        self._signal.set_state(state["signal"])
+
+
+class StreamingBollinger(StreamingIndicator):
+    """볼린저밴드 - 슬라이딩 Welford 평균/분산 (모표준편차)
+
+    창에서 빠지는 값과 들어오는 값으로 평균/제곱편차합을 O(1)에 갱신하고,
+    반올림 오차 누적을 막기 위해 창 길이만큼 갱신할 때마다 창에서 다시 계산합니다.
+    """
+
+    kind = "BBANDS"
+    outputs = ("upper", "middle", "lower")
+
+    def __init__(
+        self,
+        time_period: int = 20,
+        nbdevup: float = 2.0,
+        nbdevdn: float = 2.0,
+        series_type: str = "close",
+    ):
+        super().__init__(
+            time_period=int(time_period),
+            nbdevup=float(nbdevup),
+            nbdevdn=float(nbdevdn),
+            series_type=series_type,
+        )
+        self._period = int(time_period)
+        self._window: deque[float] = deque(maxlen=self._period)
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._since_resync = 0
+
+    @property
+    def value(self) -> Optional[dict[str, float]]:
+        if len(self._window) < self._period:
+            return None
+        std = math.sqrt(max(self._m2 / self._period, 0.0))
+        return {
+            "upper": self._mean + self.params["nbdevup"] * std,
+            "middle": self._mean,
+            "lower": self._mean - self.params["nbdevdn"] * std,
+        }
+
+    def update(self, bar: Bar) -> Optional[dict[str, float]]:
+        x = _price(bar, self.columns[0])
+        if math.isnan(x):
+            return self.value
+        if len(self._window) == self._period:
+            old = self._window[0]
+            self._window.append(x)
+            mean = self._mean + (x - old) / self._period
+            self._m2 += (x - old) * (x - mean + old - self._mean)
+            self._mean = mean
+            self._since_resync += 1
+            if self._since_resync >= self._period:
+                self._resync()
+        else:
+            self._window.append(x)
+            delta = x - self._mean
+            self._mean += delta / len(self._window)
+            self._m2 += delta * (x - self._mean)
+        return self.value
+
+    def _resync(self) -> None:
+        window = np.fromiter(self._window, dtype=np.float64)
+        self._mean = float(window.mean()) if len(window) else 0.0
+        self._m2 = float(((window - self._mean) ** 2).sum())
+        self._since_resync = 0
+
+    def _seed(self, values: np.ndarray) -> None:
+        self._window = deque(values[-self._period :].tolist(), maxlen=self._period)
+        self._resync()
+
+    def get_state(self) -> dict[str, Any]:
+        return {"window": list(self._window), "mean": self._mean, "m2": self._m2}
+
+    def set_state(self, state: Mapping[str, Any]) -> None:
+        self._window = deque(state["window"], maxlen=self._period)
+        self._mean = float(state["mean"])
+        self._m2 = float(state["m2"])
+        self._since_resync = 0
+
+
+class StreamingATR(StreamingIndicator):
+    """Wilder ATR"""
+
+    kind = "ATR"
+    inputs = ("high", "low", "close")
+
+    def __init__(self, time_period: int = 14):
+        super().__init__(time_period=int(time_period))
+        self._prev_close: Optional[float] = None
+        self._tr = _Smoother(int(time_period), 1.0 / int(time_period))
+
+    @property
+    def value(self) -> Optional[float]:
+        return self._tr.value
+
+    def update(self, bar: Bar) -> Optional[float]:
+        high, low, close = (_price(bar, c) for c in self.inputs)
+        if math.isnan(high) or math.isnan(low) or math.isnan(close):
+            return self.value
+        if self._prev_close is not None:
+            prev = self._prev_close
+            self._tr.update(max(high - low, abs(high - prev), abs(low - prev)))
+        self._prev_close = close
+        return self.value
+
+    def _seed(self, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> None:
+        if len(close) == 0:
+            return
+        self._tr.restore(engine.trange(high, low, close)[1:], engine.wilder)
+        self._prev_close = float(close[-1])
+
+    def get_state(self) -> dict[str, Any]:
+        return {"prev_close": self._prev_close, "tr": self._tr.get_state()}
+
+    def set_state(self, state: Mapping[str, Any]) -> None:
+        self._prev_close = state["prev_close"]
+        self._tr.set_state(state["tr"])
+
+
+class StreamingOBV(StreamingIndicator):
+    """On-Balance Volume (첫 값은 첫 거래량)"""
+
+    kind = "OBV"
+    inputs = ("close", "volume")
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._prev_close: Optional[float] = None
+        self._obv: Optional[float] = None
+
+    @property
+    def value(self) -> Optional[float]:
+        return self._obv
+
+    def update(self, bar: Bar) -> Optional[float]:
+        close, volume = (_price(bar, c) for c in self.inputs)
+        if math.isnan(close) or math.isnan(volume):
+            return self.value
+        if self._obv is None or self._prev_close is None:
+            self._obv = volume
+        elif close > self._prev_close:
+            self._obv += volume
+        elif close < self._prev_close:
+            self._obv -= volume
+        self._prev_close = close
+        return self.value
+
+    def _seed(self, close: np.ndarray, volume: np.ndarray) -> None:
+        if len(close) == 0:
+            return
+        self._obv = float(engine.obv(close, volume)[-1])
+        self._prev_close = float(close[-1])
+
+    def get_state(self) -> dict[str, Any]:
+        return {"prev_close": self._prev_close, "obv": self._obv}
+
+    def set_state(self, state: Mapping[str, Any]) -> None:
+        self._prev_close = state["prev_close"]
+        self._obv = state["obv"]
+
+
+class StreamingIndicatorService:
+    """심볼/간격/파라미터별 증분 지표 상태 관리
+
+    상태는 DuckDB ``indicator_stream_state`` 에 지표 하나당 한 행으로 저장됩니다.
+    상태가 없으면 저장된 전체 이력으로 한 번 시드하고, 이후에는 마지막으로 반영한
+    봉(``as_of``) 이후의 새 봉만 읽어 갱신합니다. 일봉 수정주가 보정 계수가 바뀐
+    경우(배당/분할)에는 해당 상태를 다시 시드합니다.
+
+    지표 명세 형식: ``{"indicator": "RSI", "time_period": 14}``
+    """
+
+    def __init__(self, database_manager: Optional[DatabaseManager] = None):
+        self._db_manager = database_manager
+
+    @property
+    def db_manager(self) -> DatabaseManager:
+        """데이터베이스 매니저 lazy loading"""
+        if self._db_manager is None:
+            self._db_manager = DatabaseManager()
+        return self._db_manager
+
+    async def get_latest(
+        self,
+        symbol: str,
+        specs: Sequence[Mapping[str, Any]],
+        interval: str = "daily",
+    ) -> dict[str, Any]:
+        """지표 최신 값 조회 (필요한 만큼 시드/갱신 후 상태 저장)
+
+        Args:
+            symbol: 주식 심볼
+            specs: 지표 명세 목록
+            interval: 'daily' 또는 인트라데이 간격
+
+        Returns:
+            상태 키 → 최신 값 (단일 값 또는 출력별 dict, 룩백 구간이면 None)
+        """
+        indicators = []
+        for spec in specs:
+            params = {k: v for k, v in spec.items() if k != "indicator"}
+            indicators.append(create(spec["indicator"], **params))
+        return await self._advance(symbol, interval, indicators)
+
+    async def advance(self, symbol: str, interval: str = "daily") -> dict[str, Any]:
+        """저장된 상태를 새 봉만큼 전진 (상태가 없는 심볼은 무시)
+
+        Returns:
+            상태 키 → 최신 값
+        """
+        return await self._advance(symbol, interval, None)
+
+    async def _advance(
+        self,
+        symbol: str,
+        interval: str,
+        indicators: Optional[list[StreamingIndicator]],
+    ) -> dict[str, Any]:
+        async_manager = self.db_manager.async_manager
+        stored = await async_manager.run_read(
+            "indicator_stream_load", self._load_states, symbol, interval
+        )
+        if indicators is None:
+            indicators = [
+                StreamingIndicator.from_dict(state["indicator"])
+                for state in stored.values()
+            ]
+        if not indicators:
+            return {}
+
+        indicators, rows = await async_manager.run_read(
+            "indicator_stream_advance",
+            self._advance_states,
+            symbol,
+            interval,
+            indicators,
+            stored,
+        )
+        if rows:
+            await async_manager.run_write(
+                "indicator_stream_save", self._save_states, rows
+            )
+            logger.debug(f"Advanced {len(rows)} indicator states for {symbol}")
+        return {indicator.key: indicator.value for indicator in indicators}
+
+    # ===== reader/writer 스레드 작업 =====
+
+    def _load_states(self, symbol: str, interval: str) -> dict[str, dict[str, Any]]:
+        """저장된 상태 조회 (reader 스레드에서 실행)"""
+        conn = self.db_manager.thread_cursor()
+        result = conn.execute(
+            """
+            SELECT indicator_key, state_json, as_of
+            FROM indicator_stream_state
+            WHERE symbol = ? AND interval = ?
+            """,
+            [symbol, interval],
+        ).fetchall()
+        states: dict[str, dict[str, Any]] = {}
+        for key, state_json, as_of in result:
+            state = json.loads(state_json)
+            state["as_of"] = as_of
+            states[key] = state
+        return states
+
+    def _advance_states(
+        self,
+        symbol: str,
+        interval: str,
+        indicators: list[StreamingIndicator],
+        stored: Mapping[str, Mapping[str, Any]],
+    ) -> tuple[list[StreamingIndicator], list[list[Any]]]:
+        """상태 복원 → 새 봉 반영 또는 시드 (reader 스레드에서 실행)
+
+        Returns:
+            (최종 지표 목록, 저장할 상태 행)
+        """
+        columns = sorted({column for ind in indicators for column in ind.columns})
+        result: dict[str, StreamingIndicator] = {ind.key: ind for ind in indicators}
+        rows: list[list[Any]] = []
+
+        resume: list[tuple[StreamingIndicator, datetime, float]] = []
+        fresh: list[StreamingIndicator] = []
+        for indicator in indicators:
+            state = stored.get(indicator.key)
+            if state is None or state.get("as_of") is None:
+                fresh.append(indicator)
+                continue
+            indicator.set_state(state["indicator"]["state"])
+            resume.append((indicator, state["as_of"], float(state["factor"])))
+
+        if resume:
+            since = min(as_of for _, as_of, _ in resume)
+            arrays = read_price_arrays(
+                self.db_manager, symbol, columns, interval, start=since
+            )
+            positions = {moment: i for i, moment in enumerate(arrays.times)}
+            for indicator, as_of, factor in resume:
+                row = positions.get(as_of)
+                if row is None or not math.isclose(
+                    arrays.factors[row], factor, rel_tol=_FACTOR_RTOL
+                ):
+                    # 기준 봉이 사라졌거나 수정주가가 바뀜 → 전체 이력으로 다시 시드
+                    fresh.append(indicator)
+                    continue
+                if row == len(arrays.times) - 1:
+                    continue
+                for i in range(row + 1, len(arrays.times)):
+                    bar = {c: arrays.prices[c][i] for c in indicator.columns}
+                    indicator.update(bar)
+                rows.append(self._state_row(symbol, interval, indicator, arrays, -1))
+
+        if fresh:
+            arrays = read_price_arrays(self.db_manager, symbol, columns, interval)
+            if arrays.times:
+                for indicator in fresh:
+                    seeded = type(indicator).seed(arrays.prices, **indicator.params)
+                    result[seeded.key] = seeded
+                    rows.append(self._state_row(symbol, interval, seeded, arrays, -1))
+
+        return list(result.values()), rows
+
+    @staticmethod
+    def _state_row(
+        symbol: str,
+        interval: str,
+        indicator: StreamingIndicator,
+        arrays: PriceArrays,
+        row: int,
+    ) -> list[Any]:
+        state = {"indicator": indicator.to_dict(), "factor": float(arrays.factors[row])}
+        return [
+            symbol,
+            interval,
+            indicator.key,
+            json.dumps(state),
+            arrays.times[row],
+            datetime.now(UTC).replace(tzinfo=None),
+        ]
+
+    def _save_states(self, rows: list[list[Any]]) -> None:
+        """상태 upsert (writer 스레드에서 단일 트랜잭션으로 실행)"""
+        conn = self.db_manager.thread_cursor()
+        conn.execute("BEGIN TRANSACTION")
+        try:
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO indicator_stream_state
+                (symbol, interval, indicator_key, state_json, as_of, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
@@ -11,7 +11,9 @@ from app.schemas.market_data.technical_indicator import (
     IndicatorDataPoint,
     TechnicalIndicatorData,
 )
-from .base import BaseIndicatorService
+from app.core.single_flight import coalesce
+
+from .base import BaseIndicatorService, indicator_flight
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +29,7 @@ class TrendIndicatorService(BaseIndicatorService):
     - TEMA: 삼중지수이동평균
     """
 
+    @coalesce(indicator_flight)
     async def get_sma(
         self,
         symbol: str,
@@ -52,6 +55,11 @@ class TrendIndicatorService(BaseIndicatorService):
             "series_type": series_type,
         }
 
+        # 저장된 OHLCV로 로컬 계산 (가능하면 캐시 조회/API 호출 생략)
+        local_data = await self._compute_local(symbol, "SMA", interval, parameters)
+        if local_data is not None:
+            return local_data
+
         cache_key = self._generate_cache_key(symbol, "SMA", interval, parameters)
 
         # 캐시 확인
@@ -131,6 +139,7 @@ class TrendIndicatorService(BaseIndicatorService):
             ),
         )
 
+    @coalesce(indicator_flight)
     async def get_ema(
         self,
         symbol: str,
@@ -156,6 +165,11 @@ class TrendIndicatorService(BaseIndicatorService):
             "series_type": series_type,
         }
 
+        # 저장된 OHLCV로 로컬 계산 (가능하면 캐시 조회/API 호출 생략)
+        local_data = await self._compute_local(symbol, "EMA", interval, parameters)
+        if local_data is not None:
+            return local_data
+
         cache_key = self._generate_cache_key(symbol, "EMA", interval, parameters)
 
         # 캐시 확인
@@ -229,6 +243,7 @@ class TrendIndicatorService(BaseIndicatorService):
             ),
         )
 
+    @coalesce(indicator_flight)
     async def get_wma(
         self,
         symbol: str,
@@ -254,6 +269,11 @@ class TrendIndicatorService(BaseIndicatorService):
             "series_type": series_type,
         }
 
+        # 저장된 OHLCV로 로컬 계산 (가능하면 캐시 조회/API 호출 생략)
+        local_data = await self._compute_local(symbol, "WMA", interval, parameters)
+        if local_data is not None:
+            return local_data
+
         cache_key = self._generate_cache_key(symbol, "WMA", interval, parameters)
 
         # 캐시 확인
@@ -327,6 +347,7 @@ class TrendIndicatorService(BaseIndicatorService):
             ),
         )
 
+    @coalesce(indicator_flight)
     async def get_dema(
         self,
         symbol: str,
@@ -352,6 +373,11 @@ class TrendIndicatorService(BaseIndicatorService):
             "series_type": series_type,
         }
 
+        # 저장된 OHLCV로 로컬 계산 (가능하면 캐시 조회/API 호출 생략)
+        local_data = await self._compute_local(symbol, "DEMA", interval, parameters)
+        if local_data is not None:
+            return local_data
+
         cache_key = self._generate_cache_key(symbol, "DEMA", interval, parameters)
 
         # 캐시 확인
@@ -425,6 +451,7 @@ class TrendIndicatorService(BaseIndicatorService):
             ),
         )
 
+    @coalesce(indicator_flight)
     async def get_tema(
         self,
         symbol: str,
@@ -450,6 +477,11 @@ class TrendIndicatorService(BaseIndicatorService):
             "series_type": series_type,
         }
 
+        # 저장된 OHLCV로 로컬 계산 (가능하면 캐시 조회/API 호출 생략)
+        local_data = await self._compute_local(symbol, "TEMA", interval, parameters)
+        if local_data is not None:
+            return local_data
+
         cache_key = self._generate_cache_key(symbol, "TEMA", interval, parameters)
 
         # 캐시 확인
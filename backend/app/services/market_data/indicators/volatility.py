@@ -11,7 +11,9 @@ from app.schemas.market_data.technical_indicator import (
     IndicatorDataPoint,
     TechnicalIndicatorData,
 )
-from .base import BaseIndicatorService
+from app.core.single_flight import coalesce
+
+from .base import BaseIndicatorService, indicator_flight
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +27,7 @@ class VolatilityIndicatorService(BaseIndicatorService):
     - ADX: 평균방향지수
     """
 
+    @coalesce(indicator_flight)
     async def get_bbands(
         self,
         symbol: str,
@@ -56,6 +59,11 @@ class VolatilityIndicatorService(BaseIndicatorService):
             "nbdevdn": nbdevdn,
         }
 
+        # 저장된 OHLCV로 로컬 계산 (가능하면 캐시 조회/API 호출 생략)
+        local_data = await self._compute_local(symbol, "BBANDS", interval, parameters)
+        if local_data is not None:
+            return local_data
+
         cache_key = self._generate_cache_key(symbol, "BBANDS", interval, parameters)
 
         # 캐시 확인
@@ -139,6 +147,7 @@ class VolatilityIndicatorService(BaseIndicatorService):
             ),
         )
 
+    @coalesce(indicator_flight)
     async def get_atr(
         self,
         symbol: str,
@@ -161,6 +170,11 @@ class VolatilityIndicatorService(BaseIndicatorService):
             "time_period": time_period,
         }
 
+        # 저장된 OHLCV로 로컬 계산 (가능하면 캐시 조회/API 호출 생략)
+        local_data = await self._compute_local(symbol, "ATR", interval, parameters)
+        if local_data is not None:
+            return local_data
+
         cache_key = self._generate_cache_key(symbol, "ATR", interval, parameters)
 
         # 캐시 확인
@@ -233,6 +247,7 @@ class VolatilityIndicatorService(BaseIndicatorService):
             ),
         )
 
+    @coalesce(indicator_flight)
     async def get_adx(
         self,
         symbol: str,
@@ -255,6 +270,11 @@ class VolatilityIndicatorService(BaseIndicatorService):
             "time_period": time_period,
         }
 
+        # 저장된 OHLCV로 로컬 계산 (가능하면 캐시 조회/API 호출 생략)
+        local_data = await self._compute_local(symbol, "ADX", interval, parameters)
+        if local_data is not None:
+            return local_data
+
         cache_key = self._generate_cache_key(symbol, "ADX", interval, parameters)
 
         # 캐시 확인
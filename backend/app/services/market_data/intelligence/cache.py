@@ -200,71 +200,14 @@ class IntelligenceCacheManager(BaseIntelligenceService):
                 logger.warning("No database manager or no news articles to save")
                 return True
 
-            # DuckDB 연결
-            self._db_manager.connect()
-            conn = self._db_manager.connection
-
-            if not conn:
-                logger.error("DuckDB connection failed")
-                return False
-
             logger.info(
                 f"Attempting to save {len(news_articles)} news articles to DuckDB"
             )
 
-            # 뉴스 데이터 저장
-            saved_count = 0
-            for article in news_articles:
-                try:
-                    # NewsArticle 모델에서 필드 추출
-                    if hasattr(article, "model_dump"):
-                        data = article.model_dump()
-                    elif hasattr(article, "dict"):
-                        data = article.dict()
-                    else:
-                        logger.warning(
-                            f"Article has no model_dump or dict method: {type(article)}"
-                        )
-                        continue
-
-                    logger.debug(
-                        f"Saving article: {data.get('title', 'Unknown')[:50]}..."
-                    )
-
-                    conn.execute(
-                        """
-                        INSERT OR REPLACE INTO news_cache (
-                            symbol, title, url, time_published, authors, summary,
-                            banner_image, source, category_within_source, source_domain,
-                            topics, overall_sentiment_score, overall_sentiment_label,
-                            ticker_sentiment, created_at
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        [
-                            data.get("symbol", "UNKNOWN"),
-                            data.get("title", ""),
-                            data.get("url", ""),
-                            data.get("time_published", ""),
-                            data.get("authors", []),
-                            data.get("summary", ""),
-                            data.get("banner_image", ""),
-                            data.get("news_source", data.get("source", "")),
-                            data.get("category_within_source", ""),
-                            data.get("source_domain", ""),
-                            data.get("topics", []),
-                            float(data.get("overall_sentiment_score", 0.0)),
-                            data.get("overall_sentiment_label", "Neutral"),
-                            str(data.get("ticker_sentiment", {})),
-                            datetime.now(UTC).isoformat(),
-                        ],
-                    )
-                    saved_count += 1
-                except Exception as insert_error:
-                    logger.error(f"Failed to insert news article: {insert_error}")
-                    logger.error(
-                        f"Article data: {data if 'data' in locals() else 'No data'}"
-                    )
-                    continue
+            # 뉴스 데이터 저장 (writer lane)
+            saved_count = await self._db_manager.async_manager.run_write(
+                "save_news_cache", self._write_news_rows, news_articles
+            )
 
             if saved_count > 0:
                 logger.info(
@@ -280,6 +223,63 @@ class IntelligenceCacheManager(BaseIntelligenceService):
             logger.error(f"Exception details: {type(e).__name__}: {str(e)}")
             return False
 
+    def _write_news_rows(self, news_articles: List) -> int:
+        """뉴스 기사를 news_cache 테이블에 기록 (writer 스레드에서 실행)"""
+        conn = self._db_manager.thread_cursor()
+
+        saved_count = 0
+        for article in news_articles:
+            try:
+                # NewsArticle 모델에서 필드 추출
+                if hasattr(article, "model_dump"):
+                    data = article.model_dump()
+                elif hasattr(article, "dict"):
+                    data = article.dict()
+                else:
+                    logger.warning(
+                        f"Article has no model_dump or dict method: {type(article)}"
+                    )
+                    continue
+
+                logger.debug(f"Saving article: {data.get('title', 'Unknown')[:50]}...")
+
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO news_cache (
+                        symbol, title, url, time_published, authors, summary,
+                        banner_image, source, category_within_source, source_domain,
+                        topics, overall_sentiment_score, overall_sentiment_label,
+                        ticker_sentiment, created_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    [
+                        data.get("symbol", "UNKNOWN"),
+                        data.get("title", ""),
+                        data.get("url", ""),
+                        data.get("time_published", ""),
+                        data.get("authors", []),
+                        data.get("summary", ""),
+                        data.get("banner_image", ""),
+                        data.get("news_source", data.get("source", "")),
+                        data.get("category_within_source", ""),
+                        data.get("source_domain", ""),
+                        data.get("topics", []),
+                        float(data.get("overall_sentiment_score", 0.0)),
+                        data.get("overall_sentiment_label", "Neutral"),
+                        str(data.get("ticker_sentiment", {})),
+                        datetime.now(UTC).isoformat(),
+                    ],
+                )
+                saved_count += 1
+            except Exception as insert_error:
+                logger.error(f"Failed to insert news article: {insert_error}")
+                logger.error(
+                    f"Article data: {data if 'data' in locals() else 'No data'}"
+                )
+                continue
+
+        return saved_count
+
     async def refresh_data_from_source(self, **kwargs) -> List[Dict[str, Any]]:
         """BaseMarketDataService 추상 메서드 구현 (deprecated)"""
         logger.warning(
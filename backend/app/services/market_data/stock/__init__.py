@@ -8,19 +8,29 @@ Stock Service Package
 - ✅ storage.py: StockStorage (MongoDB 저장)
 - ✅ coverage.py: CoverageManager (Coverage 메타데이터)
 - ✅ cache.py: StockCacheManager (DuckDB 캐싱)
+- ✅ quotes.py: QuoteBook (공유 실시간 호가 캐시, 대량 조회 병합)
 - ✅ __init__.py: StockService (Full delegation pattern)
 """
 
-from typing import List, Literal, Optional, cast
-from datetime import datetime, timezone
+from typing import Any, List, Literal, Optional, cast
+from datetime import date, datetime, time, timezone
 import logging
 
+import pyarrow as pa
+
+from app.core.cache_stats import cache_stats
 from app.services.database_manager import DatabaseManager
+from app.services.market_data.base_service import (
+    COMPACT_BARS,
+    compact_window,
+    trading_days_between,
+)
 from app.services.monitoring.data_quality_sentinel import DataQualitySentinel
 from app.models.market_data.stock import (
     DailyPrice,
     WeeklyPrice,
     MonthlyPrice,
+    StockDataCoverage,
 )
 from app.schemas.market_data.stock import QuoteData
 
@@ -29,9 +39,80 @@ from .fetcher import StockFetcher
 from .storage import StockStorage
 from .coverage import CoverageManager
 from .cache import StockCacheManager
+from .quotes import quote_book
 
 logger = logging.getLogger(__name__)
 
+# 히스토리 레코드로 내보내는 가격 필드 (volume 제외, float 변환)
+_HISTORY_FIELDS = (
+    "open",
+    "high",
+    "low",
+    "close",
+    "adjusted_close",
+    "dividend_amount",
+    "split_coefficient",
+)
+
+
+def _as_day(value: Any) -> Optional[date]:
+    """datetime/date/ISO 문자열을 날짜로 변환"""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+def _coverage_spans(coverage: StockDataCoverage, end_day: Optional[date]) -> bool:
+    """Coverage가 요청 범위를 덮는지 확인
+
+    full 적재 이력이 있으면 first_date가 상장 이후 전체 이력의 시작이므로 왼쪽 경계는
+    항상 충족되고, 오른쪽 경계는 last_date가 종료일(없으면 오늘)보다 1거래일 이상
+    뒤처지지 않아야 합니다.
+    """
+    if coverage.last_full_update is None or coverage.last_date is None:
+        return False
+    today = datetime.now(timezone.utc).date()
+    target = min(end_day, today) if end_day else today
+    return trading_days_between(coverage.last_date.date(), target) <= 1
+
+
+def _table_spans(
+    table: pa.Table,
+    coverage: StockDataCoverage,
+    start_day: Optional[date],
+    end_day: Optional[date],
+) -> bool:
+    """DuckDB 조회 결과가 Coverage 기준 요청 범위 양 끝을 포함하는지 확인"""
+    if table.num_rows == 0 or coverage.first_date is None or coverage.last_date is None:
+        return False
+    dates = table.column("date")
+    first = cast(date, _as_day(dates[0].as_py()))
+    last = cast(date, _as_day(dates[-1].as_py()))
+
+    expected_first = coverage.first_date.date()
+    if start_day and start_day > expected_first:
+        expected_first = start_day
+    expected_last = coverage.last_date.date()
+    if end_day and end_day < expected_last:
+        expected_last = end_day
+
+    return (
+        trading_days_between(expected_first, first) <= 1
+        and trading_days_between(last, expected_last) <= 1
+    )
+
+
+def _price_record(price: DailyPrice) -> dict[str, Any]:
+    record: dict[str, Any] = {"date": price.date, "volume": price.volume}
+    for name in _HISTORY_FIELDS:
+        value = getattr(price, name)
+        record[name] = float(value) if value is not None else None
+    return record
+
 
 class StockService(BaseStockService):
     """주식 데이터 서비스 (Modular Architecture)
@@ -41,6 +122,7 @@ class StockService(BaseStockService):
     - storage: MongoDB 저장
     - coverage: Coverage 메타데이터 관리
     - cache: DuckDB 캐싱
+    - quote_book: 공유 실시간 호가 캐시 (프로세스 전역)
     """
 
     def __init__(
@@ -69,63 +151,106 @@ class StockService(BaseStockService):
         symbol: str,
         outputsize: str = "compact",
         adjusted: bool = True,
+        force_full: bool = False,
     ) -> List[DailyPrice]:
-        """일일 주가 데이터 조회 (Coverage 기반 캐싱)
+        """일일 주가 데이터 조회 (Coverage 기반 증분 동기화)
+
+        - 저장된 데이터가 없거나 force_full이면 full 적재
+        - 업데이트 예정일(next_update_due)이 지났으면 coverage.last_date 이후 공백을 확인해
+          100봉 미만이면 compact 응답으로 신규/변경 봉만 병합, 이상이면 full 적재
+        - 분할/배당으로 과거 수정 종가가 바뀐 경우에만 삭제 후 full 재적재
+        - compact 응답을 받지 못하면 저장된 데이터를 반환하고 Coverage는 갱신하지 않음
 
         Args:
             symbol: 종목 심볼
-            outputsize: 'compact' (최근 100개) 또는 'full' (전체 데이터)
+            outputsize: 'compact' (최근 100개) 또는 'full' (전체 데이터).
+                저장된 이력은 항상 전체를 반환하므로 재적재 여부에는 영향 없음
             adjusted: True면 adjusted prices (현재는 항상 adjusted)
+            force_full: True면 캐시/업데이트 예정일과 무관하게 전체 이력 재적재
 
         Returns:
             DailyPrice 리스트
         """
         # Coverage 확인
         coverage = await self._coverage.get_or_create_coverage(symbol, "daily")
-
-        # Full update가 필요한지 확인 (최초 또는 7일 이상 경과)
-        needs_full_update = coverage.last_full_update is None
-        if not needs_full_update and coverage.last_full_update is not None:
-            # Ensure both datetimes are timezone-aware for comparison
-            now_utc = datetime.now(timezone.utc)
-            last_update = coverage.last_full_update
-
-            # If last_update is naive, make it aware (assume UTC)
-            if last_update.tzinfo is None:
-                last_update = last_update.replace(tzinfo=timezone.utc)
-
-            needs_full_update = (now_utc - last_update).days >= 7
+        if force_full:
+            cache_stats.record("stock_daily", False)
+            return await self._full_daily_update(
+                symbol, coverage, adjusted, reason="full refresh requested"
+            )
 
         # MongoDB에서 기존 데이터 조회
         existing_prices = (
             await DailyPrice.find({"symbol": symbol}).sort("-date").to_list()
         )
 
-        # 데이터가 없거나 Full update가 필요한 경우만 API 호출
-        if not existing_prices or needs_full_update:
-            logger.info(
-                f"🔄 Performing full update for {symbol} daily prices "
-                f"(existing: {len(existing_prices)}, needs_full: {needs_full_update})"
+        now_utc = datetime.now(timezone.utc)
+        last_date = coverage.last_date or (
+            existing_prices[0].date if existing_prices else None
+        )
+        if not existing_prices or last_date is None:
+            cache_stats.record("stock_daily", False)
+            return await self._full_daily_update(
+                symbol, coverage, adjusted, reason="no local data"
             )
 
-            # Storage 모듈로 fetch & store
-            prices = await self._storage.store_daily_prices(
-                symbol, adjusted=adjusted, is_full=True
-            )
+        next_due = coverage.next_update_due
+        if next_due is not None and next_due.tzinfo is None:
+            next_due = next_due.replace(tzinfo=timezone.utc)
+        is_due = next_due is None or next_due <= now_utc
 
-            # Coverage 업데이트
-            if prices:
-                await self._coverage.update_coverage(
-                    coverage=coverage, data_records=prices, update_type="full"
-                )
-            return prices or []
-        else:
+        cache_stats.record("stock_daily", not is_due)
+        if not is_due:
             logger.info(
                 f"✅ Using cached data for {symbol} daily prices "
-                f"({len(existing_prices)} records, last_update: {coverage.last_full_update})"
+                f"({len(existing_prices)} records, next update: {next_due})"
             )
             return existing_prices
 
+        gap = trading_days_between(last_date.date(), now_utc.date())
+        if gap >= COMPACT_BARS:
+            return await self._full_daily_update(
+                symbol, coverage, adjusted, reason=f"{gap} bars behind"
+            )
+
+        result = await self._storage.sync_daily_prices(symbol, existing_prices)
+        if result.mode == "full_required":
+            return await self._full_daily_update(
+                symbol, coverage, adjusted, reason=result.reason
+            )
+        if result.mode == "failed":
+            # 갱신하지 못했으므로 Coverage를 그대로 두어 다음 요청/스케줄러가 재시도
+            logger.warning(
+                f"⚠️ Delta sync failed for {symbol} ({result.reason}), "
+                f"serving {len(result.prices)} stored records"
+            )
+            return result.prices
+
+        await self._coverage.update_coverage(
+            coverage=coverage, data_records=result.prices, update_type="delta"
+        )
+        return result.prices
+
+    async def _full_daily_update(
+        self,
+        symbol: str,
+        coverage: StockDataCoverage,
+        adjusted: bool,
+        reason: str,
+    ) -> List[DailyPrice]:
+        """전체 이력 재적재 (기존 데이터 삭제 후 full 응답 저장)"""
+        logger.info(f"🔄 Performing full update for {symbol} daily prices ({reason})")
+
+        prices = await self._storage.store_daily_prices(
+            symbol, adjusted=adjusted, is_full=True
+        )
+
+        if prices:
+            await self._coverage.update_coverage(
+                coverage=coverage, data_records=prices, update_type="full"
+            )
+        return prices or []
+
     async def get_weekly_prices(
         self,
         symbol: str,
@@ -265,6 +390,26 @@ class StockService(BaseStockService):
             logger.warning(f"Error with cached quote for {symbol}: {e}")
             return await self._fetcher.fetch_quote(symbol)
 
+    async def get_real_time_quotes(
+        self, symbols: List[str], force_refresh: bool = False
+    ) -> dict[str, Optional[QuoteData]]:
+        """여러 심볼의 실시간 호가 일괄 조회 (Alpha Vantage REALTIME_BULK_QUOTES)
+
+        모든 사용자가 공유하는 단기 TTL 호가 캐시(``quote_book``)에서 먼저 읽고,
+        없는 심볼만 최대 100개씩 묶어 조회합니다. 관심종목/대시보드처럼 여러 심볼을
+        자주 조회하는 경로는 ``get_real_time_quote`` 반복 호출 대신 이 메서드를 사용합니다.
+
+        Args:
+            symbols: 주식 심볼 리스트
+            force_refresh: True인 경우 캐시 무시하고 다시 조회
+
+        Returns:
+            심볼(대문자)별 QuoteData (입력 순서 유지, 조회 실패 심볼은 None)
+        """
+        return await quote_book.get_many(
+            symbols, self._fetcher.fetch_bulk_quotes, force_refresh=force_refresh
+        )
+
     async def get_intraday_data(
         self,
         symbol: str,
@@ -273,6 +418,8 @@ class StockService(BaseStockService):
         extended_hours: bool = False,
         outputsize: Literal["compact", "full"] | None = "full",
         month: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
     ) -> List[DailyPrice]:
         """실시간/인트라데이 데이터 조회 (Alpha Vantage TIME_SERIES_INTRADAY)
 
@@ -283,6 +430,8 @@ class StockService(BaseStockService):
             extended_hours: 장외 시간 포함 여부
             outputsize: 출력 크기 (compact: 100 data points, full: 30 days or full month)
             month: 조회할 월 (YYYY-MM 형식, Premium plan only)
+            start: 시작 시점 (포함, 시계열 캐시에서 구간 조회)
+            end: 종료 시점 (포함)
 
         Returns:
             인트라데이 가격 데이터 리스트
@@ -297,20 +446,36 @@ class StockService(BaseStockService):
         }
 
         ttl_hours = interval_ttl_mapping.get(interval, 4)
-        cache_key = f"intraday_{symbol}_{interval}_{adjusted}_{extended_hours}_{outputsize}_{month or 'latest'}"
+        # outputsize는 키에서 제외: compact 갱신도 같은 시계열에 이어 붙임
+        series_key = (
+            f"{symbol}_{interval}_{adjusted}_{extended_hours}_{month or 'latest'}"
+        )
+        full_history = outputsize == "full"
 
         async def refresh_callback():
             return await self._fetcher.fetch_intraday(
                 symbol, interval, adjusted, extended_hours, outputsize, month
             )
 
-        results = await self.get_data_with_unified_cache(
-            cache_key=cache_key,
-            model_class=DailyPrice,
+        async def incremental_callback():
+            return await self._fetcher.fetch_intraday(
+                symbol, interval, adjusted, extended_hours, "compact", month
+            )
+
+        results = await self.get_series_with_cache(
+            series_key=series_key,
             data_type="stock_intraday",
-            symbol=symbol,
+            model_class=DailyPrice,
             refresh_callback=refresh_callback,
+            symbol=symbol,
             ttl_hours=ttl_hours,
+            start=start,
+            end=end,
+            limit=None if full_history or start or end else COMPACT_BARS,
+            full_history=full_history,
+            # 특정 월 조회는 전체 월 데이터가 필요하므로 증분 갱신 없음
+            incremental_callback=None if month else incremental_callback,
+            incremental_window=compact_window(interval),
         )
 
         return cast(List[DailyPrice], results)
@@ -321,7 +486,11 @@ class StockService(BaseStockService):
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
     ) -> dict:
-        """장기 히스토리 데이터 조회 (Alpha Vantage TIME_SERIES_DAILY_ADJUSTED)
+        """장기 히스토리 데이터 조회 (로컬 스토어 우선, 날짜 범위 pushdown)
+
+        DuckDB 가격 저장소 → MongoDB 순으로 날짜 범위를 쿼리에 넣어 읽고,
+        Coverage가 요청 범위를 덮지 못할 때만 get_daily_prices로 공백을 채웁니다
+        (full 또는 증분 동기화). 같은 범위를 다시 조회하면 네트워크를 사용하지 않습니다.
 
         Args:
             symbol: 주식 심볼
@@ -329,9 +498,79 @@ class StockService(BaseStockService):
             end_date: 종료 날짜
 
         Returns:
-            히스토리 데이터 딕셔너리
+            히스토리 데이터 딕셔너리 ({"symbol", "records", "data_points", ...})
         """
-        return await self._fetcher.fetch_historical(symbol, start_date, end_date)
+        start_day = _as_day(start_date)
+        end_day = _as_day(end_date)
+
+        coverage = await self._coverage.get_or_create_coverage(symbol, "daily")
+        covered = _coverage_spans(coverage, end_day)
+        cache_stats.record("stock_history", covered)
+        if not covered:
+            logger.info(
+                f"🔄 Filling daily coverage gap for {symbol} before history read"
+            )
+            await self.get_daily_prices(symbol)
+            coverage = await self._coverage.get_or_create_coverage(symbol, "daily")
+
+        records, source = await self._read_local_history(
+            symbol, coverage, start_day, end_day
+        )
+        if not records:
+            logger.warning(f"No local history for {symbol} ({start_day} ~ {end_day})")
+            return {}
+
+        logger.info(
+            f"📚 Loaded {len(records)} history records for {symbol} from {source}"
+        )
+        return {
+            "symbol": symbol,
+            "records": records,
+            "data_points": len(records),
+            "timestamp": datetime.now().isoformat(),
+            "source": source,
+        }
+
+    async def _read_local_history(
+        self,
+        symbol: str,
+        coverage: StockDataCoverage,
+        start_day: Optional[date],
+        end_day: Optional[date],
+    ) -> tuple[list[dict[str, Any]], str]:
+        """DuckDB에서 범위 조회, 커버리지가 부족하면 MongoDB 범위 조회 후 DuckDB에 미러링"""
+        if self._db_manager is not None:
+            try:
+                table = await self._db_manager.async_manager.get_prices_arrow(
+                    [symbol], start=start_day, end=end_day
+                )
+                if _table_spans(table, coverage, start_day, end_day):
+                    return table.drop_columns(["symbol"]).to_pylist(), "duckdb"
+            except Exception as e:
+                logger.warning(f"⚠️ DuckDB history read failed for {symbol}: {e}")
+
+        query: dict[str, Any] = {"symbol": symbol}
+        date_range: dict[str, datetime] = {}
+        if start_day:
+            date_range["$gte"] = datetime.combine(start_day, time.min)
+        if end_day:
+            date_range["$lte"] = datetime.combine(end_day, time.max)
+        if date_range:
+            query["date"] = date_range
+
+        prices = await DailyPrice.find(query).sort("+date").to_list()
+        records = [_price_record(price) for price in prices]
+
+        if records and self._db_manager is not None:
+            try:
+                mirror = pa.Table.from_pylist(
+                    [{**record, "symbol": symbol} for record in records]
+                )
+                await self._db_manager.async_manager.upsert_daily_prices(mirror)
+            except Exception as e:
+                logger.warning(f"⚠️ DuckDB history mirror failed for {symbol}: {e}")
+
+        return records, "mongodb"
 
     async def search_symbols(self, keywords: str) -> dict:
         """심볼 검색 (Alpha Vantage SYMBOL_SEARCH API 호출)
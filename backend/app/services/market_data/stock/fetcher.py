@@ -3,11 +3,17 @@ Stock Data Fetcher
 Alpha Vantage API 호출 로직
 """
 
-from typing import List, Literal, Optional, cast
+from typing import Any, List, Literal, Optional, cast
 from datetime import datetime
 from decimal import Decimal
+import asyncio
 import logging
 
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from app.alpha_vantage import RateLimitExceeded
+from app.alpha_vantage.stock import BULK_QUOTES_MAX_SYMBOLS
 from app.models.market_data.stock import DailyPrice, WeeklyPrice, MonthlyPrice
 from app.services.market_data.base_service import DataQualityValidator
 from app.schemas.market_data.stock import QuoteData
@@ -15,16 +21,60 @@ from .base import BaseStockService
 
 logger = logging.getLogger(__name__)
 
+# CSV 경로 레코드에 추가되는 고정 필드 (JSON 경로 레코드와 동일한 형태)
+_RECORD_DEFAULTS: dict[str, Any] = {
+    "data_quality_score": 95.0,
+    "source": "alpha_vantage",
+    "price_change": 0.0,
+    "price_change_percent": 0.0,
+}
+
+
+def _complete_price_table(table: pa.Table, symbol: str) -> pa.Table:
+    """symbol 컬럼과 조정 컬럼 기본값(close/0/1)을 채운 가격 테이블"""
+    rows = table.num_rows
+    if "adjusted_close" not in table.column_names:
+        table = table.append_column("adjusted_close", table.column("close"))
+    if "dividend_amount" not in table.column_names:
+        table = table.append_column(
+            "dividend_amount", pa.array([0.0] * rows, pa.float64())
+        )
+    if "split_coefficient" not in table.column_names:
+        table = table.append_column(
+            "split_coefficient", pa.array([1.0] * rows, pa.float64())
+        )
+    return table.append_column("symbol", pa.array([symbol] * rows, pa.string()))
+
+
+def _table_to_records(
+    table: pa.Table,
+    time_column: str = "date",
+    defaults: Optional[dict[str, Any]] = None,
+) -> list[dict[str, Any]]:
+    """Arrow Table을 레코드 리스트로 변환 (시간 컬럼은 ``date`` 로 통일)"""
+    if time_column != "date":
+        table = table.rename_columns(
+            ["date" if name == time_column else name for name in table.column_names]
+        )
+    records = table.to_pylist()
+    if defaults:
+        for record in records:
+            record.update(defaults)
+    return records
+
 
 class StockFetcher(BaseStockService):
     """Alpha Vantage API 호출 클래스
 
     Methods:
         - fetch_daily_prices: Daily price 조회
+        - fetch_daily_prices_table: Daily price CSV 조회 (Arrow Table, 로컬 스토어 적재)
         - fetch_weekly_prices: Weekly price 조회
         - fetch_monthly_prices: Monthly price 조회
         - fetch_quote: Real-time quote 조회
+        - fetch_bulk_quotes: Real-time quote 일괄 조회 (요청당 최대 100개 심볼)
         - fetch_intraday: Intraday data 조회
+        - fetch_intraday_table: Intraday data CSV 조회 (Arrow Table, 로컬 스토어 적재)
         - search_symbols: Symbol 검색
     """
 
@@ -34,17 +84,38 @@ class StockFetcher(BaseStockService):
         return []
 
     async def fetch_daily_prices(
-        self, symbol: str, outputsize: str = "compact"
+        self,
+        symbol: str,
+        outputsize: str = "compact",
+        datatype: Literal["csv", "json"] = "csv",
     ) -> List[DailyPrice]:
         """Alpha Vantage에서 일일 주가 데이터 가져오기
 
         Args:
             symbol: 주식 심볼
             outputsize: 'compact' (최근 100개) 또는 'full' (전체)
+            datatype: 'csv' (Arrow Table로 파싱 후 로컬 스토어 적재) 또는 'json'
 
         Returns:
             DailyPrice 리스트 (dict 형태 포함)
+
+        Raises:
+            RateLimitExceeded: 속도 제한기 거부 또는 Alpha Vantage 한도 응답
+                (그 외 오류는 빈 리스트 반환)
         """
+        if datatype == "csv":
+            try:
+                table = await self.fetch_daily_prices_table(symbol, outputsize)
+            except RateLimitExceeded:
+                # 한도 초과는 호출 측(스케줄러 등)이 보류/재시도하도록 그대로 전달
+                raise
+            except Exception as e:
+                logger.error(f"Failed to fetch daily prices (csv) for {symbol}: {e}")
+                return []
+            daily_prices = _table_to_records(table, "date", _RECORD_DEFAULTS)
+            logger.info(f"Fetched {len(daily_prices)} daily prices for {symbol} (csv)")
+            return daily_prices  # type: ignore
+
         try:
             # 심볼 유효성 검사
             symbol = self._validate_symbol(symbol)
@@ -212,6 +283,8 @@ class StockFetcher(BaseStockService):
                 )
                 return []
 
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             import traceback
 
@@ -220,6 +293,85 @@ class StockFetcher(BaseStockService):
             logger.error(f"Traceback: {traceback.format_exc()}")
             return []
 
+    async def fetch_daily_prices_table(
+        self, symbol: str, outputsize: str = "compact"
+    ) -> pa.Table:
+        """Alpha Vantage CSV 응답을 Arrow Table로 가져와 로컬 스토어에 bulk 적재
+
+        행 단위 dict/모델 변환 없이 타입이 지정된 컬럼으로 파싱합니다.
+
+        Args:
+            symbol: 주식 심볼
+            outputsize: 'compact' (최근 100개) 또는 'full' (전체)
+
+        Returns:
+            symbol, date, OHLCV, adjusted_close, dividend_amount, split_coefficient
+            컬럼의 ``pyarrow.Table`` (날짜 오름차순)
+
+        Raises:
+            ValueError: 심볼이 유효하지 않거나 API 에러가 발생한 경우
+        """
+        symbol = self._validate_symbol(symbol)
+        if outputsize not in ["compact", "full"]:
+            outputsize = "compact"
+
+        logger.info(f"Alpha Vantage CSV 호출 시작: {symbol}, outputsize={outputsize}")
+        table = await self.alpha_vantage.stock.daily_adjusted_table(
+            symbol=symbol,
+            outputsize=outputsize,  # type: ignore
+        )
+        table = _complete_price_table(table, symbol)
+        await self._load_local_store(table, "daily")
+        return table
+
+    async def fetch_intraday_table(
+        self,
+        symbol: str,
+        interval: Literal["1min", "5min", "15min", "30min", "60min"] = "15min",
+        adjusted: bool = False,
+        extended_hours: bool = False,
+        outputsize: Literal["compact", "full"] | None = "full",
+        month: Optional[str] = None,
+    ) -> pa.Table:
+        """Alpha Vantage 인트라데이 CSV 응답을 Arrow Table로 가져와 로컬 스토어에 bulk 적재
+
+        Args:
+            month: 조회할 월 (YYYY-MM 형식, Premium plan only)
+
+        Returns:
+            symbol, datetime, OHLCV, adjusted_close, dividend_amount, split_coefficient
+            컬럼의 ``pyarrow.Table`` (시각 오름차순)
+        """
+        symbol = self._validate_symbol(symbol).upper()
+        table = await self.alpha_vantage.stock.intraday_table(
+            symbol=symbol,
+            interval=interval,
+            adjusted=adjusted,
+            extended_hours=extended_hours,
+            month=month,
+            outputsize=outputsize,
+        )
+        table = _complete_price_table(table, symbol)
+        await self._load_local_store(table, interval)
+        return table
+
+    async def _load_local_store(self, table: pa.Table, interval: str) -> None:
+        """파싱한 가격 테이블을 DuckDB 로컬 스토어에 bulk upsert (실패해도 조회는 계속)"""
+        if self._db_manager is None or table.num_rows == 0:
+            return
+
+        try:
+            manager = self._db_manager.async_manager
+            if interval == "daily":
+                result = await manager.upsert_daily_prices(table)
+            else:
+                result = await manager.upsert_intraday_prices(table, interval)
+            logger.info(
+                f"💾 로컬 스토어 적재 ({interval}): {result.inserted} inserted, {result.updated} updated"
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ 로컬 스토어 적재 실패 ({interval}): {e}")
+
     async def fetch_weekly_prices(
         self, symbol: str, outputsize: str = "full"
     ) -> List[WeeklyPrice]:
@@ -231,6 +383,10 @@ class StockFetcher(BaseStockService):
 
         Returns:
             WeeklyPrice 리스트
+
+        Raises:
+            RateLimitExceeded: 속도 제한기 거부 또는 Alpha Vantage 한도 응답
+                (그 외 오류는 빈 리스트 반환)
         """
         try:
             symbol = self._validate_symbol(symbol)
@@ -306,6 +462,8 @@ class StockFetcher(BaseStockService):
                 )
                 return []
 
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             logger.error(f"Failed to fetch weekly prices from Alpha Vantage: {e}")
             return []
@@ -321,6 +479,10 @@ class StockFetcher(BaseStockService):
 
         Returns:
             MonthlyPrice 리스트
+
+        Raises:
+            RateLimitExceeded: 속도 제한기 거부 또는 Alpha Vantage 한도 응답
+                (그 외 오류는 빈 리스트 반환)
         """
         try:
             symbol = self._validate_symbol(symbol)
@@ -398,6 +560,8 @@ class StockFetcher(BaseStockService):
                 )
                 return []
 
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             logger.error(f"Failed to fetch monthly prices from Alpha Vantage: {e}")
             return []
@@ -435,6 +599,76 @@ class StockFetcher(BaseStockService):
             logger.error(f"Failed to fetch quote from Alpha Vantage for {symbol}: {e}")
             raise
 
+    async def fetch_bulk_quotes(
+        self, symbols: List[str]
+    ) -> dict[str, QuoteData | None]:
+        """Alpha Vantage REALTIME_BULK_QUOTES로 여러 심볼의 호가 데이터 가져오기
+
+        ``BULK_QUOTES_MAX_SYMBOLS``개씩 나누어 요청합니다. 대량 조회 요청이 실패하면
+        (Premium 미지원 키 등) 해당 묶음은 GLOBAL_QUOTE 단건 조회로 대체합니다.
+        형식이 잘못된 심볼은 요청에서 빼고 None으로 기록하므로 나머지 심볼은 정상 조회됩니다.
+
+        Args:
+            symbols: 주식 심볼 리스트
+
+        Returns:
+            심볼별 QuoteData. 유효하지 않은 심볼과 대량 조회 응답에 없는 심볼은 None,
+            일시적으로 조회하지 못한 심볼(단건 조회 실패, 파싱 실패)은 결과에서 제외
+        """
+        quotes: dict[str, QuoteData | None] = {}
+        normalized: list[str] = []
+        for symbol in symbols:
+            try:
+                normalized.append(self._validate_symbol(symbol))
+            except ValueError as e:
+                logger.warning(f"Skipping invalid quote symbol {symbol!r}: {e}")
+                quotes[str(symbol).strip().upper()] = None
+        normalized = list(dict.fromkeys(normalized))
+
+        for start in range(0, len(normalized), BULK_QUOTES_MAX_SYMBOLS):
+            chunk = normalized[start : start + BULK_QUOTES_MAX_SYMBOLS]
+            try:
+                response = await self.alpha_vantage.stock.bulk_quotes(symbols=chunk)
+            except Exception as e:
+                logger.warning(
+                    f"⚠️ Bulk quote request failed for {len(chunk)} symbols, "
+                    f"falling back to single quotes: {e}"
+                )
+                quotes.update(await self._fetch_single_quotes(chunk))
+                continue
+
+            requested = set(chunk)
+            returned: set[str] = set()
+            for item in response:
+                returned.add(str(item.get("symbol", "")).upper())
+                try:
+                    quote = self._dict_to_quote_data(item)
+                except ValueError as e:
+                    logger.warning(
+                        f"Skipping invalid bulk quote {item.get('symbol')}: {e}"
+                    )
+                    continue
+                if quote.symbol in requested:
+                    quotes[quote.symbol] = quote
+            # 응답에 없는 심볼은 None (존재하지 않는 심볼)
+            for symbol in requested - returned:
+                quotes[symbol] = None
+
+            logger.info(f"Fetched {len(response)}/{len(chunk)} bulk quotes")
+
+        return quotes
+
+    async def _fetch_single_quotes(self, symbols: List[str]) -> dict[str, QuoteData]:
+        """GLOBAL_QUOTE 단건 조회 (실패한 심볼은 제외)"""
+        results = await asyncio.gather(
+            *(self.fetch_quote(symbol) for symbol in symbols), return_exceptions=True
+        )
+        return {
+            symbol: result
+            for symbol, result in zip(symbols, results)
+            if isinstance(result, QuoteData)
+        }
+
     async def fetch_intraday(
         self,
         symbol: str,
@@ -443,6 +677,7 @@ class StockFetcher(BaseStockService):
         extended_hours: bool = False,
         outputsize: Literal["compact", "full"] | None = "full",
         month: Optional[str] = None,
+        datatype: Literal["csv", "json"] = "csv",
     ) -> List[DailyPrice]:
         """Alpha Vantage에서 인트라데이 데이터 가져오기
 
@@ -453,6 +688,7 @@ class StockFetcher(BaseStockService):
             extended_hours: 장외 시간 포함 여부
             outputsize: 출력 크기
             month: 조회할 월 (YYYY-MM 형식, Premium plan only)
+            datatype: 'csv' (Arrow Table로 파싱 후 로컬 스토어 적재) 또는 'json'
 
         Returns:
             DailyPrice 리스트 (dict 형태)
@@ -473,6 +709,23 @@ class StockFetcher(BaseStockService):
                 except ValueError:
                     logger.warning(f"Invalid month format: {month}. Expected YYYY-MM.")
 
+            if datatype == "csv":
+                table = await self.fetch_intraday_table(
+                    symbol,
+                    interval=interval,
+                    adjusted=adjusted,
+                    extended_hours=extended_hours,
+                    outputsize=outputsize,
+                    month=month_dt.strftime("%Y-%m") if month_dt else None,
+                )
+                intraday_records = _table_to_records(
+                    table, "datetime", _RECORD_DEFAULTS
+                )
+                logger.info(
+                    f"✅ Parsed {len(intraday_records)} intraday prices for {symbol} (csv)"
+                )
+                return intraday_records  # type: ignore
+
             # Alpha Vantage API 호출 (리스트 반환)
             response = await self.alpha_vantage.stock.intraday(
                 symbol=symbol,
@@ -597,6 +850,7 @@ class StockFetcher(BaseStockService):
         symbol: str,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
+        datatype: Literal["csv", "json"] = "csv",
     ) -> dict:
         """장기 히스토리 데이터 조회 (Alpha Vantage TIME_SERIES_DAILY_ADJUSTED)
 
@@ -604,10 +858,42 @@ class StockFetcher(BaseStockService):
             symbol: 주식 심볼
             start_date: 시작 날짜
             end_date: 종료 날짜
+            datatype: 'csv' (Arrow Table로 파싱 후 로컬 스토어 적재) 또는 'json'
 
         Returns:
             히스토리 데이터 딕셔너리
         """
+        if datatype == "csv":
+            try:
+                table = await self.fetch_daily_prices_table(symbol, outputsize="full")
+            except Exception as e:
+                logger.error(f"Failed to fetch historical data (csv) for {symbol}: {e}")
+                return {}
+
+            # 날짜 범위 필터링 (컬럼 단위)
+            dates = table.column("date")
+            if start_date:
+                table = table.filter(
+                    pc.greater_equal(dates, pa.scalar(start_date, dates.type))
+                )
+                dates = table.column("date")
+            if end_date:
+                table = table.filter(
+                    pc.less_equal(dates, pa.scalar(end_date, dates.type))
+                )
+
+            records = _table_to_records(table.drop_columns(["symbol"]), "date")
+            logger.info(f"Filtered to {len(records)} records for date range (csv)")
+
+            # DataProcessor가 기대하는 형태로 반환
+            return {
+                "symbol": symbol,
+                "records": records,
+                "data_points": len(records),
+                "timestamp": datetime.now().isoformat(),
+                "source": "alpha_vantage",
+            }
+
         try:
             logger.info(f"Fetching historical data for {symbol}")
 
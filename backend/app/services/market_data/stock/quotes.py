@@ -0,0 +1,182 @@
+"""
+Shared Quote Book
+대시보드/관심종목용 실시간 호가 공유 캐시
+
+모든 사용자 요청이 심볼 단위 단기 TTL 캐시 하나를 공유합니다. 캐시에 없는 심볼만
+모아 REALTIME_BULK_QUOTES(요청당 최대 100개)로 조회하고, 이미 다른 요청이 조회 중인
+심볼은 그 결과를 기다립니다. 관심종목이 겹치는 사용자 수와 무관하게 업스트림 호출
+수는 "TTL 동안 처음 보는 심볼 수 / 100" 수준으로 유지됩니다.
+
+- 심볼별 항목 (TTL ``QUOTE_CACHE_TTL_SECONDS``)
+- 조회 결과가 None인 심볼은 negative caching (잘못된 심볼 반복 조회 방지)
+- 결과에서 빠진 심볼(일시적 조회 실패)은 캐시하지 않고 다음 요청에서 재조회
+- 심볼별 in-flight 작업 공유 (겹치는 관심종목의 동시 요청 병합)
+
+사용 예제:
+    >>> quotes = await quote_book.get_many(["AAPL", "MSFT"], fetcher.fetch_bulk_quotes)
+    >>> quotes["AAPL"].price
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Iterable
+
+from app.alpha_vantage.stock import BULK_QUOTES_MAX_SYMBOLS
+from app.core.config import settings
+from app.core.l1_cache import L1Cache
+from app.schemas.market_data.stock import QuoteData
+
+logger = logging.getLogger(__name__)
+
+QUOTE_DATA_TYPE = "realtime_quote"
+
+# 심볼 묶음 → 심볼별 호가 (None: 존재하지 않는 심볼, 키 없음: 일시적 조회 실패)
+BulkQuoteFetcher = Callable[[list[str]], Awaitable[dict[str, QuoteData | None]]]
+
+
+class QuoteBook:
+    """심볼별 단기 TTL 호가 캐시 + 대량 조회 병합기
+
+    Args:
+        ttl_seconds: 호가 항목 TTL
+        max_symbols: 보관할 최대 심볼 수 (LRU)
+        batch_size: 업스트림 요청당 최대 심볼 수
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 60.0,
+        max_symbols: int = 10_000,
+        batch_size: int = BULK_QUOTES_MAX_SYMBOLS,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.batch_size = batch_size
+        self._cache = L1Cache(
+            default_budget=max_symbols,
+            max_ttl_seconds=ttl_seconds,
+            negative_ttl_seconds=ttl_seconds,
+        )
+        self._pending: dict[str, asyncio.Task[dict[str, QuoteData | None]]] = {}
+        self._stats = {"upstream_calls": 0, "symbols_fetched": 0}
+
+    async def get_many(
+        self,
+        symbols: Iterable[str],
+        fetch: BulkQuoteFetcher,
+        force_refresh: bool = False,
+    ) -> dict[str, QuoteData | None]:
+        """심볼별 호가 조회 (입력 순서 유지, 조회 실패/미존재 심볼은 None)
+
+        Args:
+            symbols: 주식 심볼 목록 (대소문자 무관, 중복 허용)
+            fetch: 캐시에 없는 심볼 묶음을 조회하는 함수
+            force_refresh: True면 캐시를 건너뛰고 다시 조회
+        """
+        requested = list(dict.fromkeys(s.strip().upper() for s in symbols if s.strip()))
+        quotes: dict[str, QuoteData | None] = {}
+        missing: list[str] = []
+
+        for symbol in requested:
+            hit, quote = (
+                (False, None)
+                if force_refresh
+                else self._cache.get(QUOTE_DATA_TYPE, symbol)
+            )
+            if hit:
+                quotes[symbol] = quote
+            else:
+                missing.append(symbol)
+
+        if missing:
+            waits = self._schedule(missing, fetch, force_refresh)
+            results = await asyncio.gather(
+                *(asyncio.shield(task) for task in waits.values()),
+                return_exceptions=True,
+            )
+            for (chunk, _), result in zip(waits.items(), results):
+                if isinstance(result, BaseException):
+                    logger.warning(f"⚠️ 호가 일괄 조회 실패 ({len(chunk)}개 심볼): {result}")
+                    result = {}
+                for symbol in chunk:
+                    quotes[symbol] = result.get(symbol)
+
+        return {symbol: quotes.get(symbol) for symbol in requested}
+
+    def _schedule(
+        self, missing: list[str], fetch: BulkQuoteFetcher, force_refresh: bool
+    ) -> dict[tuple[str, ...], asyncio.Task[dict[str, QuoteData | None]]]:
+        """진행 중인 작업에 합류하고 나머지는 batch_size 단위 새 작업으로 조회
+
+        Returns:
+            (작업 결과에서 읽을 심볼 묶음) → 작업
+        """
+        joined: dict[asyncio.Task[dict[str, QuoteData | None]], list[str]] = {}
+        fresh: list[str] = []
+        for symbol in missing:
+            task = None if force_refresh else self._pending.get(symbol)
+            if task is not None and task.get_loop() is asyncio.get_running_loop():
+                joined.setdefault(task, []).append(symbol)
+            else:
+                fresh.append(symbol)
+
+        for start in range(0, len(fresh), self.batch_size):
+            chunk = fresh[start : start + self.batch_size]
+            task = asyncio.ensure_future(self._fetch(chunk, fetch))
+            for symbol in chunk:
+                self._pending[symbol] = task
+            task.add_done_callback(lambda done, chunk=chunk: self._release(chunk, done))
+            joined[task] = chunk
+
+        return {tuple(chunk): task for task, chunk in joined.items()}
+
+    async def _fetch(
+        self, chunk: list[str], fetch: BulkQuoteFetcher
+    ) -> dict[str, QuoteData | None]:
+        self._stats["upstream_calls"] += 1
+        self._stats["symbols_fetched"] += len(chunk)
+        fetched = await fetch(chunk)
+        for symbol in chunk:
+            # None은 negative caching, 결과에서 빠진 심볼은 다음 요청에서 재조회
+            if symbol in fetched:
+                self._cache.set(QUOTE_DATA_TYPE, symbol, fetched[symbol], symbol=symbol)
+        logger.debug(f"호가 일괄 조회: {len(fetched)}/{len(chunk)}개 심볼")
+        return fetched
+
+    def _release(self, chunk: list[str], task: asyncio.Task) -> None:
+        for symbol in chunk:
+            if self._pending.get(symbol) is task:
+                del self._pending[symbol]
+        # 대기자가 모두 취소된 경우에도 예외를 회수하여 경고 방지
+        if not task.cancelled():
+            task.exception()
+
+    def invalidate(self, symbol: str | None = None) -> int:
+        """심볼(생략 시 전체) 호가 항목 삭제"""
+        return self._cache.invalidate(
+            QUOTE_DATA_TYPE, symbol=symbol.upper() if symbol else None
+        )
+
+    def get_stats(self) -> dict[str, int]:
+        counters = self._cache.snapshot().get(QUOTE_DATA_TYPE, {})
+        return {
+            **self._stats,
+            "hits": counters.get("hits", 0),
+            "negative_hits": counters.get("negative_hits", 0),
+            "misses": counters.get("misses", 0),
+            "entries": counters.get("entries", 0),
+            "in_flight": len(self._pending),
+        }
+
+    def clear(self) -> None:
+        """항목과 통계 초기화 (진행 중인 작업은 유지)"""
+        self._cache.clear()
+        self._stats = {"upstream_calls": 0, "symbols_fetched": 0}
+
+
+# 프로세스 전역 호가 캐시 (모든 StockService 인스턴스가 공유)
+quote_book = QuoteBook(
+    ttl_seconds=settings.QUOTE_CACHE_TTL_SECONDS,
+    max_symbols=settings.QUOTE_CACHE_MAX_SYMBOLS,
+)
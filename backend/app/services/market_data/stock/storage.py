@@ -3,9 +3,17 @@ Stock Data Storage
 MongoDB 저장 로직
 """
 
-from typing import List, Optional
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Any, List, Literal, Optional, Sequence, TypeVar
 import logging
+import time
 
+from beanie.odm.utils.encoder import Encoder
+from pymongo import UpdateOne
+
+from app.models.market_data.base import BaseMarketDataDocument
 from app.models.market_data.stock import DailyPrice, WeeklyPrice, MonthlyPrice
 from app.services.monitoring.data_quality_sentinel import DataQualitySentinel
 from .base import BaseStockService
@@ -13,12 +21,175 @@ from .fetcher import StockFetcher
 
 logger = logging.getLogger(__name__)
 
+# bulk_write 한 번에 보내는 UpdateOne 수
+PRICE_BULK_BATCH_SIZE = 1000
+
+# $set에서 제외하는 필드 (created_at은 $setOnInsert로 최초 1회만 기록)
+_UPSERT_EXCLUDE = {"id", "revision_id", "created_at"}
+
+PriceDocument = TypeVar("PriceDocument", bound=BaseMarketDataDocument)
+
+# 증분 동기화 시 비교하는 가격 필드
+_PRICE_FIELDS = ("open", "high", "low", "close", "volume", "adjusted_close")
+
+# 기존 봉의 수정 종가가 이 값 이상 달라지면 과거 이력이 재조정된 것으로 판단
+_ADJUSTMENT_TOLERANCE = Decimal("0.0001")
+
+
+@dataclass
+class DailySyncResult:
+    """증분 동기화 결과
+
+    ``mode`` 가 ``"full_required"`` 이면 분할/배당으로 과거 수정 종가가 바뀐 것이므로
+    호출 측에서 전체 재적재를 수행해야 합니다. ``"failed"`` 이면 compact 응답을 받지
+    못한 것이므로(네트워크 오류, 한도 초과 등) 기존 데이터만 돌려주며, 호출 측은
+    Coverage를 갱신하지 않아야 합니다.
+    """
+
+    mode: Literal["delta", "full_required", "failed"]
+    prices: List[DailyPrice] = field(default_factory=list)
+    inserted: int = 0
+    updated: int = 0
+    reason: str = ""
+
+
+@dataclass
+class BulkWriteBatch:
+    """bulk_write 배치 1회의 결과"""
+
+    size: int
+    upserted: int
+    modified: int
+    elapsed_ms: float
+
+
+@dataclass
+class BulkWriteReport:
+    """가격 bulk upsert 결과 (배치별 소요 시간 포함)"""
+
+    collection: str
+    batches: List[BulkWriteBatch] = field(default_factory=list)
+
+    @property
+    def upserted(self) -> int:
+        return sum(batch.upserted for batch in self.batches)
+
+    @property
+    def modified(self) -> int:
+        return sum(batch.modified for batch in self.batches)
+
+    @property
+    def elapsed_ms(self) -> float:
+        return sum(batch.elapsed_ms for batch in self.batches)
+
+    def summary(self) -> str:
+        timings = ", ".join(f"{batch.elapsed_ms:.1f}" for batch in self.batches)
+        return (
+            f"{self.upserted} upserted, {self.modified} modified in "
+            f"{len(self.batches)} batches ({self.elapsed_ms:.1f}ms: [{timings}])"
+        )
+
+
+def _price_document(price: BaseMarketDataDocument) -> dict[str, Any]:
+    """Beanie 인코더로 MongoDB 문서 변환 (Decimal → Decimal128)"""
+    return Encoder(exclude=_UPSERT_EXCLUDE, to_db=True).encode(price)
+
+
+async def bulk_upsert_prices(
+    model: type[PriceDocument],
+    prices: Sequence[PriceDocument],
+    batch_size: int = PRICE_BULK_BATCH_SIZE,
+) -> BulkWriteReport:
+    """(symbol, date) 고유 인덱스 기준 unordered bulk_write upsert
+
+    행마다 find_one + save/insert 하던 방식 대신 ``batch_size`` 개씩
+    ``UpdateOne(upsert=True)`` 를 묶어 한 번의 왕복으로 전송합니다.
+    """
+    collection = model.get_motor_collection()
+    report = BulkWriteReport(collection=collection.name)
+    now = datetime.now(timezone.utc)
+
+    for start in range(0, len(prices), batch_size):
+        batch = prices[start : start + batch_size]
+        operations = []
+        for price in batch:
+            document = _price_document(price)
+            document["updated_at"] = now
+            operations.append(
+                UpdateOne(
+                    {"symbol": document["symbol"], "date": document["date"]},
+                    {"$set": document, "$setOnInsert": {"created_at": now}},
+                    upsert=True,
+                )
+            )
+
+        started = time.perf_counter()
+        result = await collection.bulk_write(operations, ordered=False)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        report.batches.append(
+            BulkWriteBatch(
+                size=len(batch),
+                upserted=result.upserted_count,
+                modified=result.modified_count,
+                elapsed_ms=elapsed_ms,
+            )
+        )
+        logger.debug(
+            f"bulk_write {collection.name} batch {len(report.batches)}: "
+            f"{len(batch)} ops in {elapsed_ms:.1f}ms"
+        )
+
+    return report
+
+
+def _day(value: datetime) -> date:
+    return value.date()
+
+
+def _bar_changed(existing: DailyPrice, fetched: DailyPrice) -> bool:
+    return any(
+        getattr(existing, name) != getattr(fetched, name) for name in _PRICE_FIELDS
+    )
+
+
+def _adjustment_reason(
+    bars: List[DailyPrice], stored: dict[date, DailyPrice], last_day: date
+) -> str:
+    """분할/배당으로 과거 이력이 무효화되었는지 확인 (사유 문자열, 없으면 빈 문자열)"""
+    for bar in bars:
+        if _day(bar.date) <= last_day:
+            continue
+        split = bar.split_coefficient
+        if split is not None and split != Decimal("1"):
+            return f"split {split} on {_day(bar.date)}"
+        dividend = bar.dividend_amount
+        if dividend is not None and dividend != 0:
+            return f"dividend {dividend} on {_day(bar.date)}"
+
+    # 이벤트가 compact 범위 밖에 있더라도 겹치는 봉의 수정 종가가 바뀌었으면 재조정된 것
+    for bar in bars:
+        previous = stored.get(_day(bar.date))
+        if (
+            previous is None
+            or previous.adjusted_close is None
+            or bar.adjusted_close is None
+        ):
+            continue
+        if abs(previous.adjusted_close - bar.adjusted_close) >= _ADJUSTMENT_TOLERANCE:
+            return (
+                f"adjusted_close changed on {_day(bar.date)} "
+                f"({previous.adjusted_close} -> {bar.adjusted_close})"
+            )
+    return ""
+
 
 class StockStorage(BaseStockService):
     """MongoDB 저장 클래스
 
     Methods:
         - store_daily_prices: Daily price 저장
+        - sync_daily_prices: Daily price 증분 동기화 (신규/변경 봉만 저장)
         - store_weekly_prices: Weekly price 저장
         - store_monthly_prices: Monthly price 저장
     """
@@ -96,42 +267,93 @@ class StockStorage(BaseStockService):
                     f"Data quality sentinel evaluation failed for {symbol}: {exc}"
                 )
 
-        # MongoDB에 Upsert (symbol + date로 unique)
-        saved_prices: list[DailyPrice] = []
-        for price_obj in price_objects:
-            existing = await DailyPrice.find_one(
-                {"symbol": price_obj.symbol, "date": price_obj.date}
+        # MongoDB에 Bulk Upsert (symbol + date 고유 인덱스)
+        report = await bulk_upsert_prices(DailyPrice, price_objects)
+
+        logger.info(
+            f"✅ Stored {len(price_objects)} daily prices for {symbol} "
+            f"(adjusted={adjusted}, full={is_full}): {report.summary()}"
+        )
+
+        return price_objects
+
+    async def sync_daily_prices(
+        self, symbol: str, existing_prices: List[DailyPrice]
+    ) -> DailySyncResult:
+        """
+        compact 응답을 기존 데이터와 비교해 신규/변경된 봉만 MongoDB에 반영
+
+        기존 데이터는 삭제하지 않습니다. 최근 봉에 분할(split_coefficient != 1) 또는
+        배당(dividend_amount != 0)이 있거나 겹치는 봉의 수정 종가가 달라졌다면
+        과거 수정 종가 전체가 바뀐 것이므로 ``full_required`` 를 반환합니다.
+
+        Args:
+            symbol: 종목 심볼
+            existing_prices: MongoDB에 저장된 기존 DailyPrice 리스트
+
+        Returns:
+            DailySyncResult (prices는 병합된 전체 데이터, 최신순)
+        """
+        prices = await self.fetcher.fetch_daily_prices(symbol, outputsize="compact")
+        if not prices:
+            logger.warning(f"No daily prices fetched for {symbol} (delta sync)")
+            return DailySyncResult(
+                mode="failed",
+                prices=list(existing_prices),
+                reason="empty compact response",
             )
 
-            if existing:
-                # 기존 레코드 업데이트
-                existing.open = price_obj.open
-                existing.high = price_obj.high
-                existing.low = price_obj.low
-                existing.close = price_obj.close
-                existing.volume = price_obj.volume
-                existing.adjusted_close = price_obj.adjusted_close
-                existing.dividend_amount = price_obj.dividend_amount
-                existing.split_coefficient = price_obj.split_coefficient
-                existing.data_quality_score = price_obj.data_quality_score
-                existing.iso_anomaly_score = price_obj.iso_anomaly_score
-                existing.prophet_anomaly_score = price_obj.prophet_anomaly_score
-                existing.volume_z_score = price_obj.volume_z_score
-                existing.anomaly_severity = price_obj.anomaly_severity
-                existing.anomaly_reasons = price_obj.anomaly_reasons
-                await existing.save()
-                saved_prices.append(existing)
-            else:
-                # 신규 레코드 저장
-                await price_obj.insert()
-                saved_prices.append(price_obj)
+        fetched = [
+            DailyPrice(**price) if isinstance(price, dict) else price
+            for price in prices
+        ]
+        stored = {_day(price.date): price for price in existing_prices}
+        last_day = max(stored) if stored else date.min
+
+        reason = _adjustment_reason(fetched, stored, last_day)
+        if reason:
+            logger.info(f"🔁 Corporate action detected for {symbol}: {reason}")
+            return DailySyncResult(mode="full_required", reason=reason)
+
+        new_bars: list[DailyPrice] = []
+        changed_bars: list[DailyPrice] = []
+        for bar in fetched:
+            previous = stored.get(_day(bar.date))
+            if previous is None:
+                new_bars.append(bar)
+            elif _bar_changed(previous, bar):
+                for name in _PRICE_FIELDS:
+                    setattr(previous, name, getattr(bar, name))
+                changed_bars.append(previous)
+
+        if self.data_quality_sentinel and (new_bars or changed_bars):
+            try:
+                await self.data_quality_sentinel.evaluate_daily_prices(
+                    symbol, new_bars + changed_bars, source="alpha_vantage"
+                )
+            except Exception as exc:
+                logger.warning(
+                    f"Data quality sentinel evaluation failed for {symbol}: {exc}"
+                )
+
+        if new_bars or changed_bars:
+            report = await bulk_upsert_prices(DailyPrice, [*new_bars, *changed_bars])
+            logger.debug(f"Delta sync bulk write for {symbol}: {report.summary()}")
 
+        merged = sorted(
+            [*existing_prices, *new_bars], key=lambda price: price.date, reverse=True
+        )
         logger.info(
-            f"✅ Stored {len(saved_prices)} daily prices for {symbol} "
-            f"(adjusted={adjusted}, full={is_full})"
+            f"✅ Delta synced {symbol} daily prices: "
+            f"{len(new_bars)} new, {len(changed_bars)} changed "
+            f"({len(fetched)} fetched, {len(merged)} total)"
+        )
+        return DailySyncResult(
+            mode="delta",
+            prices=merged,
+            inserted=len(new_bars),
+            updated=len(changed_bars),
         )
-
-        return saved_prices
 
     async def store_weekly_prices(
         self, symbol: str, adjusted: bool = True
@@ -159,19 +381,17 @@ class StockStorage(BaseStockService):
             f"Deleted {delete_result.deleted_count if delete_result else 0} existing weekly prices for {symbol}"
         )
 
-        # WeeklyPrice 객체로 변환 및 저장
-        saved_prices = []
-        for price_data in prices:
-            if isinstance(price_data, dict):
-                price_obj = WeeklyPrice(**price_data)
-            else:
-                price_obj = price_data
-
-            await price_obj.insert()
-            saved_prices.append(price_obj)
+        # WeeklyPrice 객체로 변환 및 Bulk Upsert
+        price_objects = [
+            WeeklyPrice(**price_data) if isinstance(price_data, dict) else price_data
+            for price_data in prices
+        ]
+        report = await bulk_upsert_prices(WeeklyPrice, price_objects)
 
-        logger.info(f"✅ Stored {len(saved_prices)} weekly prices for {symbol}")
-        return saved_prices
+        logger.info(
+            f"✅ Stored {len(price_objects)} weekly prices for {symbol}: {report.summary()}"
+        )
+        return price_objects
 
     async def store_monthly_prices(
         self, symbol: str, adjusted: bool = True
@@ -199,16 +419,14 @@ class StockStorage(BaseStockService):
             f"Deleted {delete_result.deleted_count if delete_result else 0} existing monthly prices for {symbol}"
         )
 
-        # MonthlyPrice 객체로 변환 및 저장
-        saved_prices = []
-        for price_data in prices:
-            if isinstance(price_data, dict):
-                price_obj = MonthlyPrice(**price_data)
-            else:
-                price_obj = price_data
-
-            await price_obj.insert()
-            saved_prices.append(price_obj)
+        # MonthlyPrice 객체로 변환 및 Bulk Upsert
+        price_objects = [
+            MonthlyPrice(**price_data) if isinstance(price_data, dict) else price_data
+            for price_data in prices
+        ]
+        report = await bulk_upsert_prices(MonthlyPrice, price_objects)
 
-        logger.info(f"✅ Stored {len(saved_prices)} monthly prices for {symbol}")
-        return saved_prices
+        logger.info(
+            f"✅ Stored {len(price_objects)} monthly prices for {symbol}: {report.summary()}"
+        )
+        return price_objects
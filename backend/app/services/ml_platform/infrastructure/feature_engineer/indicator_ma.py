@@ -5,6 +5,8 @@ Trend-following indicators
 
 import pandas as pd
 
+from app.core.indicator_cache import cached_series
+
 
 class MovingAverageCalculator:
     """Calculate Simple Moving Average (SMA) and Exponential Moving Average (EMA)"""
@@ -41,12 +43,22 @@ class MovingAverageCalculator:
         df = df.copy()
         close = df["close"]
 
-        # SMA (Simple Moving Average)
+        # SMA (Simple Moving Average) - 전략 TechnicalIndicators.sma와 캐시 공유
         for period in self.sma_periods:
-            df[f"sma_{period}"] = close.rolling(window=period).mean()
+            df[f"sma_{period}"] = cached_series(
+                "pandas.SMA",
+                close,
+                {"window": period},
+                lambda: {"value": close.rolling(window=period).mean()},
+            )["value"]
 
         # EMA (Exponential Moving Average)
         for period in self.ema_periods:
-            df[f"ema_{period}"] = close.ewm(span=period, adjust=False).mean()
+            df[f"ema_{period}"] = cached_series(
+                "pandas.EMA",
+                close,
+                {"span": period, "adjust": False},
+                lambda: {"value": close.ewm(span=period, adjust=False).mean()},
+            )["value"]
 
         return df
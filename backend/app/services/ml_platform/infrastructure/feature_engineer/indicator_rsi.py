@@ -5,6 +5,8 @@ Oscillator indicating overbought/oversold conditions (0-100 range)
 
 import pandas as pd
 
+from app.core.indicator_cache import cached_series
+
 
 class RSICalculator:
     """Calculate Relative Strength Index (RSI) indicator"""
@@ -34,16 +36,23 @@ class RSICalculator:
         """
         df = df.copy()
         close = df["close"]
-        delta = close.diff()
 
-        # Type-safe comparison with explicit float conversion
-        gain = delta.where(delta > 0.0, 0.0)  # type: ignore
-        loss = -delta.where(delta < 0.0, 0.0)  # type: ignore
+        def compute() -> dict[str, pd.Series]:
+            delta = close.diff()
+
+            # Type-safe comparison with explicit float conversion
+            gain = delta.where(delta > 0.0, 0.0)  # type: ignore
+            loss = -delta.where(delta < 0.0, 0.0)  # type: ignore
+
+            avg_gain = gain.rolling(window=self.period).mean()
+            avg_loss = loss.rolling(window=self.period).mean()
 
-        avg_gain = gain.rolling(window=self.period).mean()
-        avg_loss = loss.rolling(window=self.period).mean()
+            rs = avg_gain / avg_loss
+            return {"value": 100 - (100 / (1 + rs))}
 
-        rs = avg_gain / avg_loss
-        df["rsi"] = 100 - (100 / (1 + rs))
+        # 전략 TechnicalIndicators.rsi와 같은 단순평균 RSI → 캐시 공유
+        df["rsi"] = cached_series(
+            "pandas.RSI", close, {"window": self.period}, compute
+        )["value"]
 
         return df
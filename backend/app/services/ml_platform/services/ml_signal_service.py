@@ -53,6 +53,8 @@ class MLSignalService:
     - Fallback to heuristic scoring if model unavailable
     """
 
+    _HISTORY_FIELDS = ("open", "high", "low", "close", "volume")
+
     def __init__(
         self,
         database_manager: DatabaseManager,
@@ -98,7 +100,16 @@ class MLSignalService:
         otherwise falls back to heuristic scoring.
         """
 
-        df = await asyncio.to_thread(self._load_price_history, symbol, lookback_days)
+        df = await self._db_manager.async_manager.run_read(
+            "ml_signal_prices", self._load_price_history, symbol, lookback_days
+        )
+        return await self._score_history(df, symbol, lookback_days)
+
+    async def _score_history(
+        self, df: pd.DataFrame, symbol: str, lookback_days: int
+    ) -> MLSignalInsight:
+        """Score a prepared OHLCV history (date-indexed, ascending)."""
+
         if df.empty:
             raise ValueError(f"No price history available for {symbol}")
 
@@ -277,11 +288,41 @@ class MLSignalService:
     async def score_symbols(
         self, symbols: Iterable[str], lookback_days: int = 60
     ) -> Dict[str, MLSignalInsight]:
-        """Batch scoring helper used by orchestrators or dashboards."""
+        """Batch scoring helper used by orchestrators or dashboards.
 
-        tasks = [
-            self.score_symbol(symbol, lookback_days=lookback_days) for symbol in symbols
-        ]
+        Loads every symbol's recent bars with a single DuckDB query instead of
+        one round-trip per symbol. Each symbol gets its own last
+        ``lookback_days + 20`` bars, the same window as :meth:`score_symbol`.
+        If the batch load fails, each symbol is loaded separately.
+        """
+
+        symbols = [str(symbol) for symbol in symbols]
+        histories: Dict[str, pd.DataFrame] | None
+        try:
+            histories = await self._db_manager.async_manager.get_recent_prices(
+                symbols, lookback_days + 20, fields=list(self._HISTORY_FIELDS)
+            )
+        except Exception:
+            logger.warning(
+                "Batch price load failed for signal scoring; loading per symbol",
+                exc_info=True,
+            )
+            histories = None
+
+        if histories is None:
+            tasks = [
+                self.score_symbol(symbol, lookback_days=lookback_days)
+                for symbol in symbols
+            ]
+        else:
+            tasks = [
+                self._score_history(
+                    self._drop_missing_closes(histories.get(symbol)),
+                    symbol,
+                    lookback_days,
+                )
+                for symbol in symbols
+            ]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         scored: Dict[str, MLSignalInsight] = {}
@@ -293,8 +334,14 @@ class MLSignalService:
                 scored[str(symbol)] = result
         return scored
 
+    @staticmethod
+    def _drop_missing_closes(df: pd.DataFrame | None) -> pd.DataFrame:
+        if df is None:
+            return pd.DataFrame()
+        return df[df["close"].notna()]
+
     def _load_price_history(self, symbol: str, lookback_days: int) -> pd.DataFrame:
-        conn = self._db_manager.duckdb_conn
+        conn = self._db_manager.thread_cursor()
         query = """
             SELECT date, open, high, low, close, volume
             FROM daily_prices
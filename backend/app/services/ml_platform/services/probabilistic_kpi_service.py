@@ -39,7 +39,9 @@ class ProbabilisticKPIService:
         distribution = await asyncio.to_thread(
             self._compute_distribution, points, horizon_days
         )
-        await asyncio.to_thread(self._record_forecast, distribution)
+        await self._db_manager.async_manager.run_write(
+            "portfolio_forecast", self._record_forecast, distribution
+        )
         return distribution
 
     def _compute_distribution(
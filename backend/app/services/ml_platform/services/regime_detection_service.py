@@ -28,10 +28,69 @@ class RegimeDetectionService:
     ) -> MarketRegimeSnapshot:
         """Compute and persist the latest regime snapshot for a symbol."""
 
-        df = await asyncio.to_thread(self._load_price_history, symbol, lookback_days)
+        df = await self._db_manager.async_manager.run_read(
+            "regime_prices", self._load_price_history, symbol, lookback_days
+        )
         if df.empty:
             raise ValueError(f"No market data available for regime detection: {symbol}")
 
+        snapshot = await self._build_snapshot(df, symbol, lookback_days)
+        await self._persist_snapshot(snapshot)
+        return snapshot
+
+    async def refresh_regimes(
+        self, symbols: List[str], lookback_days: int = 90
+    ) -> Dict[str, MarketRegimeSnapshot]:
+        """Refresh regimes for many symbols from one batched price query.
+
+        Each symbol uses its own last ``lookback_days + 30`` bars, like
+        :meth:`refresh_regime`. If the batch load fails, each symbol is loaded
+        separately.
+        """
+
+        histories: Dict[str, pd.DataFrame] | None
+        try:
+            histories = await self._db_manager.async_manager.get_recent_prices(
+                symbols, lookback_days + 30, fields=["close"]
+            )
+        except Exception:
+            logger.warning(
+                "Batch price load failed for regime detection; loading per symbol",
+                exc_info=True,
+            )
+            histories = None
+
+        snapshots: Dict[str, MarketRegimeSnapshot] = {}
+        for symbol in symbols:
+            try:
+                if histories is None:
+                    df = await self._db_manager.async_manager.run_read(
+                        "regime_prices", self._load_price_history, symbol, lookback_days
+                    )
+                else:
+                    df = histories.get(symbol, pd.DataFrame(columns=["close"]))
+                df = df[df["close"].notna()] if not df.empty else df
+                if df.empty:
+                    logger.warning(
+                        "No market data available for regime detection",
+                        extra={"symbol": symbol},
+                    )
+                    continue
+                snapshot = await self._build_snapshot(df, symbol, lookback_days)
+                await self._persist_snapshot(snapshot)
+            except Exception:
+                logger.warning(
+                    "Regime refresh failed", extra={"symbol": symbol}, exc_info=True
+                )
+                continue
+            snapshots[symbol] = snapshot
+        return snapshots
+
+    async def _build_snapshot(
+        self, df: pd.DataFrame, symbol: str, lookback_days: int
+    ) -> MarketRegimeSnapshot:
+        """Derive a regime snapshot from a date-indexed close history."""
+
         metrics = await asyncio.to_thread(self._compute_metrics, df)
         probabilities = self._estimate_probabilities(metrics)
         regime, confidence = self._select_regime(probabilities)
@@ -48,7 +107,6 @@ class RegimeDetectionService:
             notes=notes,
         )
 
-        await self._persist_snapshot(snapshot)
         logger.info(
             "Refreshed market regime",
             extra={
@@ -109,7 +167,7 @@ class RegimeDetectionService:
             await MarketRegime(**payload).insert()
 
     def _load_price_history(self, symbol: str, lookback_days: int) -> pd.DataFrame:
-        conn = self._db_manager.duckdb_conn
+        conn = self._db_manager.thread_cursor()
         query = """
             SELECT date, close
             FROM daily_prices
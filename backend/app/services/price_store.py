@@ -0,0 +1,396 @@
+"""파티션 Parquet 가격 저장소
+
+``daily_prices`` / ``intraday_prices`` 테이블을 ``interval/symbol/year`` 로 파티션된
+float64 Parquet 파일로 미러링하고, DuckDB ``read_parquet`` 로 Arrow 테이블을 반환합니다.
+DECIMAL → float 변환과 행 단위 Python 객체 생성 없이 컬럼 버퍼를 그대로 사용할 수 있습니다.
+
+디렉토리 구조:
+    {root}/interval=daily/symbol=AAPL/year=2024/data_0.parquet
+    {root}/interval=5min/symbol=AAPL/year=2024/data_0.parquet
+"""
+
+from __future__ import annotations
+
+import logging
+import shutil
+import threading
+import uuid
+from collections.abc import Collection, Mapping, Sequence
+from datetime import date, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import duckdb
+import pandas as pd
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    from app.services.database_manager import DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+# interval별 원본 테이블 / 시간 컬럼 / 값 컬럼 타입
+_DAILY_COLUMNS: dict[str, str] = {
+    "open": "DOUBLE",
+    "high": "DOUBLE",
+    "low": "DOUBLE",
+    "close": "DOUBLE",
+    "adjusted_close": "DOUBLE",
+    "volume": "BIGINT",
+    "dividend_amount": "DOUBLE",
+    "split_coefficient": "DOUBLE",
+}
+_INTRADAY_COLUMNS: dict[str, str] = {
+    "open": "DOUBLE",
+    "high": "DOUBLE",
+    "low": "DOUBLE",
+    "close": "DOUBLE",
+    "volume": "BIGINT",
+}
+
+DateLike = str | date | datetime
+
+
+def _sql_literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+class PriceStore:
+    """interval/symbol/year 파티션 Parquet 가격 저장소
+
+    DuckDB 가격 테이블이 원본(source of truth)이며, 저장소는 심볼 단위로 재작성되는
+    컬럼형 미러입니다. 재작성은 staging 디렉토리에 기록한 뒤 심볼 디렉토리를
+    교체하는 방식으로 이루어져 읽기 도중 부분 파일이 노출되지 않습니다.
+
+    ``root`` 가 없으면(예: 인메모리 DB) 비활성화되며, 모든 조회는 DuckDB 테이블에서
+    동일한 스키마로 수행됩니다.
+    """
+
+    def __init__(self, database_manager: DatabaseManager, root: str | Path | None):
+        self._db = database_manager
+        self.root = Path(root) if root else None
+        self._write_lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.root is not None
+
+    # ===== 경로 / 스펙 =====
+
+    @staticmethod
+    def _spec(interval: str) -> tuple[str, str, dict[str, str]]:
+        """(원본 테이블, 시간 컬럼, 값 컬럼 타입) 반환"""
+        if interval == "daily":
+            return "daily_prices", "date", _DAILY_COLUMNS
+        return "intraday_prices", "datetime", _INTRADAY_COLUMNS
+
+    def interval_dir(self, interval: str) -> Path:
+        if self.root is None:
+            raise RuntimeError("가격 저장소가 비활성화되어 있습니다")
+        return self.root / f"interval={interval}"
+
+    def partition_files(
+        self,
+        symbols: Sequence[str],
+        interval: str = "daily",
+        start_year: int | None = None,
+        end_year: int | None = None,
+    ) -> tuple[list[str], list[str]]:
+        """연도 범위에 해당하는 Parquet 파일 목록과 파티션이 없는 심볼 반환"""
+        if self.root is None:
+            return [], list(symbols)
+
+        files: list[str] = []
+        missing: list[str] = []
+        base = self.interval_dir(interval)
+        for symbol in symbols:
+            symbol_dir = base / f"symbol={symbol}"
+            if not symbol_dir.is_dir():
+                missing.append(symbol)
+                continue
+            for year_dir in sorted(symbol_dir.glob("year=*")):
+                year = int(year_dir.name.split("=", 1)[1])
+                if start_year is not None and year < start_year:
+                    continue
+                if end_year is not None and year > end_year:
+                    continue
+                files.extend(str(path) for path in sorted(year_dir.glob("*.parquet")))
+        return files, missing
+
+    # ===== 쓰기 =====
+
+    def sync(
+        self, symbols: Sequence[str] | None = None, interval: str = "daily"
+    ) -> int:
+        """DuckDB 가격 테이블 → Parquet 파티션 재작성
+
+        Args:
+            symbols: 재작성할 심볼 (None이면 해당 interval 전체 재구성)
+            interval: 'daily' 또는 인트라데이 간격 ('1min', '5min', ...)
+
+        Returns:
+            기록된 행 수
+        """
+        if self.root is None:
+            return 0
+        if symbols is not None and not symbols:
+            return 0
+
+        conditions = []
+        if symbols is not None:
+            conditions.append(
+                f"symbol IN ({', '.join(_sql_literal(s) for s in symbols)})"
+            )
+
+        base = self.interval_dir(interval)
+        staging = self.root / f".staging-{uuid.uuid4().hex}"
+        with self._write_lock:
+            try:
+                written = self._copy_to_staging(interval, conditions, staging)
+
+                base.mkdir(parents=True, exist_ok=True)
+                replaced: set[str] = set()
+                if staging.is_dir():
+                    for partition in staging.iterdir():
+                        self._swap_dir(partition, base / partition.name)
+                        replaced.add(partition.name)
+
+                # 원본에서 사라진 심볼 파티션 정리
+                if symbols is None:
+                    stale = [
+                        path
+                        for path in base.glob("symbol=*")
+                        if path.name not in replaced
+                    ]
+                else:
+                    stale = [
+                        base / f"symbol={symbol}"
+                        for symbol in symbols
+                        if f"symbol={symbol}" not in replaced
+                    ]
+                for path in stale:
+                    shutil.rmtree(path, ignore_errors=True)
+            finally:
+                shutil.rmtree(staging, ignore_errors=True)
+
+        logger.info(
+            f"📦 가격 저장소 동기화 완료 ({interval}): "
+            f"{len(symbols) if symbols is not None else '전체'} 심볼, {written}행"
+        )
+        return written
+
+    def sync_partitions(
+        self, partitions: Mapping[str, Collection[int]], interval: str = "daily"
+    ) -> int:
+        """변경된 (심볼, 연도) 파티션만 재작성 (upsert 직후 증분 동기화)
+
+        증분 upsert(최근 봉 몇 개)가 심볼 전체 이력을 다시 쓰지 않도록 해당 연도
+        디렉토리만 교체합니다. 저장소에 아직 없는 심볼은 일부 연도만 기록하면 조회가
+        나머지 연도를 놓치므로 :meth:`sync` 로 전체 이력을 기록합니다.
+
+        Args:
+            partitions: 심볼 → 변경된 연도 목록
+            interval: 'daily' 또는 인트라데이 간격
+
+        Returns:
+            기록된 행 수
+        """
+        if self.root is None or not partitions:
+            return 0
+
+        base = self.interval_dir(interval)
+        new_symbols = [s for s in partitions if not (base / f"symbol={s}").is_dir()]
+        written = self.sync(new_symbols, interval=interval) if new_symbols else 0
+
+        targets = {
+            symbol: sorted(years)
+            for symbol, years in partitions.items()
+            if symbol not in new_symbols and years
+        }
+        if not targets:
+            return written
+
+        _, time_column, _ = self._spec(interval)
+        conditions = [
+            " OR ".join(
+                f"(symbol = {_sql_literal(symbol)} AND year({time_column}) IN "
+                f"({', '.join(str(int(y)) for y in years)}))"
+                for symbol, years in targets.items()
+            )
+        ]
+        staging = self.root / f".staging-{uuid.uuid4().hex}"
+        with self._write_lock:
+            try:
+                written += self._copy_to_staging(interval, conditions, staging)
+                if staging.is_dir():
+                    for symbol_dir in staging.iterdir():
+                        target = base / symbol_dir.name
+                        target.mkdir(parents=True, exist_ok=True)
+                        for year_dir in symbol_dir.iterdir():
+                            self._swap_dir(year_dir, target / year_dir.name)
+            finally:
+                shutil.rmtree(staging, ignore_errors=True)
+
+        logger.debug(
+            f"📦 가격 저장소 파티션 갱신 ({interval}): "
+            f"{sum(len(y) for y in targets.values())} 파티션"
+        )
+        return written
+
+    def _copy_to_staging(
+        self, interval: str, conditions: list[str], staging: Path
+    ) -> int:
+        """조건에 맞는 원본 행을 ``staging/symbol=*/year=*`` 로 기록 (쓰기 lock 보유)"""
+        table, time_column, value_columns = self._spec(interval)
+        if table == "intraday_prices":
+            conditions = [f"interval_type = {_sql_literal(interval)}", *conditions]
+        where = ""
+        if conditions:
+            where = "WHERE " + " AND ".join(f"({c})" for c in conditions)
+        casts = ", ".join(
+            f"CAST({column} AS {sql_type}) AS {column}"
+            for column, sql_type in value_columns.items()
+        )
+        query = f"""
+            SELECT symbol, {time_column}, year({time_column}) AS year, {casts}
+            FROM {table} {where}
+            ORDER BY symbol, {time_column}
+        """
+
+        staging.parent.mkdir(parents=True, exist_ok=True)
+        row = (
+            self._db.thread_cursor()
+            .execute(
+                f"""
+                COPY ({query}) TO {_sql_literal(str(staging))}
+                (FORMAT PARQUET, PARTITION_BY (symbol, year), COMPRESSION ZSTD)
+                """
+            )
+            .fetchone()
+        )
+        return int(row[0]) if row else 0
+
+    @staticmethod
+    def _swap_dir(source: Path, target: Path) -> None:
+        backup = None
+        if target.exists():
+            backup = target.with_name(f".{target.name}.old-{uuid.uuid4().hex}")
+            target.rename(backup)
+        source.rename(target)
+        if backup is not None:
+            shutil.rmtree(backup, ignore_errors=True)
+
+    # ===== 읽기 =====
+
+    def get_prices_arrow(
+        self,
+        symbols: Sequence[str],
+        start: DateLike | None = None,
+        end: DateLike | None = None,
+        columns: Sequence[str] | None = None,
+        interval: str = "daily",
+    ) -> pa.Table:
+        """다중 심볼 가격 데이터를 Arrow 테이블로 조회
+
+        파티션이 있는 심볼은 Parquet에서(연도 디렉토리 단위 pruning), 없는 심볼은
+        DuckDB 테이블에서 읽어 하나의 쿼리로 합칩니다. 값 컬럼은 float64
+        (``volume`` 은 int64)이며 ``symbol, <시간 컬럼>`` 순으로 정렬됩니다.
+
+        Args:
+            symbols: 조회할 심볼 목록
+            start: 시작 시점 (포함)
+            end: 종료 시점 (포함)
+            columns: 값 컬럼 목록 (None이면 전체)
+            interval: 'daily' 또는 인트라데이 간격
+
+        Returns:
+            ``symbol``, 시간 컬럼, 요청 컬럼으로 구성된 ``pyarrow.Table``
+        """
+        _, _, value_columns = self._spec(interval)
+        selected = list(columns) if columns else list(value_columns)
+        unknown = [c for c in selected if c not in value_columns]
+        if unknown:
+            raise ValueError(f"지원하지 않는 가격 컬럼: {unknown}")
+
+        symbols = list(dict.fromkeys(symbols))
+        start_ts = pd.Timestamp(start) if start is not None else None
+        end_ts = pd.Timestamp(end) if end is not None else None
+
+        conn = self._db.thread_cursor()
+        for attempt in range(2):
+            query, params = self._build_read_query(
+                symbols, start_ts, end_ts, selected, interval
+            )
+            try:
+                return conn.execute(query, params).fetch_arrow_table()
+            except duckdb.IOException:
+                # 동기화 중 심볼 디렉토리가 교체된 경우 파일 목록을 다시 구성
+                if attempt:
+                    raise
+                logger.debug(f"가격 저장소 파티션 교체 감지, 재조회: {symbols[:5]}")
+        raise AssertionError("unreachable")
+
+    def _build_read_query(
+        self,
+        symbols: list[str],
+        start_ts: pd.Timestamp | None,
+        end_ts: pd.Timestamp | None,
+        selected: list[str],
+        interval: str,
+    ) -> tuple[str, list[object]]:
+        table, time_column, value_columns = self._spec(interval)
+        files, missing = self.partition_files(
+            symbols,
+            interval,
+            start_year=start_ts.year if start_ts is not None else None,
+            end_year=end_ts.year if end_ts is not None else None,
+        )
+
+        time_cast = "DATE" if interval == "daily" else "TIMESTAMP"
+        range_sql = ""
+        range_params: list[object] = []
+        if start_ts is not None:
+            range_sql += f" AND {time_column} >= CAST(? AS {time_cast})"
+            range_params.append(start_ts.to_pydatetime())
+        if end_ts is not None:
+            range_sql += f" AND {time_column} <= CAST(? AS {time_cast})"
+            range_params.append(end_ts.to_pydatetime())
+
+        parts: list[str] = []
+        params: list[object] = []
+        if files:
+            file_list = ", ".join(_sql_literal(f) for f in files)
+            parts.append(
+                f"""
+                SELECT CAST(symbol AS VARCHAR) AS symbol, {time_column},
+                       {", ".join(selected)}
+                FROM read_parquet([{file_list}], hive_partitioning = true,
+                                  hive_types = {{'symbol': VARCHAR, 'year': INTEGER}})
+                WHERE TRUE {range_sql}
+                """
+            )
+            params.extend(range_params)
+        if missing or not files:
+            # 파티션이 없는 심볼은 원본 테이블에서 동일한 스키마로 조회
+            table_cols = ", ".join(
+                f"CAST({c} AS {value_columns[c]}) AS {c}" for c in selected
+            )
+            placeholders = ", ".join("?" for _ in missing) or "NULL"
+            interval_sql = (
+                " AND interval_type = ?" if table == "intraday_prices" else ""
+            )
+            parts.append(
+                f"""
+                SELECT symbol, {time_column}, {table_cols}
+                FROM {table}
+                WHERE symbol IN ({placeholders}){interval_sql} {range_sql}
+                """
+            )
+            params.extend(missing)
+            if interval_sql:
+                params.append(interval)
+            params.extend(range_params)
+
+        query = " UNION ALL ".join(parts) + f" ORDER BY symbol, {time_column}"
+        return query, params
@@ -10,10 +10,14 @@ from .market_data.stock import StockService
 from .market_data.fundamental import FundamentalService
 from .market_data.economic_indicator import EconomicIndicatorService
 from .market_data.intelligence import IntelligenceService
-from .market_data.indicators import TechnicalIndicatorService
+from .market_data.indicators import (
+    StreamingIndicatorService,
+    TechnicalIndicatorService,
+)
 from .trading.strategy_service import StrategyService
 from .trading.backtest_service import BacktestService
 from .backtest.orchestrator import BacktestOrchestrator
+from .async_database_manager import AsyncDatabaseManager
 from .database_manager import DatabaseManager
 from .user.watchlist_service import WatchlistService
 from .trading.portfolio_service import PortfolioService
@@ -48,6 +52,7 @@ class ServiceFactory:
     _economic_indicator_service: Optional[EconomicIndicatorService] = None
     _intelligence_service: Optional[IntelligenceService] = None
     _technical_indicator_service: Optional[TechnicalIndicatorService] = None
+    _streaming_indicator_service: Optional[StreamingIndicatorService] = None
     _strategy_service: Optional[StrategyService] = None
     _backtest_service: Optional[BacktestService] = None
     _backtest_orchestrator: Optional[BacktestOrchestrator] = None
@@ -87,6 +92,10 @@ class ServiceFactory:
             )
         return self._database_manager
 
+    def get_async_database_manager(self) -> AsyncDatabaseManager:
+        """AsyncDatabaseManager 인스턴스 반환 (이벤트 루프용 DuckDB 파사드)"""
+        return self.get_database_manager().async_manager
+
     def get_market_data_service(self) -> MarketDataService:
         """MarketDataService 인스턴스 반환 (DuckDB 연동)"""
         if self._market_data_service is None:
@@ -141,6 +150,16 @@ class ServiceFactory:
             logger.info("Created TechnicalIndicatorService instance with DuckDB")
         return self._technical_indicator_service
 
+    def get_streaming_indicator_service(self) -> StreamingIndicatorService:
+        """StreamingIndicatorService 인스턴스 반환 (DuckDB 상태 저장)"""
+        if self._streaming_indicator_service is None:
+            database_manager = self.get_database_manager()
+            self._streaming_indicator_service = StreamingIndicatorService(
+                database_manager
+            )
+            logger.info("Created StreamingIndicatorService instance with DuckDB")
+        return self._streaming_indicator_service
+
     def get_strategy_service(self) -> StrategyService:
         """StrategyService 인스턴스 반환"""
         if self._strategy_service is None:
@@ -389,7 +408,8 @@ class ServiceFactory:
             pass
 
         if self._database_manager:
-            self._database_manager.close()
+            await self._database_manager.cache_maintenance.stop()
+            self._database_manager.shutdown()
             self._database_manager = None
 
         # 다른 서비스들도 필요시 정리
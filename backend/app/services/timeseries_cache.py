@@ -0,0 +1,454 @@
+"""시계열 캐시 테이블
+
+``unified_cache`` 는 시계열 전체를 하나의 페이로드로 저장하므로 일부 구간만 필요해도
+전체를 역직렬화해야 하고, 갱신 시에도 전체를 다시 씁니다. 시계열 data_type은
+data_type별 typed 테이블에 ``(series_key, ts)`` 단위 행으로 저장합니다.
+
+- 구간 조회는 ``ts`` 범위/LIMIT 조건으로 SQL에서 처리
+- 갱신 시 저장된 마지막 봉 이후(마지막 봉 포함, 미확정 봉 보정)만 upsert
+- 봉마다 같은 값(symbol, market, interval, source 등)은 ``ts_cache_series.attrs`` 에 한 번만 저장
+
+테이블 구조:
+    ts_cache_series           (data_type, series_key) → symbol, attrs, 범위, TTL
+    ts_cache_<data_type>      (series_key, ts) → 값 컬럼 (DOUBLE/BIGINT)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import threading
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+import duckdb
+import pandas as pd
+
+if TYPE_CHECKING:
+    from app.services.database_manager import DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+# 모델 필드 중 캐시에 저장하지 않는 필드 (문서 ID / 저장 시각)
+_SKIP_FIELDS = frozenset({"id", "_id", "revision_id", "created_at", "updated_at"})
+
+_CRYPTO_BAR_COLUMNS: dict[str, str] = {
+    "open_market": "DOUBLE",
+    "high_market": "DOUBLE",
+    "low_market": "DOUBLE",
+    "close_market": "DOUBLE",
+    "volume": "DOUBLE",
+    "open_usd": "DOUBLE",
+    "high_usd": "DOUBLE",
+    "low_usd": "DOUBLE",
+    "close_usd": "DOUBLE",
+}
+_CRYPTO_PERIOD_COLUMNS: dict[str, str] = {
+    **_CRYPTO_BAR_COLUMNS,
+    "market_cap": "DOUBLE",
+    "market_cap_usd": "DOUBLE",
+}
+_STOCK_BAR_COLUMNS: dict[str, str] = {
+    "open": "DOUBLE",
+    "high": "DOUBLE",
+    "low": "DOUBLE",
+    "close": "DOUBLE",
+    "volume": "BIGINT",
+    "adjusted_close": "DOUBLE",
+    "dividend_amount": "DOUBLE",
+    "split_coefficient": "DOUBLE",
+}
+
+
+@dataclass(frozen=True)
+class SeriesSpec:
+    """시계열 data_type 스키마 (시간 필드 + 값 컬럼 타입)"""
+
+    data_type: str
+    time_field: str
+    columns: dict[str, str]
+
+    @property
+    def table(self) -> str:
+        return f"ts_cache_{self.data_type}"
+
+
+SERIES_SPECS: dict[str, SeriesSpec] = {
+    spec.data_type: spec
+    for spec in (
+        SeriesSpec("crypto_intraday", "timestamp", _CRYPTO_BAR_COLUMNS),
+        SeriesSpec("crypto_daily", "date", _CRYPTO_PERIOD_COLUMNS),
+        SeriesSpec("crypto_weekly", "date", _CRYPTO_PERIOD_COLUMNS),
+        SeriesSpec("crypto_monthly", "date", _CRYPTO_PERIOD_COLUMNS),
+        SeriesSpec("stock_intraday", "date", _STOCK_BAR_COLUMNS),
+    )
+}
+
+
+@dataclass
+class SeriesMeta:
+    """저장된 시계열의 범위/TTL 정보"""
+
+    data_type: str
+    series_key: str
+    symbol: str | None
+    attrs: dict[str, Any]
+    first_ts: datetime | None
+    last_ts: datetime | None
+    row_count: int
+    complete: bool
+    updated_at: datetime
+    expires_at: datetime | None
+
+    def is_fresh(self, now: datetime | None = None) -> bool:
+        if self.expires_at is None:
+            return True
+        now = now or datetime.now(UTC)
+        return _naive_utc(self.expires_at) > _naive_utc(now)
+
+
+def _naive_utc(value: Any) -> datetime:
+    """tz-aware 시각은 UTC로 변환 후 tz 제거 (DuckDB TIMESTAMP 비교용)"""
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is not None:
+        ts = ts.tz_convert("UTC").tz_localize(None)
+    return ts.to_pydatetime()
+
+
+def _to_record(item: Any) -> dict[str, Any]:
+    if isinstance(item, dict):
+        return item
+    if hasattr(item, "model_dump"):  # Pydantic 모델
+        return item.model_dump()
+    return dict(item)
+
+
+class TimeSeriesCache:
+    """data_type별 typed 시계열 캐시
+
+    사용 예제:
+        >>> ts_cache = database_manager.timeseries_cache
+        >>> ts_cache.append("crypto_daily", "BTC_USD", "BTC_USD", records, ttl_hours=6)
+        >>> ts_cache.read("crypto_daily", "BTC_USD", start="2024-01-01", limit=30)
+    """
+
+    META_TABLE = "ts_cache_series"
+
+    def __init__(self, database_manager: DatabaseManager):
+        self._db = database_manager
+        self._ready: set[str] = set()
+        self._ready_lock = threading.Lock()
+
+    @staticmethod
+    def is_series_type(data_type: str) -> bool:
+        return data_type in SERIES_SPECS
+
+    @staticmethod
+    def spec(data_type: str) -> SeriesSpec:
+        try:
+            return SERIES_SPECS[data_type]
+        except KeyError:
+            raise ValueError(f"시계열 캐시를 지원하지 않는 data_type: {data_type}") from None
+
+    def reset(self) -> None:
+        """재연결 시 테이블 확인 상태 초기화"""
+        with self._ready_lock:
+            self._ready.clear()
+
+    def _ensure_tables(self, conn: duckdb.DuckDBPyConnection, spec: SeriesSpec) -> None:
+        if spec.table in self._ready:
+            return
+        with self._ready_lock:
+            conn.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {self.META_TABLE} (
+                    data_type VARCHAR NOT NULL,
+                    series_key VARCHAR NOT NULL,
+                    symbol VARCHAR,
+                    attrs JSON,                 -- 봉마다 동일한 필드 (market, interval, source 등)
+                    first_ts TIMESTAMP,
+                    last_ts TIMESTAMP,
+                    row_count BIGINT,
+                    complete BOOLEAN,           -- 전체 이력(full) 적재 여부
+                    updated_at TIMESTAMP NOT NULL,
+                    expires_at TIMESTAMP,
+                    PRIMARY KEY (data_type, series_key)
+                )
+                """
+            )
+            columns = ",\n".join(
+                f"{column} {sql_type}" for column, sql_type in spec.columns.items()
+            )
+            conn.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {spec.table} (
+                    series_key VARCHAR NOT NULL,
+                    symbol VARCHAR,
+                    ts TIMESTAMP NOT NULL,
+                    {columns},
+                    PRIMARY KEY (series_key, ts)
+                )
+                """
+            )
+            self._ready.add(spec.table)
+
+    # ===== 조회 =====
+
+    def get_meta(self, data_type: str, series_key: str) -> SeriesMeta | None:
+        spec = self.spec(data_type)
+        conn = self._db.thread_cursor()
+        self._ensure_tables(conn, spec)
+
+        row = conn.execute(
+            f"""
+            SELECT symbol, attrs, first_ts, last_ts, row_count, complete,
+                   updated_at, expires_at
+            FROM {self.META_TABLE}
+            WHERE data_type = ? AND series_key = ?
+            """,
+            [data_type, series_key],
+        ).fetchone()
+        if row is None:
+            return None
+        return SeriesMeta(
+            data_type=data_type,
+            series_key=series_key,
+            symbol=row[0],
+            attrs=json.loads(row[1]) if row[1] else {},
+            first_ts=row[2],
+            last_ts=row[3],
+            row_count=int(row[4] or 0),
+            complete=bool(row[5]),
+            updated_at=row[6],
+            expires_at=row[7],
+        )
+
+    def read(
+        self,
+        data_type: str,
+        series_key: str,
+        start: Any | None = None,
+        end: Any | None = None,
+        limit: int | None = None,
+        descending: bool = True,
+    ) -> list[dict[str, Any]]:
+        """구간 조회 (범위/LIMIT은 SQL에서 처리)
+
+        Args:
+            start: 시작 시점 (포함)
+            end: 종료 시점 (포함)
+            limit: 최신 봉 기준 최대 개수
+            descending: 최신 봉부터 반환 (Alpha Vantage 응답 순서와 동일)
+
+        Returns:
+            모델 생성용 레코드 리스트 (attrs + 시간 필드 + 값 컬럼)
+        """
+        spec = self.spec(data_type)
+        meta = self.get_meta(data_type, series_key)
+        if meta is None:
+            return []
+
+        conditions = ["series_key = ?"]
+        params: list[Any] = [series_key]
+        if start is not None:
+            conditions.append("ts >= ?")
+            params.append(_naive_utc(start))
+        if end is not None:
+            conditions.append("ts <= ?")
+            params.append(_naive_utc(end))
+
+        value_columns = list(spec.columns)
+        query = f"""
+            SELECT ts, {", ".join(value_columns)} FROM {spec.table}
+            WHERE {" AND ".join(conditions)}
+            ORDER BY ts DESC
+        """
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(int(limit))
+
+        rows = self._db.thread_cursor().execute(query, params).fetchall()
+        if not descending:
+            rows.reverse()
+
+        fields = [spec.time_field, *value_columns]
+        records = []
+        for row in rows:
+            record = dict(meta.attrs)
+            for field, value in zip(fields, row):
+                if isinstance(value, float) and math.isnan(value):
+                    value = None
+                record[field] = value
+            records.append(record)
+        return records
+
+    # ===== 쓰기 =====
+
+    def append(
+        self,
+        data_type: str,
+        series_key: str,
+        symbol: str | None,
+        records: Sequence[Any],
+        ttl_hours: float = 24,
+        complete: bool = False,
+    ) -> int:
+        """새 봉 upsert + 시계열 메타(TTL/범위) 갱신
+
+        저장된 마지막 봉보다 이전 봉은 건너뛰고, 마지막 봉과 그 이후만 기록합니다.
+
+        Args:
+            records: 모델 또는 dict 리스트 (``spec.time_field`` 필수)
+            complete: 전체 이력(full) 응답 여부 (한 번 True면 유지)
+
+        Returns:
+            기록된 봉 수
+        """
+        spec = self.spec(data_type)
+        conn = self._db.thread_cursor()
+        self._ensure_tables(conn, spec)
+        meta = self.get_meta(data_type, series_key)
+
+        rows = [_to_record(item) for item in records]
+        attrs = dict(meta.attrs) if meta else {}
+        if rows:
+            attrs.update(
+                {
+                    key: value
+                    for key, value in rows[0].items()
+                    if key not in _SKIP_FIELDS
+                    and key != spec.time_field
+                    and key not in spec.columns
+                }
+            )
+
+        frame = pd.DataFrame.from_records(rows) if rows else pd.DataFrame()
+        if not frame.empty and spec.time_field not in frame:
+            raise ValueError(f"{data_type} 레코드에 {spec.time_field} 필드가 없습니다")
+        stage = pd.DataFrame(
+            {"ts": pd.to_datetime(frame[spec.time_field], utc=True, errors="coerce")}
+            if not frame.empty
+            else {"ts": pd.Series([], dtype="datetime64[ns, UTC]")}
+        )
+        stage["ts"] = stage["ts"].dt.tz_localize(None)
+        for column in spec.columns:
+            values = (
+                frame[column] if column in frame else pd.Series(None, index=frame.index)
+            )
+            stage[column] = pd.to_numeric(values, errors="coerce").astype("float64")
+        stage = stage.dropna(subset=["ts"])
+        if meta is not None and meta.last_ts is not None:
+            stage = stage[stage["ts"] >= pd.Timestamp(meta.last_ts)]
+        stage = stage.drop_duplicates(subset="ts", keep="last")
+
+        now = datetime.now(UTC)
+        expires_at = now + timedelta(hours=ttl_hours)
+        value_columns = list(spec.columns)
+        casts = ", ".join(
+            f"CAST({column} AS {spec.columns[column]}) AS {column}"
+            for column in value_columns
+        )
+        update_set = ", ".join(
+            f"{column} = excluded.{column}" for column in value_columns
+        )
+        source_view = f"_ts_cache_src_{uuid.uuid4().hex}"
+
+        conn.register(source_view, stage)
+        try:
+            conn.execute("BEGIN TRANSACTION")
+            try:
+                if len(stage):
+                    conn.execute(
+                        f"""
+                        INSERT INTO {spec.table} (series_key, symbol, ts, {", ".join(value_columns)})
+                        SELECT ?, ?, ts, {casts} FROM {source_view}
+                        ON CONFLICT (series_key, ts) DO UPDATE SET {update_set}
+                        """,
+                        [series_key, symbol],
+                    )
+                conn.execute(
+                    f"""
+                    INSERT INTO {self.META_TABLE}
+                    (data_type, series_key, symbol, attrs, first_ts, last_ts, row_count,
+                     complete, updated_at, expires_at)
+                    SELECT ?, ?, ?, ?, MIN(ts), MAX(ts), COUNT(*), ?, ?, ?
+                    FROM {spec.table} WHERE series_key = ?
+                    ON CONFLICT (data_type, series_key) DO UPDATE SET
+                        symbol = excluded.symbol,
+                        attrs = excluded.attrs,
+                        first_ts = excluded.first_ts,
+                        last_ts = excluded.last_ts,
+                        row_count = excluded.row_count,
+                        complete = excluded.complete,
+                        updated_at = excluded.updated_at,
+                        expires_at = excluded.expires_at
+                    """,
+                    [
+                        data_type,
+                        series_key,
+                        symbol,
+                        json.dumps(attrs, default=str),
+                        complete or bool(meta and meta.complete),
+                        now,
+                        expires_at,
+                        series_key,
+                    ],
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        finally:
+            conn.unregister(source_view)
+
+        logger.info(
+            f"시계열 캐시 저장: {data_type}.{series_key} " f"({len(stage)}/{len(rows)} 봉 기록)"
+        )
+        return len(stage)
+
+    def invalidate(self, data_type: str, series_key: str) -> None:
+        """시계열 삭제 (봉 + 메타)"""
+        spec = self.spec(data_type)
+        conn = self._db.thread_cursor()
+        self._ensure_tables(conn, spec)
+        conn.execute(f"DELETE FROM {spec.table} WHERE series_key = ?", [series_key])
+        conn.execute(
+            f"DELETE FROM {self.META_TABLE} WHERE data_type = ? AND series_key = ?",
+            [data_type, series_key],
+        )
+
+    def purge_expired(self, conn: duckdb.DuckDBPyConnection, before: datetime) -> int:
+        """``before`` 이전에 만료된 시계열 삭제 (캐시 정리 태스크에서 호출)
+
+        Returns:
+            삭제된 봉 수
+        """
+        existing = {
+            row[0]
+            for row in conn.execute(
+                "SELECT table_name FROM information_schema.tables WHERE table_name LIKE 'ts_cache_%'"
+            ).fetchall()
+        }
+        if self.META_TABLE not in existing:
+            return 0
+
+        deleted = 0
+        for spec in SERIES_SPECS.values():
+            if spec.table not in existing:
+                continue
+            row = conn.execute(
+                f"""
+                DELETE FROM {spec.table} WHERE series_key IN (
+                    SELECT series_key FROM {self.META_TABLE}
+                    WHERE data_type = ? AND expires_at < ?
+                )
+                """,
+                [spec.data_type, before],
+            ).fetchone()
+            deleted += int(row[0]) if row else 0
+        conn.execute(f"DELETE FROM {self.META_TABLE} WHERE expires_at < ?", [before])
+        return deleted
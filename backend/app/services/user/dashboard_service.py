@@ -3,7 +3,7 @@
 import logging
 import random
 from datetime import UTC, datetime, timedelta
-from typing import List, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from app.schemas.user.dashboard import (
     DashboardSummary,
@@ -28,6 +28,7 @@ from app.schemas.user.dashboard import (
     DataQualitySeverity,
 )
 from app.schemas.ml_platform.predictive import PredictiveDashboardInsights
+from app.models.market_data.fundamental import CompanyOverview
 from app.services.database_manager import DatabaseManager
 from app.services.trading.portfolio_service import PortfolioService
 from app.services.trading.strategy_service import StrategyService
@@ -259,6 +260,9 @@ class DashboardService:
     async def get_watchlist_quotes(self, user_id: str) -> WatchlistQuotes:
         """관심종목 현재가를 조회합니다.
 
+        사용자의 모든 관심종목 심볼(없으면 기본 심볼)을 모아 공유 호가 캐시에서
+        일괄 조회합니다. 시세를 가져오지 못한 심볼은 결과에서 제외됩니다.
+
         Args:
             user_id: 사용자 ID
 
@@ -266,37 +270,66 @@ class DashboardService:
             관심종목 시세 데이터
         """
         try:
-            # TODO: 실제 관심종목 및 시세 데이터 조회
-            # 현재는 모의 데이터 반환
-            symbols_data = [
-                {"symbol": "AAPL", "name": "Apple Inc.", "price": 180.50},
-                {"symbol": "GOOGL", "name": "Alphabet Inc.", "price": 145.30},
-                {"symbol": "MSFT", "name": "Microsoft Corp.", "price": 380.75},
-                {"symbol": "TSLA", "name": "Tesla Inc.", "price": 195.25},
-                {"symbol": "NVDA", "name": "NVIDIA Corp.", "price": 875.40},
-            ]
-
-            quotes = []
-            for data in symbols_data:
-                change = round(random.uniform(-10, 15), 2)
-                change_percentage = round((change / data["price"]) * 100, 2)
-
-                quotes.append(
+            watchlists = await self.watchlist_service.list_watchlists(user_id)
+            symbols = list(
+                dict.fromkeys(
+                    symbol.upper()
+                    for watchlist in watchlists
+                    for symbol in watchlist.symbols
+                )
+            )
+            if not symbols:
+                symbols = await self.watchlist_service.get_default_symbols()
+
+            quotes = await self.market_data_service.stock.get_real_time_quotes(symbols)
+            profiles = await self._get_company_profiles(list(quotes))
+
+            items = []
+            for symbol, quote in quotes.items():
+                if quote is None:
+                    continue
+                name, market_cap = profiles.get(symbol, (symbol, None))
+                items.append(
                     WatchlistQuoteItem(
-                        symbol=data["symbol"],
-                        name=data["name"],
-                        current_price=data["price"],
-                        change=change,
-                        change_percentage=change_percentage,
-                        volume=random.randint(1000000, 50000000),
-                        market_cap=random.randint(100, 3000) * 1e9,  # Billions
+                        symbol=symbol,
+                        name=name,
+                        current_price=float(quote.price),
+                        change=float(quote.change or 0),
+                        change_percentage=float(quote.change_percent or 0),
+                        volume=quote.volume or 0,
+                        market_cap=market_cap,
                     )
                 )
 
-            return WatchlistQuotes(symbols=quotes, last_updated=datetime.now())
+            return WatchlistQuotes(symbols=items, last_updated=datetime.now())
         except Exception as e:
             raise Exception(f"관심종목 시세 조회 실패: {str(e)}")
 
+    async def _get_company_profiles(
+        self, symbols: List[str]
+    ) -> Dict[str, Tuple[str, Optional[float]]]:
+        """저장된 기업 개요에서 심볼별 (회사명, 시가총액)을 조회합니다."""
+        if not symbols:
+            return {}
+        try:
+            overviews = await CompanyOverview.find(
+                {"symbol": {"$in": symbols}}
+            ).to_list()
+        except Exception as e:
+            logger.warning(f"기업 개요 조회 실패, 심볼을 회사명으로 사용: {e}")
+            return {}
+        return {
+            overview.symbol: (
+                overview.name,
+                (
+                    float(overview.market_capitalization)
+                    if overview.market_capitalization is not None
+                    else None
+                ),
+            )
+            for overview in overviews
+        }
+
     async def get_news_feed(
         self,
         user_id: str,
@@ -9,6 +9,7 @@ from typing import Any
 
 import pandas as pd
 from pydantic import BaseModel, Field
+from app.core.indicator_cache import cached_series
 from app.schemas.enums import SignalType
 
 
@@ -241,52 +242,88 @@ class BaseStrategy(ABC):
 
 # 기술적 지표 계산 유틸리티
 class TechnicalIndicators:
-    """기술적 지표 계산 유틸리티"""
+    """기술적 지표 계산 유틸리티
+
+    결과는 지표 결과 캐시(:mod:`app.core.indicator_cache`)에 입력 값 지문으로 저장되어
+    같은 시계열을 쓰는 다른 전략/FeatureEngineer와 공유됩니다.
+    """
 
     @staticmethod
     def sma(data: pd.Series, window: int) -> pd.Series:
         """단순 이동평균"""
-        return data.rolling(window=window).mean()
+        return cached_series(
+            "pandas.SMA",
+            data,
+            {"window": window},
+            lambda: {"value": data.rolling(window=window).mean()},
+        )["value"]
 
     @staticmethod
     def ema(data: pd.Series, window: int) -> pd.Series:
         """지수 이동평균"""
-        return data.ewm(span=window).mean()
+        return cached_series(
+            "pandas.EMA",
+            data,
+            {"span": window, "adjust": True},
+            lambda: {"value": data.ewm(span=window).mean()},
+        )["value"]
 
     @staticmethod
     def rsi(data: pd.Series, window: int = 14) -> pd.Series:
         """RSI (Relative Strength Index)"""
         # Ensure the input series is numeric to avoid object-dtype comparison errors
         numeric = pd.to_numeric(data, errors="coerce").astype(float)
-        delta = numeric.diff()
-        gain = delta.where(delta > 0, 0.0).rolling(window=window).mean()
-        loss = (-delta.where(delta < 0, 0.0)).rolling(window=window).mean()
-        rs = gain / loss
-        return 100 - (100 / (1 + rs))
+
+        def compute() -> dict[str, pd.Series]:
+            delta = numeric.diff()
+            gain = delta.where(delta > 0, 0.0).rolling(window=window).mean()
+            loss = (-delta.where(delta < 0, 0.0)).rolling(window=window).mean()
+            rs = gain / loss
+            return {"value": 100 - (100 / (1 + rs))}
+
+        return cached_series("pandas.RSI", numeric, {"window": window}, compute)[
+            "value"
+        ]
 
     @staticmethod
     def bollinger_bands(
         data: pd.Series, window: int = 20, std_dev: float = 2
     ) -> dict[str, pd.Series]:
         """볼린저 밴드"""
-        sma = data.rolling(window=window).mean()
-        std = data.rolling(window=window).std()
 
-        return {
-            "middle": sma,
-            "upper": sma + (std * std_dev),
-            "lower": sma - (std * std_dev),
-        }
+        def compute() -> dict[str, pd.Series]:
+            sma = data.rolling(window=window).mean()
+            std = data.rolling(window=window).std()
+            return {
+                "middle": sma,
+                "upper": sma + (std * std_dev),
+                "lower": sma - (std * std_dev),
+            }
+
+        return cached_series(
+            "pandas.BBANDS",
+            data,
+            {"window": window, "std_dev": float(std_dev)},
+            compute,
+        )
 
     @staticmethod
     def macd(
         data: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9
     ) -> dict[str, pd.Series]:
         """MACD"""
-        ema_fast = data.ewm(span=fast).mean()
-        ema_slow = data.ewm(span=slow).mean()
-        macd_line = ema_fast - ema_slow
-        signal_line = macd_line.ewm(span=signal).mean()
-        histogram = macd_line - signal_line
 
-        return {"macd": macd_line, "signal": signal_line, "histogram": histogram}
+        def compute() -> dict[str, pd.Series]:
+            ema_fast = data.ewm(span=fast).mean()
+            ema_slow = data.ewm(span=slow).mean()
+            macd_line = ema_fast - ema_slow
+            signal_line = macd_line.ewm(span=signal).mean()
+            histogram = macd_line - signal_line
+            return {"macd": macd_line, "signal": signal_line, "histogram": histogram}
+
+        return cached_series(
+            "pandas.MACD",
+            data,
+            {"fast": fast, "slow": slow, "signal": signal, "adjust": True},
+            compute,
+        )
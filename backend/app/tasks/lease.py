@@ -0,0 +1,100 @@
+"""
+Background task lease
+여러 uvicorn 워커/컨테이너 중 한 프로세스만 주기 작업을 실행하도록 하는 MongoDB 리스
+
+리스 문서(``BackgroundTaskLease``)를 ``find_one_and_update`` 한 번으로 획득/갱신합니다.
+- 보유자가 없거나 만료됐거나 자신이 보유 중이면 owner/expires_at을 기록하고 성공
+- 다른 프로세스가 보유 중이면 upsert가 고유 인덱스(name)에 막혀 실패
+- 보유자는 실행할 때마다 갱신하고, 종료 시 해제하면 다른 프로세스가 바로 넘겨받음
+
+사용 예제:
+    >>> lease = TaskLease.for_interval("coverage_refresh", interval_seconds=1800)
+    >>> if await lease.acquire():
+    ...     await run_job()
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from app.models.market_data.stock import BackgroundTaskLease
+
+logger = logging.getLogger(__name__)
+
+# 주기 작업 리스의 최소 유효 시간(초)
+MIN_TTL_SECONDS = 600
+
+
+class TaskLease:
+    """작업 이름별 프로세스 간 리스
+
+    Args:
+        name: 작업 이름 (리스 문서 키)
+        ttl_seconds: 리스 유효 시간 (보유자는 그 전에 ``acquire`` 로 갱신)
+    """
+
+    def __init__(self, name: str, ttl_seconds: float):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.held = False
+
+    @classmethod
+    def for_interval(cls, name: str, interval_seconds: float) -> TaskLease:
+        """주기 작업용 리스 (보유자가 매 주기 갱신하므로 유효 시간은 주기의 2배)
+
+        유효 시간이 주기보다 길어야 보유자가 살아 있는 동안 다른 프로세스가
+        주기 사이에 끼어들어 같은 작업을 실행하지 않습니다.
+        """
+        return cls(name, ttl_seconds=max(MIN_TTL_SECONDS, 2 * interval_seconds))
+
+    async def acquire(self) -> bool:
+        """리스 획득 또는 갱신 (다른 프로세스가 보유 중이면 False)"""
+        now = datetime.now(UTC)
+        collection = BackgroundTaskLease.get_motor_collection()
+        try:
+            document = await collection.find_one_and_update(
+                {
+                    "name": self.name,
+                    "$or": [{"owner": self.owner}, {"expires_at": {"$lte": now}}],
+                },
+                {
+                    "$set": {
+                        "owner": self.owner,
+                        "expires_at": now + timedelta(seconds=self.ttl_seconds),
+                    }
+                },
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+            )
+        except DuplicateKeyError:
+            document = None
+        except Exception as e:
+            logger.warning(f"⚠️ 작업 리스 조회 실패 ({self.name}): {e}")
+            document = None
+
+        held = document is not None and document.get("owner") == self.owner
+        if held != self.held:
+            logger.info(f"🔑 작업 리스 {'획득' if held else '상실'} ({self.name}, {self.owner})")
+        self.held = held
+        return held
+
+    async def release(self) -> None:
+        """보유 중인 리스를 즉시 만료 (다른 프로세스가 바로 넘겨받을 수 있음)"""
+        if not self.held:
+            return
+        self.held = False
+        try:
+            await BackgroundTaskLease.get_motor_collection().update_one(
+                {"name": self.name, "owner": self.owner},
+                {"$set": {"expires_at": datetime.now(UTC)}},
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ 작업 리스 해제 실패 ({self.name}): {e}")
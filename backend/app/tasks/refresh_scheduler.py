@@ -0,0 +1,469 @@
+"""
+Coverage refresh scheduler
+만료된 StockDataCoverage를 API 예산 안에서 갱신하는 스케줄러
+
+- 갱신 순서: 경과 시간(next_update_due 이후) × 심볼 중요도(관심종목 포함 수, 최근 백테스트 수)
+  × data_type 가중치(일봉 > 주봉 > 월봉)
+- 동시 실행 수 제한 (``REFRESH_CONCURRENCY``), 요청은 공유 속도 제한기에서 BACKGROUND 우선순위로 대기
+- 일일 호출 예산을 하루 경과 비율만큼만 사용 (실행 주기마다 고르게 분산)
+- 계획과 당일 사용량을 CoverageRefreshCheckpoint에 저장하여 재시작 시 남은 항목부터 이어서 실행
+- 여러 워커 프로세스 중 작업 리스(``TaskLease``)를 보유한 프로세스만 실행
+
+일일 사용량에는 항목마다 실제로 나간 Alpha Vantage 호출 수만 더합니다
+(캐시 적중 0회, 증분/전체/주봉/월봉 1회, 증분 중 전체 재적재로 전환되면 2회).
+항목 수 기준으로 고른 이번 실행 분량이 예산을 넘으면 다음 실행의 허용량에서 빠집니다.
+
+사용 예제:
+    >>> result = await refresh_scheduler.run()
+    >>> result.success, result.deferred
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from app.alpha_vantage import (
+    RateLimitExceeded,
+    RequestPriority,
+    count_requests,
+    get_rate_limiter,
+    request_priority,
+)
+from app.core.config import settings
+from app.models.market_data.stock import CoverageRefreshCheckpoint, StockDataCoverage
+from app.tasks.lease import TaskLease
+
+logger = logging.getLogger(__name__)
+
+DELTA_JOB = "coverage_refresh"
+FORCE_JOB = "force_refresh"
+
+# 심볼 중요도 가중치 (관심종목/백테스트 수는 IMPORTANCE_CAP까지만 반영)
+WATCHLIST_WEIGHT = 0.5
+BACKTEST_WEIGHT = 0.3
+IMPORTANCE_CAP = 5
+# 같은 경과 시간이면 일봉 > 주봉 > 월봉 순서
+DATA_TYPE_WEIGHTS = {"daily": 1.0, "weekly": 0.5, "monthly": 0.25}
+# 한 번도 갱신되지 않은 커버리지의 경과 시간 (가장 먼저 처리)
+NEVER_UPDATED_HOURS = 24.0 * 365
+
+RefreshFn = Callable[[str, str, bool], Awaitable[None]]
+
+
+def _utc(value: datetime | None) -> datetime | None:
+    """MongoDB의 naive datetime을 UTC로 간주"""
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value
+
+
+def coverage_key(symbol: str, data_type: str) -> str:
+    return f"{symbol}:{data_type}"
+
+
+def importance(watchlists: int, backtests: int) -> float:
+    """관심종목 포함 수와 최근 백테스트 수로 계산한 중요도 배수 (최소 1)"""
+    return (
+        1.0
+        + WATCHLIST_WEIGHT * min(watchlists, IMPORTANCE_CAP)
+        + BACKTEST_WEIGHT * min(backtests, IMPORTANCE_CAP)
+    )
+
+
+def refresh_score(
+    coverage: StockDataCoverage, now: datetime, symbol_importance: float = 1.0
+) -> float:
+    """갱신 우선순위 점수 (클수록 먼저 갱신)"""
+    due = _utc(
+        coverage.next_update_due
+        or coverage.last_delta_update
+        or coverage.last_full_update
+    )
+    overdue_hours = (
+        max(0.0, (now - due).total_seconds() / 3600)
+        if due is not None
+        else NEVER_UPDATED_HOURS
+    )
+    weight = DATA_TYPE_WEIGHTS.get(coverage.data_type, 0.5)
+    return (1.0 + overdue_hours) * symbol_importance * weight
+
+
+def paced_allowance(
+    daily_budget: int, used: int, now: datetime, horizon_seconds: float
+) -> int:
+    """하루 예산 중 (자정 이후 경과 + 다음 실행까지) 비율만큼에서 사용량을 뺀 호출 수"""
+    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    elapsed = (now - midnight).total_seconds() + horizon_seconds
+    fraction = min(1.0, elapsed / 86_400)
+    return max(0, math.floor(daily_budget * fraction) - used)
+
+
+def resolve_daily_budget() -> int | None:
+    """스케줄러 일일 호출 예산 (None이면 무제한)"""
+    if settings.REFRESH_DAILY_BUDGET > 0:
+        return settings.REFRESH_DAILY_BUDGET
+    if settings.ALPHA_VANTAGE_REQUESTS_PER_DAY > 0:
+        return max(
+            1,
+            int(settings.ALPHA_VANTAGE_REQUESTS_PER_DAY * settings.REFRESH_QUOTA_SHARE),
+        )
+    return None
+
+
+@dataclass
+class RefreshItem:
+    symbol: str
+    data_type: str
+    score: float
+
+    @property
+    def key(self) -> str:
+        return coverage_key(self.symbol, self.data_type)
+
+
+@dataclass
+class RefreshRunResult:
+    """스케줄러 1회 실행 결과"""
+
+    job: str
+    total: int = 0
+    attempted: int = 0
+    success: int = 0
+    failed: int = 0
+    deferred: int = 0
+    resumed: bool = False
+    calls_used_today: int = 0
+    daily_budget: int | None = None
+    errors: list[str] = field(default_factory=list)
+
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+async def refresh_coverage(symbol: str, data_type: str, full: bool) -> None:
+    """data_type별 주식 데이터 갱신 (StockService의 Coverage 기반 경로 사용)
+
+    full이면 일봉은 캐시/업데이트 예정일과 무관하게 전체 이력을 재적재합니다.
+    """
+    from app.services.service_factory import service_factory
+
+    stock = service_factory.get_market_data_service().stock
+    if data_type == "daily":
+        await stock.get_daily_prices(
+            symbol=symbol,
+            outputsize="full" if full else "compact",
+            adjusted=True,
+            force_full=full,
+        )
+        # 새 일봉만큼 저장된 증분 지표 상태 전진 (실패해도 갱신은 성공 처리)
+        try:
+            await service_factory.get_streaming_indicator_service().advance(symbol)
+        except Exception as e:
+            logger.warning(f"⚠️ {symbol} 증분 지표 갱신 실패: {e}")
+    elif data_type == "weekly":
+        await stock.get_weekly_prices(symbol=symbol, outputsize="full", adjusted=True)
+    elif data_type == "monthly":
+        await stock.get_monthly_prices(symbol=symbol, outputsize="full", adjusted=True)
+    else:
+        raise ValueError(f"Unsupported coverage data type: {data_type}")
+
+
+class CoverageRefreshScheduler:
+    """우선순위/예산/체크포인트 기반 커버리지 갱신기
+
+    Args:
+        refresh: (symbol, data_type, full) 갱신 함수
+        concurrency: 동시 갱신 수
+        daily_budget: 일일 호출 예산 (None이면 무제한)
+        interval_seconds: 주기 실행 간격 (0이면 주기 실행 비활성화)
+        clock: 현재 UTC 시각 (테스트용)
+        lease: 프로세스 간 작업 리스 (None이면 프로세스 내 중복 실행만 방지)
+    """
+
+    def __init__(
+        self,
+        refresh: RefreshFn = refresh_coverage,
+        concurrency: int = 4,
+        daily_budget: int | None = None,
+        interval_seconds: int = 1800,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+        lease: TaskLease | None = None,
+    ):
+        self._refresh = refresh
+        self._lease = lease
+        self.concurrency = max(1, concurrency)
+        self.daily_budget = daily_budget
+        self.interval_seconds = interval_seconds
+        self._clock = clock
+        self._running = False
+        self._task: asyncio.Task[None] | None = None
+
+    # ===== 실행 =====
+
+    async def run(self, force: bool = False) -> RefreshRunResult:
+        """갱신 1회 실행
+
+        Args:
+            force: True면 만료 여부와 관계없이 모든 활성 커버리지를 전체 갱신
+                (하루 경과 비율 제한 없이 남은 일일 예산까지 사용)
+        """
+        job = FORCE_JOB if force else DELTA_JOB
+        result = RefreshRunResult(job=job, daily_budget=self.daily_budget)
+        if self._running:
+            result.errors.append("refresh already running")
+            logger.info("⏭️ 커버리지 갱신이 이미 실행 중이라 건너뜀")
+            return result
+
+        self._running = True
+        try:
+            # 다른 워커가 같은 체크포인트/예산으로 동시에 실행하지 않도록 리스 보유 시에만 실행
+            if self._lease is not None and not await self._lease.acquire():
+                result.errors.append("refresh lease held by another process")
+                logger.info("⏭️ 다른 프로세스가 커버리지 갱신 리스를 보유 중이라 건너뜀")
+                return result
+
+            now = self._clock()
+            checkpoint = await self._load_checkpoint(job, now)
+            plan, result.resumed = await self._plan(checkpoint, now, force)
+            checkpoint.pending = [item.key for item in plan]
+            result.total = len(plan)
+
+            allowance = self._allowance(checkpoint, now, force)
+            selected = plan if allowance is None else plan[:allowance]
+            await self._save_checkpoint(checkpoint)
+
+            logger.info(
+                f"📋 커버리지 갱신 계획 ({job}): {len(plan)}건 중 {len(selected)}건 실행 "
+                f"(resumed={result.resumed}, used={checkpoint.calls_used}, "
+                f"budget={self.daily_budget or 'unlimited'})"
+            )
+
+            # 대화형 요청보다 낮은 우선순위로 Alpha Vantage 큐에서 대기
+            with request_priority(RequestPriority.BACKGROUND):
+                await self._execute(selected, checkpoint, result, full=force)
+
+            result.deferred = len(checkpoint.pending)
+            result.calls_used_today = checkpoint.calls_used
+            logger.info(
+                f"✅ 커버리지 갱신 완료 ({job}): {result.success} success, "
+                f"{result.failed} failed, {result.deferred} deferred"
+            )
+            return result
+        except Exception as e:
+            logger.error(f"❌ 커버리지 갱신 실패 ({job}): {e}", exc_info=True)
+            result.errors.append(str(e))
+            return result
+        finally:
+            self._running = False
+
+    def _allowance(
+        self, checkpoint: CoverageRefreshCheckpoint, now: datetime, force: bool
+    ) -> int | None:
+        """이번 실행에서 사용할 수 있는 호출 수 (None이면 무제한)"""
+        if self.daily_budget is None:
+            return None
+        if force:
+            return max(0, self.daily_budget - checkpoint.calls_used)
+        return paced_allowance(
+            self.daily_budget, checkpoint.calls_used, now, self.interval_seconds
+        )
+
+    async def _execute(
+        self,
+        items: list[RefreshItem],
+        checkpoint: CoverageRefreshCheckpoint,
+        result: RefreshRunResult,
+        full: bool,
+    ) -> None:
+        queue = iter(items)
+        limiter = get_rate_limiter()
+        save_lock = asyncio.Lock()
+        stopped = False
+
+        async def worker() -> None:
+            nonlocal stopped
+            for item in queue:
+                if stopped:
+                    return
+                if self._lease is not None and not await self._lease.acquire():
+                    # 리스 갱신 실패 (만료 후 다른 프로세스가 넘겨받음)
+                    stopped = True
+                    logger.warning("⏸️ 커버리지 갱신 리스 상실, 남은 항목은 보유자가 실행")
+                    return
+                if limiter.remaining_today() == 0:
+                    stopped = True
+                    logger.warning("⏸️ Alpha Vantage 일일 한도 소진, 남은 항목은 다음 실행으로 미룸")
+                    return
+
+                result.attempted += 1
+                with count_requests() as calls:
+                    try:
+                        await self._refresh(item.symbol, item.data_type, full)
+                        result.success += 1
+                        checkpoint.completed += 1
+                    except RateLimitExceeded as e:
+                        # 속도 제한기 거부 또는 한도 응답: 계획에 남겨 다음 실행에서 재개
+                        stopped = True
+                        result.attempted -= 1
+                        result.errors.append(f"{item.key}: {e}")
+                        logger.warning(f"⏸️ 갱신 중단 ({item.key}): {e}")
+                        continue
+                    except Exception as e:
+                        result.failed += 1
+                        checkpoint.failed += 1
+                        result.errors.append(f"Failed to update {item.key}: {e}")
+                        logger.error(f"❌ Failed to update {item.key}: {e}")
+                    finally:
+                        # 실제로 나간 호출만 사용량에 반영
+                        checkpoint.calls_used += calls.count
+
+                async with save_lock:
+                    if item.key in checkpoint.pending:
+                        checkpoint.pending.remove(item.key)
+                    await self._save_checkpoint(checkpoint)
+
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+
+    # ===== 계획 =====
+
+    async def _plan(
+        self, checkpoint: CoverageRefreshCheckpoint, now: datetime, force: bool
+    ) -> tuple[list[RefreshItem], bool]:
+        """체크포인트의 남은 계획 → 새로 만료된 항목(점수 순) 순서의 실행 계획"""
+        coverages = await self._load_coverages(now, force)
+        weights = await self._load_importance(sorted({c.symbol for c in coverages}))
+
+        items = {
+            coverage_key(c.symbol, c.data_type): RefreshItem(
+                symbol=c.symbol,
+                data_type=c.data_type,
+                score=refresh_score(c, now, weights.get(c.symbol, 1.0)),
+            )
+            for c in coverages
+        }
+        resumed = [items[key] for key in checkpoint.pending if key in items]
+        resumed_keys = {item.key for item in resumed}
+        fresh = sorted(
+            (item for key, item in items.items() if key not in resumed_keys),
+            key=lambda item: item.score,
+            reverse=True,
+        )
+        return resumed + fresh, bool(resumed)
+
+    async def _load_coverages(
+        self, now: datetime, force: bool
+    ) -> list[StockDataCoverage]:
+        query: dict[str, Any] = {"is_active": True}
+        if not force:
+            query["next_update_due"] = {"$lte": now}
+        return await StockDataCoverage.find(query).to_list()
+
+    async def _load_importance(self, symbols: list[str]) -> dict[str, float]:
+        """심볼별 중요도 (관심종목 포함 수, 최근 백테스트 수)"""
+        if not symbols:
+            return {}
+        from app.models.trading.backtest import Backtest
+        from app.models.user.watchlist import Watchlist
+
+        since = datetime.now() - timedelta(days=settings.REFRESH_BACKTEST_LOOKBACK_DAYS)
+        try:
+            watchlist_counts = await Watchlist.aggregate(
+                [
+                    {"$match": {"symbols": {"$in": symbols}}},
+                    {"$unwind": "$symbols"},
+                    {"$group": {"_id": "$symbols", "count": {"$sum": 1}}},
+                ]
+            ).to_list()
+            backtest_counts = await Backtest.aggregate(
+                [
+                    {"$match": {"created_at": {"$gte": since}}},
+                    {"$unwind": "$config.symbols"},
+                    {"$group": {"_id": "$config.symbols", "count": {"$sum": 1}}},
+                ]
+            ).to_list()
+        except Exception as e:
+            logger.warning(f"⚠️ 심볼 중요도 조회 실패, 경과 시간만으로 정렬: {e}")
+            return {}
+
+        watchlists = {row["_id"]: row["count"] for row in watchlist_counts}
+        backtests = {row["_id"]: row["count"] for row in backtest_counts}
+        return {
+            symbol: importance(watchlists.get(symbol, 0), backtests.get(symbol, 0))
+            for symbol in symbols
+        }
+
+    # ===== 체크포인트 =====
+
+    async def _load_checkpoint(
+        self, job: str, now: datetime
+    ) -> CoverageRefreshCheckpoint:
+        """작업 체크포인트 조회 (날짜가 바뀌었으면 당일 사용량 초기화, 남은 계획은 유지)"""
+        day = now.date().isoformat()
+        checkpoint = await CoverageRefreshCheckpoint.find_one(
+            CoverageRefreshCheckpoint.job == job
+        )
+        if checkpoint is None:
+            return CoverageRefreshCheckpoint(job=job, day=day)
+        if checkpoint.day != day:
+            checkpoint.day = day
+            checkpoint.calls_used = 0
+            checkpoint.completed = 0
+            checkpoint.failed = 0
+        return checkpoint
+
+    async def _save_checkpoint(self, checkpoint: CoverageRefreshCheckpoint) -> None:
+        checkpoint.updated_at = self._clock()
+        try:
+            await checkpoint.save()
+        except Exception as e:
+            # 체크포인트 저장 실패는 갱신을 막지 않음 (재시작 시 일부 항목 재실행)
+            logger.warning(f"⚠️ 갱신 체크포인트 저장 실패 ({checkpoint.job}): {e}")
+
+    # ===== 주기 실행 =====
+
+    def start(self) -> bool:
+        """이벤트 루프에 주기 갱신 태스크 등록 (이미 실행 중이거나 비활성화면 False)"""
+        if self.interval_seconds <= 0:
+            logger.info("커버리지 갱신 태스크 비활성화 (REFRESH_SCHEDULER_INTERVAL_SECONDS=0)")
+            return False
+        if self._task is not None and not self._task.done():
+            return False
+        self._task = asyncio.get_running_loop().create_task(
+            self._run_forever(), name="coverage-refresh-scheduler"
+        )
+        logger.info(f"🗓️ 커버리지 갱신 태스크 시작 ({self.interval_seconds}s 주기)")
+        return True
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        if self._lease is not None:
+            await self._lease.release()
+
+    async def _run_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            # 실패는 run에서 기록, 다음 주기에 체크포인트부터 재개
+            await self.run()
+
+
+# 프로세스 전역 스케줄러
+refresh_scheduler = CoverageRefreshScheduler(
+    concurrency=settings.REFRESH_CONCURRENCY,
+    daily_budget=resolve_daily_budget(),
+    interval_seconds=settings.REFRESH_SCHEDULER_INTERVAL_SECONDS,
+    lease=TaskLease.for_interval(
+        DELTA_JOB, settings.REFRESH_SCHEDULER_INTERVAL_SECONDS
+    ),
+)
@@ -0,0 +1,98 @@
+"""
+가격 컬렉션 (symbol, date) 고유 인덱스 마이그레이션
+daily/weekly/monthly 가격 컬렉션의 중복 (symbol, date) 문서를 정리하고
+기존 비고유 인덱스 symbol_1_date_1 을 삭제합니다.
+
+Beanie 초기화 시 symbol_date_unique 인덱스를 만들 때 동일 키의 기존 인덱스와
+충돌하므로, 앱이 Beanie를 초기화하기 전에 반드시 실행해야 합니다.
+Beanie 초기화는 create_fastapi_app 안에서 lifespan보다 먼저 일어나므로,
+컨테이너 시작 명령(Dockerfile CMD)이 uvicorn 실행 전에 이 모듈을 실행합니다.
+여러 번 실행해도 안전합니다.
+
+    python -m app.utils.migrate_price_indexes
+"""
+
+import asyncio
+import logging
+from typing import Any
+
+from pymongo.errors import OperationFailure
+
+logger = logging.getLogger(__name__)
+
+PRICE_COLLECTIONS = ("stock_price_daily", "stock_price_weekly", "stock_price_monthly")
+LEGACY_INDEX_NAME = "symbol_1_date_1"
+
+
+async def migrate_price_unique_indexes(database: Any) -> dict[str, int]:
+    """중복 문서 삭제 후 기존 인덱스 제거
+
+    같은 (symbol, date) 문서가 여러 개면 updated_at이 가장 최근인 문서만 남깁니다.
+
+    Returns:
+        컬렉션별 삭제된 중복 문서 수
+    """
+    removed: dict[str, int] = {}
+
+    for name in PRICE_COLLECTIONS:
+        collection = database[name]
+        duplicates = collection.aggregate(
+            [
+                {"$sort": {"updated_at": -1}},
+                {
+                    "$group": {
+                        "_id": {"symbol": "$symbol", "date": "$date"},
+                        "ids": {"$push": "$_id"},
+                        "count": {"$sum": 1},
+                    }
+                },
+                {"$match": {"count": {"$gt": 1}}},
+            ],
+            allowDiskUse=True,
+        )
+
+        stale_ids: list[Any] = []
+        async for group in duplicates:
+            stale_ids.extend(group["ids"][1:])
+
+        if stale_ids:
+            result = await collection.delete_many({"_id": {"$in": stale_ids}})
+            removed[name] = result.deleted_count
+        else:
+            removed[name] = 0
+
+        index_info = await collection.index_information()
+        if LEGACY_INDEX_NAME in index_info and not index_info[LEGACY_INDEX_NAME].get(
+            "unique"
+        ):
+            try:
+                await collection.drop_index(LEGACY_INDEX_NAME)
+                logger.info(f"Dropped legacy index {LEGACY_INDEX_NAME} on {name}")
+            except OperationFailure as e:
+                # 동시에 실행된 다른 프로세스가 이미 삭제한 경우
+                if e.code != 27:  # IndexNotFound
+                    raise
+
+        logger.info(f"✅ {name}: removed {removed[name]} duplicate price documents")
+
+    return removed
+
+
+async def main() -> None:
+    """서비스 MongoDB에 마이그레이션 실행 (앱 시작 전 1회)"""
+    from mysingle_quant.core import get_mongodb_url
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    from app.core.config import settings
+
+    client = AsyncIOMotorClient(get_mongodb_url(settings.SERVICE_NAME))
+    try:
+        removed = await migrate_price_unique_indexes(client["data_service"])
+    finally:
+        client.close()
+    logger.info(f"🧹 가격 인덱스 마이그레이션 완료: {removed}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
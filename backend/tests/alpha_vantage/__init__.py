@@ -0,0 +1 @@
+"""Alpha Vantage client tests."""
@@ -0,0 +1,104 @@
+"""Unit tests for :mod:`app.alpha_vantage.csv_format` and the client CSV path."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+import pyarrow as pa
+import pytest
+
+from app.alpha_vantage.client import AlphaVantageClient
+from app.alpha_vantage.csv_format import parse_time_series_csv
+from app.alpha_vantage.rate_limiter import RateLimiter
+
+DAILY_CSV = (
+    b"timestamp,open,high,low,close,adjusted_close,volume,dividend_amount,split_coefficient\r\n"
+    b"2024-01-03,184.22,185.88,183.43,184.25,183.73,58414460,0.0000,1.0\r\n"
+    b"2024-01-02,187.15,188.44,183.885,185.64,185.12,82488674,0.0000,1.0\r\n"
+)
+
+INTRADAY_CSV = (
+    b"timestamp,open,high,low,close,volume\r\n"
+    b"2024-01-02 09:35:00,187.20,187.50,187.00,187.40,120000\r\n"
+    b"2024-01-02 09:30:00,187.15,187.30,186.90,187.20,250000\r\n"
+)
+
+
+def test_daily_csv_is_parsed_into_typed_ascending_table() -> None:
+    table = parse_time_series_csv(DAILY_CSV)
+
+    assert table.column_names[0] == "date"
+    assert table.schema.field("date").type == pa.timestamp("s")
+    assert table.schema.field("close").type == pa.float64()
+    assert table.schema.field("volume").type == pa.int64()
+    assert table.column("date").to_pylist() == [
+        datetime(2024, 1, 2),
+        datetime(2024, 1, 3),
+    ]
+    assert table.column("adjusted_close").to_pylist() == [185.12, 183.73]
+
+
+def test_intraday_csv_uses_requested_time_column() -> None:
+    table = parse_time_series_csv(INTRADAY_CSV, time_column="datetime")
+
+    assert table.column("datetime").to_pylist()[0] == datetime(2024, 1, 2, 9, 30)
+    assert "adjusted_close" not in table.column_names
+
+
+def test_headers_with_spaces_are_normalized() -> None:
+    raw = b"timestamp,open,high,low,close,adjusted close,volume,dividend amount\n2024-01-05,1,2,0.5,1.5,1.4,10,0\n"
+
+    table = parse_time_series_csv(raw)
+
+    assert {"adjusted_close", "dividend_amount"} <= set(table.column_names)
+
+
+def test_body_without_timestamp_column_is_rejected() -> None:
+    with pytest.raises(ValueError, match="timestamp"):
+        parse_time_series_csv(b"symbol,open\nAAPL,1\n")
+
+
+class _Response:
+    def __init__(self, body: bytes):
+        self._body = body
+
+    async def __aenter__(self) -> _Response:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        return None
+
+    def raise_for_status(self) -> None:
+        return None
+
+    async def read(self) -> bytes:
+        return self._body
+
+
+class _Session:
+    closed = False
+
+    def __init__(self, bodies: list[bytes]):
+        self.bodies = bodies
+        self.params: list[dict[str, Any]] = []
+
+    def get(self, *_args: Any, params: dict[str, Any], **_kwargs: Any) -> _Response:
+        self.params.append(dict(params))
+        return _Response(self.bodies.pop(0))
+
+
+@pytest.mark.asyncio
+async def test_client_returns_table_and_handles_json_errors() -> None:
+    client = AlphaVantageClient(
+        api_key="test", rate_limiter=RateLimiter(requests_per_minute=6000, burst=5)
+    )
+    session = _Session([DAILY_CSV, b'{"Error Message": "Invalid API call."}'])
+    client.session = session  # type: ignore[assignment]
+
+    table = await client.stock.daily_adjusted_table("AAPL", outputsize="compact")
+    assert table.num_rows == 2
+    assert session.params[0]["datatype"] == "csv"
+
+    with pytest.raises(ValueError, match="Invalid API call"):
+        await client.stock.daily_adjusted_table("BAD")
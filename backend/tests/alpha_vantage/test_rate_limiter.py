@@ -0,0 +1,149 @@
+"""Unit tests for :mod:`app.alpha_vantage.rate_limiter`."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+
+import pytest
+
+from app.alpha_vantage.client import AlphaVantageClient
+from app.alpha_vantage.rate_limiter import (
+    RateLimiter,
+    RateLimitExceeded,
+    RequestPriority,
+    count_requests,
+    current_priority,
+    request_priority,
+)
+
+
+@pytest.mark.asyncio
+async def test_burst_is_immediate_then_queued() -> None:
+    limiter = RateLimiter(requests_per_minute=1200, burst=2)  # 20/s
+
+    assert await limiter.acquire() == 0.0
+    assert await limiter.acquire() == 0.0
+    waited = await limiter.acquire()
+
+    assert waited > 0
+    metrics = limiter.get_metrics()
+    assert metrics["priorities"]["interactive"]["acquired"] == 3
+    assert metrics["priorities"]["interactive"]["queued"] == 1
+
+
+@pytest.mark.asyncio
+async def test_count_requests_counts_granted_tokens_in_context() -> None:
+    limiter = RateLimiter(requests_per_minute=1200, burst=1)
+
+    async def refresh(requests: int) -> int:
+        with count_requests() as calls:
+            for _ in range(requests):
+                await limiter.acquire()
+        return calls.count
+
+    # 동시 실행 중인 다른 태스크의 요청은 섞이지 않음 (대기 후 획득한 토큰 포함)
+    assert await asyncio.gather(refresh(2), refresh(0), refresh(1)) == [2, 0, 1]
+
+
+@pytest.mark.asyncio
+async def test_higher_priority_is_served_first() -> None:
+    limiter = RateLimiter(requests_per_minute=1200, burst=1)
+    await limiter.acquire()
+    order: list[str] = []
+
+    async def call(name: str, priority: RequestPriority) -> None:
+        await limiter.acquire(priority)
+        order.append(name)
+
+    background = asyncio.create_task(call("background", RequestPriority.BACKGROUND))
+    backtest = asyncio.create_task(call("backtest", RequestPriority.BACKTEST))
+    await asyncio.sleep(0)
+    interactive = asyncio.create_task(call("interactive", RequestPriority.INTERACTIVE))
+    await asyncio.gather(background, backtest, interactive)
+
+    assert order == ["interactive", "backtest", "background"]
+
+
+@pytest.mark.asyncio
+async def test_rejections_are_counted() -> None:
+    limiter = RateLimiter(requests_per_minute=1, requests_per_day=2, burst=1)
+    await limiter.acquire()
+
+    with pytest.raises(RateLimitExceeded):
+        await limiter.acquire(RequestPriority.BACKGROUND, timeout=0.01)
+    limiter._day_count = 2  # 일일 한도 소진
+    with pytest.raises(RateLimitExceeded):
+        await limiter.acquire()
+
+    priorities = limiter.get_metrics()["priorities"]
+    assert priorities["background"]["rejected"] == 1
+    assert priorities["interactive"]["rejected"] == 1
+
+
+@pytest.mark.asyncio
+async def test_queued_waiters_respect_daily_quota() -> None:
+    limiter = RateLimiter(requests_per_minute=1200, requests_per_day=2, burst=1)
+    await limiter.acquire()
+
+    # 두 요청 모두 한도 확인을 통과한 뒤 대기열에서 토큰을 기다림 → 하나만 허용
+    results = await asyncio.gather(
+        limiter.acquire(timeout=1),
+        limiter.acquire(RequestPriority.BACKGROUND, timeout=1),
+        return_exceptions=True,
+    )
+
+    assert results[0] > 0
+    assert isinstance(results[1], RateLimitExceeded)
+    assert limiter.remaining_today() == 0
+    assert limiter.get_metrics()["priorities"]["background"]["rejected"] == 1
+
+
+def test_request_priority_context() -> None:
+    assert current_priority() is RequestPriority.INTERACTIVE
+    with request_priority(RequestPriority.BACKGROUND):
+        assert current_priority() is RequestPriority.BACKGROUND
+    assert current_priority() is RequestPriority.INTERACTIVE
+
+
+class _Response:
+    def __init__(self, payload: dict[str, Any]):
+        self._payload = payload
+
+    async def __aenter__(self) -> _Response:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        return None
+
+    def raise_for_status(self) -> None:
+        return None
+
+    async def read(self) -> bytes:
+        return json.dumps(self._payload).encode()
+
+
+class _Session:
+    closed = False
+
+    def __init__(self, payloads: list[dict[str, Any]]):
+        self.payloads = payloads
+
+    def get(self, *_args: Any, **_kwargs: Any) -> _Response:
+        return _Response(self.payloads.pop(0))
+
+
+@pytest.mark.asyncio
+async def test_client_waits_and_retries_after_limit_note() -> None:
+    limiter = RateLimiter(requests_per_minute=6000, burst=5)
+    client = AlphaVantageClient(api_key="test", rate_limiter=limiter)
+    client.LIMIT_BACKOFF_SECONDS = 0.01
+    client.session = _Session([{"Note": "Thank you for using Alpha Vantage!"}, {"ok": 1}])  # type: ignore[assignment]
+
+    assert await client._make_request({"function": "TIME_SERIES_DAILY"}) == {"ok": 1}
+    assert limiter.get_metrics()["throttled"] == 1
+
+    client.session = _Session([{"Note": "limit"}] * 3)  # type: ignore[assignment]
+    with pytest.raises(ValueError, match="API Limit"):
+        await client._make_request({"function": "TIME_SERIES_DAILY"})
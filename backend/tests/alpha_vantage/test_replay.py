@@ -0,0 +1,95 @@
+"""Unit tests for :mod:`app.alpha_vantage.replay`."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from app.alpha_vantage.client import AlphaVantageClient
+from app.alpha_vantage.rate_limiter import RateLimiter
+from app.alpha_vantage.replay import ReplayConfig, ReplayServer
+
+
+def _client(url: str) -> AlphaVantageClient:
+    return AlphaVantageClient(
+        api_key="replay",
+        rate_limiter=RateLimiter(requests_per_minute=60_000, burst=100),
+        base_url=url,
+    )
+
+
+@pytest.mark.asyncio
+async def test_fixtures_are_served_by_function_and_symbol(tmp_path: Path) -> None:
+    fixture = tmp_path / "OVERVIEW" / "AAPL.json"
+    fixture.parent.mkdir()
+    fixture.write_text(json.dumps({"Symbol": "AAPL", "Name": "Apple Inc"}))
+
+    async with ReplayServer(tmp_path, ReplayConfig(synthesize=False)) as server:
+        client = _client(server.url)
+        try:
+            overview = await client.fundamental.overview("AAPL")
+            with pytest.raises(ValueError, match="No replay fixture"):
+                await client.fundamental.overview("MSFT")
+        finally:
+            await client.close()
+
+    assert overview["name"] == "Apple Inc"
+    assert server.stats.fixtures == 1
+    assert server.stats.missing == 1
+
+
+@pytest.mark.asyncio
+async def test_synthesized_series_match_client_parsers() -> None:
+    async with ReplayServer(config=ReplayConfig(full_bars=30)) as server:
+        client = _client(server.url)
+        try:
+            daily = await client.stock.daily_adjusted("AAPL", outputsize="compact")
+            table = await client.stock.daily_adjusted_table("AAPL", outputsize="full")
+            rsi = await client.ti.rsi(
+                "AAPL", interval="daily", time_period=14, series_type="close"
+            )
+        finally:
+            await client.close()
+
+    assert len(daily) == 100
+    assert daily[0]["date"] < daily[-1]["date"]
+    assert {"adjusted_close", "split_coefficient"} <= set(daily[0])
+    assert table.num_rows == 30
+    assert "rsi" in rsi[0]
+    assert server.stats.by_function["TIME_SERIES_DAILY_ADJUSTED"] == 2
+
+
+@pytest.mark.asyncio
+async def test_injected_limit_notes_are_retried() -> None:
+    async with ReplayServer(config=ReplayConfig(limit_rate=0.5, seed=3)) as server:
+        client = _client(server.url)
+        client.LIMIT_BACKOFF_SECONDS = 0.01
+        client.LIMIT_RETRIES = 20
+        try:
+            for symbol in ("AAPL", "MSFT", "NVDA", "AMZN"):
+                assert await client.stock.quote(symbol)
+        finally:
+            await client.close()
+
+    assert server.stats.injected_limits > 0
+    assert server.stats.requests == 4 + server.stats.injected_limits
+
+
+@pytest.mark.asyncio
+async def test_bulk_quotes_return_one_entry_per_symbol() -> None:
+    async with ReplayServer() as server:
+        client = _client(server.url)
+        try:
+            quotes = await client.stock.bulk_quotes(["AAPL", "MSFT"])
+            single = await client.stock.quote("AAPL")
+            with pytest.raises(ValueError, match="at most 100"):
+                await client.stock.bulk_quotes([f"S{i}" for i in range(101)])
+        finally:
+            await client.close()
+
+    assert [quote["symbol"] for quote in quotes] == ["AAPL", "MSFT"]
+    assert quotes[0]["price"] == single["price"]
+    assert quotes[0]["latest_trading_day"] == single["latest_trading_day"]
+    assert server.stats.by_function["REALTIME_BULK_QUOTES"] == 1
@@ -0,0 +1,76 @@
+"""Unit tests for :mod:`app.alpha_vantage.transport`."""
+
+from __future__ import annotations
+
+import json
+import threading
+
+import pytest
+
+from app.alpha_vantage import transport
+from app.alpha_vantage.transport import (
+    TransportConfig,
+    TransportMetrics,
+    create_session,
+    decode_json,
+)
+
+
+@pytest.mark.asyncio
+async def test_large_payloads_are_decoded_off_the_loop(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    threads: list[str] = []
+
+    def _loads(raw: bytes) -> object:
+        threads.append(threading.current_thread().name)
+        return json.loads(raw)
+
+    monkeypatch.setattr(transport, "loads", _loads)
+    payload = {
+        "Time Series (Daily)": {
+            f"2024-01-{i:02d}": {"4. close": "1.0"} for i in range(1, 29)
+        }
+    }
+    raw = json.dumps(payload).encode()
+
+    assert await decode_json(raw, offload_bytes=len(raw) + 1) == payload
+    assert await decode_json(raw, offload_bytes=len(raw)) == payload
+    assert threads[0] == threading.current_thread().name
+    assert threads[1] != threading.current_thread().name
+
+
+@pytest.mark.asyncio
+async def test_session_uses_configured_pool_and_timeouts() -> None:
+    config = TransportConfig(
+        pool_size=8, pool_per_host=2, connect_timeout=1.5, total_timeout=9
+    )
+    session = create_session(config)
+    try:
+        assert session.connector is not None
+        assert session.connector.limit == 8
+        assert session.connector.limit_per_host == 2
+        assert session.timeout.connect == 1.5
+        assert session.timeout.total == 9
+    finally:
+        await session.close()
+
+
+def test_metrics_are_aggregated_per_endpoint() -> None:
+    metrics = TransportMetrics()
+    metrics.record("TIME_SERIES_DAILY", 100.0, 2_000, 1.0)
+    metrics.record("TIME_SERIES_DAILY", 300.0, 4_000, 3.0)
+    metrics.record("OVERVIEW", 50.0, failed=True)
+
+    snapshot = metrics.snapshot()
+
+    assert snapshot["TIME_SERIES_DAILY"] == {
+        "requests": 2,
+        "errors": 0,
+        "avg_latency_ms": 200.0,
+        "max_latency_ms": 300.0,
+        "avg_bytes": 3_000,
+        "max_bytes": 4_000,
+        "avg_decode_ms": 2.0,
+    }
+    assert snapshot["OVERVIEW"]["errors"] == 1
@@ -2,8 +2,23 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+
+import pytest
+
+from app.core.l1_cache import l1_cache
+
 pytest_plugins = [
     "backend.tests.shared.fixtures.api_fixtures",
     "backend.tests.shared.fixtures.db_fixtures",
     "backend.tests.shared.fixtures.mock_fixtures",
 ]
+
+
+@pytest.fixture(autouse=True)
+def _isolate_l1_cache() -> Iterator[None]:
+    """Keep the process-wide L1 cache from leaking entries between tests."""
+
+    l1_cache.clear()
+    yield
+    l1_cache.clear()
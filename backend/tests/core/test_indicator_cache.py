@@ -0,0 +1,146 @@
+"""Unit tests for :mod:`app.core.indicator_cache`."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import app.core.indicator_cache as cache_module
+from app.core.indicator_cache import IndicatorCache
+from app.services.ml_platform.infrastructure.feature_engineer.indicator_ma import (
+    MovingAverageCalculator,
+)
+from app.services.ml_platform.infrastructure.feature_engineer.indicator_rsi import (
+    RSICalculator,
+)
+from app.strategies.base_strategy import TechnicalIndicators
+
+
+class _MemoryStore:
+    """dict 기반 spill 저장소"""
+
+    def __init__(self) -> None:
+        self.rows: dict[str, bytes] = {}
+
+    def indicator_result_keys(self) -> list[str]:
+        return list(self.rows)
+
+    def load_indicator_result(self, key: str) -> bytes | None:
+        return self.rows.get(key)
+
+    def spill_indicator_results(self, rows: list[tuple[str, str, bytes]]) -> None:
+        self.rows.update((key, payload) for key, _, payload in rows)
+
+
+@pytest.fixture
+def shared_cache(monkeypatch: pytest.MonkeyPatch) -> Iterator[IndicatorCache]:
+    cache = IndicatorCache(max_elements=100_000)
+    monkeypatch.setattr(cache_module, "indicator_cache", cache)
+    yield cache
+
+
+def _close(rows: int = 120) -> pd.Series:
+    rng = np.random.default_rng(7)
+    values = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, rows)))
+    return pd.Series(values, index=pd.date_range("2024-01-01", periods=rows))
+
+
+def test_same_values_share_results_and_return_copies() -> None:
+    cache = IndicatorCache()
+    calls = []
+
+    def compute() -> dict[str, np.ndarray]:
+        calls.append(1)
+        return {"value": np.arange(3.0)}
+
+    first = cache.get_or_compute("test.X", [[1, 2, 3]], {"n": 2}, compute)
+    first["value"][0] = 99.0
+    second = cache.get_or_compute("test.X", [np.array([1.0, 2, 3])], {"n": 2}, compute)
+    cache.get_or_compute("test.X", [[1, 2, 3]], {"n": 3}, compute)
+
+    assert len(calls) == 2
+    np.testing.assert_array_equal(second["value"], [0.0, 1.0, 2.0])
+    assert cache.snapshot()["test.X"]["memory_hits"] == 1
+    assert cache.snapshot()["test.X"]["misses"] == 2
+
+
+def test_strategy_and_feature_engineer_share_entries(
+    shared_cache: IndicatorCache,
+) -> None:
+    close = _close()
+    frame = pd.DataFrame({"close": close.to_numpy()})  # 인덱스가 달라도 값으로 공유
+
+    sma = TechnicalIndicators.sma(close, 20)
+    rsi = TechnicalIndicators.rsi(close, 14)
+    features = RSICalculator(period=14).calculate(
+        MovingAverageCalculator(sma_periods=[20], ema_periods=[12]).calculate(frame)
+    )
+
+    stats = shared_cache.snapshot()
+    assert stats["pandas.SMA"]["memory_hits"] == 1
+    assert stats["pandas.RSI"]["memory_hits"] == 1
+    assert sma.index.equals(close.index)
+    np.testing.assert_allclose(features["sma_20"], sma, equal_nan=True)
+    np.testing.assert_allclose(features["rsi"], rsi, equal_nan=True)
+    # EMA는 adjust 여부가 달라 별도 키
+    np.testing.assert_allclose(
+        features["ema_12"], close.ewm(span=12, adjust=False).mean().to_numpy()
+    )
+    np.testing.assert_allclose(
+        TechnicalIndicators.ema(close, 12), close.ewm(span=12).mean()
+    )
+    assert stats["pandas.EMA"]["misses"] == 1
+
+
+def test_cached_multi_output_matches_direct_computation(
+    shared_cache: IndicatorCache,
+) -> None:
+    close = _close()
+
+    first = TechnicalIndicators.macd(close)
+    again = TechnicalIndicators.macd(close.copy())
+    bands = TechnicalIndicators.bollinger_bands(close, 20, 2)
+
+    assert list(first) == ["macd", "signal", "histogram"]
+    pd.testing.assert_series_equal(first["macd"], again["macd"])
+    pd.testing.assert_series_equal(
+        bands["upper"],
+        close.rolling(20).mean() + close.rolling(20).std() * 2,
+    )
+    assert shared_cache.snapshot()["pandas.MACD"]["memory_hits"] == 1
+
+
+def test_evicted_entries_spill_and_reload() -> None:
+    store = _MemoryStore()
+    cache = IndicatorCache(max_elements=10)
+    assert cache.attach_spill(store)
+
+    for start in range(3):
+        cache.get_or_compute(
+            "test.X", [[start]], {}, lambda: {"value": np.full(6, float(start))}
+        )
+    assert len(store.rows) == 2
+
+    reloaded = cache.get_or_compute(
+        "test.X", [[0]], {}, lambda: pytest.fail("spill에서 복원되어야 함")
+    )
+
+    np.testing.assert_array_equal(reloaded["value"], np.zeros(6))
+    stats = cache.snapshot()["test.X"]
+    assert stats["spill_hits"] == 1
+    # 복원된 항목이 들어오며 마지막 항목도 밀려나 spill
+    assert stats["spills"] == 3
+
+
+def test_non_numeric_inputs_are_computed_without_caching() -> None:
+    cache = IndicatorCache()
+
+    outputs = cache.get_or_compute(
+        "test.X", [["a", "b"]], {}, lambda: {"value": [1.0, 2.0]}
+    )
+
+    np.testing.assert_array_equal(outputs["value"], [1.0, 2.0])
+    assert cache.snapshot()["test.X"]["uncacheable"] == 1
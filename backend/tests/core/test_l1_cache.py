@@ -0,0 +1,112 @@
+"""Unit tests for :mod:`app.core.l1_cache`."""
+
+from __future__ import annotations
+
+import pytest
+
+import app.core.l1_cache as l1_module
+from app.core.l1_cache import L1Cache, parse_item_budgets
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    clock = _Clock()
+    monkeypatch.setattr(l1_module.time, "monotonic", clock)
+    return clock
+
+
+def test_hits_return_copies_until_ttl_expires(clock: _Clock) -> None:
+    cache = L1Cache(max_ttl_seconds=60)
+    cache.set("stock_quote", ("AAPL",), [1, 2], ttl_seconds=3600, symbol="AAPL")
+
+    hit, value = cache.get("stock_quote", ("AAPL",))
+    assert hit and value == [1, 2]
+    value.append(3)
+    assert cache.get("stock_quote", ("AAPL",)) == (True, [1, 2])
+
+    # TTL은 max_ttl_seconds로 제한됨
+    clock.now += 61
+    assert cache.get("stock_quote", ("AAPL",)) == (False, None)
+    assert cache.snapshot()["stock_quote"]["expirations"] == 1
+
+
+def test_empty_results_are_negative_cached_briefly(clock: _Clock) -> None:
+    cache = L1Cache(negative_ttl_seconds=5)
+    cache.set("news", ("TSLA",), [])
+
+    assert cache.get("news", ("TSLA",)) == (True, [])
+    clock.now += 6
+    assert cache.get("news", ("TSLA",)) == (False, None)
+
+    counters = cache.snapshot()["news"]
+    assert (counters["negative_hits"], counters["misses"]) == (1, 1)
+
+
+def test_budget_evicts_least_recently_used_rows(clock: _Clock) -> None:
+    cache = L1Cache(default_budget=100, budgets={"stock_daily": 5})
+    cache.set("stock_daily", "a", [0] * 2)
+    cache.set("stock_daily", "b", [0] * 2)
+    cache.get("stock_daily", "a")
+    cache.set("stock_daily", "c", [0] * 2)
+
+    assert cache.get("stock_daily", "b") == (False, None)
+    assert cache.get("stock_daily", "a")[0]
+    snapshot = cache.snapshot()["stock_daily"]
+    assert (snapshot["evictions"], snapshot["weight"], snapshot["budget"]) == (1, 4, 5)
+
+    # 예산보다 큰 값은 저장하지 않음
+    cache.set("stock_daily", "huge", [0] * 6)
+    assert cache.get("stock_daily", "huge") == (False, None)
+
+
+def test_invalidate_by_cache_key_and_symbol(clock: _Clock) -> None:
+    cache = L1Cache()
+    cache.set(
+        "stock_quote",
+        ("quote_AAPL", "AAPL"),
+        [1],
+        cache_key="quote_AAPL",
+        symbol="AAPL",
+    )
+    cache.set(
+        "stock_quote",
+        ("quote_MSFT", "MSFT"),
+        [1],
+        cache_key="quote_MSFT",
+        symbol="MSFT",
+    )
+    cache.set(
+        "fundamental",
+        ("overview_AAPL", "AAPL"),
+        [1],
+        cache_key="overview_AAPL",
+        symbol="AAPL",
+    )
+
+    assert cache.invalidate("stock_quote", cache_key="quote_MSFT") == 1
+    assert cache.invalidate(symbol="AAPL") == 2
+    assert cache.snapshot()["stock_quote"]["entries"] == 0
+    assert cache.snapshot()["fundamental"]["invalidations"] == 1
+
+
+def test_disabled_cache_never_stores() -> None:
+    cache = L1Cache(enabled=False)
+    cache.set("stock_quote", "AAPL", [1])
+
+    assert cache.get("stock_quote", "AAPL") == (False, None)
+    assert cache.snapshot() == {}
+
+
+def test_parse_item_budgets_skips_invalid_entries() -> None:
+    assert parse_item_budgets("stock_intraday=500000, news=2000,bad=x,") == {
+        "stock_intraday": 500_000,
+        "news": 2_000,
+    }
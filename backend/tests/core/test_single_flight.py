@@ -0,0 +1,95 @@
+"""Unit tests for :mod:`app.core.single_flight`."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.core.single_flight import SingleFlight, coalesce, single_flight_stats
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution() -> None:
+    flight = SingleFlight("test_share")
+    calls = 0
+
+    async def fetch() -> list[int]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return [calls]
+
+    results = await asyncio.gather(*(flight.do("AAPL", fetch) for _ in range(5)))
+
+    assert calls == 1
+    assert all(result is results[0] for result in results)
+    assert flight.get_stats() == {
+        "executions": 1,
+        "coalesced": 4,
+        "errors": 0,
+        "in_flight": 0,
+    }
+
+    # 완료 후에는 다시 실행 (결과를 캐시하지 않음)
+    assert await flight.do("AAPL", fetch) == [2]
+
+
+@pytest.mark.asyncio
+async def test_errors_propagate_to_all_waiters() -> None:
+    flight = SingleFlight("test_errors")
+
+    async def fail() -> None:
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream down")
+
+    results = await asyncio.gather(
+        *(flight.do("k", fail) for _ in range(3)), return_exceptions=True
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert flight.get_stats()["errors"] == 1
+    assert flight.in_flight() == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_cancel_waiters() -> None:
+    flight = SingleFlight("test_cancel")
+    release = asyncio.Event()
+
+    async def fetch() -> str:
+        await release.wait()
+        return "done"
+
+    leader = asyncio.create_task(flight.do("k", fetch))
+    follower = asyncio.create_task(flight.do("k", fetch))
+    await asyncio.sleep(0)
+    leader.cancel()
+    release.set()
+
+    assert await follower == "done"
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+
+@pytest.mark.asyncio
+async def test_coalesce_decorator_keys_by_arguments() -> None:
+    flight = SingleFlight("test_decorator")
+    calls: list[tuple[str, int]] = []
+
+    class Service:
+        @coalesce(flight)
+        async def get(self, symbol: str, period: int = 20) -> tuple[str, int]:
+            calls.append((symbol, period))
+            await asyncio.sleep(0.01)
+            return symbol, period
+
+    first, second = Service(), Service()
+    await asyncio.gather(
+        first.get("AAPL"),
+        second.get("AAPL", period=20),
+        first.get("AAPL", 50),
+    )
+
+    assert sorted(calls) == [("AAPL", 20), ("AAPL", 50)]
+    assert single_flight_stats()["test_decorator"]["coalesced"] == 1
@@ -74,11 +74,20 @@ def background_task_stub(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
     return task
 
 
+class _FakeAsyncManager:
+    async def run_read(self, _operation: str, func: Any, *args: Any) -> Any:
+        return func(*args)
+
+
 def _patch_database(monkeypatch: pytest.MonkeyPatch, count: int) -> None:
     conn = _FakeConnection(count)
     monkeypatch.setattr(
         "app.api.routes.ml_platform.train.service_factory.get_database_manager",
-        lambda: SimpleNamespace(duckdb_conn=conn),
+        lambda: SimpleNamespace(
+            duckdb_conn=conn,
+            thread_cursor=lambda: conn,
+            async_manager=_FakeAsyncManager(),
+        ),
     )
 
 
@@ -117,7 +126,9 @@ async def test_train_model_returns_not_found_when_symbol_missing(
 
 
 @pytest.mark.asyncio
-async def test_list_models_uses_registry(async_client, auth_headers, fake_registry) -> None:
+async def test_list_models_uses_registry(
+    async_client, auth_headers, fake_registry
+) -> None:
     response = await async_client.get(
         "/api/v1/ml/train/models",
         headers=auth_headers,
@@ -129,7 +140,9 @@ async def test_list_models_uses_registry(async_client, auth_headers, fake_regist
 
 
 @pytest.mark.asyncio
-async def test_get_model_info_returns_metadata(async_client, auth_headers, fake_registry) -> None:
+async def test_get_model_info_returns_metadata(
+    async_client, auth_headers, fake_registry
+) -> None:
     response = await async_client.get(
         "/api/v1/ml/train/models/v1",
         headers=auth_headers,
@@ -140,7 +153,9 @@ async def test_get_model_info_returns_metadata(async_client, auth_headers, fake_
 
 
 @pytest.mark.asyncio
-async def test_delete_model_marks_version(async_client, auth_headers, fake_registry) -> None:
+async def test_delete_model_marks_version(
+    async_client, auth_headers, fake_registry
+) -> None:
     response = await async_client.delete(
         "/api/v1/ml/train/models/v1",
         headers=auth_headers,
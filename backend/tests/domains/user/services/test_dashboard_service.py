@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
+from decimal import Decimal
 from types import SimpleNamespace
 from typing import Any, Dict, Tuple
 
@@ -31,6 +32,7 @@ from app.schemas.user.dashboard import (
     NewsFeed,
     EconomicCalendar,
 )
+from app.schemas.market_data.stock import QuoteData
 from app.schemas.ml_platform.predictive import (
     ForecastPercentileBand,
     MLSignalInsight,
@@ -322,7 +324,9 @@ async def test_get_portfolio_performance_delegates_to_portfolio_service(
     )
     deps["portfolio"].get_portfolio_performance.return_value = performance
 
-    result = await service.get_portfolio_performance("user", period="1M", granularity="day")
+    result = await service.get_portfolio_performance(
+        "user", period="1M", granularity="day"
+    )
 
     assert result is performance
     deps["portfolio"].get_portfolio_performance.assert_awaited_once_with(
@@ -382,7 +386,9 @@ async def test_get_predictive_snapshot_refreshes_stale_regime(
     )
     deps["portfolio"].get_probabilistic_forecast.return_value = forecast
 
-    snapshot = await service.get_predictive_snapshot("user", symbol="AAPL", horizon_days=30)
+    snapshot = await service.get_predictive_snapshot(
+        "user", symbol="AAPL", horizon_days=30
+    )
 
     assert isinstance(snapshot, PredictiveDashboardInsights)
     assert snapshot.signal == signal
@@ -421,7 +427,8 @@ async def test_get_strategy_comparison_sorts_by_return(
     randint_values = iter([150, 10, 200, 20, 250, 30])
 
     monkeypatch.setattr(
-        "app.services.user.dashboard_service.random.choice", lambda seq: next(choice_values)
+        "app.services.user.dashboard_service.random.choice",
+        lambda seq: next(choice_values),
     )
     monkeypatch.setattr(
         "app.services.user.dashboard_service.random.uniform",
@@ -432,7 +439,9 @@ async def test_get_strategy_comparison_sorts_by_return(
         lambda a, b: next(randint_values),
     )
 
-    comparison = await service.get_strategy_comparison("user", limit=3, sort_by="return")
+    comparison = await service.get_strategy_comparison(
+        "user", limit=3, sort_by="return"
+    )
 
     assert isinstance(comparison, StrategyComparison)
     returns = [item.total_return for item in comparison.strategies]
@@ -466,7 +475,8 @@ async def test_get_strategy_comparison_sorts_by_sharpe(
     randint_values = iter([150, 10, 200, 20, 250, 30])
 
     monkeypatch.setattr(
-        "app.services.user.dashboard_service.random.choice", lambda seq: next(choice_values)
+        "app.services.user.dashboard_service.random.choice",
+        lambda seq: next(choice_values),
     )
     monkeypatch.setattr(
         "app.services.user.dashboard_service.random.uniform",
@@ -477,48 +487,72 @@ async def test_get_strategy_comparison_sorts_by_sharpe(
         lambda a, b: next(randint_values),
     )
 
-    comparison = await service.get_strategy_comparison("user", limit=3, sort_by="sharpe")
+    comparison = await service.get_strategy_comparison(
+        "user", limit=3, sort_by="sharpe"
+    )
 
     sharpes = [item.sharpe_ratio for item in comparison.strategies]
     assert sharpes == [1.5, 1.1, 0.8]
 
 
 @pytest.mark.asyncio
-async def test_get_watchlist_quotes_generates_deterministic_payload(
+async def test_get_watchlist_quotes_batches_watchlist_symbols(
     service_with_mocks: Tuple[DashboardService, Dict[str, Any]],
-    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    """Watchlist quotes should expose consistent market data snapshots."""
+    """Watchlist quotes should come from one batched lookup over all watchlists."""
 
     service, _ = service_with_mocks
+    service.watchlist_service.list_watchlists = AsyncMock(
+        return_value=[
+            SimpleNamespace(symbols=["AAPL", "msft"]),
+            SimpleNamespace(symbols=["MSFT", "BAD"]),
+        ]
+    )
+    quote = QuoteData(
+        symbol="AAPL",
+        timestamp=datetime(2024, 1, 2),
+        price=Decimal("180.5"),
+        change=Decimal("2.5"),
+        change_percent=Decimal("1.4"),
+        volume=1_000_000,
+    )
+    get_quotes = AsyncMock(
+        return_value={
+            "AAPL": quote,
+            "MSFT": quote.model_copy(update={"symbol": "MSFT", "change": None}),
+            "BAD": None,
+        }
+    )
+    service.market_data_service.stock = SimpleNamespace(get_real_time_quotes=get_quotes)
+    service._get_company_profiles = AsyncMock(  # type: ignore[method-assign]
+        return_value={"AAPL": ("Apple Inc.", 3e12)}
+    )
 
-    change_values = iter([5.0, -2.5, 3.0, 0.0, 1.5])
-    volume_values = iter([1_000_000, 2_000_000, 3_000_000, 4_000_000, 5_000_000])
-    market_cap_values = iter([100, 200, 150, 180, 220])
+    quotes = await service.get_watchlist_quotes("user-1")
 
-    monkeypatch.setattr(
-        "app.services.user.dashboard_service.random.uniform",
-        lambda a, b: next(change_values),
-    )
+    get_quotes.assert_awaited_once_with(["AAPL", "MSFT", "BAD"])
+    assert [item.symbol for item in quotes.symbols] == ["AAPL", "MSFT"]
+    first, second = quotes.symbols
+    assert (first.name, first.current_price, first.change) == ("Apple Inc.", 180.5, 2.5)
+    assert first.market_cap == 3e12
+    assert (second.name, second.change, second.market_cap) == ("MSFT", 0.0, None)
 
-    def _deterministic_randint(a: int, b: int) -> int:
-        if b == 50_000_000:
-            return next(volume_values)
-        return next(market_cap_values)
 
-    monkeypatch.setattr(
-        "app.services.user.dashboard_service.random.randint", _deterministic_randint
-    )
+@pytest.mark.asyncio
+async def test_get_watchlist_quotes_falls_back_to_default_symbols(
+    service_with_mocks: Tuple[DashboardService, Dict[str, Any]],
+) -> None:
+    service, _ = service_with_mocks
+    service.watchlist_service.list_watchlists = AsyncMock(return_value=[])
+    service.watchlist_service.get_default_symbols = AsyncMock(return_value=["SPY"])
+    get_quotes = AsyncMock(return_value={"SPY": None})
+    service.market_data_service.stock = SimpleNamespace(get_real_time_quotes=get_quotes)
+    service._get_company_profiles = AsyncMock(return_value={})  # type: ignore[method-assign]
 
     quotes = await service.get_watchlist_quotes("user-1")
 
-    assert isinstance(quotes.symbols, list)
-    assert len(quotes.symbols) == 5
-    first = quotes.symbols[0]
-    assert first.symbol == "AAPL"
-    assert first.change == 5.0
-    assert first.volume == 1_000_000
-    assert first.market_cap == 100 * 1e9
+    get_quotes.assert_awaited_once_with(["SPY"])
+    assert quotes.symbols == []
 
 
 @pytest.mark.asyncio
@@ -618,4 +652,3 @@ async def test_get_recent_activity_returns_recent_snapshot(
     assert activity.trades_count_today == 15
     assert activity.backtests_count_week == 3
     assert activity.last_login.year == 2023
-
@@ -0,0 +1,64 @@
+"""Unit tests for :mod:`app.services.market_data.indicators.base`."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.database_manager import DatabaseManager
+from app.services.market_data.indicators.base import BaseIndicatorService
+
+
+@pytest.fixture
+def db_manager(tmp_path: Path) -> Iterator[DatabaseManager]:
+    manager = DatabaseManager(
+        db_path=str(tmp_path / "quant.duckdb"),
+        reader_threads=2,
+        price_store_path=str(tmp_path / "store"),
+    )
+    manager.connect()
+    try:
+        yield manager
+    finally:
+        manager.shutdown()
+
+
+def _store_daily(
+    db_manager: DatabaseManager, symbol: str, days: pd.DatetimeIndex
+) -> None:
+    close = np.linspace(100.0, 120.0, len(days))
+    db_manager.upsert_daily_prices(
+        pd.DataFrame(
+            {
+                "symbol": symbol,
+                "open": close,
+                "high": close * 1.01,
+                "low": close * 0.99,
+                "close": close,
+                "adjusted_close": close,
+                "volume": 1_000,
+            },
+            index=days.rename("date"),
+        )
+    )
+
+
+def test_local_rows_require_up_to_date_prices(db_manager: DatabaseManager) -> None:
+    today = pd.Timestamp(datetime.now(UTC).date())
+    _store_daily(db_manager, "FRESH", pd.bdate_range(end=today, periods=60))
+    # 마지막 봉이 일주일 전 → 여러 거래일 뒤처짐
+    week_ago = today - pd.Timedelta(days=7)
+    _store_daily(db_manager, "STALE", pd.bdate_range(end=week_ago, periods=60))
+    service = BaseIndicatorService(db_manager)
+    params = {"time_period": 14}
+
+    fresh = service._compute_local_rows("FRESH", "SMA", "daily", params)
+    stale = service._compute_local_rows("STALE", "SMA", "daily", params)
+
+    assert fresh is not None and len(fresh[0]) == 60
+    assert stale is None
@@ -0,0 +1,156 @@
+"""Unit tests for :mod:`app.services.market_data.indicators.batch`."""
+
+from __future__ import annotations
+
+import io
+from collections.abc import Iterator
+from datetime import timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from app.services.database_manager import DatabaseManager
+from app.services.market_data.indicators import engine
+from app.services.market_data.indicators.batch import BatchIndicatorService
+
+SPECS = [
+    {"indicator": "rsi", "time_period": 14},
+    {"indicator": "MACD"},
+    {"indicator": "ATR", "time_period": 14, "name": "atr"},
+]
+
+
+@pytest.fixture
+def db_manager(tmp_path: Path) -> Iterator[DatabaseManager]:
+    manager = DatabaseManager(
+        db_path=str(tmp_path / "quant.duckdb"),
+        reader_threads=2,
+        price_store_path=str(tmp_path / "store"),
+    )
+    manager.connect()
+    try:
+        yield manager
+    finally:
+        manager.shutdown()
+
+
+def _daily_frame(symbol: str, index: pd.DatetimeIndex, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = np.round(100 * np.exp(np.cumsum(rng.normal(0, 0.02, len(index)))), 2)
+    return pd.DataFrame(
+        {
+            "symbol": symbol,
+            "open": close,
+            "high": close * 1.01,
+            "low": close * 0.99,
+            "close": close,
+            "adjusted_close": close,
+            "volume": 1_000,
+        },
+        index=index.rename("date"),
+    )
+
+
+@pytest.fixture
+def frames(db_manager: DatabaseManager) -> dict[str, pd.DataFrame]:
+    days = pd.bdate_range("2023-01-02", periods=200)
+    frames = {
+        "AAPL": _daily_frame("AAPL", days, seed=1),
+        # 늦게 상장 + 하루 거래 정지 → 달력이 다른 심볼
+        "MSFT": _daily_frame("MSFT", days[60:].delete(40), seed=2),
+    }
+    for frame in frames.values():
+        db_manager.upsert_daily_prices(frame)
+    return frames
+
+
+@pytest.mark.asyncio
+async def test_batch_matches_single_symbol_engine(
+    db_manager: DatabaseManager, frames: dict[str, pd.DataFrame]
+) -> None:
+    service = BatchIndicatorService(db_manager)
+
+    batch = await service.compute(["aapl", "MSFT", "NVDA"], SPECS)
+    table = batch.to_table()
+
+    assert table.column_names == [
+        "date",
+        "symbol",
+        "RSI(time_period=14)",
+        "MACD().macd",
+        "MACD().signal",
+        "MACD().histogram",
+        "atr",
+    ]
+    for symbol, frame in frames.items():
+        rows = table.filter(pa.compute.equal(table["symbol"], symbol))
+        assert rows.num_rows == len(frame)
+        np.testing.assert_allclose(
+            rows.column("RSI(time_period=14)").to_numpy(zero_copy_only=False),
+            engine.rsi(frame["close"].to_numpy(), 14),
+            equal_nan=True,
+        )
+        expected_atr = engine.atr(
+            frame["high"].to_numpy(), frame["low"].to_numpy(), frame["close"].to_numpy()
+        )
+        np.testing.assert_allclose(
+            rows.column("atr").to_numpy(zero_copy_only=False),
+            expected_atr,
+            equal_nan=True,
+        )
+    assert "NVDA" not in table.column("symbol").to_pylist()
+
+
+@pytest.mark.asyncio
+async def test_limit_and_start_trim_output_only(
+    db_manager: DatabaseManager, frames: dict[str, pd.DataFrame]
+) -> None:
+    service = BatchIndicatorService(db_manager)
+    start = frames["AAPL"].index[150].to_pydatetime()
+
+    batch = await service.compute(["AAPL", "MSFT"], SPECS[:1], start=start)
+    data = b"".join(batch.iter_ipc_stream(limit=3))
+    table = pa.ipc.open_stream(io.BytesIO(data)).read_all()
+
+    assert table.num_rows == 6
+    aapl = table.filter(pa.compute.equal(table["symbol"], "AAPL"))
+    expected = engine.rsi(frames["AAPL"]["close"].to_numpy(), 14)[-3:]
+    np.testing.assert_allclose(
+        aapl.column("RSI(time_period=14)").to_numpy(zero_copy_only=False), expected
+    )
+
+
+@pytest.mark.asyncio
+async def test_timezone_aware_bounds_are_converted_to_utc(
+    db_manager: DatabaseManager, frames: dict[str, pd.DataFrame]
+) -> None:
+    service = BatchIndicatorService(db_manager)
+    start = frames["AAPL"].index[150].to_pydatetime()
+    end = frames["AAPL"].index[180].to_pydatetime()
+    eastern = timezone(timedelta(hours=-5))
+
+    naive = await service.compute(["AAPL"], SPECS, start=start, end=end)
+    aware = await service.compute(
+        ["AAPL"],
+        SPECS,
+        start=start.replace(tzinfo=timezone.utc).astimezone(eastern),
+        end=end.replace(tzinfo=timezone.utc).astimezone(eastern),
+    )
+
+    assert aware.to_table().equals(naive.to_table())
+    assert len(naive.index) == 31
+
+
+@pytest.mark.asyncio
+async def test_rejects_unsupported_requests(db_manager: DatabaseManager) -> None:
+    service = BatchIndicatorService(db_manager)
+
+    with pytest.raises(ValueError):
+        await service.compute(["AAPL"], [{"indicator": "VWAP"}])
+    with pytest.raises(ValueError):
+        await service.compute(["AAPL"], SPECS, interval="weekly")
+    with pytest.raises(ValueError):
+        await service.compute(["AAPL"], [{"indicator": "SMA"}, {"indicator": "SMA"}])
@@ -0,0 +1,116 @@
+"""Unit tests for :mod:`app.services.market_data.indicators.engine`."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from app.services.market_data.indicators import engine
+
+
+def _walk(rows: int = 300, seed: int = 3) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, rows)))
+    high = close * (1 + rng.uniform(0, 0.02, rows))
+    low = close * (1 - rng.uniform(0, 0.02, rows))
+    return high, low, close
+
+
+def test_moving_averages_match_hand_computed_values() -> None:
+    values = np.arange(1.0, 7.0)
+
+    np.testing.assert_allclose(
+        engine.sma(values, 3), [np.nan, np.nan, 2, 3, 4, 5], equal_nan=True
+    )
+    np.testing.assert_allclose(
+        engine.wma(values, 3),
+        [np.nan, np.nan, 14 / 6, 20 / 6, 26 / 6, 32 / 6],
+        equal_nan=True,
+    )
+    # 첫 3개 평균(2)으로 시작, k = 0.5
+    np.testing.assert_allclose(
+        engine.ema(values[:5], 3), [np.nan, np.nan, 2, 3, 4], equal_nan=True
+    )
+
+
+def test_lookback_matches_first_valid_row() -> None:
+    high, low, close = _walk()
+    prices = {"high": high, "low": low, "close": close}
+    cases = {
+        "SMA": {"time_period": 10},
+        "DEMA": {"time_period": 10},
+        "TEMA": {"time_period": 10},
+        "MACD": {"fastperiod": 12, "slowperiod": 26, "signalperiod": 9},
+        "RSI": {"time_period": 14},
+        "STOCH": {"fastkperiod": 14, "slowkperiod": 3, "slowdperiod": 3},
+        "BBANDS": {"time_period": 20},
+        "ATR": {"time_period": 14},
+        "ADX": {"time_period": 14},
+    }
+    for indicator, parameters in cases.items():
+        outputs = engine.compute(indicator, prices, parameters)
+        expected = engine.lookback(indicator, parameters)
+        for name, values in outputs.items():
+            first = int(np.argmax(np.isfinite(values)))
+            assert first == expected, (indicator, name)
+            assert np.isfinite(values[first:]).all(), (indicator, name)
+
+
+def test_macd_histogram_and_period_order() -> None:
+    _, _, close = _walk()
+
+    line, signal, hist = engine.macd(close, 12, 26, 9)
+    swapped = engine.macd(close, 26, 12, 9)
+
+    np.testing.assert_allclose(hist, line - signal, equal_nan=True)
+    np.testing.assert_allclose(swapped[0], line, equal_nan=True)
+
+
+def test_bounded_oscillators_on_trending_and_flat_series() -> None:
+    rising = np.arange(1.0, 41.0)
+    flat = np.full(40, 10.0)
+
+    assert np.nanmin(engine.rsi(rising, 14)) == 100.0
+    # 변동이 없으면 TA-Lib과 같이 0
+    assert np.nanmax(engine.rsi(flat, 14)) == 0.0
+
+    slow_k, slow_d = engine.stoch(rising + 0.5, rising - 0.5, rising + 0.5, 5, 3, 3)
+    np.testing.assert_allclose(slow_k[~np.isnan(slow_k)], 100.0)
+    np.testing.assert_allclose(slow_d[~np.isnan(slow_d)], 100.0)
+
+
+def test_volatility_indicators_on_constant_range() -> None:
+    close = np.full(60, 50.0)
+
+    atr = engine.atr(close + 1, close - 1, close, 14)
+    upper, middle, lower = engine.bbands(close, 20, 2, 2)
+
+    np.testing.assert_allclose(atr[14:], 2.0)
+    np.testing.assert_allclose(upper[19:], 50.0)
+    np.testing.assert_allclose(lower[19:], 50.0)
+    np.testing.assert_allclose(middle[19:], 50.0)
+
+
+def test_panel_columns_with_late_listing_match_single_series() -> None:
+    _, _, close = _walk()
+    late = np.r_[np.full(40, np.nan), close[:-40]]
+    panel = np.column_stack([close, late, np.full(len(close), np.nan)])
+
+    for indicator in ("EMA", "TEMA", "RSI", "MACD", "WMA"):
+        outputs = engine.compute(indicator, {"close": panel}, {"time_period": 10})
+        single = engine.compute(indicator, {"close": close[:-40]}, {"time_period": 10})
+        for name, values in outputs.items():
+            assert values.shape == panel.shape
+            np.testing.assert_allclose(values[40:, 1], single[name], equal_nan=True)
+            assert np.isnan(values[:, 2]).all()
+
+
+def test_registry_parameters() -> None:
+    assert engine.required_inputs("SMA", {"series_type": "high"}) == ["high"]
+    assert engine.required_inputs("ATR", {}) == ["high", "low", "close"]
+    assert engine.supports("STOCH", {"slowkmatype": 0, "slowdmatype": 0})
+    assert not engine.supports("STOCH", {"slowkmatype": 1})
+    assert not engine.supports("VWAP", {})
+
+    with pytest.raises(ValueError):
+        engine.compute("BBANDS", {"close": np.ones(30)}, {"matype": 1})
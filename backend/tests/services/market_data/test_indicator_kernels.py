@@ -0,0 +1,78 @@
+"""Unit tests for :mod:`app.services.market_data.indicators.kernels`."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import app.services.market_data.indicators.kernels as kernels
+from app.services.market_data.indicators import engine
+
+
+@pytest.fixture(params=["lfilter", "blocked", "rows"])
+def path(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """SciPy / NumPy 블록 / 행 단위 경로를 각각 강제"""
+    if request.param == "lfilter" and kernels.lfilter is None:
+        pytest.skip("SciPy 미설치")
+    if request.param == "blocked":
+        monkeypatch.setattr(kernels, "lfilter", None)
+    if request.param == "rows":
+        monkeypatch.setattr(kernels, "_WIDE_COLUMNS", 1)
+    return request.param
+
+
+def _reference(x: np.ndarray, alpha: float, start: int, seed: np.ndarray) -> np.ndarray:
+    out = np.full(x.shape, np.nan)
+    out[start] = seed
+    for t in range(start + 1, len(x)):
+        out[t] = (1 - alpha) * out[t - 1] + alpha * x[t]
+    return out
+
+
+def test_matches_row_recursion_across_blocks(path: str) -> None:
+    x = np.random.default_rng(1).normal(100, 5, (300, 4))
+    seed = x[:10].mean(axis=0)
+
+    np.testing.assert_allclose(
+        kernels.recursive_filter(x, 0.2, 9, seed),
+        _reference(x, 0.2, 9, seed),
+        rtol=1e-12,
+        equal_nan=True,
+    )
+
+
+def test_missing_inputs_poison_only_later_rows(path: str) -> None:
+    x = np.random.default_rng(2).normal(100, 5, (200, 3))
+    x[150, 1] = np.nan
+    x[80, 2] = np.inf
+    seed = x[:5].mean(axis=0)
+
+    out = kernels.recursive_filter(x, 0.1, 4, seed)
+
+    np.testing.assert_allclose(out[:, 0], _reference(x, 0.1, 4, seed)[:, 0])
+    assert np.isfinite(out[4:150, 1]).all() and np.isnan(out[150:, 1]).all()
+    assert np.isfinite(out[4:80, 2]).all() and np.isnan(out[80:, 2]).all()
+
+
+def test_long_slow_filter_stays_accurate(path: str) -> None:
+    x = 1e4 + np.cumsum(np.random.default_rng(3).normal(0, 1, (20_000, 2)), axis=0)
+    seed = x[:200].mean(axis=0)
+
+    out = kernels.recursive_filter(x, 1 / 200, 199, seed)
+
+    np.testing.assert_allclose(out, _reference(x, 1 / 200, 199, seed), rtol=1e-11)
+
+
+def test_engine_indicators_agree_across_paths(monkeypatch: pytest.MonkeyPatch) -> None:
+    rng = np.random.default_rng(4)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, (400, 3)), axis=0))
+    prices = {"high": close * 1.01, "low": close * 0.99, "close": close}
+    cases = [("TEMA", {}), ("MACD", {}), ("RSI", {}), ("ADX", {})]
+    expected = {name: engine.compute(name, prices, params) for name, params in cases}
+
+    monkeypatch.setattr(kernels, "_WIDE_COLUMNS", 1)
+    for name, params in cases:
+        for output, values in engine.compute(name, prices, params).items():
+            np.testing.assert_allclose(
+                values, expected[name][output], rtol=1e-9, atol=1e-9, equal_nan=True
+            )
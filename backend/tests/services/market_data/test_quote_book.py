@@ -0,0 +1,102 @@
+"""Unit tests for :mod:`app.services.market_data.stock.quotes`."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from app.schemas.market_data.stock import QuoteData
+from app.services.market_data.stock.quotes import QuoteBook
+
+
+def _quote(symbol: str) -> QuoteData:
+    return QuoteData(symbol=symbol, timestamp=datetime(2024, 1, 2), price=Decimal("10"))
+
+
+class _Upstream:
+    """Bulk quote endpoint stub that records every requested chunk."""
+
+    def __init__(self, unknown: frozenset[str] = frozenset()) -> None:
+        self.calls: list[list[str]] = []
+        self.unknown = unknown
+
+    async def __call__(self, symbols: list[str]) -> dict[str, QuoteData | None]:
+        self.calls.append(symbols)
+        await asyncio.sleep(0.01)
+        return {s: None if s in self.unknown else _quote(s) for s in symbols}
+
+
+@pytest.mark.asyncio
+async def test_overlapping_watchlists_share_upstream_calls() -> None:
+    book = QuoteBook(ttl_seconds=60)
+    upstream = _Upstream()
+    universe = [f"SYM{i}" for i in range(60)]
+    rng = random.Random(7)
+    watchlists = [rng.sample(universe, 30) for _ in range(50)]
+
+    results = await asyncio.gather(
+        *(book.get_many(symbols, upstream) for symbols in watchlists)
+    )
+
+    # 50명 × 30개 심볼 (1,500건) → 심볼 60개가 업스트림에서 한 번씩만 조회됨
+    fetched = [symbol for call in upstream.calls for symbol in call]
+    assert sorted(fetched) == sorted(universe)
+    assert len(upstream.calls) == 7
+    assert all(len(result) == 30 and all(result.values()) for result in results)
+
+    await book.get_many(universe, upstream)
+    assert len(upstream.calls) == 7
+    assert book.get_stats()["hits"] == 60
+
+
+@pytest.mark.asyncio
+async def test_missing_symbols_are_chunked_and_negative_cached() -> None:
+    book = QuoteBook(ttl_seconds=60, batch_size=100)
+    upstream = _Upstream(unknown=frozenset({"BAD"}))
+    symbols = [f"S{i}" for i in range(230)] + ["bad", "S0"]
+
+    quotes = await book.get_many(symbols, upstream)
+
+    assert [len(call) for call in upstream.calls] == [100, 100, 31]
+    assert list(quotes)[:2] == ["S0", "S1"] and len(quotes) == 231
+    assert quotes["BAD"] is None
+
+    assert (await book.get_many(["BAD"], upstream))["BAD"] is None
+    assert len(upstream.calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_fetch_returns_none_and_is_retried() -> None:
+    book = QuoteBook(ttl_seconds=60)
+    calls = 0
+
+    async def flaky(symbols: list[str]) -> dict[str, QuoteData]:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RuntimeError("upstream down")
+        return {s: _quote(s) for s in symbols}
+
+    assert await book.get_many(["AAPL"], flaky) == {"AAPL": None}
+    assert (await book.get_many(["AAPL"], flaky))["AAPL"] == _quote("AAPL")
+
+
+@pytest.mark.asyncio
+async def test_symbols_left_out_of_the_result_are_retried() -> None:
+    book = QuoteBook(ttl_seconds=60)
+    calls: list[list[str]] = []
+
+    async def fallback(symbols: list[str]) -> dict[str, QuoteData | None]:
+        # 첫 조회에서 MSFT 단건 조회가 일시적으로 실패 → 결과에서 빠짐
+        calls.append(symbols)
+        return {s: _quote(s) for s in symbols if len(calls) > 1 or s != "MSFT"}
+
+    assert (await book.get_many(["AAPL", "MSFT"], fallback))["MSFT"] is None
+    quotes = await book.get_many(["AAPL", "MSFT"], fallback)
+
+    assert quotes["MSFT"] == _quote("MSFT")
+    assert calls == [["AAPL", "MSFT"], ["MSFT"]]
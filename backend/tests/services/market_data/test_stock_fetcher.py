@@ -0,0 +1,117 @@
+"""Unit tests for the CSV path of :class:`StockFetcher`."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.alpha_vantage.csv_format import parse_time_series_csv
+from app.services.database_manager import DatabaseManager
+from app.services.market_data.stock.fetcher import StockFetcher
+
+DAILY_CSV = (
+    b"timestamp,open,high,low,close,adjusted_close,volume,dividend_amount,split_coefficient\r\n"
+    b"2024-01-04,182.15,183.09,180.88,181.91,181.40,71983570,0.0000,1.0\r\n"
+    b"2024-01-03,184.22,185.88,183.43,184.25,183.73,58414460,0.0000,1.0\r\n"
+    b"2024-01-02,187.15,188.44,183.885,185.64,185.12,82488674,0.0000,1.0\r\n"
+)
+
+
+@pytest.fixture
+def db_manager() -> Iterator[DatabaseManager]:
+    manager = DatabaseManager(db_path=":memory:", reader_threads=2)
+    manager.connect()
+    try:
+        yield manager
+    finally:
+        manager.shutdown()
+
+
+@pytest.fixture
+def fetcher(db_manager: DatabaseManager) -> StockFetcher:
+    fetcher = StockFetcher(db_manager)
+    table = parse_time_series_csv(DAILY_CSV)
+    fetcher._alpha_vantage_client = SimpleNamespace(  # type: ignore[assignment]
+        stock=SimpleNamespace(daily_adjusted_table=AsyncMock(return_value=table))
+    )
+    return fetcher
+
+
+@pytest.mark.asyncio
+async def test_daily_prices_are_bulk_loaded_into_local_store(
+    fetcher: StockFetcher, db_manager: DatabaseManager
+) -> None:
+    prices = await fetcher.fetch_daily_prices("AAPL", outputsize="full")
+
+    assert [price["date"] for price in prices] == [  # type: ignore[index]
+        datetime(2024, 1, 2),
+        datetime(2024, 1, 3),
+        datetime(2024, 1, 4),
+    ]
+    assert prices[0]["symbol"] == "AAPL"  # type: ignore[index]
+    assert prices[0]["source"] == "alpha_vantage"  # type: ignore[index]
+
+    stored = db_manager.duckdb_conn.execute(
+        "SELECT COUNT(*), CAST(MAX(close) AS DOUBLE) FROM daily_prices WHERE symbol = 'AAPL'"
+    ).fetchone()
+    assert stored == (3, 185.64)
+
+
+@pytest.mark.asyncio
+async def test_historical_records_are_filtered_by_date(fetcher: StockFetcher) -> None:
+    result = await fetcher.fetch_historical(
+        "AAPL", start_date=datetime(2024, 1, 3), end_date=datetime(2024, 1, 3)
+    )
+
+    assert result["data_points"] == 1
+    record = result["records"][0]
+    assert record["date"] == datetime(2024, 1, 3)
+    assert record["volume"] == 58414460
+    assert "symbol" not in record
+
+
+@pytest.mark.asyncio
+async def test_invalid_symbol_does_not_fail_bulk_quotes(fetcher: StockFetcher) -> None:
+    bulk_quotes = AsyncMock(
+        return_value=[
+            {"symbol": "AAPL", "price": "185.64"},
+            {"symbol": "MSFT", "price": "370.1"},
+        ]
+    )
+    fetcher._alpha_vantage_client.stock.bulk_quotes = bulk_quotes  # type: ignore[union-attr]
+
+    quotes = await fetcher.fetch_bulk_quotes(["AAPL", "BAD$SYM", "MSFT"])
+
+    bulk_quotes.assert_awaited_once_with(symbols=["AAPL", "MSFT"])
+    assert quotes["BAD$SYM"] is None
+    assert quotes["AAPL"].price == Decimal("185.64")  # type: ignore[union-attr]
+    assert quotes["MSFT"] is not None
+
+
+@pytest.mark.asyncio
+async def test_bulk_quotes_mark_only_omitted_symbols_missing(
+    fetcher: StockFetcher,
+) -> None:
+    stock = fetcher._alpha_vantage_client.stock  # type: ignore[union-attr]
+    stock.bulk_quotes = AsyncMock(return_value=[{"symbol": "AAPL", "price": "185.64"}])
+
+    quotes = await fetcher.fetch_bulk_quotes(["AAPL", "NOPE"])
+
+    assert quotes["AAPL"] is not None
+    assert quotes["NOPE"] is None
+
+    # 대량 조회 실패 → 단건 조회 대체, 일시적으로 실패한 심볼은 결과에서 제외
+    stock.bulk_quotes = AsyncMock(side_effect=RuntimeError("premium only"))
+    stock.quote = AsyncMock(
+        side_effect=[{"symbol": "AAPL", "price": "185.64"}, TimeoutError()]
+    )
+
+    quotes = await fetcher.fetch_bulk_quotes(["AAPL", "MSFT"])
+
+    assert quotes["AAPL"] is not None
+    assert "MSFT" not in quotes
@@ -9,17 +9,19 @@ async-friendly stubs so that we can exercise the decision logic in isolation.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
 from types import SimpleNamespace
 from typing import Any, Iterable, List
 from unittest.mock import AsyncMock, ANY
 
+import pyarrow as pa
 import pytest
 
 import app.services.market_data.stock as stock_module
 from app.schemas.market_data.stock import QuoteData
 from app.services.market_data.stock import StockService
+from app.services.market_data.stock.storage import DailySyncResult
 
 
 class _FindQuery:
@@ -41,6 +43,9 @@ class _CoverageStub:
     data_type: str
     last_full_update: datetime | None = None
     last_delta_update: datetime | None = None
+    first_date: datetime | None = None
+    last_date: datetime | None = None
+    next_update_due: datetime | None = None
 
 
 @pytest.fixture
@@ -58,6 +63,7 @@ def stock_service(monkeypatch: pytest.MonkeyPatch) -> StockService:
 
     service._storage = SimpleNamespace(  # type: ignore[attr-defined]
         store_daily_prices=AsyncMock(name="store_daily_prices"),
+        sync_daily_prices=AsyncMock(name="sync_daily_prices"),
         store_weekly_prices=AsyncMock(name="store_weekly_prices"),
         store_monthly_prices=AsyncMock(name="store_monthly_prices"),
     )
@@ -74,13 +80,20 @@ def stock_service(monkeypatch: pytest.MonkeyPatch) -> StockService:
     )
 
     monkeypatch.setattr(service, "get_data_with_unified_cache", AsyncMock())
+    monkeypatch.setattr(service, "get_series_with_cache", AsyncMock())
     return service
 
 
-def _patch_find(monkeypatch: pytest.MonkeyPatch, attr: str, results: Iterable[Any]) -> None:
+def _patch_find(
+    monkeypatch: pytest.MonkeyPatch, attr: str, results: Iterable[Any]
+) -> None:
     """Patch ``DailyPrice.find``/``WeeklyPrice.find`` helpers with stub data."""
 
-    monkeypatch.setattr(getattr(stock_module, attr), "find", lambda *_args, **_kwargs: _FindQuery(results))
+    monkeypatch.setattr(
+        getattr(stock_module, attr),
+        "find",
+        lambda *_args, **_kwargs: _FindQuery(results),
+    )
 
 
 def _make_price(day: int, close: float = 150.0) -> SimpleNamespace:
@@ -120,25 +133,109 @@ async def test_get_daily_prices_performs_full_update_when_missing_cache(
 async def test_get_daily_prices_uses_cached_data_when_recent(
     stock_service: StockService, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    last_update = datetime.now(UTC) - timedelta(days=2)
-    coverage = _CoverageStub("AAPL", "daily", last_full_update=last_update)
+    coverage = _CoverageStub(
+        "AAPL",
+        "daily",
+        last_full_update=datetime.now(UTC) - timedelta(days=30),
+        next_update_due=datetime.now(UTC) + timedelta(hours=6),
+    )
+    stock_service._coverage.get_or_create_coverage.return_value = coverage  # type: ignore[attr-defined]
+
+    existing = [_make_price(2), _make_price(1)]
+    _patch_find(monkeypatch, "DailyPrice", existing)
+
+    prices = await stock_service.get_daily_prices("AAPL")
+
+    stock_service._storage.store_daily_prices.assert_not_awaited()  # type: ignore[attr-defined]
+    stock_service._storage.sync_daily_prices.assert_not_awaited()  # type: ignore[attr-defined]
+    assert prices == existing
+
+
+@pytest.mark.asyncio
+async def test_get_daily_prices_force_full_reloads_fresh_cache(
+    stock_service: StockService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    coverage = _CoverageStub(
+        "AAPL",
+        "daily",
+        last_date=datetime.now(UTC),
+        next_update_due=datetime.now(UTC) + timedelta(hours=6),
+    )
+    stock_service._coverage.get_or_create_coverage.return_value = coverage  # type: ignore[attr-defined]
+    stock_service._storage.store_daily_prices.return_value = [_make_price(2)]  # type: ignore[attr-defined]
+
+    _patch_find(monkeypatch, "DailyPrice", [_make_price(1)])
+
+    prices = await stock_service.get_daily_prices("AAPL", force_full=True)
+
+    stock_service._storage.sync_daily_prices.assert_not_awaited()  # type: ignore[attr-defined]
+    stock_service._storage.store_daily_prices.assert_awaited_once_with("AAPL", adjusted=True, is_full=True)  # type: ignore[attr-defined]
+    assert prices == stock_service._storage.store_daily_prices.return_value  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+async def test_get_daily_prices_delta_syncs_when_update_due(
+    stock_service: StockService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    now = datetime.now()
+    coverage = _CoverageStub(
+        "AAPL",
+        "daily",
+        last_full_update=now - timedelta(days=10),  # naive datetime
+        last_date=now - timedelta(days=3),
+        next_update_due=now - timedelta(hours=1),
+    )
     stock_service._coverage.get_or_create_coverage.return_value = coverage  # type: ignore[attr-defined]
+    merged = [_make_price(3), _make_price(2), _make_price(1)]
+    stock_service._storage.sync_daily_prices.return_value = DailySyncResult(  # type: ignore[attr-defined]
+        mode="delta", prices=merged, inserted=1
+    )
 
-    existing = [_make_price(1), _make_price(2)]
+    existing = [_make_price(2), _make_price(1)]
     _patch_find(monkeypatch, "DailyPrice", existing)
 
     prices = await stock_service.get_daily_prices("AAPL")
 
+    stock_service._storage.sync_daily_prices.assert_awaited_once_with("AAPL", existing)  # type: ignore[attr-defined]
     stock_service._storage.store_daily_prices.assert_not_awaited()  # type: ignore[attr-defined]
+    stock_service._coverage.update_coverage.assert_awaited_once_with(  # type: ignore[attr-defined]
+        coverage=coverage, data_records=merged, update_type="delta"
+    )
+    assert prices == merged
+
+
+@pytest.mark.asyncio
+async def test_get_daily_prices_failed_sync_keeps_coverage_due(
+    stock_service: StockService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    now = datetime.now(UTC)
+    coverage = _CoverageStub(
+        "AAPL",
+        "daily",
+        last_date=now - timedelta(days=3),
+        next_update_due=now - timedelta(hours=1),
+    )
+    stock_service._coverage.get_or_create_coverage.return_value = coverage  # type: ignore[attr-defined]
+    existing = [_make_price(2), _make_price(1)]
+    stock_service._storage.sync_daily_prices.return_value = DailySyncResult(  # type: ignore[attr-defined]
+        mode="failed", prices=existing, reason="empty compact response"
+    )
+    _patch_find(monkeypatch, "DailyPrice", existing)
+
+    prices = await stock_service.get_daily_prices("AAPL")
+
     assert prices == existing
+    stock_service._coverage.update_coverage.assert_not_awaited()  # type: ignore[attr-defined]
+    stock_service._storage.store_daily_prices.assert_not_awaited()  # type: ignore[attr-defined]
 
 
 @pytest.mark.asyncio
-async def test_get_daily_prices_triggers_update_for_stale_naive_timestamp(
+async def test_get_daily_prices_reloads_when_gap_exceeds_compact_window(
     stock_service: StockService, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    last_update = datetime.now() - timedelta(days=10)  # naive datetime
-    coverage = _CoverageStub("AAPL", "daily", last_full_update=last_update)
+    coverage = _CoverageStub(
+        "AAPL", "daily", last_date=datetime.now(UTC) - timedelta(days=200)
+    )
     stock_service._coverage.get_or_create_coverage.return_value = coverage  # type: ignore[attr-defined]
     stock_service._storage.store_daily_prices.return_value = [_make_price(3)]  # type: ignore[attr-defined]
 
@@ -146,7 +243,31 @@ async def test_get_daily_prices_triggers_update_for_stale_naive_timestamp(
 
     await stock_service.get_daily_prices("AAPL")
 
-    stock_service._storage.store_daily_prices.assert_awaited_once()  # type: ignore[attr-defined]
+    stock_service._storage.sync_daily_prices.assert_not_awaited()  # type: ignore[attr-defined]
+    stock_service._storage.store_daily_prices.assert_awaited_once_with("AAPL", adjusted=True, is_full=True)  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+async def test_get_daily_prices_reloads_after_corporate_action(
+    stock_service: StockService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    coverage = _CoverageStub(
+        "AAPL", "daily", last_date=datetime.now(UTC) - timedelta(days=2)
+    )
+    stock_service._coverage.get_or_create_coverage.return_value = coverage  # type: ignore[attr-defined]
+    stock_service._storage.sync_daily_prices.return_value = DailySyncResult(  # type: ignore[attr-defined]
+        mode="full_required", reason="split 4 on 2024-01-03"
+    )
+    stock_service._storage.store_daily_prices.return_value = [_make_price(3)]  # type: ignore[attr-defined]
+
+    _patch_find(monkeypatch, "DailyPrice", [_make_price(1)])
+
+    prices = await stock_service.get_daily_prices("AAPL")
+
+    stock_service._storage.store_daily_prices.assert_awaited_once_with("AAPL", adjusted=True, is_full=True)  # type: ignore[attr-defined]
+    stock_service._coverage.update_coverage.assert_awaited_once_with(  # type: ignore[attr-defined]
+        coverage=coverage, data_records=prices, update_type="full"
+    )
 
 
 @pytest.mark.asyncio
@@ -278,7 +399,7 @@ async def test_get_monthly_prices_returns_empty_when_storage_none(
 
 @pytest.mark.asyncio
 async def test_get_real_time_quote_force_refresh_bypasses_cache(
-    stock_service: StockService
+    stock_service: StockService,
 ) -> None:
     stock_service._fetcher.fetch_quote.return_value = QuoteData(  # type: ignore[attr-defined]
         symbol="AAPL",
@@ -294,8 +415,12 @@ async def test_get_real_time_quote_force_refresh_bypasses_cache(
 
 
 @pytest.mark.asyncio
-async def test_get_real_time_quote_returns_cached_instance(stock_service: StockService) -> None:
-    cached_quote = QuoteData(symbol="AAPL", timestamp=datetime.now(UTC), price=Decimal("150.0"))
+async def test_get_real_time_quote_returns_cached_instance(
+    stock_service: StockService,
+) -> None:
+    cached_quote = QuoteData(
+        symbol="AAPL", timestamp=datetime.now(UTC), price=Decimal("150.0")
+    )
     stock_service.get_data_with_unified_cache.return_value = [cached_quote]
 
     quote = await stock_service.get_real_time_quote("AAPL")
@@ -317,9 +442,13 @@ async def test_get_real_time_quote_converts_dict(stock_service: StockService) ->
 
 
 @pytest.mark.asyncio
-async def test_get_real_time_quote_falls_back_on_cache_error(stock_service: StockService) -> None:
+async def test_get_real_time_quote_falls_back_on_cache_error(
+    stock_service: StockService,
+) -> None:
     stock_service.get_data_with_unified_cache.side_effect = RuntimeError("cache error")
-    fallback = QuoteData(symbol="AAPL", timestamp=datetime.now(UTC), price=Decimal("88.1"))
+    fallback = QuoteData(
+        symbol="AAPL", timestamp=datetime.now(UTC), price=Decimal("88.1")
+    )
     stock_service._fetcher.fetch_quote.return_value = fallback  # type: ignore[attr-defined]
 
     quote = await stock_service.get_real_time_quote("AAPL")
@@ -328,35 +457,64 @@ async def test_get_real_time_quote_falls_back_on_cache_error(stock_service: Stoc
 
 
 @pytest.mark.asyncio
-async def test_get_intraday_data_uses_interval_specific_ttl(stock_service: StockService) -> None:
-    stock_service.get_data_with_unified_cache.return_value = []
+async def test_get_intraday_data_uses_interval_specific_ttl(
+    stock_service: StockService,
+) -> None:
+    stock_service.get_series_with_cache.return_value = []
 
     await stock_service.get_intraday_data("AAPL", interval="1min")
 
-    stock_service.get_data_with_unified_cache.assert_awaited_with(
-        cache_key="intraday_AAPL_1min_False_False_full_latest",
-        model_class=stock_module.DailyPrice,
+    stock_service.get_series_with_cache.assert_awaited_with(
+        series_key="AAPL_1min_False_False_latest",
         data_type="stock_intraday",
-        symbol="AAPL",
+        model_class=stock_module.DailyPrice,
         refresh_callback=ANY,
+        symbol="AAPL",
         ttl_hours=1,
+        start=None,
+        end=None,
+        limit=None,
+        full_history=True,
+        incremental_callback=ANY,
+        incremental_window=timedelta(minutes=99),
     )
 
 
 @pytest.mark.asyncio
-async def test_get_intraday_data_defaults_to_four_hour_ttl(stock_service: StockService) -> None:
-    stock_service.get_data_with_unified_cache.reset_mock()
-    stock_service.get_data_with_unified_cache.return_value = []
+async def test_get_intraday_data_defaults_to_four_hour_ttl(
+    stock_service: StockService,
+) -> None:
+    stock_service.get_series_with_cache.reset_mock()
+    stock_service.get_series_with_cache.return_value = []
+
+    await stock_service.get_intraday_data("AAPL", interval="custom")  # type: ignore[arg-type]
+
+    kwargs = stock_service.get_series_with_cache.call_args.kwargs
+    assert kwargs["ttl_hours"] == 4
+    assert kwargs["incremental_window"] is None
+
+
+@pytest.mark.asyncio
+async def test_get_intraday_data_compact_limits_to_latest_bars(
+    stock_service: StockService,
+) -> None:
+    stock_service.get_series_with_cache.return_value = []
 
-    await stock_service.get_intraday_data("AAPL", interval="custom")
+    await stock_service.get_intraday_data("AAPL", outputsize="compact", month="2024-01")
 
-    assert stock_service.get_data_with_unified_cache.call_args.kwargs["ttl_hours"] == 4
+    kwargs = stock_service.get_series_with_cache.call_args.kwargs
+    assert kwargs["series_key"] == "AAPL_15min_False_False_2024-01"
+    assert kwargs["limit"] == 100
+    assert kwargs["full_history"] is False
+    assert kwargs["incremental_callback"] is None
 
 
 @pytest.mark.asyncio
-async def test_get_intraday_data_returns_cached_list(stock_service: StockService) -> None:
+async def test_get_intraday_data_returns_cached_list(
+    stock_service: StockService,
+) -> None:
     sample = [_make_price(1)]
-    stock_service.get_data_with_unified_cache.return_value = sample
+    stock_service.get_series_with_cache.return_value = sample
 
     data = await stock_service.get_intraday_data("AAPL")
 
@@ -364,13 +522,61 @@ async def test_get_intraday_data_returns_cached_list(stock_service: StockService
 
 
 @pytest.mark.asyncio
-async def test_get_historical_data_delegates_to_fetcher(stock_service: StockService) -> None:
-    stock_service._fetcher.fetch_historical.return_value = {"prices": []}  # type: ignore[attr-defined]
+async def test_get_historical_data_reads_covered_range_from_local_store(
+    stock_service: StockService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    coverage = _CoverageStub(
+        "AAPL",
+        "daily",
+        last_full_update=datetime(2024, 1, 10),
+        first_date=datetime(2020, 1, 2),
+        last_date=datetime(2024, 1, 10),
+    )
+    stock_service._coverage.get_or_create_coverage.return_value = coverage  # type: ignore[attr-defined]
+    table = pa.table(
+        {
+            "symbol": ["AAPL", "AAPL"],
+            "date": [date(2024, 1, 2), date(2024, 1, 5)],
+            "close": [185.64, 181.18],
+        }
+    )
+    get_prices_arrow = AsyncMock(return_value=table)
+    stock_service._db_manager = SimpleNamespace(  # type: ignore[assignment]
+        async_manager=SimpleNamespace(get_prices_arrow=get_prices_arrow)
+    )
+    monkeypatch.setattr(stock_service, "get_daily_prices", AsyncMock())
+
+    result = await stock_service.get_historical_data(
+        "AAPL", start_date=datetime(2024, 1, 2), end_date=datetime(2024, 1, 5)
+    )
+
+    get_prices_arrow.assert_awaited_once_with(
+        ["AAPL"], start=date(2024, 1, 2), end=date(2024, 1, 5)
+    )
+    stock_service.get_daily_prices.assert_not_awaited()  # type: ignore[attr-defined]
+    stock_service._fetcher.fetch_historical.assert_not_awaited()  # type: ignore[attr-defined]
+    assert result["source"] == "duckdb"
+    assert result["records"] == [
+        {"date": date(2024, 1, 2), "close": 185.64},
+        {"date": date(2024, 1, 5), "close": 181.18},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_historical_data_fills_coverage_gap_before_reading(
+    stock_service: StockService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    coverage = _CoverageStub("AAPL", "daily")
+    stock_service._coverage.get_or_create_coverage.return_value = coverage  # type: ignore[attr-defined]
+    monkeypatch.setattr(stock_service, "get_daily_prices", AsyncMock())
+    _patch_find(monkeypatch, "DailyPrice", [_make_price(2), _make_price(3)])
 
     result = await stock_service.get_historical_data("AAPL")
 
-    stock_service._fetcher.fetch_historical.assert_awaited_once_with("AAPL", None, None)  # type: ignore[attr-defined]
-    assert result == {"prices": []}
+    stock_service.get_daily_prices.assert_awaited_once_with("AAPL")  # type: ignore[attr-defined]
+    assert result["source"] == "mongodb"
+    assert result["data_points"] == 2
+    assert result["records"][0]["close"] == 150.0
 
 
 @pytest.mark.asyncio
@@ -381,5 +587,3 @@ async def test_search_symbols_delegates_to_fetcher(stock_service: StockService)
 
     stock_service._fetcher.search_symbols.assert_awaited_once_with("apple")  # type: ignore[attr-defined]
     assert result == {"bestMatches": []}
-
-
@@ -0,0 +1,132 @@
+"""Unit tests for the bulk persistence and incremental sync in :class:`StockStorage`."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+import app.services.market_data.stock.storage as storage_module
+from app.services.market_data.stock.storage import (
+    BulkWriteReport,
+    StockStorage,
+    bulk_upsert_prices,
+)
+
+
+def _bar(day: int, close: str = "150", **overrides: Any) -> SimpleNamespace:
+    values: dict[str, Any] = {
+        "symbol": "AAPL",
+        "date": datetime(2024, 1, day),
+        "open": Decimal("149"),
+        "high": Decimal("151"),
+        "low": Decimal("148"),
+        "close": Decimal(close),
+        "volume": 1_000,
+        "adjusted_close": Decimal(close),
+        "dividend_amount": Decimal("0"),
+        "split_coefficient": Decimal("1"),
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+@pytest.fixture
+def bulk_upsert(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    mock = AsyncMock(name="bulk_upsert_prices", return_value=BulkWriteReport("prices"))
+    monkeypatch.setattr(storage_module, "bulk_upsert_prices", mock)
+    return mock
+
+
+def _storage(fetched: list[SimpleNamespace]) -> StockStorage:
+    fetcher = SimpleNamespace(fetch_daily_prices=AsyncMock(return_value=fetched))
+    return StockStorage(fetcher)  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_sync_writes_only_new_and_changed_bars(bulk_upsert: AsyncMock) -> None:
+    existing = [_bar(3, close="152"), _bar(2), _bar(1)]
+    fetched = [_bar(1), _bar(2), _bar(3, close="152", volume=2_000), _bar(4), _bar(5)]
+
+    result = await _storage(fetched).sync_daily_prices("AAPL", existing)
+
+    assert result.mode == "delta"
+    assert (result.inserted, result.updated) == (2, 1)
+    bulk_upsert.assert_awaited_once_with(
+        storage_module.DailyPrice, [fetched[3], fetched[4], existing[0]]
+    )
+    assert existing[0].volume == 2_000
+    assert [bar.date.day for bar in result.prices] == [5, 4, 3, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_sync_requests_full_reload_on_new_split(bulk_upsert: AsyncMock) -> None:
+    existing = [_bar(2), _bar(1)]
+    fetched = [_bar(1), _bar(2), _bar(3, split_coefficient=Decimal("4"))]
+
+    result = await _storage(fetched).sync_daily_prices("AAPL", existing)
+
+    assert result.mode == "full_required"
+    assert "split" in result.reason
+    bulk_upsert.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_sync_requests_full_reload_when_history_readjusted(
+    bulk_upsert: AsyncMock,
+) -> None:
+    existing = [_bar(2), _bar(1)]
+    fetched = [_bar(1, adjusted_close=Decimal("149.2")), _bar(2), _bar(3)]
+
+    result = await _storage(fetched).sync_daily_prices("AAPL", existing)
+
+    assert result.mode == "full_required"
+    assert "adjusted_close" in result.reason
+
+
+@pytest.mark.asyncio
+async def test_sync_reports_failure_on_empty_fetch(bulk_upsert: AsyncMock) -> None:
+    existing = [_bar(2), _bar(1)]
+
+    result = await _storage([]).sync_daily_prices("AAPL", existing)
+
+    assert result.mode == "failed"
+    assert result.prices == existing
+    bulk_upsert.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_sends_unordered_batches(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        storage_module,
+        "_price_document",
+        lambda price: {
+            "symbol": price.symbol,
+            "date": price.date,
+            "close": price.close,
+        },
+    )
+    collection = SimpleNamespace(
+        name="stock_price_daily",
+        bulk_write=AsyncMock(
+            side_effect=lambda ops, ordered: SimpleNamespace(
+                upserted_count=len(ops), modified_count=0
+            )
+        ),
+    )
+    model = SimpleNamespace(get_motor_collection=lambda: collection)
+
+    report = await bulk_upsert_prices(model, [_bar(day) for day in range(1, 6)], batch_size=2)  # type: ignore[arg-type]
+
+    assert [batch.size for batch in report.batches] == [2, 2, 1]
+    assert report.upserted == 5
+    (operations,) = collection.bulk_write.await_args_list[0].args
+    assert collection.bulk_write.await_args_list[0].kwargs == {"ordered": False}
+    assert operations[0]._filter == {"symbol": "AAPL", "date": datetime(2024, 1, 1)}
+    assert operations[0]._upsert is True
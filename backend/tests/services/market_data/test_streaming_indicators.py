@@ -0,0 +1,194 @@
+"""Unit tests for :mod:`app.services.market_data.indicators.streaming`."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.database_manager import DatabaseManager
+from app.services.market_data.indicators import engine
+from app.services.market_data.indicators.streaming import (
+    StreamingIndicator,
+    StreamingIndicatorService,
+    create,
+)
+
+CASES = [
+    ("EMA", {"time_period": 10}),
+    ("RSI", {"time_period": 14}),
+    ("MACD", {"fastperiod": 12, "slowperiod": 26, "signalperiod": 9}),
+    ("BBANDS", {"time_period": 20, "nbdevup": 2.0, "nbdevdn": 1.5}),
+    ("ATR", {"time_period": 14}),
+    ("OBV", {}),
+]
+
+
+def _history(rows: int = 400, seed: int = 11) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    close = np.round(100 * np.exp(np.cumsum(rng.normal(0, 0.02, rows))), 2)
+    return {
+        "open": close,
+        "high": close * (1 + rng.uniform(0, 0.02, rows)),
+        "low": close * (1 - rng.uniform(0, 0.02, rows)),
+        "close": close,
+        "volume": rng.integers(1_000, 5_000, rows).astype(float),
+    }
+
+
+def _bars(history: dict[str, np.ndarray], start: int = 0) -> Iterator[dict[str, float]]:
+    for i in range(start, len(history["close"])):
+        yield {name: float(values[i]) for name, values in history.items()}
+
+
+def _batch_last(kind: str, params: dict, history: dict[str, np.ndarray]) -> object:
+    outputs = engine.compute(kind, history, params)
+    if list(outputs) == ["value"]:
+        return float(outputs["value"][-1])
+    return {name: float(values[-1]) for name, values in outputs.items()}
+
+
+def _assert_close(actual: object, expected: object) -> None:
+    if isinstance(expected, dict):
+        assert isinstance(actual, dict)
+        for name, value in expected.items():
+            assert actual[name] == pytest.approx(value, rel=1e-9, abs=1e-9)
+    else:
+        assert actual == pytest.approx(expected, rel=1e-9, abs=1e-9)
+
+
+@pytest.mark.parametrize(("kind", "params"), CASES)
+def test_bar_by_bar_updates_match_batch_engine(kind: str, params: dict) -> None:
+    history = _history()
+    indicator = create(kind, **params)
+    lookback = engine.lookback(kind, params)
+
+    for i, bar in enumerate(_bars(history)):
+        value = indicator.update(bar)
+        if i < lookback:
+            assert value is None
+        elif i % 37 == 0 or i == len(history["close"]) - 1:
+            prefix = {name: values[: i + 1] for name, values in history.items()}
+            _assert_close(value, _batch_last(kind, params, prefix))
+
+
+@pytest.mark.parametrize(("kind", "params"), CASES)
+def test_seed_then_update_continues_batch_series(kind: str, params: dict) -> None:
+    history = _history()
+    head = {name: values[:300] for name, values in history.items()}
+
+    indicator = StreamingIndicator.registry[kind].seed(head, **params)
+    restored = StreamingIndicator.from_dict(json.loads(json.dumps(indicator.to_dict())))
+    for bar in _bars(history, start=300):
+        restored.update(bar)
+
+    assert restored.key == indicator.key
+    _assert_close(restored.value, _batch_last(kind, params, history))
+
+
+def test_short_history_seed_keeps_warmup_state() -> None:
+    history = _history(rows=40)
+    head = {name: values[:20] for name, values in history.items()}
+
+    macd = StreamingIndicator.registry["MACD"].seed(head)
+    assert macd.value is None
+
+    values = [macd.update(bar) for bar in _bars(history, start=20)]
+
+    # 룩백 26 + 9 - 2 = 33 → 34번째 봉부터 값
+    assert all(value is None for value in values[:13])
+    _assert_close(values[-1], _batch_last("MACD", {}, history))
+
+
+def test_bollinger_stays_accurate_over_long_runs() -> None:
+    rng = np.random.default_rng(5)
+    closes = 1e6 + np.cumsum(rng.normal(0, 1, 20_000))
+    bands = create("BBANDS", time_period=20)
+
+    for close in closes:
+        bands.update(close)
+
+    upper, middle, lower = engine.bbands(closes, 20, 2.0, 2.0)
+    assert bands.value["middle"] == pytest.approx(middle[-1], rel=1e-12)
+    assert bands.value["upper"] - bands.value["middle"] == pytest.approx(
+        upper[-1] - middle[-1], rel=1e-6
+    )
+
+
+def test_unknown_indicator_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        create("VWAP")
+
+
+def test_incomplete_subclass_cannot_be_instantiated(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(StreamingIndicator, "registry", {})
+
+    class StreamingPartial(StreamingIndicator):
+        kind = "PARTIAL"
+
+        def update(self, bar):
+            return None
+
+    with pytest.raises(TypeError):
+        StreamingPartial()
+
+
+@pytest.fixture
+def db_manager(tmp_path: Path) -> Iterator[DatabaseManager]:
+    manager = DatabaseManager(
+        db_path=str(tmp_path / "quant.duckdb"),
+        reader_threads=2,
+        price_store_path=str(tmp_path / "store"),
+    )
+    manager.connect()
+    try:
+        yield manager
+    finally:
+        manager.shutdown()
+
+
+def _daily_frame(closes: np.ndarray, start: str = "2024-01-01") -> pd.DataFrame:
+    index = pd.date_range(start, periods=len(closes), freq="D", name="date")
+    return pd.DataFrame(
+        {
+            "symbol": "AAPL",
+            "open": closes,
+            "high": closes,
+            "low": closes,
+            "close": closes,
+            "adjusted_close": closes,
+            "volume": 100,
+        },
+        index=index,
+    )
+
+
+@pytest.mark.asyncio
+async def test_service_seeds_then_advances_stored_state(
+    db_manager: DatabaseManager,
+) -> None:
+    closes = _history(rows=120)["close"]
+    db_manager.upsert_daily_prices(_daily_frame(closes[:100]))
+    service = StreamingIndicatorService(db_manager)
+    spec = {"indicator": "EMA", "time_period": 10}
+
+    seeded = await service.get_latest("AAPL", [spec])
+    (key,) = seeded
+    assert seeded[key] == pytest.approx(engine.ema(closes[:100], 10)[-1], rel=1e-9)
+
+    db_manager.upsert_daily_prices(_daily_frame(closes[100:], start="2024-04-10"))
+    advanced = await service.advance("AAPL")
+    assert advanced[key] == pytest.approx(engine.ema(closes, 10)[-1], rel=1e-9)
+
+    # 과거 수정주가가 바뀌면(분할) 전체 이력으로 다시 시드
+    split = _daily_frame(closes)
+    split["adjusted_close"] = closes / 2
+    db_manager.upsert_daily_prices(split)
+    reseeded = await service.advance("AAPL")
+    assert reseeded[key] == pytest.approx(engine.ema(closes / 2, 10)[-1], rel=1e-9)
@@ -0,0 +1,121 @@
+"""Unit tests for the unified cache path of :class:`BaseMarketDataService`."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+from pydantic import BaseModel
+
+from app.services.database_manager import UnifiedCacheEntry
+from app.services.market_data.base_service import BaseMarketDataService
+
+
+class _Quote(BaseModel):
+    symbol: str
+    price: float
+
+
+class _Service(BaseMarketDataService):
+    async def refresh_data_from_source(self, **kwargs: Any) -> list[Any]:
+        return []
+
+
+def _service(entry: UnifiedCacheEntry | None) -> tuple[_Service, SimpleNamespace]:
+    async_db = SimpleNamespace(
+        connect=AsyncMock(),
+        get_unified_cache_entry=AsyncMock(return_value=entry),
+        store_unified_cache=AsyncMock(return_value=True),
+    )
+    service = _Service(SimpleNamespace(async_manager=async_db))  # type: ignore[arg-type]
+    return service, async_db
+
+
+async def _get(service: _Service, refresh: AsyncMock) -> list[Any]:
+    return await service.get_data_with_unified_cache(
+        cache_key="quote_AAPL",
+        data_type="stock_quote",
+        model_class=_Quote,
+        refresh_callback=refresh,
+        symbol="AAPL",
+        ttl_hours=1,
+    )
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_within_grace_is_served_while_revalidating() -> None:
+    stale = UnifiedCacheEntry(
+        data=[{"symbol": "AAPL", "price": 100.0}],
+        expires_at=datetime.now(UTC) - timedelta(minutes=5),
+    )
+    service, async_db = _service(stale)
+    refresh_started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_refresh() -> list[dict[str, Any]]:
+        refresh_started.set()
+        await release.wait()
+        return [{"symbol": "AAPL", "price": 101.0}]
+
+    refresh = AsyncMock(side_effect=slow_refresh)
+
+    first = await _get(service, refresh)
+    second = await _get(service, refresh)
+
+    # 갱신이 끝나기 전에 만료 데이터가 즉시 반환되고, 갱신은 한 번만 실행됨
+    assert [quote.price for quote in first] == [100.0]
+    assert [quote.price for quote in second] == [100.0]
+    await asyncio.wait_for(refresh_started.wait(), timeout=1)
+    release.set()
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+    refresh.assert_awaited_once()
+    async_db.store_unified_cache.assert_awaited_once()
+    assert async_db.store_unified_cache.await_args.kwargs["data"] == [
+        {"symbol": "AAPL", "price": 101.0}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_fresh_entry_skips_refresh() -> None:
+    fresh = UnifiedCacheEntry(
+        data=[{"symbol": "AAPL", "price": 100.0}],
+        expires_at=datetime.now(UTC) + timedelta(minutes=5),
+    )
+    service, async_db = _service(fresh)
+    refresh = AsyncMock()
+
+    result = await _get(service, refresh)
+
+    assert result == [_Quote(symbol="AAPL", price=100.0)]
+    refresh.assert_not_awaited()
+    async_db.store_unified_cache.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_miss_refreshes_synchronously() -> None:
+    service, async_db = _service(None)
+    refresh = AsyncMock(return_value=[{"symbol": "AAPL", "price": 102.0}])
+
+    result = await _get(service, refresh)
+
+    assert result == [_Quote(symbol="AAPL", price=102.0)]
+    async_db.store_unified_cache.assert_awaited_once()
+
+
+def test_stale_grace_resolves_exact_then_prefix() -> None:
+    strategy = _Service().cache_strategy
+    strategy.stale_grace_hours = {
+        "fundamental": 24.0,
+        "fundamental_overview": 2.0,
+        "news": 0.0,
+    }
+
+    assert strategy.stale_grace("fundamental_overview") == timedelta(hours=2)
+    assert strategy.stale_grace("fundamental_income") == timedelta(hours=24)
+    assert strategy.stale_grace("news") == timedelta(0)
@@ -0,0 +1,117 @@
+"""Unit tests for :mod:`app.services.async_database_manager`."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Iterator
+
+import pandas as pd
+import pytest
+
+from app.services.async_database_manager import AsyncDatabaseManager
+from app.services.database_manager import DatabaseManager
+
+
+@pytest.fixture
+def db_manager() -> Iterator[DatabaseManager]:
+    manager = DatabaseManager(db_path=":memory:", reader_threads=2)
+    manager.connect()
+    try:
+        yield manager
+    finally:
+        manager.shutdown()
+
+
+def _daily_frame(symbol: str, closes: list[float]) -> pd.DataFrame:
+    index = pd.date_range("2024-01-01", periods=len(closes), freq="D", name="date")
+    return pd.DataFrame(
+        {
+            "symbol": symbol,
+            "open": closes,
+            "high": closes,
+            "low": closes,
+            "close": closes,
+            "volume": 100,
+        },
+        index=index,
+    )
+
+
+def test_async_manager_is_cached(db_manager: DatabaseManager) -> None:
+    facade = db_manager.async_manager
+
+    assert isinstance(facade, AsyncDatabaseManager)
+    assert db_manager.async_manager is facade
+    assert facade.database_manager is db_manager
+
+
+@pytest.mark.asyncio
+async def test_mirrored_methods_round_trip(db_manager: DatabaseManager) -> None:
+    facade = db_manager.async_manager
+
+    result = await facade.upsert_daily_prices(_daily_frame("AAPL", [1.0, 2.0, 3.0]))
+    assert result.inserted == 3
+
+    prices = await facade.get_daily_prices("AAPL")
+    assert len(prices) == 3
+    assert await facade.get_available_symbols() == ["AAPL"]
+
+    assert await facade.store_unified_cache(
+        cache_key="k", data=[{"a": 1}], data_type="test", symbol="AAPL"
+    )
+    assert await facade.get_unified_cache("k", "test", "AAPL") == [{"a": 1}]
+
+
+@pytest.mark.asyncio
+async def test_calls_never_run_on_event_loop_thread(
+    db_manager: DatabaseManager,
+) -> None:
+    facade = db_manager.async_manager
+    loop_thread = threading.current_thread().name
+
+    reader = await facade.run_read("whoami", lambda: threading.current_thread().name)
+    writer = await facade.run_write("whoami", lambda: threading.current_thread().name)
+
+    assert reader != loop_thread and reader.startswith("duckdb-reader")
+    assert writer != loop_thread and writer.startswith("duckdb-writer")
+
+
+@pytest.mark.asyncio
+async def test_metrics_track_queue_depth_latency_and_errors(
+    db_manager: DatabaseManager,
+) -> None:
+    facade = db_manager.async_manager
+    release = threading.Event()
+
+    blocker = asyncio.ensure_future(facade.run_write("block", release.wait, 5))
+    queued = [
+        asyncio.ensure_future(facade.run_write("queued", lambda: None))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0.05)
+
+    # writer lane은 단일 스레드이므로 뒤따르는 쓰기는 대기열에 쌓인다
+    metrics = facade.get_metrics()
+    assert metrics["queue_depth"]["write"] == 3
+    assert metrics["in_flight"]["write"] == 1
+
+    release.set()
+    await asyncio.gather(blocker, *queued)
+
+    def _fail() -> None:
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        await facade.run_read("fail", _fail)
+
+    metrics = facade.get_metrics()
+    assert metrics["queue_depth"] == {"read": 0, "write": 0}
+    assert metrics["max_queue_depth"]["write"] >= 3
+    assert metrics["operations"]["queued"]["calls"] == 3
+    assert metrics["operations"]["queued"]["max_queue_wait_ms"] > 0
+    assert metrics["operations"]["block"]["max_latency_ms"] > 0
+    assert metrics["operations"]["fail"]["errors"] == 1
+
+    facade.reset_metrics()
+    assert facade.get_metrics()["operations"] == {}
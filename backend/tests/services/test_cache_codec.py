@@ -0,0 +1,221 @@
+"""Unit tests for :mod:`app.services.cache_codec` and DuckDB cache payload storage."""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+import duckdb
+import pytest
+
+from app.services.cache_codec import (
+    ARROW_MIN_ROWS,
+    decode_payload,
+    encode_payload,
+    select_codec,
+)
+from app.services.database_manager import DatabaseManager
+
+
+@pytest.fixture
+def db_manager() -> Iterator[DatabaseManager]:
+    manager = DatabaseManager(db_path=":memory:", reader_threads=2)
+    manager.connect()
+    try:
+        yield manager
+    finally:
+        manager.shutdown()
+
+
+def _bars(count: int) -> list[dict]:
+    start = datetime(2024, 1, 1, 9, 30)
+    return [
+        {
+            "timestamp": start + timedelta(minutes=5 * i),
+            "trade_date": date(2024, 1, 1),
+            "open": Decimal("10.5") + i,
+            "close": 11.25 + i,
+            "volume": 1_000 + i,
+            "symbol": "BTC",
+        }
+        for i in range(count)
+    ]
+
+
+def _json_round_trip(records: list[dict]) -> list[dict]:
+    """기존 JSON 텍스트 경로의 결과 (datetime → ISO 문자열, Decimal → float)"""
+
+    def _default(value: object) -> object:
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        return float(value)  # type: ignore[arg-type]
+
+    return json.loads(json.dumps(records, default=_default))
+
+
+def test_select_codec_by_data_type() -> None:
+    assert select_codec("crypto_daily") == "arrow+zstd"
+    assert select_codec("fundamental_overview") == "json+zstd"
+    assert select_codec("crypto_daily", "json") == "json"
+
+
+@pytest.mark.parametrize("codec", ["json", "json+zstd", "arrow+zstd"])
+def test_codecs_match_json_text_semantics(codec: str) -> None:
+    records = _bars(ARROW_MIN_ROWS + 4)
+
+    stored_codec, data_json, payload = encode_payload(records, codec)  # type: ignore[arg-type]
+
+    assert stored_codec == codec
+    assert decode_payload(stored_codec, data_json, payload) == _json_round_trip(records)
+
+
+def test_arrow_falls_back_to_json_for_irregular_records() -> None:
+    nested = [{"symbol": "AAPL", "fields": {"a": i}} for i in range(ARROW_MIN_ROWS)]
+    ragged = [{"a": 1}] + [{"a": 1, "b": 2}] * ARROW_MIN_ROWS
+
+    for records in (nested, ragged, _bars(2)):
+        codec, data_json, payload = encode_payload(records, "arrow+zstd")
+        assert codec == "json+zstd"
+        assert decode_payload(codec, data_json, payload) == _json_round_trip(records)
+
+
+def test_unified_cache_stores_compressed_payload(db_manager: DatabaseManager) -> None:
+    records = _bars(ARROW_MIN_ROWS)
+
+    assert db_manager.store_unified_cache("k", records, "crypto_intraday", "BTC")
+    row = db_manager.duckdb_conn.execute(
+        "SELECT codec, data_json, payload IS NOT NULL FROM unified_cache"
+    ).fetchone()
+
+    assert row == ("arrow+zstd", "", True)
+    assert db_manager.get_unified_cache(
+        "k", "crypto_intraday", "BTC"
+    ) == _json_round_trip(records)
+
+
+def test_cache_table_stores_one_row_per_key(db_manager: DatabaseManager) -> None:
+    records = [{"date": "2024-01-0%d" % i, "close": float(i)} for i in range(1, 4)]
+
+    assert db_manager.store_cache_data("k", records, table_name="market_data_cache")
+
+    count = db_manager.duckdb_conn.execute(
+        "SELECT COUNT(*) FROM market_data_cache WHERE cache_key = 'k'"
+    ).fetchone()
+    assert count == (1,)
+    assert db_manager.get_cache_data("k", table_name="market_data_cache") == records
+
+
+def test_legacy_rows_are_readable_and_migrated(db_manager: DatabaseManager) -> None:
+    conn = db_manager.duckdb_conn
+    now = datetime.now(UTC)
+    items = [{"date": f"2024-01-{i:02d}", "close": float(i)} for i in range(1, 21)]
+    for i, item in enumerate(items):
+        conn.execute(
+            """
+            INSERT INTO market_data_cache (id, cache_key, data_json, created_at, updated_at)
+            VALUES (?, 'legacy', ?, ?, ?)
+            """,
+            [f"row-{i}", json.dumps(item), now + timedelta(microseconds=i), now],
+        )
+    conn.execute(
+        """
+        INSERT INTO unified_cache (id, cache_key, data_type, symbol, data_json)
+        VALUES ('u1', 'legacy', 'crypto_daily', 'BTC_USD', ?)
+        """,
+        [json.dumps(items)],
+    )
+
+    assert db_manager.get_cache_data("legacy", table_name="market_data_cache") == items
+    assert db_manager.get_unified_cache("legacy", "crypto_daily", "BTC_USD") == items
+
+    assert db_manager.migrate_cache_payloads("market_data_cache") == 1
+    assert db_manager.migrate_cache_payloads("unified_cache") == 1
+    assert db_manager.migrate_cache_payloads("unified_cache") == 0
+
+    assert conn.execute(
+        "SELECT COUNT(*), MIN(codec) FROM market_data_cache WHERE cache_key = 'legacy'"
+    ).fetchone() == (1, "arrow+zstd")
+    assert db_manager.get_cache_data("legacy", table_name="market_data_cache") == items
+    assert db_manager.get_unified_cache("legacy", "crypto_daily", "BTC_USD") == items
+
+
+def test_legacy_table_gains_payload_columns(tmp_path: Path) -> None:
+    path = str(tmp_path / "legacy.duckdb")
+    with duckdb.connect(path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE stock_cache (
+                id VARCHAR PRIMARY KEY,
+                cache_key VARCHAR NOT NULL,
+                data_json TEXT NOT NULL,
+                created_at TIMESTAMP NOT NULL,
+                updated_at TIMESTAMP NOT NULL
+            )
+            """
+        )
+        conn.execute("CREATE INDEX idx_stock_cache_cache_key ON stock_cache(cache_key)")
+
+    manager = DatabaseManager(db_path=path, reader_threads=1, price_store_path="")
+    try:
+        assert manager.store_cache_data("k", [{"a": 1}], table_name="stock_cache")
+        assert manager.get_cache_data("k", table_name="stock_cache") == [{"a": 1}]
+        indexes = manager.duckdb_conn.execute(
+            "SELECT index_name FROM duckdb_indexes() WHERE table_name = 'stock_cache'"
+        ).fetchall()
+        assert ("idx_stock_cache_cache_key",) in indexes
+    finally:
+        manager.shutdown()
+
+
+def test_concurrent_first_reads_prepare_legacy_table_once(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    path = str(tmp_path / "legacy.duckdb")
+    with duckdb.connect(path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE stock_cache (
+                id VARCHAR PRIMARY KEY,
+                cache_key VARCHAR NOT NULL,
+                data_json TEXT NOT NULL,
+                created_at TIMESTAMP NOT NULL,
+                updated_at TIMESTAMP NOT NULL
+            )
+            """
+        )
+        conn.execute("CREATE INDEX idx_stock_cache_cache_key ON stock_cache(cache_key)")
+
+    manager = DatabaseManager(db_path=path, reader_threads=4, price_store_path="")
+    try:
+        manager.connect()
+        barrier = threading.Barrier(4)
+
+        def first_read(key: str) -> list[dict] | None:
+            barrier.wait()
+            return manager.get_cache_data(key, table_name="stock_cache")
+
+        with caplog.at_level(logging.INFO, logger="app.services.database_manager"):
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                results = list(pool.map(first_read, ["a", "b", "c", "d"]))
+
+        assert results == [None] * 4
+        messages = [record.getMessage() for record in caplog.records]
+        assert not [m for m in messages if "조회 실패" in m]
+        assert len([m for m in messages if "컬럼 추가" in m]) == 1
+        columns = manager.duckdb_conn.execute(
+            "SELECT column_name FROM information_schema.columns "
+            "WHERE table_name = 'stock_cache'"
+        ).fetchall()
+        assert ("last_accessed_at",) in columns
+
+        assert manager.store_cache_data("k", [{"a": 1}], table_name="stock_cache")
+        assert manager.store_cache_data("k", [{"a": 2}], table_name="stock_cache")
+        assert manager.get_cache_data("k", table_name="stock_cache") == [{"a": 2}]
+    finally:
+        manager.shutdown()
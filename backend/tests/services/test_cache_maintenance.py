@@ -0,0 +1,150 @@
+"""Unit tests for :mod:`app.services.cache_maintenance`."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.services.cache_maintenance import parse_budgets
+from app.services.database_manager import DatabaseManager
+
+
+@pytest.fixture
+def db_manager() -> Iterator[DatabaseManager]:
+    manager = DatabaseManager(db_path=":memory:", reader_threads=2)
+    manager.connect()
+    try:
+        yield manager
+    finally:
+        manager.shutdown()
+
+
+def _payload(size: int) -> list[dict]:
+    return [{"value": "x" * size}]
+
+
+def _keys(db_manager: DatabaseManager, table: str = "unified_cache") -> list[str]:
+    rows = db_manager.duckdb_conn.execute(
+        f"SELECT cache_key FROM {table} ORDER BY cache_key"
+    ).fetchall()
+    return [row[0] for row in rows]
+
+
+def test_parse_budgets() -> None:
+    assert parse_budgets("news=1, crypto_intraday=0.5,,bad") == {
+        "news": 1024 * 1024,
+        "crypto_intraday": 512 * 1024,
+    }
+
+
+def test_expired_rows_are_purged_after_grace(db_manager: DatabaseManager) -> None:
+    maintenance = db_manager.cache_maintenance
+    maintenance.expired_grace = timedelta(hours=1)
+    db_manager.store_unified_cache("fresh", _payload(10), "news", ttl_hours=1)
+    db_manager.store_unified_cache("stale", _payload(10), "news", ttl_hours=-0.5)
+    db_manager.store_unified_cache("dead", _payload(10), "news", ttl_hours=-2)
+
+    result = maintenance.run_once()
+
+    assert result.expired_rows == 1
+    assert _keys(db_manager) == ["fresh", "stale"]
+
+
+def test_lru_eviction_respects_per_type_budget(db_manager: DatabaseManager) -> None:
+    maintenance = db_manager.cache_maintenance
+    maintenance.default_budget_bytes = 10 * 1024 * 1024
+    maintenance.budgets = {"news": 2_500}
+    # 1,000바이트 레거시 JSON 행 3개 (a가 가장 최근, c가 가장 오래됨)
+    for key in ("a", "b", "c"):
+        db_manager.duckdb_conn.execute(
+            """
+            INSERT INTO unified_cache (id, cache_key, data_type, data_json, updated_at)
+            VALUES (?, ?, 'news', ?, ?)
+            """,
+            [
+                key,
+                key,
+                json.dumps(["x" * 996]),
+                datetime.now(UTC) - timedelta(minutes=ord(key)),
+            ],
+        )
+    db_manager.store_unified_cache("other", _payload(10), "fundamental_overview")
+
+    # 가장 오래된 "c"를 조회하면 LRU 순서에서 가장 최근이 된다
+    assert db_manager.get_unified_cache("c", "news") is not None
+    result = maintenance.run_once()
+
+    assert result.access_updates == 1
+    assert result.evicted_rows == {"news": 1}
+    assert result.evicted_bytes == 1_000
+    assert _keys(db_manager) == ["a", "c", "other"]
+
+    stats = maintenance.get_stats()
+    assert stats["runs"] == 1
+    assert stats["evicted_rows"] == {"news": 1}
+    assert stats["pending_access_updates"] == 0
+
+
+def test_cache_tables_are_aged_out_and_budgeted(db_manager: DatabaseManager) -> None:
+    maintenance = db_manager.cache_maintenance
+    maintenance.table_max_age = timedelta(hours=1)
+    db_manager.store_cache_data("new", [{"a": 1}], table_name="market_data_cache")
+    db_manager.store_cache_data("old", [{"a": 1}], table_name="market_data_cache")
+    db_manager.duckdb_conn.execute(
+        "UPDATE market_data_cache SET updated_at = ? WHERE cache_key = 'old'",
+        [datetime.now(UTC) - timedelta(hours=2)],
+    )
+
+    result = maintenance.run_once()
+    assert result.expired_rows == 1
+    assert _keys(db_manager, "market_data_cache") == ["new"]
+
+    maintenance.budgets = {"market_data_cache": 0}
+    result = maintenance.run_once()
+    assert result.evicted_rows == {"market_data_cache": 1}
+    assert _keys(db_manager, "market_data_cache") == []
+
+
+@pytest.mark.asyncio
+async def test_background_task_lifecycle(db_manager: DatabaseManager) -> None:
+    maintenance = db_manager.cache_maintenance
+    maintenance.interval_seconds = 3600
+
+    assert maintenance.start()
+    assert not maintenance.start()
+    assert maintenance.get_stats()["running"]
+
+    result = await maintenance.run()
+    assert result.expired_rows == 0
+
+    await maintenance.stop()
+    assert not maintenance.get_stats()["running"]
+
+    maintenance.interval_seconds = 0
+    assert not maintenance.start()
+
+
+@pytest.mark.asyncio
+async def test_periodic_run_requires_the_lease(
+    db_manager: DatabaseManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    maintenance = db_manager.cache_maintenance
+    maintenance.interval_seconds = 0.01  # type: ignore[assignment]
+    run = AsyncMock()
+    monkeypatch.setattr(maintenance, "run", run)
+    lease = SimpleNamespace(acquire=AsyncMock(return_value=False), release=AsyncMock())
+
+    assert maintenance.start(lease=lease)  # type: ignore[arg-type]
+    await asyncio.sleep(0.05)
+    await maintenance.stop()
+
+    # 다른 워커가 리스를 보유 중이면 정리를 실행하지 않음
+    lease.acquire.assert_awaited()
+    run.assert_not_awaited()
+    lease.release.assert_awaited_once()
@@ -0,0 +1,244 @@
+"""Unit tests for :mod:`app.services.database_manager` against in-memory DuckDB."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from app.services.database_manager import DatabaseManager
+
+
+@pytest.fixture
+def db_manager() -> Iterator[DatabaseManager]:
+    manager = DatabaseManager(db_path=":memory:", reader_threads=2)
+    manager.connect()
+    try:
+        yield manager
+    finally:
+        manager.shutdown()
+
+
+def _daily_frame(
+    symbol: str, closes: list[float], start: str = "2024-01-01"
+) -> pd.DataFrame:
+    index = pd.date_range(start, periods=len(closes), freq="D", name="date")
+    return pd.DataFrame(
+        {
+            "symbol": symbol,
+            "open": closes,
+            "high": [c + 1 for c in closes],
+            "low": [c - 1 for c in closes],
+            "close": closes,
+            "volume": 1_000,
+        },
+        index=index,
+    )
+
+
+def test_upsert_daily_prices_reports_inserted_and_updated(
+    db_manager: DatabaseManager,
+) -> None:
+    first = db_manager.upsert_daily_prices(_daily_frame("AAPL", [10.0, 11.0, 12.0]))
+    assert (first.inserted, first.updated) == (3, 0)
+
+    # 마지막 2일 갱신 + 1일 신규
+    second = db_manager.upsert_daily_prices(
+        _daily_frame("AAPL", [21.0, 22.0, 23.0], start="2024-01-02")
+    )
+    assert (second.inserted, second.updated) == (1, 2)
+    assert second.total == 3
+
+    stored = db_manager.get_daily_prices("AAPL")
+    assert len(stored) == 4
+    assert stored["close"].astype(float).tolist() == [10.0, 21.0, 22.0, 23.0]
+    # 누락된 선택 컬럼은 기본값으로 채워진다
+    assert stored["adjusted_close"].astype(float).tolist() == [10.0, 21.0, 22.0, 23.0]
+    assert stored["split_coefficient"].astype(float).unique().tolist() == [1.0]
+
+
+def test_upsert_daily_prices_collapses_duplicate_keys(
+    db_manager: DatabaseManager,
+) -> None:
+    frame = pd.concat(
+        [_daily_frame("MSFT", [c]) for c in (3.0, 1.0, 2.0)]
+        + [_daily_frame("AAPL", [5.0])]
+    )
+
+    result = db_manager.upsert_daily_prices(frame)
+
+    assert result.total == 2
+    # 배치 안의 중복 키는 마지막 입력 행이 남는다
+    assert db_manager.get_daily_prices("MSFT")["close"].astype(float).tolist() == [2.0]
+
+    table = pa.Table.from_pandas(frame.reset_index(), preserve_index=False)
+    db_manager.upsert_daily_prices(table.take([3, 1, 2, 0]))
+    assert db_manager.get_daily_prices("MSFT")["close"].astype(float).tolist() == [3.0]
+
+
+def test_insert_intraday_prices_uses_bulk_path(db_manager: DatabaseManager) -> None:
+    index = pd.date_range("2024-01-02 09:30", periods=4, freq="5min")
+    frame = pd.DataFrame(
+        {
+            "symbol": "AAPL",
+            "open": 1.0,
+            "high": 2.0,
+            "low": 0.5,
+            "close": 1.5,
+            "volume": 10,
+        },
+        index=index,
+    )
+
+    assert db_manager.insert_intraday_prices(frame, "5min") == 4
+    assert db_manager.insert_intraday_prices(frame, "5min") == 4
+
+    count = db_manager.duckdb_conn.execute(
+        "SELECT COUNT(*) FROM intraday_prices WHERE interval_type = '5min'"
+    ).fetchone()
+    assert count == (4,)
+
+
+def test_upsert_requires_symbol_column(db_manager: DatabaseManager) -> None:
+    frame = _daily_frame("AAPL", [1.0]).drop(columns=["symbol"])
+
+    with pytest.raises(ValueError):
+        db_manager.upsert_daily_prices(frame)
+
+
+def test_thread_cursor_is_reused_per_thread(db_manager: DatabaseManager) -> None:
+    main_cursor = db_manager.thread_cursor()
+    assert db_manager.thread_cursor() is main_cursor
+
+    other: list[object] = []
+    worker = threading.Thread(target=lambda: other.append(db_manager.thread_cursor()))
+    worker.start()
+    worker.join()
+
+    assert other[0] is not main_cursor
+    assert other[0] is not db_manager.connection
+
+
+def test_thread_cursor_is_reissued_after_reconnect(db_manager: DatabaseManager) -> None:
+    cursor = db_manager.thread_cursor()
+
+    db_manager.close()
+    db_manager.connect()
+
+    assert db_manager.thread_cursor() is not cursor
+
+
+@pytest.mark.asyncio
+async def test_run_read_and_run_write_use_dedicated_lanes(
+    db_manager: DatabaseManager,
+) -> None:
+    db_manager.upsert_daily_prices(_daily_frame("AAPL", [1.0, 2.0]))
+
+    def _read() -> tuple[str, int]:
+        row = (
+            db_manager.thread_cursor()
+            .execute("SELECT COUNT(*) FROM daily_prices")
+            .fetchone()
+        )
+        return threading.current_thread().name, int(row[0])
+
+    def _write() -> str:
+        db_manager.upsert_daily_prices(_daily_frame("AAPL", [3.0], start="2024-02-01"))
+        return threading.current_thread().name
+
+    reader_name, count = await db_manager.run_read(_read)
+    writer_name = await db_manager.run_write(_write)
+
+    assert reader_name.startswith("duckdb-reader")
+    assert count == 2
+    assert writer_name.startswith("duckdb-writer")
+    assert len(db_manager.get_daily_prices("AAPL")) == 3
+
+
+def _panel_fixture(db_manager: DatabaseManager) -> None:
+    # AAPL: 1/2(화)~1/5(금), MSFT: 1/3(수)·1/5(금)만 존재
+    db_manager.upsert_daily_prices(
+        _daily_frame("AAPL", [1.0, 2.0, 3.0, 4.0], start="2024-01-02")
+    )
+    msft = _daily_frame("MSFT", [10.0, 20.0], start="2024-01-03")
+    msft.index = pd.DatetimeIndex(["2024-01-03", "2024-01-05"], name="date")
+    db_manager.upsert_daily_prices(msft)
+
+
+def test_price_panel_union_calendar_with_ffill(db_manager: DatabaseManager) -> None:
+    _panel_fixture(db_manager)
+
+    raw = db_manager.get_price_panel(["MSFT", "AAPL"], field="close")
+    assert raw.symbols == ["MSFT", "AAPL"]
+    assert raw.values.shape == (4, 2)
+    assert np.isnan(raw.values[0, 0]) and np.isnan(raw.values[2, 0])
+
+    filled = db_manager.get_price_panel(["MSFT", "AAPL"], field="close", ffill=True)
+    assert filled.column("MSFT")[1:].tolist() == [10.0, 10.0, 20.0]
+    assert np.isnan(filled.column("MSFT")[0])  # 선행 결측은 채우지 않음
+
+
+def test_price_panel_intersection_and_lookback(db_manager: DatabaseManager) -> None:
+    _panel_fixture(db_manager)
+
+    both = db_manager.get_price_panel(["AAPL", "MSFT"], calendar="intersection")
+    assert list(both.index.strftime("%Y-%m-%d")) == ["2024-01-03", "2024-01-05"]
+    assert both.values.tolist() == [[2.0, 10.0], [4.0, 20.0]]
+
+    recent = db_manager.get_price_panel(["AAPL", "MSFT"], lookback=2)
+    assert list(recent.index.strftime("%Y-%m-%d")) == ["2024-01-04", "2024-01-05"]
+
+
+def test_price_panel_explicit_calendar_uses_as_of_values(
+    db_manager: DatabaseManager,
+) -> None:
+    _panel_fixture(db_manager)
+
+    calendar = pd.DatetimeIndex(["2024-01-04", "2024-01-08"])
+    panel = db_manager.get_price_panel(["AAPL", "MSFT"], calendar=calendar, ffill=True)
+
+    assert panel.index.equals(pd.DatetimeIndex(calendar, name="date"))
+    assert panel.values.tolist() == [[3.0, 10.0], [4.0, 20.0]]
+
+    business = db_manager.get_price_panel(
+        ["AAPL"], start="2024-01-05", end="2024-01-09", calendar="business"
+    )
+    assert len(business.index) == 3  # 1/5(금), 1/8(월), 1/9(화)
+    assert np.isnan(business.values[1:, 0]).all()
+
+
+def test_price_panels_share_one_calendar(db_manager: DatabaseManager) -> None:
+    _panel_fixture(db_manager)
+
+    panels = db_manager.get_price_panels(["AAPL", "MSFT"], fields=["close", "volume"])
+
+    assert panels["close"].index.equals(panels["volume"].index)
+    assert panels["volume"].values.dtype == np.float64
+    assert panels["close"].to_frame().columns.tolist() == ["AAPL", "MSFT"]
+
+
+def test_recent_prices_window_is_per_symbol(db_manager: DatabaseManager) -> None:
+    db_manager.upsert_daily_prices(
+        _daily_frame("AAPL", [float(i) for i in range(200)], start="2024-01-01")
+    )
+    # 거래가 멈춘 심볼: 더 오래된 100개 봉만 존재
+    db_manager.upsert_daily_prices(
+        _daily_frame("OLD", [float(i) for i in range(100)], start="2023-01-01")
+    )
+
+    recent = db_manager.get_recent_prices(
+        ["AAPL", "OLD", "NONE"], 80, fields=["close", "volume"]
+    )
+
+    assert sorted(recent) == ["AAPL", "OLD"]
+    assert len(recent["OLD"]) == 80
+    assert recent["OLD"]["close"].tolist() == [float(i) for i in range(20, 100)]
+    assert recent["AAPL"].index.is_monotonic_increasing
+    assert recent["AAPL"]["close"].iloc[-1] == 199.0
+    # 달력 기준 lookback 패널에서는 OLD가 비어 있음
+    panel = db_manager.get_price_panel(["AAPL", "OLD"], lookback=80)
+    assert np.isnan(panel.column("OLD")).all()
@@ -0,0 +1,178 @@
+"""Unit tests for :mod:`app.services.price_store`."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from app.services.database_manager import DatabaseManager
+
+
+@pytest.fixture
+def db_manager(tmp_path: Path) -> Iterator[DatabaseManager]:
+    manager = DatabaseManager(
+        db_path=str(tmp_path / "quant.duckdb"),
+        reader_threads=2,
+        price_store_path=str(tmp_path / "store"),
+    )
+    manager.connect()
+    try:
+        yield manager
+    finally:
+        manager.shutdown()
+
+
+def _daily_frame(
+    symbol: str, start: str, periods: int, base: float = 10.0
+) -> pd.DataFrame:
+    index = pd.date_range(start, periods=periods, freq="D", name="date")
+    closes = [base + i for i in range(periods)]
+    return pd.DataFrame(
+        {
+            "symbol": symbol,
+            "open": closes,
+            "high": closes,
+            "low": closes,
+            "close": closes,
+            "volume": 100,
+        },
+        index=index,
+    )
+
+
+def test_upsert_writes_symbol_year_partitions(
+    db_manager: DatabaseManager, tmp_path: Path
+) -> None:
+    db_manager.upsert_daily_prices(_daily_frame("AAPL", "2023-12-30", 4))
+
+    symbol_dir = tmp_path / "store" / "interval=daily" / "symbol=AAPL"
+    assert sorted(p.name for p in symbol_dir.iterdir()) == ["year=2023", "year=2024"]
+    assert not list((tmp_path / "store").glob(".staging-*"))
+
+
+def test_get_prices_arrow_returns_float64_columns(db_manager: DatabaseManager) -> None:
+    db_manager.upsert_daily_prices(_daily_frame("AAPL", "2024-01-01", 5))
+    db_manager.upsert_daily_prices(_daily_frame("MSFT", "2024-01-01", 5, base=100.0))
+
+    table = db_manager.get_prices_arrow(
+        ["MSFT", "AAPL"],
+        start="2024-01-02",
+        end="2024-01-04",
+        columns=["close", "volume"],
+    )
+
+    assert table.column_names == ["symbol", "date", "close", "volume"]
+    assert table.schema.field("close").type == pa.float64()
+    assert table.schema.field("volume").type == pa.int64()
+    assert table.column("symbol").to_pylist() == ["AAPL"] * 3 + ["MSFT"] * 3
+    assert table.column("close").to_numpy().tolist() == [
+        11.0,
+        12.0,
+        13.0,
+        101.0,
+        102.0,
+        103.0,
+    ]
+
+
+def test_resync_replaces_partition_contents(db_manager: DatabaseManager) -> None:
+    db_manager.upsert_daily_prices(_daily_frame("AAPL", "2024-01-01", 3))
+    db_manager.upsert_daily_prices(_daily_frame("AAPL", "2024-01-02", 1, base=50.0))
+
+    closes = db_manager.get_prices_arrow(["AAPL"], columns=["close"]).column("close")
+
+    assert closes.to_pylist() == [10.0, 50.0, 12.0]
+
+
+def test_incremental_upsert_rewrites_only_touched_years(
+    db_manager: DatabaseManager, tmp_path: Path
+) -> None:
+    db_manager.upsert_daily_prices(_daily_frame("AAPL", "2023-12-30", 4))
+    symbol_dir = tmp_path / "store" / "interval=daily" / "symbol=AAPL"
+    old_year = next((symbol_dir / "year=2023").glob("*.parquet"))
+    old_inode = old_year.stat().st_ino
+
+    db_manager.upsert_daily_prices(_daily_frame("AAPL", "2024-01-03", 1, base=50.0))
+
+    assert next((symbol_dir / "year=2023").glob("*.parquet")).stat().st_ino == old_inode
+    closes = db_manager.get_prices_arrow(["AAPL"], columns=["close"]).column("close")
+    assert closes.to_pylist() == [10.0, 11.0, 12.0, 13.0, 50.0]
+
+
+def test_first_sync_of_a_symbol_writes_full_history(
+    db_manager: DatabaseManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        "app.services.database_manager.settings.PRICE_STORE_AUTO_SYNC", False
+    )
+    db_manager.upsert_daily_prices(_daily_frame("TSLA", "2023-12-30", 3))
+    monkeypatch.setattr(
+        "app.services.database_manager.settings.PRICE_STORE_AUTO_SYNC", True
+    )
+
+    db_manager.upsert_daily_prices(_daily_frame("TSLA", "2024-01-02", 1, base=20.0))
+
+    files, missing = db_manager.price_store.partition_files(["TSLA"])
+    assert len(files) == 2 and not missing
+    table = db_manager.get_prices_arrow(["TSLA"], columns=["close"])
+    assert table.column("close").to_pylist() == [10.0, 11.0, 12.0, 20.0]
+
+
+def test_symbols_without_partitions_fall_back_to_table(
+    db_manager: DatabaseManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        "app.services.database_manager.settings.PRICE_STORE_AUTO_SYNC", False
+    )
+    db_manager.upsert_daily_prices(_daily_frame("TSLA", "2024-01-01", 2))
+    assert db_manager.price_store.partition_files(["TSLA"]) == ([], ["TSLA"])
+
+    table = db_manager.get_prices_arrow(["TSLA"], columns=["close"])
+    assert table.schema.field("close").type == pa.float64()
+    assert table.num_rows == 2
+
+    assert db_manager.sync_price_store(["TSLA"]) == 2
+    files, missing = db_manager.price_store.partition_files(["TSLA"])
+    assert files and not missing
+
+
+def test_intraday_prices_partitioned_by_interval(
+    db_manager: DatabaseManager, tmp_path: Path
+) -> None:
+    index = pd.date_range("2024-01-02 09:30", periods=3, freq="5min")
+    frame = pd.DataFrame(
+        {
+            "symbol": "AAPL",
+            "open": 1.0,
+            "high": 2.0,
+            "low": 0.5,
+            "close": 1.5,
+            "volume": 10,
+        },
+        index=index,
+    )
+    db_manager.upsert_intraday_prices(frame, "5min")
+
+    assert (tmp_path / "store" / "interval=5min" / "symbol=AAPL").is_dir()
+    table = db_manager.get_prices_arrow(["AAPL"], interval="5min")
+    assert table.column_names == [
+        "symbol",
+        "datetime",
+        "open",
+        "high",
+        "low",
+        "close",
+        "volume",
+    ]
+    assert table.num_rows == 3
+
+
+def test_unknown_columns_are_rejected(db_manager: DatabaseManager) -> None:
+    with pytest.raises(ValueError):
+        db_manager.get_prices_arrow(
+            ["AAPL"], columns=["adjusted_close"], interval="5min"
+        )
@@ -0,0 +1,167 @@
+"""Unit tests for :mod:`app.services.timeseries_cache`."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+
+from app.services.database_manager import DatabaseManager
+from app.services.market_data.base_service import BaseMarketDataService
+
+
+@pytest.fixture
+def db_manager() -> Iterator[DatabaseManager]:
+    manager = DatabaseManager(db_path=":memory:", reader_threads=2)
+    manager.connect()
+    try:
+        yield manager
+    finally:
+        manager.shutdown()
+
+
+def _bars(start: int, count: int, close_offset: float = 0.0) -> list[dict[str, Any]]:
+    origin = datetime(2024, 1, 1)
+    return [
+        {
+            "symbol": "BTC",
+            "market": "USD",
+            "date": origin + timedelta(days=i),
+            "open_market": 100.0 + i,
+            "high_market": 110.0 + i,
+            "low_market": 90.0 + i,
+            "close_market": 105.0 + i + close_offset,
+            "volume": 1_000.0 + i,
+            "market_cap": None,
+            "source": "alpha_vantage",
+            "created_at": datetime(2024, 6, 1),
+        }
+        for i in range(start, start + count)
+    ]
+
+
+def test_append_and_range_read(db_manager: DatabaseManager) -> None:
+    ts_cache = db_manager.timeseries_cache
+
+    assert (
+        ts_cache.append("crypto_daily", "BTC_USD", "BTC_USD", _bars(0, 10), ttl_hours=1)
+        == 10
+    )
+
+    meta = ts_cache.get_meta("crypto_daily", "BTC_USD")
+    assert meta is not None and meta.is_fresh()
+    assert meta.row_count == 10
+    assert meta.attrs == {"symbol": "BTC", "market": "USD", "source": "alpha_vantage"}
+
+    rows = ts_cache.read("crypto_daily", "BTC_USD", start=datetime(2024, 1, 3), limit=2)
+    assert [row["date"] for row in rows] == [
+        datetime(2024, 1, 10),
+        datetime(2024, 1, 9),
+    ]
+    assert rows[0]["close_market"] == 114.0
+    assert rows[0]["market_cap"] is None
+    assert rows[0]["market"] == "USD"
+
+    ascending = ts_cache.read(
+        "crypto_daily", "BTC_USD", end=datetime(2024, 1, 2), descending=False
+    )
+    assert [row["date"] for row in ascending] == [
+        datetime(2024, 1, 1),
+        datetime(2024, 1, 2),
+    ]
+
+
+def test_append_only_writes_bars_from_last_stored(db_manager: DatabaseManager) -> None:
+    ts_cache = db_manager.timeseries_cache
+    ts_cache.append("crypto_daily", "BTC_USD", "BTC_USD", _bars(0, 10))
+
+    # 전체 응답을 다시 받아도 마지막 봉(보정) + 새 봉만 기록
+    written = ts_cache.append(
+        "crypto_daily", "BTC_USD", "BTC_USD", _bars(0, 12, close_offset=0.5)
+    )
+
+    assert written == 3
+    rows = ts_cache.read("crypto_daily", "BTC_USD")
+    assert len(rows) == 12
+    assert rows[0]["close_market"] == 116.5  # 새 봉
+    assert rows[2]["close_market"] == 114.5  # 갱신된 마지막 봉
+    assert rows[3]["close_market"] == 113.0  # 기존 봉은 유지
+
+
+def test_expired_series_are_purged_by_maintenance(db_manager: DatabaseManager) -> None:
+    ts_cache = db_manager.timeseries_cache
+    ts_cache.append("crypto_daily", "OLD_USD", "OLD_USD", _bars(0, 3), ttl_hours=-2)
+    ts_cache.append("crypto_daily", "BTC_USD", "BTC_USD", _bars(0, 3), ttl_hours=-0.5)
+
+    maintenance = db_manager.cache_maintenance
+    maintenance.table_max_age = timedelta(hours=1)
+    result = maintenance.run_once()
+
+    assert result.expired_rows == 3
+    assert ts_cache.get_meta("crypto_daily", "OLD_USD") is None
+    assert len(ts_cache.read("crypto_daily", "BTC_USD")) == 3
+
+
+class _Bar(BaseModel):
+    symbol: str
+    market: str
+    date: datetime
+    close_market: float
+
+
+class _SeriesService(BaseMarketDataService):
+    async def refresh_data_from_source(self, **kwargs: Any) -> list[Any]:
+        return []
+
+
+@pytest.mark.asyncio
+async def test_get_series_with_cache_refreshes_incrementally(
+    db_manager: DatabaseManager,
+) -> None:
+    service = _SeriesService(db_manager)
+    calls: list[str] = []
+
+    async def full() -> list[dict[str, Any]]:
+        calls.append("full")
+        return _bars(0, 10)
+
+    async def compact() -> list[dict[str, Any]]:
+        calls.append("compact")
+        return _bars(8, 4)
+
+    options: dict[str, Any] = {
+        "series_key": "BTC_USD",
+        "data_type": "crypto_daily",
+        "model_class": _Bar,
+        "refresh_callback": full,
+        "incremental_callback": compact,
+        "incremental_window": timedelta(days=365 * 100),
+        "full_history": True,
+    }
+
+    first = await service.get_series_with_cache(**options, limit=3)
+    cached = await service.get_series_with_cache(**options)
+    assert [bar.date.day for bar in first] == [10, 9, 8]
+    assert len(cached) == 10
+    assert calls == ["full"]
+
+    db_manager.duckdb_conn.execute(
+        "UPDATE ts_cache_series SET expires_at = TIMESTAMP '2000-01-01'"
+    )
+    refreshed = await service.get_series_with_cache(**options)
+    assert calls == ["full", "compact"]
+    assert len(refreshed) == 12
+
+    async def failing() -> list[dict[str, Any]]:
+        raise RuntimeError("rate limited")
+
+    db_manager.duckdb_conn.execute(
+        "UPDATE ts_cache_series SET expires_at = TIMESTAMP '2000-01-01'"
+    )
+    stale = await service.get_series_with_cache(
+        **{**options, "incremental_callback": failing}
+    )
+    assert len(stale) == 12
@@ -0,0 +1,72 @@
+"""Unit tests for :mod:`app.tasks.lease`."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+import pytest
+from pymongo.errors import DuplicateKeyError
+
+from app.models.market_data.stock import BackgroundTaskLease
+from app.tasks.lease import TaskLease
+
+
+class _LeaseCollection:
+    """Single-document stand-in for the lease collection (unique ``name``)."""
+
+    def __init__(self) -> None:
+        self.document: dict[str, Any] | None = None
+
+    async def find_one_and_update(
+        self, query: dict[str, Any], update: dict[str, Any], **_: Any
+    ) -> dict[str, Any]:
+        owner, expired = query["$or"][0]["owner"], query["$or"][1]["expires_at"]["$lte"]
+        doc = self.document
+        if doc is not None and doc["owner"] != owner and doc["expires_at"] > expired:
+            # 조건 불일치 → upsert 삽입이 고유 인덱스에 막힘
+            raise DuplicateKeyError("E11000 duplicate key error")
+        self.document = {"name": query["name"], **update["$set"]}
+        return self.document
+
+    async def update_one(self, query: dict[str, Any], update: dict[str, Any]) -> None:
+        if self.document is not None and self.document["owner"] == query["owner"]:
+            self.document.update(update["$set"])
+
+
+@pytest.fixture
+def collection(monkeypatch: pytest.MonkeyPatch) -> _LeaseCollection:
+    fake = _LeaseCollection()
+    monkeypatch.setattr(
+        BackgroundTaskLease, "get_motor_collection", lambda: fake, raising=False
+    )
+    return fake
+
+
+@pytest.mark.asyncio
+async def test_only_one_process_holds_the_lease(collection: _LeaseCollection) -> None:
+    first, second = TaskLease("job", 600), TaskLease("job", 600)
+
+    assert await first.acquire()
+    assert not await second.acquire()
+    # 보유자는 갱신 가능
+    assert await first.acquire()
+
+    await first.release()
+    assert await second.acquire()
+    assert not await first.acquire()
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_is_taken_over(collection: _LeaseCollection) -> None:
+    stale, fresh = TaskLease("job", 600), TaskLease("job", 600)
+    assert await stale.acquire()
+    collection.document["expires_at"] = datetime(2000, 1, 1).astimezone()  # type: ignore[index]
+
+    assert await fresh.acquire()
+    assert not await stale.acquire()
+
+
+def test_periodic_lease_outlives_the_interval() -> None:
+    assert TaskLease.for_interval("job", 1800).ttl_seconds == 3600
+    assert TaskLease.for_interval("job", 60).ttl_seconds == 600
@@ -0,0 +1,233 @@
+"""Unit tests for :mod:`app.tasks.refresh_scheduler`."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.alpha_vantage import LimitResponseError, record_request
+from app.services.database_manager import DatabaseManager
+from app.services.market_data.stock.fetcher import StockFetcher
+from app.tasks.refresh_scheduler import (
+    CoverageRefreshScheduler,
+    importance,
+    paced_allowance,
+)
+
+NOW = datetime(2024, 3, 4, 6, 0, tzinfo=UTC)
+
+
+def _coverage(symbol: str, data_type: str = "daily", overdue_hours: float = 1.0) -> Any:
+    return SimpleNamespace(
+        symbol=symbol,
+        data_type=data_type,
+        next_update_due=NOW - timedelta(hours=overdue_hours),
+        last_delta_update=None,
+        last_full_update=None,
+    )
+
+
+class _Scheduler(CoverageRefreshScheduler):
+    """Scheduler with MongoDB access replaced by in-memory state."""
+
+    def __init__(
+        self,
+        coverages: list[Any],
+        weights: dict[str, float] | None = None,
+        checkpoint: Any = None,
+        calls: dict[str, int] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self.refreshed: list[str] = []
+        # 심볼별 갱신 1회에 나가는 Alpha Vantage 호출 수 (기본 1회)
+        self.calls = calls or {}
+        self.active = 0
+        self.max_active = 0
+        super().__init__(refresh=self._fake_refresh, clock=lambda: NOW, **kwargs)
+        self.coverages = coverages
+        self.weights = weights or {}
+        self.checkpoint = checkpoint or SimpleNamespace(
+            job="coverage_refresh",
+            day=NOW.date().isoformat(),
+            calls_used=0,
+            pending=[],
+            completed=0,
+            failed=0,
+            updated_at=None,
+        )
+        self.saved_pending: list[list[str]] = []
+
+    async def _fake_refresh(self, symbol: str, data_type: str, full: bool) -> None:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.001)
+        for _ in range(self.calls.get(symbol, 1)):
+            record_request()
+        self.active -= 1
+        if symbol == "FAIL":
+            raise RuntimeError("boom")
+        self.refreshed.append(f"{symbol}:{data_type}")
+
+    async def _load_coverages(self, now: datetime, force: bool) -> list[Any]:
+        return self.coverages
+
+    async def _load_importance(self, symbols: list[str]) -> dict[str, float]:
+        return self.weights
+
+    async def _load_checkpoint(self, job: str, now: datetime) -> Any:
+        return self.checkpoint
+
+    async def _save_checkpoint(self, checkpoint: Any) -> None:
+        self.saved_pending.append(list(checkpoint.pending))
+
+
+@pytest.mark.asyncio
+async def test_plan_orders_by_staleness_importance_and_data_type() -> None:
+    scheduler = _Scheduler(
+        [
+            _coverage("OLD", overdue_hours=10),
+            _coverage("HOT", overdue_hours=4),
+            _coverage("OLD", "monthly", overdue_hours=10),
+            _coverage("NEW", overdue_hours=1),
+        ],
+        weights={"HOT": importance(watchlists=3, backtests=2)},
+        concurrency=1,
+    )
+
+    result = await scheduler.run()
+
+    # HOT: 5h × 3.1 > OLD: 11h × 1 > OLD monthly: 11h × 0.25 > NEW: 2h
+    assert scheduler.refreshed == ["HOT:daily", "OLD:daily", "OLD:monthly", "NEW:daily"]
+    assert (result.total, result.success, result.deferred) == (4, 4, 0)
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded_and_failures_are_recorded() -> None:
+    coverages = [_coverage(f"S{i}") for i in range(10)] + [_coverage("FAIL")]
+    scheduler = _Scheduler(coverages, concurrency=3)
+
+    result = await scheduler.run()
+
+    assert scheduler.max_active == 3
+    assert (result.success, result.failed) == (10, 1)
+    assert scheduler.checkpoint.pending == []
+
+
+@pytest.mark.asyncio
+async def test_daily_budget_is_paced_and_remaining_plan_is_checkpointed() -> None:
+    coverages = [_coverage(f"S{i}", overdue_hours=20 - i) for i in range(10)]
+    scheduler = _Scheduler(
+        coverages, daily_budget=96, interval_seconds=0, concurrency=2
+    )
+    scheduler.checkpoint.calls_used = 20
+
+    result = await scheduler.run()
+
+    # 06:00 → 하루 예산의 1/4 (24건) 중 20건 사용 → 4건만 실행
+    assert result.attempted == 4
+    assert sorted(scheduler.refreshed) == [
+        "S0:daily",
+        "S1:daily",
+        "S2:daily",
+        "S3:daily",
+    ]
+    assert scheduler.checkpoint.pending == [f"S{i}:daily" for i in range(4, 10)]
+    assert (result.deferred, result.calls_used_today) == (6, 24)
+
+
+@pytest.mark.asyncio
+async def test_restart_resumes_checkpointed_plan_first() -> None:
+    coverages = [_coverage("A", overdue_hours=50), _coverage("B"), _coverage("C")]
+    scheduler = _Scheduler(coverages, concurrency=1)
+    # 이전 실행에서 C → B 순서로 남은 계획, A는 그 이후 새로 만료됨
+    scheduler.checkpoint.pending = ["C:daily", "GONE:daily", "B:daily"]
+
+    result = await scheduler.run()
+
+    assert result.resumed
+    assert scheduler.refreshed == ["C:daily", "B:daily", "A:daily"]
+
+
+@pytest.mark.asyncio
+async def test_usage_counts_only_requests_actually_sent() -> None:
+    coverages = [_coverage("HIT"), _coverage("DELTA"), _coverage("ESCALATE")]
+    # 캐시 적중 0회, 증분 1회, 증분 → 전체 재적재 2회
+    scheduler = _Scheduler(coverages, calls={"HIT": 0, "ESCALATE": 2}, concurrency=2)
+    scheduler.checkpoint.calls_used = 5
+
+    result = await scheduler.run()
+
+    assert result.success == 3
+    assert result.calls_used_today == 8
+
+
+@pytest.mark.asyncio
+async def test_throttled_fetch_stops_run_and_keeps_items_pending() -> None:
+    fetcher = StockFetcher(DatabaseManager(db_path=":memory:"))
+    limited = AsyncMock(side_effect=LimitResponseError("Alpha Vantage API Limit: Note"))
+    fetcher._alpha_vantage_client = SimpleNamespace(  # type: ignore[assignment]
+        stock=SimpleNamespace(daily_adjusted_table=limited)
+    )
+
+    async def refresh(symbol: str, data_type: str, full: bool) -> None:
+        await fetcher.fetch_daily_prices(symbol, outputsize="compact")
+
+    scheduler = _Scheduler([_coverage("AAPL"), _coverage("MSFT")], concurrency=1)
+    scheduler._refresh = refresh
+
+    result = await scheduler.run()
+
+    # 한도 응답은 성공으로 처리되지 않고, 실행을 멈춘 뒤 두 항목 모두 다음 실행으로 보류
+    limited.assert_awaited_once()
+    assert (result.success, result.attempted, result.deferred) == (0, 0, 2)
+    assert scheduler.checkpoint.pending == ["AAPL:daily", "MSFT:daily"]
+
+
+class _Lease:
+    """Lease stub that is held for the first ``grants`` acquisitions only."""
+
+    def __init__(self, grants: int) -> None:
+        self.grants = grants
+        self.released = False
+
+    async def acquire(self) -> bool:
+        self.grants -= 1
+        return self.grants >= 0
+
+    async def release(self) -> None:
+        self.released = True
+
+
+@pytest.mark.asyncio
+async def test_run_requires_the_cross_process_lease() -> None:
+    coverages = [_coverage("A"), _coverage("B"), _coverage("C")]
+    blocked = _Scheduler(coverages, lease=_Lease(grants=0))
+
+    result = await blocked.run()
+
+    assert blocked.refreshed == [] and result.total == 0
+    assert "lease" in result.errors[0]
+
+    # 실행 중 리스를 잃으면 남은 항목은 계획에 남김 (시작 1회 + 항목 1회 갱신)
+    losing = _Scheduler(coverages, lease=_Lease(grants=2), concurrency=1)
+    result = await losing.run()
+
+    assert losing.refreshed == ["A:daily"]
+    assert losing.checkpoint.pending == ["B:daily", "C:daily"]
+
+    lease = _Lease(grants=0)
+    await _Scheduler(coverages, lease=lease).stop()
+    assert lease.released
+
+
+def test_paced_allowance_spreads_budget_across_the_day() -> None:
+    assert paced_allowance(100, 0, NOW.replace(hour=0), horizon_seconds=0) == 0
+    assert paced_allowance(100, 0, NOW.replace(hour=12), horizon_seconds=0) == 50
+    assert paced_allowance(100, 60, NOW.replace(hour=12), horizon_seconds=0) == 0
+    # 마지막 실행은 남은 예산을 모두 사용
+    assert paced_allowance(100, 90, NOW.replace(hour=23), horizon_seconds=3600) == 10
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+DuckDB 캐시 페이로드 코덱 벤치마크
+json(기존 TEXT) vs json+zstd vs arrow+zstd: 저장/HIT 지연과 디스크 크기 비교
+
+사용법:
+    # 기본: 5,000봉 시계열 × 200 캐시 키
+    python scripts/benchmark_cache_codec.py
+
+    # 시계열 길이/키 수 조정
+    python scripts/benchmark_cache_codec.py --bars 20000 --keys 50
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+# Add backend directory to Python path
+backend_dir = Path(__file__).parent.parent / "backend"
+sys.path.insert(0, str(backend_dir))
+
+import numpy as np  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.services.database_manager import DatabaseManager  # noqa: E402
+
+
+def build_series(bars: int, seed: int = 42) -> list[dict]:
+    """합성 인트라데이 봉 데이터 (Pydantic model_dump 결과와 같은 형태)"""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.002, size=bars)))
+    start = datetime(2024, 1, 2, 9, 30)
+    return [
+        {
+            "id": f"{i:024x}",
+            "symbol": "BTC_USD",
+            "timestamp": start + timedelta(minutes=5 * i),
+            "open": Decimal(f"{close[i] * 0.999:.4f}"),
+            "high": Decimal(f"{close[i] * 1.002:.4f}"),
+            "low": Decimal(f"{close[i] * 0.998:.4f}"),
+            "close": Decimal(f"{close[i]:.4f}"),
+            "volume": int(rng.integers(1_000, 1_000_000)),
+            "created_at": start,
+            "updated_at": start,
+        }
+        for i in range(bars)
+    ]
+
+
+def run(codec: str, series: list[dict], keys: int, tmp_dir: str) -> dict:
+    settings.CACHE_PAYLOAD_CODEC = codec
+    db_path = str(Path(tmp_dir) / f"cache_{codec.replace('+', '_')}.duckdb")
+
+    with DatabaseManager(db_path, price_store_path="") as db:
+        started = time.perf_counter()
+        for key in range(keys):
+            db.store_unified_cache(f"key_{key}", series, "crypto_intraday", f"SYM{key}")
+        store_sec = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for key in range(keys):
+            rows = db.get_unified_cache(f"key_{key}", "crypto_intraday", f"SYM{key}")
+            assert rows is not None and len(rows) == len(series)
+        hit_sec = time.perf_counter() - started
+
+        db.duckdb_conn.execute("CHECKPOINT")
+
+    return {
+        "store_ms": store_sec / keys * 1000,
+        "hit_ms": hit_sec / keys * 1000,
+        "size_mb": os.path.getsize(db_path) / 1024 / 1024,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Cache payload codec benchmark")
+    parser.add_argument("--bars", type=int, default=5000, help="캐시 키당 봉 수")
+    parser.add_argument("--keys", type=int, default=200, help="캐시 키 수")
+    args = parser.parse_args()
+
+    series = build_series(args.bars)
+    print(f"📦 Generated {args.bars:,} bars × {args.keys} keys")
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for codec in ("json", "json+zstd", "arrow+zstd"):
+            results[codec] = run(codec, series, args.keys, tmp_dir)
+
+    baseline = results["json"]
+    print("\n" + "=" * 68)
+    print("📊 Cache Codec Results (per key)")
+    print("=" * 68)
+    print(
+        f"{'codec':<12} {'store ms':>10} {'hit ms':>10} {'db size MB':>12} {'hit speedup':>12}"
+    )
+    for codec, result in results.items():
+        print(
+            f"{codec:<12} {result['store_ms']:10.2f} {result['hit_ms']:10.2f} "
+            f"{result['size_mb']:12.1f} {baseline['hit_ms'] / result['hit_ms']:11.1f}x"
+        )
+    print("=" * 68)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+DuckDB 가격 데이터 적재 벤치마크
+DatabaseManager.upsert_daily_prices (bulk) vs 기존 행 단위 INSERT 루프 비교
+
+사용법:
+    # 기본: 1,200,000행 bulk 적재 + 20,000행 샘플로 행 단위 루프 측정
+    python scripts/benchmark_duckdb_ingest.py
+
+    # 심볼 수/기간 조정
+    python scripts/benchmark_duckdb_ingest.py --symbols 400 --days 5040 --legacy-rows 50000
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add backend directory to Python path
+backend_dir = Path(__file__).parent.parent / "backend"
+sys.path.insert(0, str(backend_dir))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from app.services.database_manager import DatabaseManager  # noqa: E402
+
+
+def build_frame(symbols: int, days: int, seed: int = 42) -> pd.DataFrame:
+    """합성 일봉 데이터 생성 (symbols × days 행, date 인덱스)"""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(end="2024-12-31", periods=days)
+    rows = symbols * days
+
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, size=(symbols, days)), axis=1))
+    close = close.reshape(rows)
+    spread = np.abs(rng.normal(0, 0.005, size=rows)) * close
+
+    frame = pd.DataFrame(
+        {
+            "symbol": np.repeat([f"SYM{i:04d}" for i in range(symbols)], days),
+            "open": close + rng.normal(0, 0.002, size=rows) * close,
+            "high": close + spread,
+            "low": close - spread,
+            "close": close,
+            "adjusted_close": close,
+            "volume": rng.integers(10_000, 5_000_000, size=rows),
+            "dividend_amount": 0.0,
+            "split_coefficient": 1.0,
+        },
+        index=pd.DatetimeIndex(np.tile(dates, symbols), name="date"),
+    )
+    return frame
+
+
+def legacy_insert(db: DatabaseManager, df: pd.DataFrame) -> int:
+    """기존 insert_daily_prices 구현 (iterrows + 행 단위 INSERT OR REPLACE)"""
+    conn = db.duckdb_conn
+    df_copy = df.copy()
+    df_copy["date"] = df_copy.index.to_series().dt.date
+    rows = 0
+    for _, row in df_copy.iterrows():
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO daily_prices
+            (symbol, date, open, high, low, close, adjusted_close, volume,
+             dividend_amount, split_coefficient)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+            [
+                row["symbol"],
+                row["date"],
+                row["open"],
+                row["high"],
+                row["low"],
+                row["close"],
+                row["adjusted_close"],
+                row["volume"],
+                row["dividend_amount"],
+                row["split_coefficient"],
+            ],
+        )
+        rows += 1
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="DuckDB daily_prices ingest benchmark")
+    parser.add_argument("--symbols", type=int, default=240, help="심볼 수")
+    parser.add_argument("--days", type=int, default=5000, help="심볼당 영업일 수")
+    parser.add_argument(
+        "--legacy-rows",
+        type=int,
+        default=20_000,
+        help="행 단위 루프 측정에 사용할 샘플 행 수 (전체 측정은 수십 분 소요)",
+    )
+    args = parser.parse_args()
+
+    frame = build_frame(args.symbols, args.days)
+    total_rows = len(frame)
+    print(
+        f"📦 Generated {total_rows:,} rows ({args.symbols} symbols × {args.days} days)"
+    )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # 1) Bulk upsert - 최초 적재 (전부 insert)
+        with DatabaseManager(
+            str(Path(tmp_dir) / "bulk.duckdb"),
+            price_store_path=str(Path(tmp_dir) / "bulk_store"),
+        ) as db:
+            started = time.perf_counter()
+            first = db.upsert_daily_prices(frame)
+            bulk_insert_sec = time.perf_counter() - started
+
+            # 2) Bulk upsert - 동일 데이터 재적재 (전부 update)
+            started = time.perf_counter()
+            second = db.upsert_daily_prices(frame)
+            bulk_update_sec = time.perf_counter() - started
+
+        # 3) Legacy 행 단위 루프 - 샘플로 측정 후 외삽
+        sample = frame.iloc[: args.legacy_rows]
+        with DatabaseManager(
+            str(Path(tmp_dir) / "legacy.duckdb"),
+            price_store_path=str(Path(tmp_dir) / "legacy_store"),
+        ) as db:
+            started = time.perf_counter()
+            legacy_rows = legacy_insert(db, sample)
+            legacy_sec = time.perf_counter() - started
+
+    legacy_rate = legacy_rows / legacy_sec if legacy_sec else float("inf")
+    legacy_projected = total_rows / legacy_rate if legacy_rate else float("inf")
+    bulk_rate = total_rows / bulk_insert_sec if bulk_insert_sec else float("inf")
+
+    print("\n" + "=" * 60)
+    print("📊 Ingest Results")
+    print("=" * 60)
+    print(
+        f"bulk insert : {bulk_insert_sec:8.2f}s  ({bulk_rate:,.0f} rows/s) "
+        f"inserted={first.inserted:,} updated={first.updated:,}"
+    )
+    print(
+        f"bulk upsert : {bulk_update_sec:8.2f}s  "
+        f"inserted={second.inserted:,} updated={second.updated:,}"
+    )
+    print(
+        f"legacy loop : {legacy_sec:8.2f}s for {legacy_rows:,} rows "
+        f"({legacy_rate:,.0f} rows/s, projected {legacy_projected:,.0f}s for all rows)"
+    )
+    print(f"speedup     : {legacy_projected / bulk_insert_sec:,.0f}x")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
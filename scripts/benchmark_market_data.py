@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+시장 데이터 파이프라인 부하 벤치마크 (오프라인)
+로컬 Alpha Vantage 리플레이 서버를 띄우고 StockService / CryptoService /
+FundamentalService / 기술 지표 서비스를 지정한 동시성으로 호출합니다.
+
+리포트: 처리량(ops/s), 작업별 p50/p99 지연, 캐시(L1 포함) 적중률, 업스트림 호출 수,
+single-flight 병합 수, 속도 제한 대기 시간
+
+사전 조건: MongoDB 연결 (MONGODB_URL 등 서비스 설정). DuckDB는 임시 파일을 사용합니다.
+
+사용법:
+    # 기본: 동시성 16, 500회, 심볼 20개, 전체 작업 혼합
+    python scripts/benchmark_market_data.py
+
+    # 지연/오류/한도 응답 주입
+    python scripts/benchmark_market_data.py --latency-ms 80 --jitter-ms 40 \\
+        --error-rate 0.01 --limit-rate 0.02
+
+    # 녹화된 fixture 사용, 일부 작업만 실행, JSON 리포트
+    python scripts/benchmark_market_data.py --fixtures fixtures/av \\
+        --ops stock.intraday,indicator.rsi --concurrency 64 --json
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+# Add backend directory to Python path
+backend_dir = Path(__file__).parent.parent / "backend"
+sys.path.insert(0, str(backend_dir))
+
+from app.alpha_vantage.replay import ReplayConfig, ReplayServer  # noqa: E402
+from app.core.cache_stats import cache_stats  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.core.l1_cache import l1_cache  # noqa: E402
+from app.core.single_flight import single_flight_stats  # noqa: E402
+
+Operation = Callable[[Any, str], Awaitable[Any]]
+
+# 작업 이름 -> (서비스 묶음, 심볼) 호출
+OPERATIONS: dict[str, Operation] = {
+    "stock.daily": lambda s, sym: s.market.stock.get_daily_prices(sym),
+    "stock.intraday": lambda s, sym: s.market.stock.get_intraday_data(
+        sym, interval="5min"
+    ),
+    "crypto.daily": lambda s, sym: s.market.crypto.get_daily_prices(sym),
+    "fundamental.overview": lambda s, sym: s.market.fundamental.get_company_overview(
+        sym
+    ),
+    "indicator.sma": lambda s, sym: s.indicators.get_sma(sym),
+    "indicator.rsi": lambda s, sym: s.indicators.get_rsi(sym),
+    "indicator.bbands": lambda s, sym: s.indicators.get_bbands(sym),
+}
+
+
+class Services:
+    def __init__(self, db_manager: Any):
+        from app.services.market_data import MarketDataService
+        from app.services.market_data.indicators import TechnicalIndicatorService
+
+        self.market = MarketDataService(database_manager=db_manager)
+        self.indicators = TechnicalIndicatorService(db_manager)
+
+
+def percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, round(q * (len(ordered) - 1)))]
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    ops = [name.strip() for name in args.ops.split(",") if name.strip()]
+    unknown = [name for name in ops if name not in OPERATIONS]
+    if unknown:
+        raise SystemExit(f"알 수 없는 작업: {unknown} (가능: {', '.join(OPERATIONS)})")
+
+    config = ReplayConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        limit_rate=args.limit_rate,
+        full_bars=args.bars,
+        seed=args.seed,
+    )
+    async with ReplayServer(args.fixtures, config) as server:
+        # 클라이언트/속도 제한기는 최초 사용 시 설정값으로 생성됨
+        settings.ALPHA_VANTAGE_BASE_URL = server.url
+        settings.ALPHA_VANTAGE_API_KEY = "replay"
+        settings.ALPHA_VANTAGE_REQUESTS_PER_MINUTE = args.rpm
+        settings.ALPHA_VANTAGE_BURST = args.burst
+
+        from mysingle_quant.core import init_mongodb_async
+
+        from app import models
+        from app.alpha_vantage import AlphaVantageClient, get_rate_limiter
+        from app.alpha_vantage.transport import transport_metrics
+        from app.services.database_manager import DatabaseManager
+
+        AlphaVantageClient.LIMIT_BACKOFF_SECONDS = args.limit_backoff
+
+        await init_mongodb_async(
+            service_name=settings.SERVICE_NAME,
+            document_models=models.collections,
+        )
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_manager = DatabaseManager(str(Path(tmp_dir) / "bench.duckdb"))
+            db_manager.connect()
+            services = Services(db_manager)
+            cache_stats.reset()
+            l1_cache.clear()
+            transport_metrics.reset()
+
+            rng = random.Random(args.seed)
+            symbols = [f"SYM{i:03d}" for i in range(args.symbols)]
+            plan = [
+                (rng.choice(ops), rng.choice(symbols)) for _ in range(args.requests)
+            ]
+
+            latencies: dict[str, list[float]] = defaultdict(list)
+            errors: dict[str, int] = defaultdict(int)
+            semaphore = asyncio.Semaphore(args.concurrency)
+
+            async def execute(name: str, symbol: str) -> None:
+                async with semaphore:
+                    started = time.perf_counter()
+                    try:
+                        result = await OPERATIONS[name](services, symbol)
+                        if not result:
+                            errors[name] += 1
+                    except Exception:
+                        errors[name] += 1
+                    latencies[name].append((time.perf_counter() - started) * 1000)
+
+            started = time.perf_counter()
+            await asyncio.gather(*(execute(name, symbol) for name, symbol in plan))
+            wall_sec = time.perf_counter() - started
+
+            await services.market.close()
+            db_manager.shutdown()
+
+        all_latencies = [value for values in latencies.values() for value in values]
+        totals = cache_stats.total()
+        return {
+            "requests": len(plan),
+            "concurrency": args.concurrency,
+            "wall_sec": round(wall_sec, 3),
+            "throughput_ops": round(len(plan) / wall_sec, 2) if wall_sec else 0.0,
+            "p50_ms": round(percentile(all_latencies, 0.50), 2),
+            "p99_ms": round(percentile(all_latencies, 0.99), 2),
+            "errors": sum(errors.values()),
+            "operations": {
+                name: {
+                    "count": len(values),
+                    "errors": errors[name],
+                    "p50_ms": round(percentile(values, 0.50), 2),
+                    "p99_ms": round(percentile(values, 0.99), 2),
+                }
+                for name, values in sorted(latencies.items())
+            },
+            "cache_hit_ratio": round(totals.hit_ratio, 4),
+            "cache": cache_stats.snapshot(),
+            "l1_cache": l1_cache.snapshot(),
+            "upstream": server.stats.snapshot(),
+            "single_flight": single_flight_stats(),
+            "rate_limiter": get_rate_limiter().get_metrics(),
+        }
+
+
+def print_report(report: dict[str, Any]) -> None:
+    upstream = report["upstream"]
+    print("\n" + "=" * 60)
+    print("📊 Market Data Pipeline Benchmark")
+    print("=" * 60)
+    print(
+        f"requests          : {report['requests']:,} (concurrency {report['concurrency']})"
+    )
+    print(f"wall time         : {report['wall_sec']:8.2f}s")
+    print(f"throughput        : {report['throughput_ops']:8.1f} ops/s")
+    print(f"latency p50 / p99 : {report['p50_ms']:8.1f} / {report['p99_ms']:.1f} ms")
+    print(f"errors            : {report['errors']:,}")
+    print(f"cache hit ratio   : {report['cache_hit_ratio']:8.1%}")
+    print(
+        f"upstream calls    : {upstream['requests']:,} "
+        f"(injected errors {upstream['injected_errors']}, limits {upstream['injected_limits']})"
+    )
+    print("-" * 60)
+    print(f"{'operation':<22}{'count':>8}{'errors':>8}{'p50 ms':>10}{'p99 ms':>10}")
+    for name, stats in report["operations"].items():
+        print(
+            f"{name:<22}{stats['count']:>8}{stats['errors']:>8}"
+            f"{stats['p50_ms']:>10.1f}{stats['p99_ms']:>10.1f}"
+        )
+    print("-" * 60)
+    for data_type, stats in report["cache"].items():
+        print(
+            f"cache {data_type:<18}: {stats['hits']:>6} hit / {stats['misses']:>6} miss"
+        )
+    for data_type, stats in report["l1_cache"].items():
+        print(
+            f"l1 {data_type:<21}: {stats['hits'] + stats['negative_hits']:>6} hit / "
+            f"{stats['misses']:>6} miss / {stats['evictions']:>6} evicted"
+        )
+    for name, stats in report["single_flight"].items():
+        print(
+            f"single-flight {name:<10}: {stats['coalesced']:>6} coalesced / {stats['executions']:>6} runs"
+        )
+    print("=" * 60)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Market data pipeline benchmark (replay server)"
+    )
+    parser.add_argument("--ops", default=",".join(OPERATIONS), help="실행할 작업 (쉼표 구분)")
+    parser.add_argument("--requests", type=int, default=500, help="전체 호출 수")
+    parser.add_argument("--concurrency", type=int, default=16, help="동시 실행 수")
+    parser.add_argument("--symbols", type=int, default=20, help="심볼 수 (적을수록 캐시 적중 증가)")
+    parser.add_argument("--fixtures", help="리플레이 fixture 디렉터리 (없으면 합성 응답)")
+    parser.add_argument("--bars", type=int, default=1000, help="full 합성 응답 봉 수")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="업스트림 지연")
+    parser.add_argument("--jitter-ms", type=float, default=20.0, help="업스트림 지연 편차")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="HTTP 500 비율")
+    parser.add_argument("--limit-rate", type=float, default=0.0, help="한도 초과 Note 비율")
+    parser.add_argument(
+        "--limit-backoff", type=float, default=1.0, help="한도 응답 후 대기(초)"
+    )
+    parser.add_argument("--rpm", type=float, default=6000, help="속도 제한 (분당 요청 수)")
+    parser.add_argument("--burst", type=int, default=50, help="속도 제한 버스트")
+    parser.add_argument("--seed", type=int, default=7, help="난수 시드")
+    parser.add_argument("--json", action="store_true", help="JSON 리포트 출력")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    if args.json:
+        print(json.dumps(report, indent=2, default=str))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
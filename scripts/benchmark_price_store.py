@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+파티션 Parquet 가격 저장소 읽기 벤치마크
+심볼별 get_daily_prices 루프 (DECIMAL → .df()) vs get_prices_arrow (float64 Arrow) 비교
+
+사용법:
+    # 기본: 1,000 심볼 × 2,520 영업일
+    python scripts/benchmark_price_store.py
+
+    # 심볼 수/기간 조정
+    python scripts/benchmark_price_store.py --symbols 3000 --days 5040
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add backend directory to Python path
+backend_dir = Path(__file__).parent.parent / "backend"
+sys.path.insert(0, str(backend_dir))
+
+from benchmark_duckdb_ingest import build_frame  # noqa: E402
+
+from app.services.database_manager import DatabaseManager  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Price store read benchmark")
+    parser.add_argument("--symbols", type=int, default=1000, help="심볼 수")
+    parser.add_argument("--days", type=int, default=2520, help="심볼당 영업일 수")
+    args = parser.parse_args()
+
+    frame = build_frame(args.symbols, args.days)
+    symbols = sorted(frame["symbol"].unique().tolist())
+    print(
+        f"📦 Generated {len(frame):,} rows ({args.symbols} symbols × {args.days} days)"
+    )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with DatabaseManager(
+            str(Path(tmp_dir) / "quant.duckdb"),
+            price_store_path=str(Path(tmp_dir) / "store"),
+        ) as db:
+            started = time.perf_counter()
+            db.upsert_daily_prices(frame)
+            ingest_sec = time.perf_counter() - started
+
+            # 1) 기존 경로: 심볼별 조회 + Decimal → float 변환
+            started = time.perf_counter()
+            legacy_rows = 0
+            for symbol in symbols:
+                df = db.get_daily_prices(symbol)
+                legacy_rows += len(df["close"].astype(float))
+            legacy_sec = time.perf_counter() - started
+
+            # 2) 파티션 Parquet → Arrow (단일 쿼리)
+            started = time.perf_counter()
+            table = db.get_prices_arrow(symbols, columns=["close", "volume"])
+            close = table.column("close").to_numpy()
+            arrow_sec = time.perf_counter() - started
+
+    print("\n" + "=" * 60)
+    print("📊 Read Results")
+    print("=" * 60)
+    print(f"ingest + sync     : {ingest_sec:8.2f}s")
+    print(f"per-symbol .df()  : {legacy_sec:8.2f}s  ({legacy_rows:,} rows)")
+    print(f"get_prices_arrow  : {arrow_sec:8.2f}s  ({len(close):,} rows)")
+    print(f"speedup           : {legacy_sec / arrow_sec:,.1f}x")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()